@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
 # 파일명: Search_Author_Check.py
-# 버전: v2.0.0
+# 버전: v2.1.1
 # 생성일: 2025-10-31
 # 설명: nlk_biblio.sqlite 검색 래퍼 (search_common_manager 통합)
 
 from search_common_manager import SearchCommonManager
+from search_page import SearchPage
 
 
 def search_nlk_biblio(
@@ -97,3 +98,62 @@ def search_nlk_biblio(
         import traceback
         traceback.print_exc()
         return []
+
+
+def search_nlk_biblio_page(
+    title_query=None,
+    author_query=None,
+    kac_query=None,
+    year_query=None,
+    cursor=None,
+    page_size=None,
+    with_count=False,
+    app_instance=None,
+    db_manager=None,
+):
+    """
+    ✅ [성능 개선] nlk_biblio.sqlite 페이지 단위 검색 (저자 확인 탭 "더 보기"용)
+
+    Args:
+        cursor (dict): 이전 페이지의 next_cursor (None이면 첫 페이지)
+        page_size (int): 페이지당 건수 (None이면 SearchCommonManager 기본값)
+        with_count (bool): True면 FTS 기반 히트 수 추정치도 함께 반환
+
+    Returns:
+        SearchPage: results(list[dict]), next_cursor(dict | None),
+                    total_estimate((건수, 상한 도달 여부) | None)
+    """
+    page = SearchPage([])
+    if not db_manager:
+        if app_instance:
+            app_instance.log_message(
+                "오류: db_manager가 제공되지 않았습니다.", "ERROR"
+            )
+        return page
+
+    query = {
+        "title_query": title_query,
+        "author_query": author_query,
+        "kac_query": kac_query,
+        "year_query": year_query,
+    }
+    search_manager = SearchCommonManager(db_manager)
+    page = search_manager.search_nlk_biblio_page(
+        cursor=cursor, page_size=page_size, **query
+    )
+    # 다음 페이지가 없으면 로드된 건수가 곧 전체 건수 (추정 쿼리 생략)
+    if with_count and cursor is None:
+        if page.next_cursor is None:
+            page = page._replace(total_estimate=(len(page.results), False))
+        else:
+            page = page._replace(
+                total_estimate=search_manager.estimate_nlk_biblio_count(**query)
+            )
+
+    if app_instance:
+        app_instance.log_message(
+            f"정보: NLK Biblio 페이지 검색 완료. {len(page.results)}건 반환"
+            + (" (다음 페이지 있음)" if page.next_cursor else ""),
+            "INFO",
+        )
+    return page
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 # 파일명: Search_BNF.py
-# Version: v1.0.0
-# 수정일시: 2025-08-08 KST (GAS BNF 로직 파이썬 포팅)
+# Version: v1.0.3
+# 수정일시: 2025-10-31 KST (번역 메모리 + 묶음 번역: 용어집 재적재/개별 번역 폴백 제거)
+# v1.0.2: sru_paging으로 50건 제한 해제: startRecord 병렬 페이지 + 페이지 스트리밍
+# v1.0.1: marc_xml_parser 스트리밍 파싱으로 전환
 
 """
 Search_BNF.py - 프랑스 국립도서관(BNF) SRU 카탈로그를 검색하는 로직을 포함합니다.
@@ -13,12 +15,14 @@ from ssl_cert_utils import configure_ssl_certificates
 configure_ssl_certificates()
 
 import requests
-import xml.etree.ElementTree as ET
 import re
-from concurrent.futures import ThreadPoolExecutor
-from qt_api_clients import translate_text
+from marc_xml_parser import MARCXCHANGE_NS, XML_PARSE_ERRORS, iter_marc_records
+from sru_paging import PagedSearch, result_budget, stop_checker, sru_total
 from qt_api_clients import translate_text_batch_async
 
+BNF_HOST = "catalogue.bnf.fr"
+BNF_PAGE_SIZE = 50  # BNF SRU maximumRecords 상한
+
 
 # Search_BNF.py 파일 상단의 임포트 부분 다음에 추가
 def _should_auto_translate(app_instance):
@@ -36,9 +40,10 @@ def _get_foreign_auto_translation_setting(app_instance):
     return True
 
 
-def _parse_unimarc_record(unimarc_record_element, namespaces, app_instance):
+def _parse_unimarc_record(unimarc_record, app_instance):
     """
-    UNIMARC 레코드에서 필요한 정보를 추출하여 LC 탭과 유사한 딕셔너리로 반환합니다.
+    UNIMARC 레코드(marc_xml_parser.MarcRecord)에서 필요한 정보를 추출하여
+    LC 탭과 유사한 딕셔너리로 반환합니다.
     """
     record = {
         "제목": "없음",
@@ -65,22 +70,15 @@ def _parse_unimarc_record(unimarc_record_element, namespaces, app_instance):
         "650 필드 (번역)": "없음",
     }
 
-    def get_subfield_value(datafield_element, codes, separator=" "):
+    def get_subfield_value(datafield, codes, separator=" "):
         """특정 서브필드 값들을 가져와 문자열로 결합"""
-        values = []
-        for subfield in datafield_element.findall("marc:subfield", namespaces):
-            code = subfield.get("code")
-            if code in codes and subfield.text:
-                values.append(subfield.text.strip())
-        result = separator.join(values).strip()
+        result = separator.join(datafield.values(codes)).strip()
         # 끝의 구두점 제거 (대괄호는 중요한 서지정보이므로 보존!)
         return re.sub(r"[\/,;:]\s*$", "", result).strip()
 
     try:
         # Control Fields
-        for field in unimarc_record_element.findall("marc:controlfield", namespaces):
-            tag = field.get("tag")
-            value = field.text or ""
+        for tag, value in unimarc_record.controlfields.items():
 
             if tag == "001":  # BNF 고유 식별자
                 record["LCCN"] = value.strip()
@@ -89,12 +87,12 @@ def _parse_unimarc_record(unimarc_record_element, namespaces, app_instance):
                     record["상세 링크"] = value.strip()
 
         # Data Fields
-        data_fields = unimarc_record_element.findall("marc:datafield", namespaces)
+        data_fields = unimarc_record.datafields
         raw_subjects = []
         isbn_list = []  # 모든 ISBN을 수집할 리스트
 
         for field in data_fields:
-            tag = field.get("tag")
+            tag = field.tag
 
             if tag == "010":  # ISBN (여러 개의 010 필드가 있을 수 있음)
                 isbn_value = get_subfield_value(field, ["a"])
@@ -186,11 +184,7 @@ def _parse_unimarc_record(unimarc_record_element, namespaces, app_instance):
                 # 나중에 사용할 수 있도록 저장
 
             elif tag in ["606", "607", "608", "610", "611", "612"]:  # 주제어 필드들
-                subject_parts = []
-                for subfield in field.findall("marc:subfield", namespaces):
-                    code = subfield.get("code")
-                    if code in ["a", "x", "y", "z", "c"] and subfield.text:
-                        subject_parts.append(subfield.text.strip())
+                subject_parts = field.values(["a", "x", "y", "z", "c"])
                 if subject_parts:
                     raw_subjects.append(" -- ".join(subject_parts))
 
@@ -200,9 +194,7 @@ def _parse_unimarc_record(unimarc_record_element, namespaces, app_instance):
                     record["082"] = ddc_value
                 # 지시자 추출 (082 필드와 동일한 방식)
                 if record["082 ind"] == "없음":
-                    ind1 = field.get("ind1", " ").strip()
-                    ind2 = field.get("ind2", " ").strip()
-                    record["082 ind"] = f"{ind1}{ind2}".replace(" ", "#")
+                    record["082 ind"] = field.indicators()
 
             elif tag == "676":  # 추가 DDC 필드 (620에서 찾지 못했을 경우)
                 if record["082"] == "없음":
@@ -211,9 +203,7 @@ def _parse_unimarc_record(unimarc_record_element, namespaces, app_instance):
                         record["082"] = ddc_value
                     # 지시자 추출
                     if record["082 ind"] == "없음":
-                        ind1 = field.get("ind1", " ").strip()
-                        ind2 = field.get("ind2", " ").strip()
-                        record["082 ind"] = f"{ind1}{ind2}".replace(" ", "#")
+                        record["082 ind"] = field.indicators()
 
             elif tag in ["700", "701", "710"]:  # 저자 필드들
                 if record["저자"] == "없음":
@@ -264,9 +254,13 @@ def search_bnf_catalog(
     year_query=None,  # ← 추가!
     app_instance=None,
     db_manager=None,
+    on_page=None,
 ):
-    """BNF SRU API를 호출하고 LC 탭과 호환되는 형식으로 결과를 파싱하여 반환합니다."""
-    base_url = "https://catalogue.bnf.fr/api/SRU"
+    """BNF SRU API를 호출하고 LC 탭과 호환되는 형식으로 결과를 파싱하여 반환합니다.
+    ✅ [성능 개선] startRecord 페이지를 sru_paging으로 병렬 요청 (결과 예산까지),
+    on_page가 있으면 도착한 페이지(번역 전)를 먼저 전달합니다.
+    """
+    base_url = f"https://{BNF_HOST}/api/SRU"
 
     # CQL 쿼리 구성 (5개 필드: 제목, 저자, ISBN, DDC, 연도)
     query_parts = []
@@ -296,7 +290,7 @@ def search_bnf_catalog(
         "version": "1.2",
         "query": cql_query,
         "recordSchema": "unimarcXchange",
-        "maximumRecords": "50",
+        "maximumRecords": str(BNF_PAGE_SIZE),
     }
 
     try:
@@ -305,55 +299,60 @@ def search_bnf_catalog(
                 f"정보: BNF API 요청: {base_url} (쿼리: {cql_query})", level="INFO"
             )
 
-        response = requests.get(base_url, params=params, timeout=30)
-        response.raise_for_status()
+        def fetch_page(offset):
+            response = requests.get(
+                base_url,
+                params={**params, "startRecord": str(offset + 1)},
+                timeout=30,
+            )
+            response.raise_for_status()
+
+            # ✅ [성능 개선] iterparse 스트리밍 파싱 (MARCXchange 레코드 단위 색인 후 즉시 해제)
+            page = []
+            for unimarc_record in iter_marc_records(
+                response.content, namespace=MARCXCHANGE_NS
+            ):
+                if app_instance and app_instance.stop_search_flag.is_set():
+                    break
+
+                parsed_record = _parse_unimarc_record(unimarc_record, app_instance)
+                if parsed_record:
+                    page.append(parsed_record)
+            return page, sru_total(response.content)
+
+        def log_page_error(offset, error):
+            if app_instance:
+                app_instance.log_message(
+                    f"경고: BNF {offset + 1}번째 레코드부터의 페이지 수신 실패: {error}",
+                    level="WARNING",
+                )
+
+        paging = PagedSearch(
+            fetch_page,
+            page_size=BNF_PAGE_SIZE,
+            host=BNF_HOST,
+            budget=result_budget(app_instance),
+            record_key=lambda record: record.get("LCCN"),
+            on_page=on_page,
+            should_stop=stop_checker(app_instance),
+            on_error=log_page_error,
+        )
+        results = paging.run()
 
         if app_instance:
             app_instance.log_message(
-                f"정보: BNF API 응답 상태: {response.status_code}", level="INFO"
+                f"정보: BNF 전체 {paging.total or 0}건 중 {len(results)}건 수신 "
+                f"({paging.pages_fetched}페이지{', 결과 예산 도달' if paging.truncated else ''})",
+                level="INFO",
             )
 
-        xml_content = response.text
-
-        # XML 응답 파싱
-        root = ET.fromstring(xml_content)
-
-        # 네임스페이스 정의
-        namespaces = {
-            "srw": "http://www.loc.gov/zing/srw/",
-            "marc": "info:lc/xmlns/marcxchange-v2",
-        }
-
-        # 검색 결과 레코드 추출
-        records_element = root.find("srw:records", namespaces)
-        if records_element is None:
+        if not results:
             if app_instance:
                 app_instance.log_message(
                     "정보: BNF 검색 결과가 없습니다.", level="INFO"
                 )
             return []
 
-        record_elements = records_element.findall("srw:record", namespaces)
-
-        results = []
-        for record_element in record_elements:
-            if app_instance and app_instance.stop_search_flag.is_set():
-                break
-
-            record_data_element = record_element.find("srw:recordData", namespaces)
-            if record_data_element is None:
-                continue
-
-            unimarc_record = record_data_element.find("marc:record", namespaces)
-            if unimarc_record is None:
-                continue
-
-            parsed_record = _parse_unimarc_record(
-                unimarc_record, namespaces, app_instance
-            )
-            if parsed_record:
-                results.append(parsed_record)
-
         # 연도 기준으로 최신순 정렬
         results.sort(
             key=lambda x: int(x["연도"]) if x["연도"].isdigit() else 0,
@@ -394,44 +393,12 @@ def search_bnf_catalog(
                     "🚀🚀 중앙집중 비동기 배치 번역 시스템 시작!", level="INFO"
                 )
 
-                # 용어집 가져오기
-                custom_glossary_map = {}
-                if db_manager:
-                    custom_glossary_map = db_manager.get_all_custom_translations()
-
-                # 🚀 중앙집중 비동기 번역 실행!
+                # ✅ [성능 개선] 용어집 전체를 검색마다 읽지 않고 번역 메모리 사용
+                # (메모리 적중은 바로, 나머지는 묶음 원격 번역 - 실패한 주제어는 원문 유지)
                 translation_map = translate_text_batch_async(
-                    all_unique_subjects, app_instance, custom_glossary_map, db_manager
+                    all_unique_subjects, app_instance, None, db_manager
                 )
 
-                if not translation_map:
-                    # 실패시 기존 동기 방식으로 폴백
-                    if app_instance:
-                        app_instance.log_message(
-                            "⚠️ 비동기 번역 실패, 기존 동기 방식으로 폴백",
-                            level="WARNING",
-                        )
-
-                    with ThreadPoolExecutor(max_workers=15) as executor:
-                        future_to_subject = {
-                            executor.submit(
-                                translate_text, subject, custom_glossary_map, db_manager
-                            ): subject
-                            for subject in all_unique_subjects
-                        }
-
-                        for future in future_to_subject:
-                            subject = future_to_subject[future]
-                            try:
-                                translation_map[subject] = future.result()
-                            except Exception as exc:
-                                translation_map[subject] = f"{subject} (번역 오류)"
-                                if app_instance:
-                                    app_instance.log_message(
-                                        f"오류: 주제어 '{subject}' 번역 실패: {exc}",
-                                        level="ERROR",
-                                    )
-
             # 3단계: 번역 결과를 각 레코드에 적용 (NDL 방식)
             for record in results:
                 raw_subjects = record.get("주제어_원문", [])
@@ -500,7 +467,7 @@ def search_bnf_catalog(
             app_instance.log_message(f"오류: {error_message}", level="ERROR")
         raise ConnectionError(error_message)
 
-    except ET.ParseError as e:
+    except XML_PARSE_ERRORS as e:
         error_message = f"BNF API 응답 XML 파싱 오류: {e}"
         if app_instance:
             app_instance.log_message(f"오류: {error_message}", level="ERROR")
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
-# Version: v1.0.0
+# Version: v1.0.1
 # 작성일시: 2025-09-17 (GAS 버전 1.0.22를 Python으로 포팅)
+# 수정일시: 2025-10-31 (marc_xml_parser.iter_elements로 atom:entry 스트리밍 파싱)
 
 """
 Search_CiNii.py - CiNii Books API 검색 모듈
@@ -12,9 +13,9 @@ from ssl_cert_utils import configure_ssl_certificates
 configure_ssl_certificates()
 
 import requests
-import xml.etree.ElementTree as ET
 from urllib.parse import quote_plus
 import re
+from marc_xml_parser import ATOM_NS, XML_PARSE_ERRORS, iter_elements
 
 
 def search_cinii_books(
@@ -82,10 +83,6 @@ def search_cinii_books(
         response = requests.get(url, headers=headers, timeout=15)
         response.raise_for_status()
 
-        # XML 파싱
-        xml_content = response.text
-        document = ET.fromstring(xml_content)
-
         # 네임스페이스 정의 (GAS와 동일)
         namespaces = {
             "atom": "http://www.w3.org/2005/Atom",
@@ -95,22 +92,14 @@ def search_cinii_books(
             "cinii": "http://ci.nii.ac.jp/ns/1.0/",
         }
 
-        # entry 요소들 찾기
-        entries = document.findall(".//atom:entry", namespaces)
-
-        if app_instance:
-            app_instance.log_message(f"정보: CiNii에서 {len(entries)}개 항목 발견")
-
-        if not entries:
-            if app_instance:
-                app_instance.log_message("정보: CiNii 검색 결과가 없습니다.")
-            return []
-
         # 결과 파싱
+        # ✅ [성능 개선] iterparse 스트리밍 파싱 (atom:entry 단위로 처리 후 즉시 해제)
         results = []
         filtered_count = 0
+        entry_count = 0
 
-        for entry in entries:
+        for entry in iter_elements(response.content, f"{{{ATOM_NS}}}entry"):
+            entry_count += 1
             try:
                 # 데이터 추출 (GAS 로직과 동일)
                 title = _get_element_text(entry, ".//atom:title", namespaces) or ""
@@ -177,6 +166,14 @@ def search_cinii_books(
                     )
                 continue
 
+        if app_instance:
+            app_instance.log_message(f"정보: CiNii에서 {entry_count}개 항목 발견")
+
+        if not entry_count:
+            if app_instance:
+                app_instance.log_message("정보: CiNii 검색 결과가 없습니다.")
+            return []
+
         # 발행 연도 최신순 정렬 (GAS 로직과 동일)
         results.sort(
             key=lambda x: int(x["연도"]) if x["연도"].isdigit() else 0,
@@ -194,7 +191,7 @@ def search_cinii_books(
         if app_instance:
             app_instance.log_message(f"오류: CiNii API 요청 실패: {e}", level="ERROR")
         return []
-    except ET.ParseError as e:
+    except XML_PARSE_ERRORS as e:
         if app_instance:
             app_instance.log_message(f"오류: CiNii XML 파싱 실패: {e}", level="ERROR")
         return []
@@ -1,17 +1,18 @@
 # -*- coding: utf-8 -*-
 # 파일명: Search_DNB.py
-# Version: v1.0.7
-# 수정일시: 2025-08-09 KST (사용자 피드백 반영: 번역 병렬 처리 강화)
+# Version: v1.0.10
+# 수정일시: 2025-10-31 KST (번역 메모리 + 묶음 번역: 용어집 재적재/개별 번역 폴백 제거)
+# v1.0.9: sru_paging으로 50건 제한 해제: startRecord 병렬 페이지 + 페이지 스트리밍
+# v1.0.8: marc_xml_parser 스트리밍 파싱으로 전환
 
 """
 Search_DNB.py - 독일 국립도서관(DNB) SRU 카탈로그를 검색하는 로직을 포함합니다.
 Google Apps Script 버전의 로직을 Python으로 포팅했으며, Tab_LC.py와 호환되는 형식으로 결과를 반환합니다.
 """
 import requests
-import xml.etree.ElementTree as ET
 import re
-from concurrent.futures import ThreadPoolExecutor
-from qt_api_clients import translate_text
+from marc_xml_parser import iter_marc_records
+from sru_paging import PagedSearch, result_budget, stop_checker, sru_total
 from qt_api_clients import translate_text_batch_async
 
 # ✅ [추가] PyInstaller 환경에서 SSL 인증서 경로 설정
@@ -19,6 +20,9 @@ from ssl_cert_utils import configure_ssl_certificates
 
 configure_ssl_certificates()
 
+DNB_HOST = "services.dnb.de"
+DNB_PAGE_SIZE = 50
+
 
 # Search_DNB.py 파일 상단의 임포트 부분 다음에 추가
 def _should_auto_translate(app_instance):
@@ -36,9 +40,10 @@ def _get_foreign_auto_translation_setting(app_instance):
     return True
 
 
-def _parse_marc_record(marc_record_element, namespaces, app_instance):
+def _parse_marc_record(marc_record, app_instance):
     """
-    MARC 레코드에서 필요한 정보를 추출하여 LC 탭과 유사한 딕셔너리로 반환합니다.
+    MARC 레코드(marc_xml_parser.MarcRecord)에서 필요한 정보를 추출하여
+    LC 탭과 유사한 딕셔너리로 반환합니다.
     """
     # ✅ 수정: 새로운 컬럼(출판지역, 출판사) 추가
     record = {
@@ -61,107 +66,81 @@ def _parse_marc_record(marc_record_element, namespaces, app_instance):
 
     try:
         # Control Fields
-        for field in marc_record_element.findall("marc:controlfield", namespaces):
-            tag = field.get("tag")
-            value = field.text or ""
-            if tag == "001":
-                record["LCCN"] = value  # DNB 고유 식별자를 LCCN 필드에 저장
-            elif tag == "008" and len(value) >= 11:
-                year_str = value[7:11]
-                if re.match(r"^\d{4}$", year_str):
-                    record["연도"] = year_str
-
-        # Data Fields
-        data_fields = marc_record_element.findall("marc:datafield", namespaces)
+        record["LCCN"] = marc_record.controlfield("001", "")  # DNB 고유 식별자를 LCCN 필드에 저장
+        field_008 = marc_record.controlfield("008", "")
+        if len(field_008) >= 11:
+            year_str = field_008[7:11]
+            if re.match(r"^\d{4}$", year_str):
+                record["연도"] = year_str
 
         # 저자 (100, 110, 700, 710)
         author_names = []
         for tag in ["100", "110", "700", "710"]:
-            for field in data_fields:
-                if field.get("tag") == tag:
-                    subfield_a = field.find("marc:subfield[@code='a']", namespaces)
-                    if subfield_a is not None and subfield_a.text:
-                        author_names.append(subfield_a.text.strip())
+            for field in marc_record.fields(tag):
+                name = field.get("a")
+                if name:
+                    author_names.append(name.strip())
         record["저자"] = ", ".join(author_names) if author_names else "없음"
 
         # 제목 (245)
-        field_245 = next((f for f in data_fields if f.get("tag") == "245"), None)
+        field_245 = marc_record.field("245")
         if field_245 is not None:
-            sub_a = field_245.find("marc:subfield[@code='a']", namespaces)
-            sub_b = field_245.find("marc:subfield[@code='b']", namespaces)
-            title_a = sub_a.text.strip() if sub_a is not None and sub_a.text else ""
-            title_b = sub_b.text.strip() if sub_b is not None and sub_b.text else ""
+            title_a = (field_245.get("a") or "").strip()
+            title_b = (field_245.get("b") or "").strip()
             record["제목"] = f"{title_a} : {title_b}".strip(" :")
-
-            all_subfields_245 = [
-                sf.text.strip()
-                for sf in field_245.findall("marc:subfield", namespaces)
-                if sf.text
-            ]
-            record["245 필드"] = " ".join(all_subfields_245)
+            record["245 필드"] = " ".join(field_245.values())
 
         # DDC (082)
-        field_082 = next((f for f in data_fields if f.get("tag") == "082"), None)
+        field_082 = marc_record.field("082")
         if field_082 is not None:
-            ind1 = field_082.get("ind1", " ").strip()
-            ind2 = field_082.get("ind2", " ").strip()
-            record["082 ind"] = f"{ind1}{ind2}".replace(" ", "#")
-            sub_a_082 = field_082.find("marc:subfield[@code='a']", namespaces)
-            if sub_a_082 is not None and sub_a_082.text:
-                record["082"] = sub_a_082.text.strip().replace("/", "")
-
-        # ✅ 추가: 출판 정보 (260, 264)
+            record["082 ind"] = field_082.indicators()
+            ddc = field_082.get("a")
+            if ddc:
+                record["082"] = ddc.strip().replace("/", "")
+
+        # ✅ 추가: 출판 정보 (260, 264 중 문서상 먼저 나오는 필드)
+        data_fields = marc_record.datafields
         publication_field = next(
-            (f for f in data_fields if f.get("tag") in ["260", "264"]), None
+            (f for f in data_fields if f.tag in ["260", "264"]), None
         )
         if publication_field is not None:
-            place_subfield = publication_field.find(
-                "marc:subfield[@code='a']", namespaces
-            )
-            publisher_subfield = publication_field.find(
-                "marc:subfield[@code='b']", namespaces
-            )
-            if place_subfield is not None and place_subfield.text:
-                record["출판지역"] = place_subfield.text.strip().rstrip(" :")
-            if publisher_subfield is not None and publisher_subfield.text:
-                record["출판사"] = publisher_subfield.text.strip().rstrip(" ,")
+            place = publication_field.get("a")
+            publisher = publication_field.get("b")
+            if place:
+                record["출판지역"] = place.strip().rstrip(" :")
+            if publisher:
+                record["출판사"] = publisher.strip().rstrip(" ,")
             # 008 필드에서 연도를 못찾았을 경우 여기서 다시 시도
             if record["연도"] == "없음":
-                date_subfield = publication_field.find(
-                    "marc:subfield[@code='c']", namespaces
-                )
-                if date_subfield is not None and date_subfield.text:
-                    year_match = re.search(r"\d{4}", date_subfield.text)
+                date_text = publication_field.get("c")
+                if date_text:
+                    year_match = re.search(r"\d{4}", date_text)
                     if year_match:
                         record["연도"] = year_match.group(0)
 
         # 기타 필드
         raw_subjects = []
         for field in data_fields:
-            tag = field.get("tag")
+            tag = field.tag
 
             if tag.startswith("6"):
-                subject_parts = [
-                    sf.text.strip()
-                    for sf in field.findall("marc:subfield", namespaces)
-                    if sf.get("code") in ["a", "x", "y", "z"] and sf.text
-                ]
+                subject_parts = field.values(("a", "x", "y", "z"))
                 if subject_parts:
                     raw_subjects.append(" -- ".join(subject_parts))
                 continue
 
-            sub_a = field.find("marc:subfield[@code='a']", namespaces)
-            if sub_a is None or not sub_a.text:
+            sub_a = field.get("a")
+            if not sub_a:
                 continue
 
             if tag == "020" and record["ISBN"] == "없음":
-                record["ISBN"] = re.sub(r"\s*\(.*?\)", "", sub_a.text).strip()
+                record["ISBN"] = re.sub(r"\s*\(.*?\)", "", sub_a).strip()
             elif tag == "250":
-                record["250"] = sub_a.text.strip()
+                record["250"] = sub_a.strip()
             elif tag == "856":
-                sub_u = field.find("marc:subfield[@code='u']", namespaces)
-                if sub_u is not None and sub_u.text:
-                    record["상세 링크"] = sub_u.text.strip()
+                sub_u = field.get("u")
+                if sub_u:
+                    record["상세 링크"] = sub_u.strip()
 
         record["주제어_원문"] = raw_subjects
 
@@ -186,9 +165,13 @@ def search_dnb_catalog(
     year_query=None,  # ← 추가!
     app_instance=None,
     db_manager=None,
+    on_page=None,
 ):
-    """DNB SRU API를 호출하고 LC 탭과 호환되는 형식으로 결과를 파싱하여 반환합니다."""
-    base_url = "https://services.dnb.de/sru/dnb"
+    """DNB SRU API를 호출하고 LC 탭과 호환되는 형식으로 결과를 파싱하여 반환합니다.
+    ✅ [성능 개선] startRecord 페이지를 sru_paging으로 병렬 요청 (결과 예산까지),
+    on_page가 있으면 도착한 페이지(번역 전)를 먼저 전달합니다.
+    """
+    base_url = f"https://{DNB_HOST}/sru/dnb"
     cql_parts = []
     if isbn_query:
         cql_parts.append(f"dnb.num=\"{isbn_query.replace('-', '').replace(' ', '')}\"")
@@ -214,7 +197,7 @@ def search_dnb_catalog(
         "operation": "searchRetrieve",
         "query": cql_query,
         "recordSchema": "MARC21-xml",
-        "maximumRecords": "50",
+        "maximumRecords": str(DNB_PAGE_SIZE),
     }
 
     try:
@@ -223,33 +206,54 @@ def search_dnb_catalog(
                 f"정보: DNB API 요청: {base_url}?{requests.compat.urlencode(params)}",
                 level="INFO",
             )
-        response = requests.get(
-            base_url,
-            params=params,
-            timeout=5,
-            headers={"User-Agent": "LibraryTool/1.0"},
+
+        def fetch_page(offset):
+            response = requests.get(
+                base_url,
+                params={**params, "startRecord": str(offset + 1)},
+                timeout=5,
+                headers={"User-Agent": "LibraryTool/1.0"},
+            )
+            response.raise_for_status()
+            # ✅ [성능 개선] iterparse 스트리밍 파싱 (레코드 단위 색인 후 즉시 해제)
+            page = []
+            for marc_record in iter_marc_records(response.content):
+                parsed = _parse_marc_record(marc_record, app_instance)
+                if parsed:
+                    page.append(parsed)
+            return page, sru_total(response.content)
+
+        def deliver_page(page):
+            # 번역 전 미리보기: 원문 주제어를 650 필드에 표시
+            for record in page:
+                if record.get("주제어_원문"):
+                    record["650 필드"] = " | ".join(record["주제어_원문"])
+            on_page(page)
+
+        def log_page_error(offset, error):
+            if app_instance:
+                app_instance.log_message(
+                    f"경고: DNB {offset + 1}번째 레코드부터의 페이지 수신 실패: {error}",
+                    level="WARNING",
+                )
+
+        paging = PagedSearch(
+            fetch_page,
+            page_size=DNB_PAGE_SIZE,
+            host=DNB_HOST,
+            budget=result_budget(app_instance),
+            record_key=lambda record: record.get("LCCN"),
+            on_page=deliver_page if on_page else None,
+            should_stop=stop_checker(app_instance),
+            on_error=log_page_error,
         )
-        response.raise_for_status()
-
-        namespaces = {
-            "zs": "http://www.loc.gov/zing/srw/",
-            "marc": "http://www.loc.gov/MARC21/slim",
-        }
-        root = ET.fromstring(response.content)
-
-        all_results = []
-        records_element = root.find("zs:records", namespaces)
-        if records_element is None:
-            return []
-
-        for record_element in records_element.findall("zs:record", namespaces):
-            record_data = record_element.find("zs:recordData", namespaces)
-            if record_data is not None:
-                marc_record = record_data.find("marc:record", namespaces)
-                if marc_record is not None:
-                    parsed = _parse_marc_record(marc_record, namespaces, app_instance)
-                    if parsed:
-                        all_results.append(parsed)
+        all_results = paging.run()
+        if app_instance:
+            app_instance.log_message(
+                f"정보: DNB 전체 {paging.total or 0}건 중 {len(all_results)}건 수신 "
+                f"({paging.pages_fetched}페이지{', 결과 예산 도달' if paging.truncated else ''})",
+                level="INFO",
+            )
 
         # ✅ 수정: BNF 방식의 번역 로직 적용 (병렬 처리 강화)
         # ===== 🆕 설정 확인 후 번역 실행 =====
@@ -283,44 +287,12 @@ def search_dnb_catalog(
                     "🚀🚀 중앙집중 비동기 배치 번역 시스템 시작!", level="INFO"
                 )
 
-                # 용어집 가져오기
-                custom_glossary_map = {}
-                if db_manager:
-                    custom_glossary_map = db_manager.get_all_custom_translations()
-
-                # 🚀 중앙집중 비동기 번역 실행!
+                # ✅ [성능 개선] 용어집 전체를 검색마다 읽지 않고 번역 메모리 사용
+                # (메모리 적중은 바로, 나머지는 묶음 원격 번역 - 실패한 주제어는 원문 유지)
                 translation_map = translate_text_batch_async(
-                    all_unique_subjects, app_instance, custom_glossary_map, db_manager
+                    all_unique_subjects, app_instance, None, db_manager
                 )
 
-                if not translation_map:
-                    # 실패시 기존 동기 방식으로 폴백
-                    if app_instance:
-                        app_instance.log_message(
-                            "⚠️ 비동기 번역 실패, 기존 동기 방식으로 폴백",
-                            level="WARNING",
-                        )
-
-                    with ThreadPoolExecutor(max_workers=15) as executor:
-                        future_to_subject = {
-                            executor.submit(
-                                translate_text, subject, custom_glossary_map, db_manager
-                            ): subject
-                            for subject in all_unique_subjects
-                        }
-
-                        for future in future_to_subject:
-                            subject = future_to_subject[future]
-                            try:
-                                translation_map[subject] = future.result()
-                            except Exception as exc:
-                                translation_map[subject] = f"{subject} (번역 오류)"
-                                if app_instance:
-                                    app_instance.log_message(
-                                        f"오류: 주제어 '{subject}' 번역 실패: {exc}",
-                                        level="ERROR",
-                                    )
-
             for record in all_results:
                 raw_subjects = record.get("주제어_원문", [])
                 if raw_subjects:
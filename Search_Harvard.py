@@ -1,14 +1,21 @@
 # -*- coding: utf-8 -*-
 # 파일명: Search_Harvard.py
-# Version: v1.0.0
+# Version: v1.0.3
 # 생성일시: 2025-09-18 KST
+# 수정일시: 2025-10-31 KST (번역 메모리 + 묶음 번역: 검색마다 용어집 전체 적재 제거)
+# v1.0.2: sru_paging으로 limit=50 제한 해제: start 병렬 페이지 + 페이지 스트리밍
+# v1.0.1: marc_xml_parser 스트리밍 MODS 파싱으로 전환
 # 설명: Harvard LibraryCloud API를 사용하여 도서 정보를 검색하는 Python 모듈.
 
 import requests
-import xml.etree.ElementTree as ET
 from urllib.parse import urlencode
 import re
 from qt_api_clients import translate_text_batch_async
+from marc_xml_parser import MODS_NS, iter_mods_records
+from sru_paging import PagedSearch, num_found_total, result_budget, stop_checker
+
+HARVARD_HOST = "api.lib.harvard.edu"
+HARVARD_PAGE_SIZE = 50
 
 
 # Search_Harvard.py 파일 상단의 임포트 부분 다음에 추가
@@ -146,14 +153,17 @@ def search_harvard_library(
     year_query=None,  # ← 추가!
     app_instance=None,
     db_manager=None,
+    on_page=None,
 ):
     """
     Harvard LibraryCloud API를 호출하고 결과를 파싱하여 반환합니다. (URL 로깅 추가)
+    ✅ [성능 개선] start 페이지를 sru_paging으로 병렬 요청 (결과 예산까지),
+    on_page가 있으면 도착한 페이지(번역 전)를 먼저 전달합니다.
     """
     if not app_instance or not db_manager:
         return []
-    base_url = "https://api.lib.harvard.edu/v2/items.xml"
-    params = {"limit": 50}
+    base_url = f"https://{HARVARD_HOST}/v2/items.xml"
+    params = {"limit": HARVARD_PAGE_SIZE}
     # 쿼리 구성 (기존과 동일)
     if isbn_query:
         # Harvard API 문서에 따른 올바른 ISBN 검색 방법
@@ -193,32 +203,62 @@ def search_harvard_library(
             level="INFO",
         )
 
-        response = requests.get(request_url, timeout=20)
-        response.raise_for_status()
+        ns = {"mods": MODS_NS}
 
-        # 응답이 비어있는 경우 처리
-        if not response.content:
+        def fetch_page(offset):
+            response = requests.get(
+                base_url, params={**params, "start": offset}, timeout=20
+            )
+            response.raise_for_status()
+
+            # 응답이 비어있는 경우 처리
+            if not response.content:
+                return [], 0
+
+            # ✅ [성능 개선] iterparse 스트리밍 파싱 (mods 레코드 단위로 처리 후 즉시 해제)
+            page = []
+            for record_xml in iter_mods_records(response.content):
+                parsed = _parse_harvard_record(record_xml, ns, app_instance)
+                if parsed:
+                    page.append(parsed)
+            return page, num_found_total(response.content)
+
+        def deliver_page(page):
+            # 번역 전 미리보기: 원문 주제어를 650 필드에 표시
+            for record in page:
+                record["650 필드"] = " | ".join(record.get("주제어_원문", []))
+            on_page(page)
+
+        def log_page_error(offset, error):
             app_instance.log_message(
-                "정보: Harvard API에서 비어있는 응답을 받았습니다.", level="INFO"
+                f"경고: Harvard {offset + 1}번째 레코드부터의 페이지 수신 실패: {error}",
+                level="WARNING",
             )
-            return []
 
-        root = ET.fromstring(response.content)
-        ns = {"mods": "http://www.loc.gov/mods/v3"}
+        paging = PagedSearch(
+            fetch_page,
+            page_size=HARVARD_PAGE_SIZE,
+            host=HARVARD_HOST,
+            budget=result_budget(app_instance),
+            # HOLLIS 영구 링크가 레코드 ID 역할
+            record_key=lambda record: record.get("상세 링크"),
+            on_page=deliver_page if on_page else None,
+            should_stop=stop_checker(app_instance),
+            on_error=log_page_error,
+        )
+        all_results = paging.run()
+        app_instance.log_message(
+            f"정보: Harvard 전체 {paging.total or 0}건 중 {len(all_results)}건 수신 "
+            f"({paging.pages_fetched}페이지{', 결과 예산 도달' if paging.truncated else ''})",
+            level="INFO",
+        )
 
-        mods_records = root.findall(".//mods:mods", ns)
-        if not mods_records:
+        if not all_results:
             app_instance.log_message(
                 "정보: Harvard 검색 결과가 없습니다 (mods 레코드 없음).", level="INFO"
             )
             return []
 
-        all_results = []
-        for record_xml in mods_records:
-            parsed = _parse_harvard_record(record_xml, ns, app_instance)
-            if parsed:
-                all_results.append(parsed)
-
         # 주제어 일괄 번역
         # ===== 🆕 설정 확인 후 번역 실행 =====
         if all_results and app_instance and _should_auto_translate(app_instance):
@@ -231,9 +271,9 @@ def search_harvard_library(
                 if s
             )
             if all_unique_subjects:
-                custom_glossary = db_manager.get_all_custom_translations()
+                # ✅ [성능 개선] 용어집 전체 재적재 대신 번역 메모리 (묶음 원격 번역)
                 translation_map = translate_text_batch_async(
-                    list(all_unique_subjects), app_instance, custom_glossary, db_manager
+                    list(all_unique_subjects), app_instance, None, db_manager
                 )
                 for record in all_results:
                     raw_subjects = record.get("주제어_원문", [])
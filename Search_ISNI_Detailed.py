@@ -1,18 +1,21 @@
 # -*- coding: utf-8 -*-
-# Version: v1.0.9
-# 수정일시: 2025-08-04 13:10 KST (SyntaxError 발생 로직 원상복구 및 컬럼 순서 재조정)
+# Version: v1.1.0
+# 수정일시: 2025-10-31 KST (페이지 요청 적응형 동시성(AIMD) + 지터 재시도 + 페이지 스트리밍 + 페이지 캐시)
+# v1.0.9: 2025-08-04 13:10 KST (SyntaxError 발생 로직 원상복구 및 컬럼 순서 재조정)
 
 import requests  # requests는 여전히 필요하지만, 직접적인 get 호출은 fetch_content로 대체
 import json
 import re
 import pandas as pd
-from concurrent.futures import ThreadPoolExecutor
 import urllib.parse
-import time  # 요청 간 딜레이를 위해 추가
-from bs4 import BeautifulSoup  # ❗ BeautifulSoup 임포트 추가
+from lazy_imports import lazy_attr
+BeautifulSoup = lazy_attr("bs4", "BeautifulSoup")  # ✅ [성능 개선] 첫 파싱 때 import
 
 # ❗ 추가: api_clients 모듈에서 필요한 함수 임포트
 from qt_api_clients import fetch_content
+from adaptive_fetch import AdaptivePageFetcher, AIMDController
+from search_cache import PersistentLRUCache
+from sru_paging import stop_checker
 
 # API 기본 URL
 BASE_API_URL = "https://www.nl.go.kr/isni/search/detail/selectDetail"
@@ -53,10 +56,56 @@ COMMON_PARAMS = {
 #     'sec-ch-ua-platform': '"Windows"'
 # }
 
-# 캐시를 위한 딕셔너리 (간단한 인메모리 캐시)
-# 실제 앱에서는 SQLite 또는 파일 기반 캐시를 고려할 수 있습니다.
+# ✅ [성능 개선] 페이지 요청 적응형 동시성 (AIMD) 설정
+ISNI_INITIAL_WORKERS = 3
+ISNI_MAX_WORKERS = 10
+ISNI_TARGET_LATENCY = 3.0  # 이보다 느린 응답은 혼잡으로 보고 동시 요청 수를 줄임 (초)
+ISNI_PAGE_RETRIES = 3
+ISNI_PAGE_TIMEOUT = 15
+
+# 결과 컬럼 (_extract_resource_data의 행 순서와 동일)
+RESULT_HEADERS = [
+    "TITLE",
+    "ITITLE",
+    "AUTHOR (Main)",
+    "OFF_AUTHOR_LIST (공저자명 (KAC코드))",
+    "PUBLISHER",
+    "PUBLISH_YEAR",
+    "SUBJECT_INFO",
+    "KDC",
+    "KDC_CLASS_NO",
+    "LANGUAGE",
+    "IMAGE_URL",
+    "CONTROL_NO",
+    "EBOOK_YN",
+    "JOIN_TYPE",
+    "REC_KEY",
+    "AC_CONTROL_NO (Main)",
+    "MANAGE_CODE",
+    "OFFER_DBCODE_1S",
+    "RNUM",
+    "TYPE_CODE",
+    "ID",
+    "NOT_IMAGE",
+    "INFO_CODE",
+    "IS_MA",
+    "SHAPE_NAME",
+]
+
+# 캐시를 위한 딕셔너리 (간단한 인메모리 캐시, 완전한 결과만 저장)
 _cache = {}
 
+# ✅ [성능 개선] 저자(KAC)·총건수·페이지별 결과 영구 캐시 (search_cache.db, TTL 3일)
+_page_cache = PersistentLRUCache(
+    "isni_works_pages",
+    max_bytes=32 * 1024 * 1024,
+    ttl_sec=3 * 24 * 3600,
+    memory_items=2000,
+)
+
+# 페이지 요청용 공유 세션 (연결 재사용, 풀 크기 = 최대 동시 요청 수)
+_session = None
+
 
 def _build_url(base_url, params):
     """
@@ -261,85 +310,71 @@ def _extract_resource_data(resource):
     return row
 
 
-def _fetch_page_data(
-    session, url, app_instance=None, page_num=1, total_pages=1, delay_sec=0.0
-):
-    """
-    단일 페이지의 데이터를 가져오고 파싱합니다.
-    Args:
-        session (requests.Session): HTTP 세션 객체.
-        url (str): 요청할 URL.
-        app_instance (object, optional): GUI 애플리케이션 인스턴스 (로그 및 진행도 업데이트용).
-        page_num (int): 현재 페이지 번호.
-        total_pages (int): 전체 페이지 수 (진행률 계산용).
-    Returns:
-        list: 추출된 리소스 데이터 리스트, 또는 빈 리스트.
-    """
-    extracted_resources = []
-    try:
-        if app_instance and app_instance.stop_search_flag.is_set():
-            app_instance.log_message(
-                f"정보: 페이지 {page_num} 요청 전 중단되었습니다.", level="INFO"
-            )
-            return []
-
-        # ❗ 수정: requests.get 대신 fetch_content 사용
-        response_text = fetch_content(
-            url, f"ISNI 상세 페이지 {page_num}", app_instance, accept_header="text/html"
-        )
+class ISNIPageError(Exception):
+    """페이지 응답에서 RESOURCE_LIST JSON을 찾지 못함 (차단/오류 페이지) - 재시도 대상"""
 
-        if response_text is None:  # fetch_content에서 오류 처리되었거나 중단된 경우
-            if app_instance:
-                app_instance.log_message(
-                    f"오류: 페이지 {page_num} HTML 콘텐츠를 가져오지 못했습니다.",
-                    level="ERROR",
-                )
-            return []
+    pass
 
-        json_data = _extract_json_from_response_text(response_text)
 
-        if (
-            json_data
-            and json_data.get("RESOURCE_LIST")
-            and isinstance(json_data["RESOURCE_LIST"], list)
-        ):
-            for resource in json_data["RESOURCE_LIST"]:
-                extracted_resources.append(_extract_resource_data(resource))
-            if app_instance:
-                app_instance.log_message(
-                    f"페이지 {page_num}에서 {len(json_data['RESOURCE_LIST'])}개 자료 추출 완료.",
-                    level="INFO",
-                )
-        else:
-            if app_instance:
-                app_instance.log_message(
-                    f"페이지 {page_num}에서 'RESOURCE_LIST'를 찾을 수 없거나 비어 있습니다.",
-                    level="INFO",
-                )
+def _get_session():
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=2, pool_maxsize=ISNI_MAX_WORKERS, max_retries=0
+        )
+        _session.mount("https://", adapter)
+        _session.headers.update(
+            {
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                "Accept": "text/html",
+            }
+        )
+    return _session
 
-        if app_instance:
-            # 진행률 업데이트 (첫 페이지에서 total_pages를 확정하므로, 여기서는 page_num만으로 계산)
-            progress = int((page_num / total_pages) * 100)
-            app_instance.update_progress(progress)
 
-    except requests.exceptions.RequestException as e:
-        if app_instance:
-            app_instance.log_message(
-                f"오류: 페이지 {page_num} 요청 실패: {e}", level="ERROR"
-            )
-    except Exception as e:
-        if app_instance:
-            app_instance.log_message(
-                f"오류: 페이지 {page_num} 처리 중 예기치 않은 오류: {e}", level="ERROR"
-            )
+def _is_retryable(exc):
+    """429/5xx, 연결 오류, 오류 페이지는 재시도. 그 밖의 4xx는 재시도해도 같은 결과."""
+    if isinstance(exc, requests.exceptions.HTTPError) and exc.response is not None:
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, (requests.exceptions.RequestException, ISNIPageError))
 
-    # Adaptive pacing: delay_sec > 0일 때만 동적으로 sleep
-    if delay_sec and delay_sec > 0:
-        time.sleep(delay_sec)
-    return extracted_resources
 
+def _fetch_page_rows(url):
+    """
+    단일 페이지를 요청해 행 목록으로 반환합니다.
+    오류는 예외로 올려 AdaptivePageFetcher가 동시성 조절과 재시도를 하도록 합니다.
+    Args:
+        url (str): 요청할 URL.
+    Returns:
+        list: 추출된 리소스 데이터 리스트.
+    """
+    response = _get_session().get(url, allow_redirects=True, timeout=ISNI_PAGE_TIMEOUT)
+    response.raise_for_status()
+    json_data = _extract_json_from_response_text(response.text)
+    if json_data is None:
+        raise ISNIPageError("응답에서 RESOURCE_LIST JSON을 찾지 못했습니다.")
+    resources = json_data.get("RESOURCE_LIST")
+    if not isinstance(resources, list):
+        return []
+    return [_extract_resource_data(resource) for resource in resources]
+
+
+def scrape_isni_detailed_full_data(ac_control_no, app_instance=None, on_page=None):
+    """
+    KAC 코드의 상세 저작물 목록을 모든 페이지에서 수집합니다.
 
-def scrape_isni_detailed_full_data(ac_control_no, app_instance=None):
+    ✅ [성능 개선] 고정 10개 스레드 대신 AdaptivePageFetcher(AIMD)로 동시 요청 수를 서버 응답에
+    맞춰 조절하고, 실패 페이지는 지터를 두고 재시도합니다. 페이지 결과는 저자·총건수별로
+    search_cache.db에 저장(TTL)되며, 도착한 페이지는 on_page로 완료 순서대로 전달됩니다.
+    Args:
+        ac_control_no (str): KAC 코드.
+        app_instance (object, optional): GUI 애플리케이션 인스턴스.
+        on_page (callable, optional): 페이지가 도착할 때마다 레코드(dict) 목록을 받는 콜백.
+    Returns:
+        pd.DataFrame: 페이지 순서대로 모은 저작물 목록.
+    """
     if not ac_control_no:
         if app_instance:
             app_instance.log_message("오류: KAC 코드가 없습니다.", level="ERROR")
@@ -381,80 +416,96 @@ def scrape_isni_detailed_full_data(ac_control_no, app_instance=None):
         PAGE_SIZE = 10
         total_pages = max(1, (total_cnt + PAGE_SIZE - 1) // PAGE_SIZE)
 
+        def page_url(page):
+            # total_cnt와 함께 rec_key를 제거하여 안정성 확보
+            params = {
+                **COMMON_PARAMS,
+                "page": page,
+                "ac_control_no": ac_control_no,
+                "total_cnt": total_cnt,
+            }
+            params.pop("rec_key", None)
+            return _build_url(BASE_API_URL, params)
+
+        def deliver(page, rows):
+            if on_page is not None and rows:
+                on_page([dict(zip(RESULT_HEADERS, row)) for row in rows])
+            if app_instance:
+                done = len(page_rows) + len(fetcher.results) if fetcher else len(page_rows)
+                app_instance.update_progress(10 + int(done / total_pages * 90))
+
+        # 2. 캐시된 페이지 먼저 (총건수가 바뀌면 페이지 경계가 달라지므로 키에 포함)
+        page_keys = {
+            page: f"{ac_control_no}:{total_cnt}:{page}" for page in range(1, total_pages + 1)
+        }
+        cached = _page_cache.get_many(list(page_keys.values()))
+        page_rows = {
+            page: cached[key] for page, key in page_keys.items() if key in cached
+        }
+        fetcher = None
+        for page in sorted(page_rows):
+            deliver(page, page_rows[page])
+        missing_pages = [page for page in page_keys if page not in page_rows]
+
         if app_instance:
             app_instance.log_message(
-                f"정보: 총 {total_pages} 페이지, {total_cnt}개 저작물 확인. 병렬 요청 시작.",
+                f"정보: 총 {total_pages} 페이지, {total_cnt}개 저작물 확인. "
+                f"캐시 {len(page_rows)} 페이지, 요청 {len(missing_pages)} 페이지.",
                 level="INFO",
             )
             app_instance.update_progress(10)
 
-        # 2. 알아낸 total_cnt를 사용하여 모든 페이지 병렬 요청
-        all_rows = []
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = []
-            for page in range(1, total_pages + 1):
-                if app_instance and app_instance.stop_search_flag.is_set():
-                    break
-
-                # total_cnt와 함께 rec_key를 제거하여 안정성 확보
-                params = {
-                    **COMMON_PARAMS,
-                    "page": page,
-                    "ac_control_no": ac_control_no,
-                    "total_cnt": total_cnt,
-                }
-                if "rec_key" in params:
-                    del params["rec_key"]
-
-                page_url = _build_url(BASE_API_URL, params)
-                futures.append(
-                    executor.submit(_fetch_page_data, None, page_url, app_instance)
-                )
+        # 3. 나머지 페이지를 적응형 동시성으로 요청
+        failed_pages = []
+        if missing_pages:
 
-            for i, future in enumerate(futures):
-                if app_instance and app_instance.stop_search_flag.is_set():
-                    break
-                all_rows.extend(future.result())
+            def report_failure(page, exc):
+                failed_pages.append(page)
                 if app_instance:
-                    app_instance.update_progress(
-                        int(((i + 1) / total_pages) * 100)
+                    app_instance.log_message(
+                        f"오류: 페이지 {page} 요청 실패 (재시도 소진): {exc}",
+                        level="ERROR",
                     )
 
-        headers = [
-            "TITLE",
-            "ITITLE",
-            "AUTHOR (Main)",
-            "OFF_AUTHOR_LIST (공저자명 (KAC코드))",
-            "PUBLISHER",
-            "PUBLISH_YEAR",
-            "SUBJECT_INFO",
-            "KDC",
-            "KDC_CLASS_NO",
-            "LANGUAGE",
-            "IMAGE_URL",
-            "CONTROL_NO",
-            "EBOOK_YN",
-            "JOIN_TYPE",
-            "REC_KEY",
-            "AC_CONTROL_NO (Main)",
-            "MANAGE_CODE",
-            "OFFER_DBCODE_1S",
-            "RNUM",
-            "TYPE_CODE",
-            "ID",
-            "NOT_IMAGE",
-            "INFO_CODE",
-            "IS_MA",
-            "SHAPE_NAME",
-        ]
-
-        df = pd.DataFrame(all_rows, columns=headers)
+            fetcher = AdaptivePageFetcher(
+                lambda page: _fetch_page_rows(page_url(page)),
+                missing_pages,
+                controller=AIMDController(
+                    initial=ISNI_INITIAL_WORKERS,
+                    maximum=ISNI_MAX_WORKERS,
+                    target_latency=ISNI_TARGET_LATENCY,
+                ),
+                max_retries=ISNI_PAGE_RETRIES,
+                is_retryable=_is_retryable,
+                on_page=deliver,
+                on_error=report_failure,
+                should_stop=stop_checker(app_instance),
+                thread_name_prefix="ISNIPages",
+            )
+            fetched = fetcher.run()
+            _page_cache.put_many({page_keys[page]: rows for page, rows in fetched.items()})
+            page_rows.update(fetched)
+
+            if app_instance:
+                app_instance.log_message(
+                    f"정보: 페이지 요청 완료 - 최대 동시 {fetcher.peak_concurrency}개, "
+                    f"재시도 {fetcher.retries}회, 실패 {len(failed_pages)} 페이지.",
+                    level="INFO",
+                )
+
+        all_rows = []
+        for page in sorted(page_rows):
+            all_rows.extend(page_rows[page])
+
+        df = pd.DataFrame(all_rows, columns=RESULT_HEADERS)
         if app_instance:
             app_instance.log_message(
                 f"정보: 총 {len(df)}개 자료 추출 완료.", level="INFO"
             )
 
-        _cache[cache_key] = df
+        # 일부 페이지가 빠졌거나 중지된 결과는 세션 캐시에 두지 않음
+        if not failed_pages and not (fetcher and fetcher.stopped_by_user):
+            _cache[cache_key] = df
         return df
 
     except Exception as e:
@@ -1,6 +1,8 @@
 ﻿# -*- coding: utf-8 -*-
-# Version: v1.0.1
-# 수정일시: 2025-08-04 15:20 KST (저작물 목록 링크 URL 형식 수정)
+# Version: v1.1.1
+# 수정일시: 2025-10-31 KST (PoliteRateLimiter를 librarian_rate_limit.py로 이동 - KSH Lite와 공유)
+# v1.1.0: 2025-10-31 KST (페이지 파이프라인 + 적응형 요청 간격 + lxml 파서 + KAC 코드별 영구 캐시)
+# v1.0.1: 2025-08-04 15:20 KST (저작물 목록 링크 URL 형식 수정)
 
 # ✅ [추가] PyInstaller 환경에서 SSL 인증서 경로 설정
 from ssl_cert_utils import configure_ssl_certificates
@@ -9,11 +11,18 @@ configure_ssl_certificates()
 import requests
 import json
 import re
+import importlib.util
+import threading
 import pandas as pd
-from bs4 import BeautifulSoup  # HTML 파싱을 위해 BeautifulSoup 사용
+from lazy_imports import lazy_attr
+BeautifulSoup = lazy_attr("bs4", "BeautifulSoup")  # ✅ [성능 개선] 첫 파싱 때 import
+SoupStrainer = lazy_attr("bs4", "SoupStrainer")
 import urllib.parse
 import time
 from concurrent.futures import ThreadPoolExecutor
+from search_cache import PersistentLRUCache
+from sru_paging import stop_checker
+from librarian_rate_limit import RETRYABLE_STATUS, librarian_limiter, retry_after
 
 # 국립중앙도서관 인명 상세 검색 URL
 SEARCH_KAC_BASE_URL = "https://librarian.nl.go.kr/LI/contents/L20101000000.do"
@@ -32,8 +41,32 @@ DEFAULT_HEADERS = {
     "Upgrade-Insecure-Requests": "1",
 }
 
-# 캐시를 위한 딕셔너리 (간단한 인메모리 캐시)
-_cache = {}
+# ✅ [성능 개선] 페이지 목록 HTML 파서: lxml이 설치되어 있으면 lxml (html.parser보다 수 배 빠름)
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+KAC_PAGE_SIZE = 1000  # GAS 코드와 동일한 페이지당 아이템 수
+KAC_FETCH_RETRIES = 2  # 429/5xx 응답 시 간격을 늘려 재시도하는 횟수
+_SECTION_RE = re.compile(r'class="[^"]*\btable_bd\b')
+
+# ✅ [성능 개선] 모듈 전역 dict(검색어별 DataFrame, 무제한, 재시작 시 소실) →
+# search_cache.db의 2단 LRU 캐시
+# - kac_person: 제어번호(KAC 코드) → 파싱된 인명 행 (다른 검색어로 찾은 인명도 코드 검색 시 재사용)
+# - kac_search: 검색어 → 결과 제어번호 목록 (같은 검색 반복 시 네트워크 없이 결과 구성)
+_person_cache = PersistentLRUCache(
+    "kac_person",
+    max_bytes=32 * 1024 * 1024,
+    ttl_sec=7 * 24 * 3600,
+    memory_items=5000,
+)
+_search_cache = PersistentLRUCache(
+    "kac_search",
+    max_bytes=4 * 1024 * 1024,
+    ttl_sec=24 * 3600,
+    memory_items=500,
+)
+
+
+# KSH Lite(Search_KSH_Lite)도 같은 호스트에 요청하므로 같은 제한기를 공유
+_rate_limiter = librarian_limiter
 
 
 def strip_html_tags_and_trim(html_string):
@@ -46,6 +79,9 @@ def strip_html_tags_and_trim(html_string):
     """
     if not html_string:
         return ""
+    # ✅ [성능 개선] 태그/엔티티가 없는 일반 텍스트(get_text() 결과)는 파서를 거치지 않음
+    if "<" not in html_string and "&" not in html_string:
+        return re.sub(r"\s+", " ", html_string).strip()
     # BeautifulSoup을 사용하여 태그 제거
     soup = BeautifulSoup(html_string, "html.parser")
     text = soup.get_text()
@@ -99,8 +135,13 @@ def get_person_sections(html_content):
     Returns:
         list: 각 인명에 대한 BeautifulSoup 태그 객체 리스트.
     """
-    soup = BeautifulSoup(html_content, "html.parser")
     # 각 인명 데이터는 <div class="table_bd"> 로 시작합니다.
+    # ✅ [성능 개선] SoupStrainer로 인명 섹션만 트리로 만들고 (메뉴/스크립트 등 제외), lxml 우선
+    soup = BeautifulSoup(
+        html_content,
+        HTML_PARSER,
+        parse_only=SoupStrainer("div", attrs={"class": "table_bd"}),
+    )
     # find_all을 사용하여 모든 섹션을 찾습니다.
     person_sections = soup.find_all("div", class_="table_bd")
     return person_sections
@@ -316,9 +357,112 @@ def parse_person_section(person_html_soup, person_index, app_instance=None):
     ]
 
 
+# 헤더 정의 (GAS 코드의 saveToCurrentSheet 함수에서 정의된 순서와 일치)
+RESULT_HEADERS = [
+    "이름",
+    "ISNI",
+    "제어번호",
+    "직업",
+    "생몰년",
+    "활동분야",
+    "전체 저작물",
+    "국립중앙도서관 리소스 수",  # GUI 키와 일치
+    "관련 기관",
+    "최근 저작물",
+    "지역",
+    "기관명",
+    "상세페이지 링크",
+    "저작물 목록 링크",
+    "성별",
+    "국가",
+    "기관 코드",
+    "로마자 이름",
+    "한자 이름",
+    "조직 제어번호",
+    "등록 상태",
+    "전체 ISNI 리소스 수",  # GUI 키와 일치
+    "ISNI 발급일",
+]
+CONTROL_NO_INDEX = RESULT_HEADERS.index("제어번호")
+
+
+def build_result_dataframe(all_person_data):
+    """parse_person_section 결과 행 목록을 GUI 컬럼명의 DataFrame으로 만듭니다."""
+    df = pd.DataFrame(all_person_data, columns=RESULT_HEADERS)
+
+    # -------------------
+    # ✅ [핵심 수정] GUI column_map의 key와 일치하도록 컬럼명을 명시적으로 변경 (rename)
+    # GUI에서 사용하는 key: "NLK 리소스"와 "ISNI 리소스"
+
+    # 'NLK 리소스'는 GUI에서 사용하는 이름이므로, DataFrame 컬럼 이름을 GUI 키와 일치시킵니다.
+    df.rename(
+        columns={
+            "국립중앙도서관 리소스 수": "NLK 리소스",
+            "전체 ISNI 리소스 수": "ISNI 리소스",
+            "상세페이지 링크": "상세 링크",
+            "저작물 목록 링크": "저작물 목록 링크",
+        },
+        inplace=True,
+    )
+    # -------------------
+    return df
+
+
+def _load_cached_rows(search_key, kac_code=None):
+    """캐시만으로 결과를 만들 수 있으면 행 목록, 아니면 None."""
+    if kac_code:
+        row = _person_cache.get(kac_code)
+        if row is not None:
+            return [row]
+    codes = _search_cache.get(search_key)
+    if not codes:
+        return None
+    persons = _person_cache.get_many(codes)
+    if len(persons) < len(set(codes)):
+        return None  # 일부 인명 항목이 만료/삭제됨 → 네트워크로 다시
+    return [persons[code] for code in codes]
+
+
+def _store_rows(search_key, rows):
+    """인명 행을 제어번호별로, 검색어 → 제어번호 목록을 검색어별로 저장합니다."""
+    by_code = {
+        row[CONTROL_NO_INDEX]: row for row in rows if row[CONTROL_NO_INDEX]
+    }
+    _person_cache.put_many(by_code)
+    if rows and len(by_code) == len(rows):
+        # 제어번호가 없는 행이 섞여 있으면 검색어 캐시로 재구성할 수 없으므로 저장하지 않음
+        _search_cache.put(search_key, [row[CONTROL_NO_INDEX] for row in rows])
+
+
+def _fetch_page(session, base_params, page, should_stop):
+    """검색 결과 한 페이지 HTML을 받습니다 (중지 요청 시 None).
+
+    요청 간격은 공용 PoliteRateLimiter가 정하고, 429/5xx 응답은 간격을 늘려 재시도합니다.
+    """
+    params = base_params.copy()
+    params["page"] = page
+    url = build_url(SEARCH_KAC_BASE_URL, params)
+    for attempt in range(KAC_FETCH_RETRIES + 1):
+        if not _rate_limiter.acquire(should_stop):
+            return None
+        started = time.monotonic()
+        response = session.get(url, headers=DEFAULT_HEADERS, timeout=15)
+        if response.status_code in RETRYABLE_STATUS and attempt < KAC_FETCH_RETRIES:
+            _rate_limiter.record_throttle(retry_after(response))
+            continue
+        response.raise_for_status()  # HTTP 오류 발생 시 예외 발생
+        _rate_limiter.record_success(time.monotonic() - started)
+        return response.text
+    return None
+
+
 def run_full_extraction(search_term, app_instance=None):
     """
     주어진 검색어로 국립중앙도서관 웹사이트에서 인명 데이터를 추출합니다.
+
+    ✅ [성능 개선] 페이지 N을 파싱하는 동안 페이지 N+1을 미리 요청하고 (파이프라인),
+    요청 간격은 고정 0.5초 대신 PoliteRateLimiter가 응답 상태에 맞춰 조절합니다.
+    파싱한 인명은 제어번호별로 search_cache.db에 저장되어 반복 검색은 네트워크 없이 반환됩니다.
     Args:
         search_term (str): 검색할 인명 또는 KAC 코드.
         app_instance (object, optional): GUI 애플리케이션 인스턴스 (로그 및 진행도 업데이트용).
@@ -330,14 +474,26 @@ def run_full_extraction(search_term, app_instance=None):
             app_instance.log_message("오류: 유효한 검색어가 없습니다.", level="ERROR")
         return pd.DataFrame()
 
-    cache_key = f"KAC_PERSON_SEARCH_{search_term}"
-    if cache_key in _cache:
+    search_term = search_term.strip()
+
+    # -------------------
+    # KAC 코드와 일반 이름 검색 구분 (한 번만 실행)
+    if search_term.upper().startswith("KAC") and len(search_term) >= 8:
+        # KAC로 시작하는 경우에만 정규식 체크
+        is_kac_code = bool(re.match(r"^KAC[A-Z0-9]+$", search_term.upper()))
+    else:
+        # KAC로 시작하지 않으면 바로 일반 이름으로 처리
+        is_kac_code = False
+
+    search_key = search_term.upper() if is_kac_code else search_term
+    cached_rows = _load_cached_rows(search_key, search_key if is_kac_code else None)
+    if cached_rows is not None:
         if app_instance:
             app_instance.log_message(
                 f"정보: 검색어 '{search_term}'에 대한 데이터가 캐시에서 로드되었습니다.",
                 level="INFO",
             )
-        return _cache[cache_key]
+        return build_result_dataframe(cached_rows)
 
     if app_instance:
         app_instance.log_message(
@@ -345,24 +501,10 @@ def run_full_extraction(search_term, app_instance=None):
         )
         app_instance.update_progress(0)
 
-    all_person_data = []
-    page = 1
-    page_size = 1000  # GAS 코드와 동일한 페이지당 아이템 수
-    session = requests.Session()  # 세션 유지
-
-    # -------------------
-    # KAC 코드와 일반 이름 검색 구분 (한 번만 실행)
-    if search_term.upper().startswith("KAC") and len(search_term) >= 8:
-        # KAC로 시작하는 경우에만 정규식 체크
-        is_kac_code = bool(re.match(r"^KAC[A-Z0-9]+$", search_term.upper()))
-    else:
-        # KAC로 시작하지 않으면 바로 일반 이름으로 처리
-        is_kac_code = False
-
     if is_kac_code:
         # KAC 코드 검색
         val_param = ""
-        detail_ac_control_no = search_term.upper()
+        detail_ac_control_no = search_key
         if app_instance:
             app_instance.log_message(
                 f"정보: KAC 코드 검색 모드 - {detail_ac_control_no}",
@@ -378,6 +520,15 @@ def run_full_extraction(search_term, app_instance=None):
             )
     # -------------------
 
+    all_person_data = []
+    page = 1
+    page_size = KAC_PAGE_SIZE
+    completed = False  # 중지/오류 없이 마지막 페이지까지 받았는지 (검색어 캐시 저장 조건)
+    should_stop = stop_checker(app_instance)
+    session = requests.Session()  # 세션 유지
+    # 다음 페이지를 미리 받는 작업자 1개 (페이지 요청은 항상 한 번에 하나)
+    prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="KACPrefetch")
+
     base_params = {
         "searchType": "detail",
         "pageSize": page_size,
@@ -401,8 +552,11 @@ def run_full_extraction(search_term, app_instance=None):
     # -------------------
 
     try:
+        pending_page = prefetcher.submit(
+            _fetch_page, session, base_params, page, should_stop
+        )
         while True:
-            if app_instance and app_instance.stop_search_flag.is_set():
+            if should_stop():
                 app_instance.log_message(
                     "정보: 검색 중단 요청 수신. 현재까지의 결과 반환.", level="INFO"
                 )
@@ -413,15 +567,8 @@ def run_full_extraction(search_term, app_instance=None):
                     f"정보: 페이지 {page} 처리 중...", level="INFO"
                 )
 
-            # 페이지만 업데이트하고 복사
-            params = base_params.copy()
-            params["page"] = page
-            url = build_url(SEARCH_KAC_BASE_URL, params)
-
             try:
-                response = session.get(url, headers=DEFAULT_HEADERS, timeout=15)
-                response.raise_for_status()  # HTTP 오류 발생 시 예외 발생
-                html_content = response.text
+                html_content = pending_page.result()
             except requests.exceptions.RequestException as e:
                 if app_instance:
                     app_instance.log_message(
@@ -433,6 +580,16 @@ def run_full_extraction(search_term, app_instance=None):
                         "error",
                     )
                 break  # 오류 발생 시 루프 종료
+            if html_content is None:
+                break  # 요청 대기 중 중지 요청
+
+            # ✅ [성능 개선] 섹션 수만 빠르게 세어 꽉 찬 페이지면 다음 페이지를 먼저 요청
+            # (다운로드와 아래 파싱이 겹침)
+            pending_page = None
+            if len(_SECTION_RE.findall(html_content)) >= page_size:
+                pending_page = prefetcher.submit(
+                    _fetch_page, session, base_params, page + 1, should_stop
+                )
 
             person_sections = get_person_sections(html_content)
 
@@ -441,10 +598,11 @@ def run_full_extraction(search_term, app_instance=None):
                     app_instance.log_message(
                         "정보: 더 이상 인명 데이터를 찾을 수 없습니다.", level="INFO"
                     )
+                completed = True
                 break  # 더 이상 데이터가 없으면 루프 종료
 
             for i, person_html_soup in enumerate(person_sections):
-                if app_instance and app_instance.stop_search_flag.is_set():
+                if should_stop():
                     app_instance.log_message(
                         "정보: 검색 중단 요청 수신. 현재까지의 결과 반환.", level="INFO"
                     )
@@ -454,16 +612,19 @@ def run_full_extraction(search_term, app_instance=None):
                 )
                 all_person_data.append(person_data)
 
-            if app_instance and app_instance.stop_search_flag.is_set():
+            if should_stop():
                 break  # 내부 루프에서 중단 요청 시 외부 루프도 종료
 
             # 다음 페이지가 있는지 확인 (현재 페이지에 pageSize 미만이면 마지막 페이지로 간주)
             if len(person_sections) < page_size:
+                completed = True
                 break
-            else:
-                page += 1
-
-            time.sleep(0.5)  # 서버 부하 방지를 위한 딜레이 (500ms)
+            if pending_page is None:
+                # 섹션 수 추정이 빗나간 경우: 이제 요청
+                pending_page = prefetcher.submit(
+                    _fetch_page, session, base_params, page + 1, should_stop
+                )
+            page += 1
 
             if app_instance:
                 # 대략적인 진행률 업데이트 (페이지 수 기반)
@@ -479,53 +640,17 @@ def run_full_extraction(search_term, app_instance=None):
             )
             app_instance.update_progress(100)
 
-        # 헤더 정의 (GAS 코드의 saveToCurrentSheet 함수에서 정의된 순서와 일치)
-        headers = [
-            "이름",
-            "ISNI",
-            "제어번호",
-            "직업",
-            "생몰년",
-            "활동분야",
-            "전체 저작물",
-            "국립중앙도서관 리소스 수",  # GUI 키와 일치
-            "관련 기관",
-            "최근 저작물",
-            "지역",
-            "기관명",
-            "상세페이지 링크",
-            "저작물 목록 링크",
-            "성별",
-            "국가",
-            "기관 코드",
-            "로마자 이름",
-            "한자 이름",
-            "조직 제어번호",
-            "등록 상태",
-            "전체 ISNI 리소스 수",  # GUI 키와 일치
-            "ISNI 발급일",
-        ]
-        df = pd.DataFrame(all_person_data, columns=headers)
-
-        # -------------------
-        # ✅ [핵심 수정] GUI column_map의 key와 일치하도록 컬럼명을 명시적으로 변경 (rename)
-        # GUI에서 사용하는 key: "NLK 리소스"와 "ISNI 리소스"
-
-        # 'NLK 리소스'는 GUI에서 사용하는 이름이므로, DataFrame 컬럼 이름을 GUI 키와 일치시킵니다.
-        df.rename(
-            columns={
-                "국립중앙도서관 리소스 수": "NLK 리소스",
-                "전체 ISNI 리소스 수": "ISNI 리소스",
-                "상세페이지 링크": "상세 링크",
-                "저작물 목록 링크": "저작물 목록 링크",
-            },
-            inplace=True,
-        )
-        # -------------------
-
-        # 캐시에 저장
-        _cache[cache_key] = df
-        return df
+        if completed:
+            _store_rows(search_key, all_person_data)
+        else:
+            _person_cache.put_many(
+                {
+                    row[CONTROL_NO_INDEX]: row
+                    for row in all_person_data
+                    if row[CONTROL_NO_INDEX]
+                }
+            )
+        return build_result_dataframe(all_person_data)
 
     except Exception as e:
         error_message = f"KAC 인명 검색 중 예기치 않은 오류 발생: {e}"
@@ -538,6 +663,8 @@ def run_full_extraction(search_term, app_instance=None):
             )
         return pd.DataFrame()
     finally:
+        # 중지/오류로 끝났으면 미리 요청한 페이지는 기다리지 않음
+        prefetcher.shutdown(wait=False, cancel_futures=True)
         session.close()  # 세션 종료
         if app_instance:
             app_instance.update_progress(100)
@@ -546,12 +673,17 @@ def run_full_extraction(search_term, app_instance=None):
 def run_multiple_kac_search(search_terms, app_instance=None):
     """
     복수의 검색어로 KAC 인명 데이터를 병렬 검색하여 통합 결과를 반환합니다.
+    (요청 간격은 검색어들이 공용 PoliteRateLimiter를 함께 쓰므로 동시 검색해도 유지됩니다.)
     Args:
         search_terms (list): 검색할 인명 또는 KAC 코드 리스트.
         app_instance (object, optional): GUI 애플리케이션 인스턴스.
     Returns:
         pd.DataFrame: 통합된 검색 결과 DataFrame.
     """
+    # ✅ [성능 개선] 같은 검색어를 두 번 요청하지 않음 (순서 유지)
+    search_terms = list(
+        dict.fromkeys(term.strip() for term in search_terms or [] if term and term.strip())
+    )
     if not search_terms:
         if app_instance:
             app_instance.log_message(
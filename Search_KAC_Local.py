@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+# 파일명: Search_KAC_Local.py
+# 설명: 로컬 전거 DB(NLK_Authorities.sqlite) 우선 KAC 인명 검색 + 네트워크 폴백
+# 생성일: 2025-10-31
+# 사용처: search_orchestrator.py (저자전거 검색 탭)
+#
+# 배경:
+# - 저자전거 검색 탭은 build_kac_authority_and_biblio_db.py로 구축한 로컬 전거 DB
+#   (authority / authority_altlabel / authority_fts)가 있어도 매번
+#   librarian.nl.go.kr을 스크레이핑했다 (검색어당 수 초, 서버 부하).
+#
+# 방식:
+# 1. KAC 코드는 authority.kac_id 색인으로, 이름은 authority_fts(이름/대표명/레이블/이형명)
+#    MATCH로 찾고, 직업/활동분야/이형명(로마자·한자 이름)은 보조 테이블에서 채움.
+# 2. 저작물은 nlk_biblio.sqlite의 biblio_title_fts kac_codes 조인으로
+#    저작물 수와 최근 저작물을 채움 (DB가 없으면 authority_create 건수만).
+# 3. 로컬에 없는 KAC 코드 / 결과 없는 이름만 Search_KAC_Authorities(네트워크)로 검색.
+#    전거 DB 스냅샷이 설정(kac_local_max_age_days)보다 오래되면 전부 네트워크로 검색.
+# 4. 결과 컬럼은 Search_KAC_Authorities.build_result_dataframe과 동일.
+#
+#     df = search_kac_local_first(["홍길동", "KAC200702805"], app_instance, db_manager)
+
+import os
+import re
+import sqlite3
+import time
+
+import pandas as pd
+
+from Search_KAC_Authorities import (
+    KAC_BASE_URL,
+    build_result_dataframe,
+    run_full_extraction,
+    run_multiple_kac_search,
+)
+
+LOCAL_MAX_AGE_SETTING = "kac_local_max_age_days"
+DEFAULT_LOCAL_MAX_AGE_DAYS = 120  # 전거 DB는 2개월 주기 스냅샷
+LOCAL_RESULT_LIMIT = 500  # 이름 검색 1건당 최대 인명 수
+WORKS_LOOKUP_LIMIT = 200  # 최근 저작물을 nlk_biblio에서 조회할 최대 인명 수
+
+_KAC_CODE_RE = re.compile(r"^(?:nlk:)?(KAC[A-Z0-9]+)$", re.IGNORECASE)
+_HANJA_RE = re.compile(r"[\u4e00-\u9fff]")
+_LATIN_RE = re.compile(r"^[A-Za-z][A-Za-z .,'\-]*$")
+
+_AUTHORITY_COLUMNS = (
+    "a.kac_id_full, a.kac_id, a.name, a.pref_label, a.label, a.gender, "
+    "a.corporate_name, a.isni, a.birth_year, a.death_year"
+)
+
+
+def parse_kac_code(term):
+    """'KAC200702805' / 'nlk:KAC200702805' → 'KAC200702805' (KAC 코드가 아니면 None)."""
+    term = (term or "").strip()
+    if len(term) < 8:
+        return None
+    match = _KAC_CODE_RE.match(term)
+    return match.group(1).upper() if match else None
+
+
+# =====================
+# 스냅샷 신선도
+# =====================
+
+
+def _snapshot_time(conn, db_path):
+    """전거 DB를 만든 원본 JSON 덤프 시각 (build_checkpoint 기록, 없으면 DB 파일 수정 시각)."""
+    try:
+        row = conn.execute(
+            "SELECT MAX(file_mtime) FROM build_checkpoint WHERE kind = 'authority'"
+        ).fetchone()
+        if row and row[0]:
+            return row[0]
+    except sqlite3.Error:
+        pass  # 체크포인트 기능 이전에 구축한 DB
+    return os.path.getmtime(db_path)
+
+
+def _max_age_days(db_manager):
+    try:
+        value = db_manager.get_setting(LOCAL_MAX_AGE_SETTING)
+        if value:
+            return max(1, int(value))
+    except Exception:
+        pass  # 잘못된 값/설정 DB 오류 시 기본값
+    return DEFAULT_LOCAL_MAX_AGE_DAYS
+
+
+# =====================
+# 로컬 검색
+# =====================
+
+
+def _fts_rowid_aligned(conn):
+    """authority_fts rowid가 authority rowid와 같은지 (fts_maintenance.is_rowid_aligned의 읽기 전용판)."""
+    try:
+        row = conn.execute(
+            "SELECT rowid_aligned FROM fts_state WHERE fts_table = 'authority_fts'"
+        ).fetchone()
+    except sqlite3.Error:
+        row = None  # fts_state 이전에 구축한 DB
+    if row is not None and row[0]:
+        return True
+    return conn.execute("SELECT 1 FROM authority_fts LIMIT 1").fetchone() is None
+
+
+def _fts_phrase(term):
+    """검색어를 authority_fts 이름 컬럼 대상 접두 구문 검색식으로 바꿉니다."""
+    phrase = term.replace('"', '""')
+    return f'{{name pref_label label alt_labels}} : "{phrase}"*'
+
+
+def _find_by_code(conn, kac_code):
+    return conn.execute(
+        f"SELECT {_AUTHORITY_COLUMNS} FROM authority a WHERE a.kac_id = ?",
+        (kac_code,),
+    ).fetchall()
+
+
+def _find_by_name(conn, term, use_fts):
+    if use_fts:
+        return conn.execute(
+            f"""
+            SELECT {_AUTHORITY_COLUMNS}
+            FROM authority_fts f
+            JOIN authority a ON a.rowid = f.rowid
+            WHERE authority_fts MATCH ? AND a.kac_id LIKE 'KAC%'
+            ORDER BY f.rank
+            LIMIT ?
+            """,
+            (_fts_phrase(term), LOCAL_RESULT_LIMIT),
+        ).fetchall()
+    # FTS rowid가 원본과 어긋난 DB: 색인된 name 정확 일치만
+    return conn.execute(
+        f"SELECT {_AUTHORITY_COLUMNS} FROM authority a "
+        f"WHERE a.name = ? AND a.kac_id LIKE 'KAC%' LIMIT ?",
+        (term, LOCAL_RESULT_LIMIT),
+    ).fetchall()
+
+
+def _group_values(conn, table, column, kac_ids_full):
+    """보조 테이블(kac_id_full, column)을 {kac_id_full: [값, ...]}으로 한 번에 읽습니다."""
+    grouped = {}
+    ids = list(kac_ids_full)
+    for i in range(0, len(ids), 500):
+        chunk = ids[i : i + 500]
+        for kac_id_full, value in conn.execute(
+            f"SELECT kac_id_full, {column} FROM {table} "
+            f"WHERE kac_id_full IN ({','.join('?' * len(chunk))})",
+            chunk,
+        ):
+            grouped.setdefault(kac_id_full, []).append(value)
+    return grouped
+
+
+def _create_counts(conn, kac_ids_full):
+    counts = {}
+    ids = list(kac_ids_full)
+    for i in range(0, len(ids), 500):
+        chunk = ids[i : i + 500]
+        for kac_id_full, count in conn.execute(
+            f"SELECT kac_id_full, COUNT(*) FROM authority_create "
+            f"WHERE kac_id_full IN ({','.join('?' * len(chunk))}) GROUP BY kac_id_full",
+            chunk,
+        ):
+            counts[kac_id_full] = count
+    return counts
+
+
+def get_local_works(biblio_conn, kac_code, limit=None):
+    """nlk_biblio.sqlite에서 KAC 코드의 저작물을 최근 연도 순으로 반환합니다.
+
+    Returns:
+        list[dict]: {"제목", "연도", "식별자"} 목록
+    """
+    sql = """
+        SELECT b.title, b.year, b.nlk_id
+        FROM biblio_title_fts f
+        JOIN biblio b ON b.rowid = f.rowid
+        WHERE biblio_title_fts MATCH ?
+        ORDER BY b.year DESC
+    """
+    params = [f'kac_codes:"{kac_code}"']
+    if limit:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return [
+        {"제목": title or "", "연도": str(year) if year else "", "식별자": nlk_id or ""}
+        for title, year, nlk_id in biblio_conn.execute(sql, params)
+    ]
+
+
+def _pick_names(labels):
+    """이형명/레이블에서 로마자 이름과 한자 이름을 하나씩 고릅니다."""
+    roman = next((v for v in labels if v and _LATIN_RE.match(v)), "")
+    hanja = next((v for v in labels if v and _HANJA_RE.search(v)), "")
+    return roman, hanja
+
+
+def _lifespan(birth_year, death_year):
+    if not birth_year and not death_year:
+        return ""
+    return f"{birth_year or ''}-{death_year or ''}"
+
+
+def _build_rows(conn, biblio_conn, authority_rows):
+    """authority 행 → Search_KAC_Authorities.parse_person_section과 같은 순서의 행 목록."""
+    by_full = {row[0]: row for row in authority_rows}
+    jobs = _group_values(conn, "authority_job", "job_title", by_full)
+    fields = _group_values(conn, "authority_field", "field", by_full)
+    alt_labels = _group_values(conn, "authority_altlabel", "alt_label", by_full)
+    create_counts = _create_counts(conn, by_full)
+
+    rows = []
+    for index, (kac_id_full, row) in enumerate(by_full.items()):
+        (_, kac_id, name, pref_label, label, gender, corporate_name, isni,
+         birth_year, death_year) = row
+        roman, hanja = _pick_names([label, pref_label, *alt_labels.get(kac_id_full, [])])
+
+        works_count = create_counts.get(kac_id_full, 0)
+        recent_work = ""
+        if biblio_conn is not None and index < WORKS_LOOKUP_LIMIT:
+            try:
+                works = get_local_works(biblio_conn, kac_id, limit=1)
+                if works:
+                    recent_work = works[0]["제목"]
+            except sqlite3.Error:
+                pass  # biblio_title_fts 없는 구버전 서지 DB
+
+        rows.append(
+            [
+                name or pref_label or label or "이름없음",
+                (isni or "").replace(" ", ""),
+                kac_id,
+                ", ".join(jobs.get(kac_id_full, [])),
+                _lifespan(birth_year, death_year),
+                ", ".join(fields.get(kac_id_full, [])),
+                "더블 클릭",  # 전체 저작물 (간략 저작물 탭 연동)
+                str(works_count) if works_count else "",
+                "",  # 관련 기관
+                recent_work,
+                "",  # 지역
+                corporate_name or "",
+                f"{KAC_BASE_URL}/LI/contents/L20101000000.do?id={kac_id}",
+                f"https://www.nl.go.kr/isni/{kac_id}",
+                gender or "",
+                "",  # 국가
+                "",  # 기관 코드
+                roman,
+                hanja,
+                "",  # 조직 제어번호
+                "",  # 등록 상태
+                "",  # 전체 ISNI 리소스 수
+                "",  # ISNI 발급일
+            ]
+        )
+    return rows
+
+
+def search_kac_local(search_terms, db_manager, app_instance=None):
+    """로컬 전거 DB에서 검색어들을 찾습니다.
+
+    Returns:
+        tuple: (행 목록, 네트워크로 검색할 검색어 목록)
+            전거 DB가 없거나 스냅샷이 오래되었으면 ([], search_terms)
+    """
+    db_path = getattr(db_manager, "kac_authority_db_path", None)
+    if not db_path or not os.path.exists(db_path):
+        return [], list(search_terms)
+
+    conn = None
+    biblio_conn = None
+    try:
+        conn = db_manager._get_kac_authority_connection()
+        age_days = (time.time() - _snapshot_time(conn, db_path)) / 86400
+        if age_days > _max_age_days(db_manager):
+            if app_instance:
+                app_instance.log_message(
+                    f"정보: 로컬 전거 DB 스냅샷이 {age_days:.0f}일 지나 네트워크로 검색합니다.",
+                    level="INFO",
+                )
+            return [], list(search_terms)
+
+        use_fts = _fts_rowid_aligned(conn)
+        if os.path.exists(db_manager.nlk_biblio_db_path):
+            biblio_conn = db_manager._get_nlk_biblio_connection()
+
+        found = {}  # kac_id → authority 행 (검색어 순서 유지, 중복 제거)
+        remaining = []
+        for term in search_terms:
+            kac_code = parse_kac_code(term)
+            matches = (
+                _find_by_code(conn, kac_code)
+                if kac_code
+                else _find_by_name(conn, term, use_fts)
+            )
+            if not matches:
+                remaining.append(term)
+                continue
+            for row in matches:
+                found.setdefault(row[1], row)
+
+        return _build_rows(conn, biblio_conn, list(found.values())), remaining
+    except sqlite3.Error as e:
+        if app_instance:
+            app_instance.log_message(
+                f"경고: 로컬 전거 DB 검색 실패, 네트워크로 검색합니다: {e}",
+                level="WARNING",
+            )
+        return [], list(search_terms)
+    finally:
+        if biblio_conn is not None:
+            biblio_conn.close()
+        if conn is not None:
+            conn.close()
+
+
+def search_kac_local_first(search_terms, app_instance, db_manager):
+    """로컬 전거 DB 우선 검색 후, 로컬에서 못 찾은 검색어만 네트워크로 검색합니다.
+
+    Returns:
+        pd.DataFrame: Search_KAC_Authorities와 같은 컬럼의 결과 (제어번호 기준 중복 제거)
+    """
+    local_rows, remaining = search_kac_local(search_terms, db_manager, app_instance)
+    frames = []
+    if local_rows:
+        frames.append(build_result_dataframe(local_rows))
+        if app_instance:
+            app_instance.log_message(
+                f"정보: 로컬 전거 DB에서 {len(local_rows)}명을 찾았습니다."
+                + (f" (네트워크 검색 {len(remaining)}건)" if remaining else ""),
+                level="INFO",
+            )
+
+    if remaining and not (app_instance and app_instance.stop_search_flag.is_set()):
+        if len(remaining) > 1:
+            network_df = run_multiple_kac_search(remaining, app_instance)
+        else:
+            network_df = run_full_extraction(remaining[0], app_instance)
+        if network_df is not None and not network_df.empty:
+            frames.append(network_df)
+
+    if not frames:
+        return pd.DataFrame()
+    combined = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    if "제어번호" in combined.columns:
+        combined = combined.drop_duplicates(subset=["제어번호"], keep="first")
+    return combined
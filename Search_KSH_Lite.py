@@ -1,14 +1,20 @@
 ﻿# -*- coding: utf-8 -*-
-# Version: v1.0.1
+# Version: v1.1.1
 # search_ksh_lite.py
-# 수정일시: 2025-08-07 01:15 KST (KSH Pro의 데이터 추출 및 포맷팅 로직 100% 복사 완료)
+# 수정일시: 2025-10-31 KST (목록/상세 요청을 KAC와 공용 PoliteRateLimiter로 간격 제어, 429/5xx 재시도)
+# v1.1.0: 2025-10-31 KST (로컬 DB 우선 + 상세 페이지 캐시/공용 세션 병렬 조회 + lxml 파서 + 목록 먼저 스트리밍 + 단계별 시간 로그)
+# v1.0.2: 2025-10-31 KST (한 글자 검색은 search_single_word.get_single_word_subjects 캐시 사용)
+# v1.0.1: 2025-08-07 01:15 KST (KSH Pro의 데이터 추출 및 포맷팅 로직 100% 복사 완료)
 # 이번 기능 수정: 2025-08-08 KST (기능 오류 수정 및 원본 주석 완벽 복원)
 
 import requests
+import importlib.util
 import json
 import re
+import threading
 import pandas as pd
-from bs4 import BeautifulSoup
+from lazy_imports import lazy_attr
+BeautifulSoup = lazy_attr("bs4", "BeautifulSoup")  # ✅ [성능 개선] 첫 파싱 때 import
 import urllib.parse
 import time
 from concurrent.futures import ThreadPoolExecutor
@@ -16,6 +22,9 @@ import concurrent.futures
 import search_single_word
 from collections import Counter  # ← 추가
 from search_query_manager import SearchQueryManager  # ← 추가
+from search_cache import PersistentLRUCache
+from sru_paging import stop_checker
+from librarian_rate_limit import RETRYABLE_STATUS, librarian_limiter, retry_after
 
 
 # 국립중앙도서관 KSH 상세 검색 URL
@@ -38,6 +47,25 @@ DEFAULT_HEADERS = {
 # 캐시를 위한 딕셔너리 (간단한 인메모리 캐시)
 _cache = {}
 
+# ✅ [성능 개선] lxml이 있으면 lxml 파서 사용 (html.parser보다 빠름, 결과 구조 동일)
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+REQUEST_TIMEOUT = (5, 15)  # (연결, 읽기) 초
+DETAIL_FETCH_WORKERS = 6  # 관계어 상세 페이지 동시 요청 수 (공용 세션 연결 풀 크기)
+KSH_FETCH_RETRIES = 2  # 429/5xx 응답 시 간격을 늘려 재시도하는 횟수
+
+# ✅ [성능 개선] 상세 페이지 파싱 결과 영구 캐시 (termId → mainKSH/우선어/관계어)
+# - 같은 주제어를 다시 검색하거나 Pro 모드에서 이미 본 관계어는 네트워크 없이 처리
+_detail_cache = PersistentLRUCache(
+    "ksh_lite_detail",
+    max_bytes=16 * 1024 * 1024,
+    ttl_sec=7 * 24 * 3600,
+    memory_items=500,
+)
+
+_session = None
+_session_lock = threading.Lock()
+
 
 def parse_qualifiers_from_title(title):
     """
@@ -92,22 +120,49 @@ def clean_subject(text):
     return cleaned_text.strip()
 
 
-def fetch_html(url, app_instance=None):
+def _get_session():
+    """목록/상세 페이지 공용 세션 (keep-alive 연결 재사용, 동시 요청 수만큼 연결 풀)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=DETAIL_FETCH_WORKERS, max_retries=0
+            )
+            session.mount("https://", adapter)
+            session.headers.update(DEFAULT_HEADERS)
+            _session = session
+        return _session
+
+
+def fetch_html(url, app_instance=None, should_stop=None):
     """
     주어진 URL에서 HTML 콘텐츠를 가져옵니다.
     GAS fetchHtml() 함수 포팅
+    ✅ [성능 개선] 공용 세션 사용, 요청마다 두던 0.5초 고정 지연 대신
+    Search_KAC_Authorities와 공용 PoliteRateLimiter(librarian_limiter)로 요청 시작 간격을 조절
+    (429/5xx 응답이면 간격을 늘려 KSH_FETCH_RETRIES번까지 재시도)
     Args:
         url (str): HTML을 가져올 URL.
         app_instance (object, optional): GUI 애플리케이션 인스턴스 (로그용).
+        should_stop (callable, optional): 간격 대기 중 중지 요청 확인 함수.
     Returns:
-        str: HTML 콘텐츠 문자열.
+        str: HTML 콘텐츠 문자열. (간격 대기 중 중지되면 None)
     """
     if app_instance:
         app_instance.log_message(f"정보: HTML 가져오는 중: {url}", level="INFO")
     try:
-        response = requests.get(url, headers=DEFAULT_HEADERS, timeout=15)
+        for attempt in range(KSH_FETCH_RETRIES + 1):
+            if not librarian_limiter.acquire(should_stop):
+                return None
+            started = time.monotonic()
+            response = _get_session().get(url, timeout=REQUEST_TIMEOUT)
+            if response.status_code in RETRYABLE_STATUS and attempt < KSH_FETCH_RETRIES:
+                librarian_limiter.record_throttle(retry_after(response))
+                continue
+            break
         response.raise_for_status()  # HTTP 오류 발생 시 예외 발생
-        time.sleep(0.5)  # 500ms 지연 추가 (서버 부하 방지)
+        librarian_limiter.record_success(time.monotonic() - started)
         if app_instance:
             app_instance.log_message(
                 f"정보: HTML 가져오기 성공. 내용 길이: {len(response.text)}",
@@ -126,6 +181,82 @@ def fetch_html(url, app_instance=None):
         raise ConnectionError(error_message)
 
 
+def detail_page_url(term_id):
+    return f"{KSH_BASE_URL}/LI/contents/L20201000000.do?termId={term_id}"
+
+
+def _is_usable_detail(parsed):
+    """차단/오류 페이지(제목과 KSH 모두 없음)는 캐시하지 않습니다."""
+    return bool(parsed and (parsed.get("priorityTermTitle") or parsed.get("mainKSH")))
+
+
+def get_detail_page(term_id, app_instance=None):
+    """
+    termId의 상세 페이지 파싱 결과를 반환합니다. (영구 캐시 우선, 없으면 웹에서 가져와 캐시)
+    Returns:
+        dict: parse_detail_page()와 같은 형식 (mainKSH, priorityTermTitle, relatedTerms).
+    """
+    cached = _detail_cache.get(term_id)
+    if cached is not None:
+        if app_instance:
+            app_instance.log_message(
+                f"정보: 상세 페이지 캐시 사용 (termId={term_id})", level="INFO"
+            )
+        return cached
+    html = fetch_html(detail_page_url(term_id), app_instance)
+    parsed = parse_detail_page(html, app_instance)
+    if _is_usable_detail(parsed):
+        _detail_cache.put(term_id, parsed)
+    return parsed
+
+
+def fetch_detail_pages(term_ids, app_instance=None):
+    """
+    여러 termId의 상세 페이지를 캐시 우선으로, 캐시에 없는 것만 공용 세션으로 병렬 조회합니다.
+    요청 시작 간격은 공용 librarian_limiter가 정하므로 작업자 수와 관계없이 서버 부하는 KAC 검색과 같습니다.
+    개별 실패는 건너뛰고(메시지 박스 없음) 로그에 건수만 남깁니다.
+    Returns:
+        dict: {termId: 파싱 결과} (가져오지 못한 termId는 제외)
+    """
+    unique_ids = list(dict.fromkeys(t for t in term_ids if t))
+    details = _detail_cache.get_many(unique_ids)
+    missing = [t for t in unique_ids if t not in details]
+    if not missing:
+        return details
+
+    should_stop = stop_checker(app_instance)
+
+    def fetch_one(term_id):
+        if should_stop():
+            return term_id, None
+        try:
+            html = fetch_html(detail_page_url(term_id), should_stop=should_stop)
+            if html is None:
+                return term_id, None
+            return term_id, parse_detail_page(html)
+        except Exception:
+            return term_id, None
+
+    fetched = {}
+    with ThreadPoolExecutor(
+        max_workers=min(DETAIL_FETCH_WORKERS, len(missing)),
+        thread_name_prefix="KshDetail",
+    ) as executor:
+        for term_id, parsed in executor.map(fetch_one, missing):
+            if _is_usable_detail(parsed):
+                fetched[term_id] = parsed
+    _detail_cache.put_many(fetched)
+    details.update(fetched)
+
+    if app_instance:
+        app_instance.log_message(
+            f"정보: 상세 페이지 {len(unique_ids)}개 중 캐시 {len(unique_ids) - len(missing)}개, "
+            f"웹 {len(fetched)}/{len(missing)}개 성공",
+            level="INFO",
+        )
+    return details
+
+
 def perform_search(search_keyword, app_instance=None):
     total_start = time.time()
 
@@ -160,7 +291,7 @@ def perform_search(search_keyword, app_instance=None):
         )
 
     parse_start = time.time()
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
 
     all_results = []
     best_match = {"targetTermId": "", "mainSubjectFromList": ""}
@@ -343,7 +474,7 @@ def perform_search(search_keyword, app_instance=None):
         )
 
     if app_instance:
-        ksh_lite_sanity_check(html, all_results, app_instance)
+        ksh_lite_sanity_check(soup, all_results, app_instance)
 
     return {"allResults": all_results, "bestMatch": best_match}
 
@@ -363,7 +494,7 @@ def parse_detail_page(html, app_instance=None):
             "정보: 상세 페이지 HTML에서 메인 KSH, 우선어, 원시 관계어 파싱 중.",
             level="INFO",
         )
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
 
     result = {
         "mainKSH": None,
@@ -432,9 +563,12 @@ def parse_detail_page(html, app_instance=None):
     return result
 
 
-def run_ksh_lite_extraction(search_term, search_mode, app_instance=None):
+def run_ksh_lite_extraction(search_term, search_mode, app_instance=None, on_page=None):
     """
     주어진 검색어로 KSH 데이터를 추출합니다. (Pro/Lite 모드 및 한 글자 검색 통합)
+    ✅ [성능 개선] 목록/관계어 KSH 코드는 로컬 DB(nlk_concepts.sqlite)에서 먼저 찾고,
+    상세 페이지는 캐시 → 웹 순서로, Pro 모드에서는 로컬 DB에 없는 관계어만 병렬로 조회합니다.
+    on_page (callable, optional): 목록 검색 결과 행(dict)을 관계어 조회 전에 먼저 전달.
     """
     # 1. 검색어 유효성 검사
     if not search_term or not isinstance(search_term, str) or search_term.strip() == "":
@@ -451,11 +585,9 @@ def run_ksh_lite_extraction(search_term, search_mode, app_instance=None):
                 level="INFO",
             )
         try:
-            response_text = search_single_word.scrape_nl_go_kr_ajax_with_retry(
-                search_term, app_instance, max_retries=3
-            )
-            subjects = search_single_word.parse_ajax_response_for_subjects(
-                response_text, search_term
+            # ✅ [성능 개선] 글자별 SQLite 캐시 우선 (장기 세션으로 원격 조회, 오래된 항목은 백그라운드 갱신)
+            subjects = search_single_word.get_single_word_subjects(
+                search_term, app_instance
             )
             if not subjects:
                 if app_instance:
@@ -476,14 +608,15 @@ def run_ksh_lite_extraction(search_term, search_mode, app_instance=None):
 
     # 3. 두 글자 이상 검색 처리
     total_start_time = time.time()
-    cache_key = f"KSH_SEARCH_{search_term}"
+    timings = {}  # ✅ [성능 개선] 단계별 소요 시간 (마지막에 한 줄로 로그)
+    cache_key = f"KSH_SEARCH_{search_mode}_{search_term}"
     if cache_key in _cache:
         if app_instance:
             app_instance.log_message(
                 f"정보: '{search_term}'에 대한 데이터가 캐시에서 로드되었습니다.",
                 level="INFO",
             )
-            return _cache[cache_key]
+        return _cache[cache_key]
     if app_instance:
         app_instance.update_progress(0)
         app_instance.log_message(
@@ -491,6 +624,7 @@ def run_ksh_lite_extraction(search_term, search_mode, app_instance=None):
         )
 
     # target_term_id 찾기
+    phase_start = time.time()
     target_term_id = ""
     main_subject_from_list = ""
     found_term_id = False
@@ -517,6 +651,7 @@ def run_ksh_lite_extraction(search_term, search_mode, app_instance=None):
                 break
         except ConnectionError:
             return pd.DataFrame()
+    timings["목록 검색"] = time.time() - phase_start
     if not found_term_id:
         if app_instance:
             app_instance.show_messagebox(
@@ -524,58 +659,147 @@ def run_ksh_lite_extraction(search_term, search_mode, app_instance=None):
                 f"'{search_term}'에 대한 정확히 일치하는 항목을 찾을 수 없습니다.",
                 "error",
             )
-            return pd.DataFrame()
+        return pd.DataFrame()
 
     # 상세 페이지 처리 및 관계어 처리
+    detail_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="KshDetail")
     try:
         if app_instance:
             app_instance.update_progress(20)
-        detail_url = (
-            f"{KSH_BASE_URL}/LI/contents/L20201000000.do?termId={target_term_id}"
-        )
-        detail_html = fetch_html(detail_url, app_instance)  # 상세 HTML 가져오기
-        detail_parsed = parse_detail_page(
-            detail_html, app_instance
-        )  # 상세 HTML 파싱 (메인 우선어/KSH/관계어 추출)
+        # ✅ [성능 개선] 상세 페이지(캐시 → 웹)는 백그라운드에서 받고, 그동안 목록 KSH 코드를 로컬 DB에서 조회
+        detail_started = time.time()
+        detail_future = detail_executor.submit(
+            get_detail_page, target_term_id, app_instance
+        )  # 상세 HTML 가져오기 + 파싱 (메인 우선어/KSH/관계어 추출)
+
+        # 목록 KSH 코드 일괄 조회 (DataFrame 채우기 전 준비)
+        phase_start = time.time()
+        list_subjects_with_qualifiers = []
+        subject_map_for_list = {}
+        preferred_terms_set = set()  # ✅ 우선어 저장용
+
+        for item in global_search_results:
+            subject = item["subject"]
+            pure, paren, bracket = parse_qualifiers_from_title(subject)
+            # 💡 [핵심 수정] DB 조회용 튜플과 맵핑용 튜플의 형식을 (str, str, str)로 통일합니다.
+            list_subjects_with_qualifiers.append((pure, paren or "", bracket or ""))
+            subject_map_for_list[subject] = (pure, paren or "", bracket or "")
+
+            # ✅ 우선어도 조회 대상에 포함
+            preferred_term = item.get("preferredTerm")
+            if preferred_term and preferred_term.strip():
+                preferred_terms_set.add(preferred_term)
+                pure_pref, paren_pref, bracket_pref = parse_qualifiers_from_title(
+                    preferred_term
+                )
+                # 💡 [핵심 수정] DB 조회용 튜플과 맵핑용 튜플의 형식을 (str, str, str)로 통일합니다.
+                list_subjects_with_qualifiers.append(
+                    (pure_pref, paren_pref or "", bracket_pref or "")
+                )
+                subject_map_for_list[preferred_term] = (
+                    pure_pref,
+                    paren_pref or "",
+                    bracket_pref or "",
+                )
+
+        list_ksh_code_map = {}
+        sqm = None  # SearchQueryManager 인스턴스 (아래 루프에서도 사용 가능하도록 여기서 선언)
+        if hasattr(app_instance, "db_manager"):
+            sqm = SearchQueryManager(app_instance.db_manager)  # 여기서 미리 생성
+
+        if list_subjects_with_qualifiers and sqm:
+            try:
+                batch_results_df = sqm.get_ksh_entries_batch_exact(
+                    list_subjects_with_qualifiers
+                )  # 수정된 정확한 조회 함수 사용
+                # -------------------
+                # [로그 제거] 디버깅용 로그 삭제
+                # -------------------
+                if not batch_results_df.empty:
+                    temp_map = {}
+                    for _, row_db in batch_results_df.iterrows():
+                        db_pure = row_db["pure_subject_name"]
+                        db_paren = row_db["qualifier_parentheses"] or ""
+                        db_bracket = row_db["qualifier_square_brackets"] or ""
+                        ksh_code = row_db["ksh_code"]
+                        # 💡 [핵심 수정] DB에서 반환된 'pref_label'을 사용합니다.
+                        # (폴백으로 공백 제거된 db_pure 사용)
+                        db_label = row_db.get("pref_label", db_pure)
+                        if ksh_code:
+                            markup = f"▼a{db_label}▼0{ksh_code}▲"
+                        else:
+                            markup = f"▼a{db_label}▲"
+
+                        # -------------------
+                        # [로그 제거] 디버깅용 로그 삭제
+                        log_key = (db_pure, db_paren, db_bracket)
+                        # -------------------
+
+                        temp_map[log_key] = markup
+
+                    for original_subject, qualifiers in subject_map_for_list.items():
+                        if qualifiers in temp_map:
+                            list_ksh_code_map[original_subject] = temp_map[qualifiers]
+                        # -------------------
+                        # [로그 제거] 디버깅용 로그 삭제
+                        # -------------------
+            except Exception as e:
+                if app_instance:
+                    app_instance.log_message(
+                        f"⚠️ 목록 KSH 코드 일괄 조회 실패: {e}", level="WARNING"
+                    )
+        timings["목록 로컬 DB"] = time.time() - phase_start
+
+        # ✅ [성능 개선] 목록 검색 결과를 먼저 탭에 표시 (완료 시 관계어를 포함한 최종 결과로 교체)
+        if on_page is not None and global_search_results:
+            try:
+                on_page(_list_preview_rows(global_search_results, list_ksh_code_map))
+            except Exception:
+                pass
+
+        detail_parsed = detail_future.result()
+        timings["상세 페이지"] = time.time() - detail_started
         raw_related_terms = detail_parsed["relatedTerms"]
+        if app_instance:
+            app_instance.update_progress(40)
 
         # 관계어 처리 (Pro/Lite 분기)
         categorized_relations_details = {}  # 초기화
         if search_mode == "Pro":
-            # ... (Pro 모드 로직 - 변경 없음) ...
             app_instance.log_message(
                 "정보: [Pro 모드] 로컬 DB 조회 및 웹 스크레이핑을 시작합니다.",
                 level="INFO",
             )
             db_cache_start_time = time.time()
-            categorized_relations_details, fetch_requests, url_to_term_data_map = (
-                process_related_terms_with_db_cache(raw_related_terms, app_instance)
+            categorized_relations_details, fetch_requests, term_id_to_term_data_map = (
+                process_related_terms_with_db_cache(
+                    raw_related_terms, app_instance, collect_missing=True
+                )
             )
+            timings["관계어 로컬 DB"] = time.time() - db_cache_start_time
             if app_instance:
                 app_instance.log_message(
-                    f"⏱️ 로컬 DB 캐시 처리 총 시간: {time.time() - db_cache_start_time:.2f}초",
+                    f"⏱️ 로컬 DB 캐시 처리 총 시간: {timings['관계어 로컬 DB']:.2f}초",
                     level="INFO",
                 )
             if fetch_requests:
+                # ✅ [성능 개선] 로컬 DB에 없는 관계어만 상세 페이지 조회 (캐시 우선 + 공용 세션 병렬)
                 app_instance.log_message(
-                    f"정보: [Pro 모드] {len(fetch_requests)}개 관계어 상세 정보 동시 요청 중...",
+                    f"정보: [Pro 모드] 로컬 DB에 없는 관계어 {len(fetch_requests)}개 상세 정보 동시 요청 중...",
                     level="INFO",
                 )
                 web_fetch_start_time = time.time()
-                with ThreadPoolExecutor(max_workers=10) as executor:
-                    futures = {
-                        executor.submit(fetch_html, url, app_instance): url
-                        for url in fetch_requests
-                    }
-                    categorized_relations_details = process_web_fetched_ksh_codes(
-                        futures,
-                        url_to_term_data_map,
-                        categorized_relations_details,
-                        app_instance,
-                    )
+                fetched_details = fetch_detail_pages(fetch_requests, app_instance)
+                categorized_relations_details = process_web_fetched_ksh_codes(
+                    fetched_details,
+                    term_id_to_term_data_map,
+                    categorized_relations_details,
+                    app_instance,
+                )
+                timings["관계어 웹 상세"] = time.time() - web_fetch_start_time
                 if app_instance:
                     app_instance.log_message(
-                        f"⏱️ 웹 스크레이핑 총 시간: {time.time() - web_fetch_start_time:.2f}초",
+                        f"⏱️ 웹 스크레이핑 총 시간: {timings['관계어 웹 상세']:.2f}초",
                         level="INFO",
                     )
 
@@ -587,9 +811,10 @@ def run_ksh_lite_extraction(search_term, search_mode, app_instance=None):
             categorized_relations_details, _, _ = process_related_terms_with_db_cache(
                 raw_related_terms, app_instance
             )  # 관계어 KSH 코드 등 조회
+            timings["관계어 로컬 DB"] = time.time() - db_cache_start_time
             if app_instance:
                 app_instance.log_message(
-                    f"⏱️ 로컬 DB 캐시 처리 총 시간: {time.time() - db_cache_start_time:.2f}초",
+                    f"⏱️ 로컬 DB 캐시 처리 총 시간: {timings['관계어 로컬 DB']:.2f}초",
                     level="INFO",
                 )
 
@@ -601,6 +826,7 @@ def run_ksh_lite_extraction(search_term, search_mode, app_instance=None):
             app_instance.update_progress(80)
 
         # DataFrame 생성
+        phase_start = time.time()
         headers = [
             "",
             "전체 목록 검색 결과",
@@ -639,84 +865,6 @@ def run_ksh_lite_extraction(search_term, search_mode, app_instance=None):
             1,
         )
 
-        # 목록 KSH 코드 일괄 조회 (DataFrame 채우기 전 준비)
-        list_subjects_with_qualifiers = []
-        subject_map_for_list = {}
-        preferred_terms_set = set()  # ✅ 우선어 저장용
-
-        for item in global_search_results:
-            subject = item["subject"]
-            pure, paren, bracket = parse_qualifiers_from_title(subject)
-            # 💡 [핵심 수정] DB 조회용 튜플과 맵핑용 튜플의 형식을 (str, str, str)로 통일합니다.
-            list_subjects_with_qualifiers.append((pure, paren or "", bracket or ""))
-            subject_map_for_list[subject] = (pure, paren or "", bracket or "")
-
-            # ✅ 우선어도 조회 대상에 포함
-            preferred_term = item.get("preferredTerm")
-            if preferred_term and preferred_term.strip():
-                preferred_terms_set.add(preferred_term)
-                pure_pref, paren_pref, bracket_pref = parse_qualifiers_from_title(
-                    preferred_term
-                )
-                # 💡 [핵심 수정] DB 조회용 튜플과 맵핑용 튜플의 형식을 (str, str, str)로 통일합니다.
-                list_subjects_with_qualifiers.append(
-                    (pure_pref, paren_pref or "", bracket_pref or "")
-                )
-                subject_map_for_list[preferred_term] = (
-                    pure_pref,
-                    paren_pref or "",
-                    bracket_pref or "",
-                )
-
-        list_ksh_code_map = {}
-        sqm = None  # SearchQueryManager 인스턴스 (아래 루프에서도 사용 가능하도록 여기서 선언)
-        if hasattr(app_instance, "db_manager"):
-            sqm = SearchQueryManager(app_instance.db_manager)  # 여기서 미리 생성
-
-        if list_subjects_with_qualifiers and sqm:
-            try:
-                batch_results_df = sqm.get_ksh_entries_batch_exact(
-                    list_subjects_with_qualifiers
-                )  # 수정된 정확한 조회 함수 사용
-                # -------------------
-                # [로그 제거] 디버깅용 로그 삭제
-                # -------------------
-                if not batch_results_df.empty:
-                    temp_map = {}
-                    for _, row_db in batch_results_df.iterrows():
-                        db_pure = row_db["pure_subject_name"]
-                        db_paren = row_db["qualifier_parentheses"] or ""
-                        db_bracket = row_db["qualifier_square_brackets"] or ""
-                        ksh_code = row_db["ksh_code"]
-                        # 💡 [핵심 수정] DB에서 반환된 'pref_label'을 사용합니다.
-                        # (폴백으로 공백 제거된 db_pure 사용)
-                        db_label = row_db.get("pref_label", db_pure)
-                        if ksh_code:
-                            markup = f"▼a{db_label}▼0{ksh_code}▲"
-                        else:
-                            markup = f"▼a{db_label}▲"
-
-                        # -------------------
-                        # [로그 제거] 디버깅용 로그 삭제
-                        log_key = (db_pure, db_paren, db_bracket)
-                        # -------------------
-
-                        temp_map[log_key] = markup
-
-                    for original_subject, qualifiers in subject_map_for_list.items():
-                        if qualifiers in temp_map:
-                            list_ksh_code_map[original_subject] = temp_map[qualifiers]
-                        # -------------------
-                        # [로그 제거] 디버깅용 로그 삭제
-                        # -------------------
-            except Exception as e:
-                if app_instance:
-                    app_instance.log_message(
-                        f"⚠️ 목록 KSH 코드 일괄 조회 실패: {e}", level="WARNING"
-                    )
-        # -------------------
-        # [로그 제거] 디버깅용 로그 삭제
-        # -------------------
         # DataFrame 채우기 최적화: 열 단위 데이터 준비
         data_dict = {h: [""] * max_rows for h in headers}  # 모든 컬럼 초기화
 
@@ -734,19 +882,12 @@ def run_ksh_lite_extraction(search_term, search_mode, app_instance=None):
         preferred_col = [""] * max_rows
 
         for i in range(num_list_results):
-            original_subject = list_subjects[i]
             preferred_term = list_preferred[i]
-            term_for_ksh_code = preferred_term if preferred_term else original_subject
 
             # KSH 코드 결정
-            if term_for_ksh_code in list_ksh_code_map:
-                ksh_codes_col[i] = list_ksh_code_map[term_for_ksh_code]
-            elif global_search_results[i].get("kshCode") and not preferred_term:
-                ksh_codes_col[i] = (
-                    f"▼a{original_subject}▼0{global_search_results[i]['kshCode']}▲"
-                )
-            else:
-                ksh_codes_col[i] = f"▼a{term_for_ksh_code}▲"
+            ksh_codes_col[i] = _list_ksh_markup(
+                global_search_results[i], list_ksh_code_map
+            )
 
             # 우선어 결정
             if i == 0:
@@ -781,8 +922,14 @@ def run_ksh_lite_extraction(search_term, search_mode, app_instance=None):
 
         # 4. 최종 DataFrame 생성
         df = pd.DataFrame(data_dict)
+        timings["표 구성"] = time.time() - phase_start
         # 로그, 캐시 저장, 반환
         if app_instance:
+            app_instance.log_message(
+                "⏱️ 단계별 시간: "
+                + ", ".join(f"{name} {sec:.2f}초" for name, sec in timings.items()),
+                level="INFO",
+            )
             app_instance.log_message(
                 f"🎯 KSH '{search_mode}' 모드 전체 실행 시간: {time.time() - total_start_time:.2f}초",
                 level="INFO",
@@ -801,14 +948,55 @@ def run_ksh_lite_extraction(search_term, search_mode, app_instance=None):
         if app_instance:
             app_instance.log_message(f"오류: {error_message}", level="ERROR")
         raise  # 상위로 예외 전달
+    finally:
+        detail_executor.shutdown(wait=False)
+
+
+def _list_ksh_markup(item, list_ksh_code_map):
+    """목록 항목의 'KSH 코드' 셀 (로컬 DB → 목록 페이지의 KSH 코드 → 마크업만)."""
+    original_subject = item["subject"]
+    preferred_term = item.get("preferredTerm")
+    term_for_ksh_code = preferred_term if preferred_term else original_subject
+    if term_for_ksh_code in list_ksh_code_map:
+        return list_ksh_code_map[term_for_ksh_code]
+    if item.get("kshCode") and not preferred_term:
+        return f"▼a{original_subject}▼0{item['kshCode']}▲"
+    return f"▼a{term_for_ksh_code}▲"
+
+
+def _list_preview_rows(global_search_results, list_ksh_code_map):
+    """관계어 조회 전에 먼저 표시할 목록 행 (탭 column_map 키 기준 dict)."""
+    rows = []
+    for i, item in enumerate(global_search_results):
+        preferred_term = item.get("preferredTerm")
+        ksh_markup = _list_ksh_markup(item, list_ksh_code_map)
+        if i == 0:
+            preferred = ksh_markup  # 상세 페이지 우선어는 최종 결과에서 반영
+        elif preferred_term:
+            preferred = list_ksh_code_map.get(preferred_term, f"▼a{preferred_term}▲")
+        else:
+            preferred = ""
+        rows.append(
+            {
+                "전체 목록 검색 결과": item["subject"],
+                "KSH 코드": ksh_markup,
+                "우선어": preferred,
+                "_url_data": item["url"],
+            }
+        )
+    return rows
 
 
 # 파일: Search_KSH_Lite.py
-def process_related_terms_with_db_cache(raw_related_terms, app_instance=None):
+def process_related_terms_with_db_cache(
+    raw_related_terms, app_instance=None, collect_missing=False
+):
     """
     관계어들의 KSH 코드를 처리합니다. (DB 일괄 조회 최적화 적용)
     1. 메모리 캐시에서 먼저 확인합니다.
     2. 캐시에 없는 항목들을 모아 DB에서 '단 한 번' 일괄 조회합니다.
+    3. collect_missing=True(Pro 모드)면 로컬 DB에서도 코드를 못 찾은 관계어의 termId를
+       웹 상세 조회 대상으로 모아 반환합니다.
     """
     categorized_relations_details = {
         "synonyms": [],
@@ -904,6 +1092,8 @@ def process_related_terms_with_db_cache(raw_related_terms, app_instance=None):
             _cache[f"KSH_CODE_{term_id}"] = ksh_code
 
     # 3단계: 모든 관계어를 다시 순회하며 최종 결과 생성
+    fetch_requests = []  # 웹 상세 조회가 필요한 termId (Pro 모드)
+    term_id_to_term_data_map = {}  # termId → (관계 유형, 제목, 상세 URL)
     for term_type, title, term_id in raw_related_terms:
         hyperlink_url = f"{KSH_BASE_URL}/LI/contents/L20201000000.do?termId={term_id}"
 
@@ -928,6 +1118,9 @@ def process_related_terms_with_db_cache(raw_related_terms, app_instance=None):
             formatted_ksh_string = f"▼a{title}▼0{cached_ksh_code}▲"
         else:
             formatted_ksh_string = f"▼a{title}▲"
+            if collect_missing and term_id not in term_id_to_term_data_map:
+                fetch_requests.append(term_id)
+                term_id_to_term_data_map[term_id] = (term_type, title, hyperlink_url)
 
         term_details = (title, formatted_ksh_string, hyperlink_url)
 
@@ -943,19 +1136,39 @@ def process_related_terms_with_db_cache(raw_related_terms, app_instance=None):
         else:
             categorized_relations_details["foreign"].append(term_details)
 
-    # Lite 모드이므로 fetch_requests(웹 요청 목록)는 항상 비어있음
-    return categorized_relations_details, [], {}
+    # Lite 모드(collect_missing=False)에서는 fetch_requests(웹 요청 목록)가 항상 비어있음
+    return categorized_relations_details, fetch_requests, term_id_to_term_data_map
 
 
 def process_web_fetched_ksh_codes(
-    futures, url_to_term_data_map, categorized_formatted_relations, app_instance=None
+    fetched_details,
+    term_id_to_term_data_map,
+    categorized_formatted_relations,
+    app_instance=None,
 ):
     """
-    웹에서 가져온 KSH 코드들을 처리하고 로컬 DB에 저장합니다.
-    (기능 수정: KSH Lite에서는 웹 스크레이핑을 수행하지 않으므로 이 함수는 비워둡니다.)
+    웹에서 가져온 관계어 상세 페이지(fetch_detail_pages 결과)의 KSH 코드를 관계어 목록에 반영합니다.
+    찾은 코드는 메모리 캐시(_cache)에도 기록해 같은 실행 중 재조회를 막습니다. (Pro 모드)
     """
-    # KSH Lite에서는 관계어에 대한 웹 스크레이핑을 하지 않으므로, 이 함수의 로직은 실행되지 않습니다.
-    # 기존 코드 구조를 유지하기 위해 함수 선언은 남겨두고, 적절한 반환값을 제공합니다
+    resolved = 0
+    for term_id, (term_type, title, url) in term_id_to_term_data_map.items():
+        detail = fetched_details.get(term_id)
+        ksh_code = detail.get("mainKSH") if detail else None
+        if not ksh_code:
+            continue
+        _cache[f"KSH_CODE_{term_id}"] = ksh_code
+        formatted_ksh_string = f"▼a{title}▼0{ksh_code}▲"
+        for term_details_list in categorized_formatted_relations.values():
+            for i, (rel_title, _, rel_url) in enumerate(term_details_list):
+                if rel_url == url:
+                    term_details_list[i] = (rel_title, formatted_ksh_string, rel_url)
+        resolved += 1
+
+    if app_instance:
+        app_instance.log_message(
+            f"정보: [Pro 모드] 웹 상세 조회로 관계어 {resolved}/{len(term_id_to_term_data_map)}개의 KSH 코드 보완",
+            level="INFO",
+        )
     return categorized_formatted_relations
 
 
@@ -1163,12 +1376,8 @@ def extract_relations_for_best_match(best_match, app_instance=None):
                 f"정보: 상세 페이지 접근: {detail_url}", level="INFO"
             )
 
-        detail_html = fetch_html(detail_url, app_instance)
-        if not detail_html:
-            return initialize_empty_relations()
-
-        # 관계어 파싱 (기존 함수 재사용)
-        detail_parsed = parse_detail_page(detail_html, app_instance)
+        # ✅ [성능 개선] 상세 페이지 캐시 우선 (관계어 파싱은 기존 함수 재사용)
+        detail_parsed = get_detail_page(term_id, app_instance)
         raw_related_terms = detail_parsed["relatedTerms"]
 
         if app_instance:
@@ -1411,10 +1620,8 @@ def initialize_empty_relations():
 
 
 def ksh_lite_sanity_check(html, results, app_instance=None):
-    from bs4 import BeautifulSoup
-    import re
-
-    soup = BeautifulSoup(html, "html.parser")
+    # ✅ [성능 개선] perform_search가 파싱한 soup를 그대로 받음 (HTML 문자열이면 새로 파싱)
+    soup = html if not isinstance(html, str) else BeautifulSoup(html, HTML_PARSER)
     all_a = soup.select('a[href*="termId="]')
     # table_bd 내의 가시 링크만 카운트(= 우리가 실제로 쓰는 기준)
     visible_links = soup.select('span.cont.post_not a[href*="termId="]')
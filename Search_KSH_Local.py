@@ -1,10 +1,14 @@
 # ==============================
 # 파일명: Search_KSH_Local.py
-# 버전: v1.5.0 - 복수 주제어 동시 검색 최적화 메서드 추가
+# 버전: v1.5.2 - 인덱스 구축 중 알림(IndexBuildingError)을 다중 키워드 검색에서도 전달
 # 설명: KSH Local 전용 검색 모듈 (DB 접근/전처리/진행률/취소) + 주제모음 편집 저장
-# 수정일: 2025-10-13
+# 수정일: 2025-10-31
 #
 # 변경 이력:
+# v1.5.2 (2025-10-31)
+# - [버그 수정] 병렬 다중 키워드 검색이 IndexBuildingError를 삼키지 않고 다시 발생
+# v1.5.1 (2025-10-31)
+# - [성능 개선] search_ksh_local_orchestrated: 워밍업 전 첫 검색은 wait_for_db_warmup()으로 대기
 # v1.5.0 (2025-10-13)
 # - [성능 개선] search_biblio_by_multiple_subjects 메서드 추가
 #   : 여러 개의 주제어를 리스트로 받아 단일 SQL 쿼리로 결과를 반환
@@ -23,6 +27,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 # 프로젝트 공용 모듈
 from search_query_manager import SearchQueryManager
 from database_manager import DatabaseManager
+from schema_migrations import IndexBuildingError
 
 # ✅ [신규 추가] 누락된 타입 정의
 ProgressCB = Optional[Callable[[int], None]]
@@ -363,6 +368,15 @@ def search_ksh_local_orchestrated(
     sqm = SearchQueryManager(db_manager)
     searcher = KshLocalSearcher(db_manager)
 
+    # ✅ [성능 개선] 앱 시작 직후 첫 검색이면 DB 워밍업(예열)이 끝날 때까지 대기
+    # (진행 막대 앞 절반에 워밍업 진행률 표시, 이후 검색은 즉시 통과)
+    def _on_warmup_progress(fraction):
+        if hasattr(app_instance, "update_progress"):
+            app_instance.update_progress(int(fraction * 50))
+
+    if not sqm.wait_for_db_warmup(on_progress=_on_warmup_progress):
+        app_instance.log_message("DB 워밍업 대기 시간 초과 - 검색을 계속합니다.", "WARNING")
+
     # 쉼표나 세미콜론으로 구분된 다중 키워드인지 확인
     keywords = [kw.strip() for kw in re.split(r"[,;]", search_term) if kw.strip()]
 
@@ -392,6 +406,8 @@ def search_ksh_local_orchestrated(
                         all_concepts_raw.append(df_c_raw)
                     if not df_b.empty:
                         all_biblio.append(df_b)
+                except IndexBuildingError:
+                    raise  # "인덱스 구축 중"은 빈 결과 대신 탭에 안내
                 except Exception as e:
                     kw = future_to_keyword[future]
                     app_instance.log_message(f"'{kw}' 검색 중 오류: {e}", "ERROR")
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
-# Version: v1.0.56
-# 수정일시: 2025-08-04 16:00 KST (GAS 버전 로직을 기반으로 NDL 상세 링크 추출 로직 재구성)
+# Version: v1.0.57
+# 수정일시: 2025-10-31 KST (주제어/제목 번역을 번역 메모리 + 묶음 번역으로 전환)
+# v1.0.56: GAS 버전 로직을 기반으로 NDL 상세 링크 추출 로직 재구성
 
 """
 Search_NDL.py - 일본 국립국회도서관(NDL) SRU API 검색 로직을 포함합니다.
@@ -15,15 +16,12 @@ import requests
 import xml.etree.ElementTree as ET
 from urllib.parse import quote_plus
 import re
-import asyncio
-import threading
-from concurrent.futures import ThreadPoolExecutor
 
 # ❗ 추가: DatabaseManager 모듈 임포트
 from database_manager import DatabaseManager
 
-# ❗ 수정: api_clients 모듈에서 extract_year와 translate_text 함수 임포트
-from qt_api_clients import extract_year, translate_text
+# ❗ 수정: api_clients 모듈에서 extract_year와 묶음 번역 함수 임포트
+from qt_api_clients import extract_year, translate_text_batch_async
 
 # NDL SRU API 기본 URL (GAS와 동일하게 변경)
 NDL_SRU_BASE_URL = "https://ndlsearch.ndl.go.jp/api/sru"
@@ -77,13 +75,7 @@ def search_ndl_catalog(
             f"정보: NDL 검색 시작: 제목='{title_query}', 저자='{author_query}', ISBN='{isbn_query}', 발행연도='{year_query}'"
         )
 
-    # ❗ 변경: db_manager를 통해 맞춤형 용어집을 한 번만 로드
-    custom_glossary_map = db_manager.get_all_custom_translations()
-    if app_instance:
-        app_instance.log_message(
-            f"정보: SQLite 용어집 {len(custom_glossary_map)}개 항목 로드됨.",
-            level="INFO",
-        )
+    # ✅ [성능 개선] 용어집은 번역 메모리(db_manager.translation_memory)가 한 번만 적재
 
     # 검색어 유효성 검사 및 우선순위 로직 적용
     cql_query_parts = []
@@ -470,7 +462,7 @@ def search_ndl_catalog(
         if _should_auto_translate(app_instance) and all_unique_subjects:
             if app_instance:
                 app_instance.log_message(
-                    "🚀🚀 비동기 고유 주제어 개별 번역 시스템 시작! (번역 품질 향상)",
+                    "🚀🚀 고유 주제어 묶음 번역 시작! (번역 메모리 우선)",
                     level="INFO",
                 )
                 app_instance.log_message(
@@ -483,90 +475,11 @@ def search_ndl_catalog(
                         level="INFO",
                     )
 
-            # 2단계: 🚀🚀 고유 주제어 개별 비동기 번역 실행!
-            # 비동기 처리를 위한 새 이벤트 루프 생성 및 설정 (현재 스레드가 아닐 수 있으므로)
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-            # 개별 번역 작업을 위한 코루틴 함수 정의
-            async def _perform_individual_translations():
-                nonlocal translation_map  # 외부 translation_map을 사용
-                # ThreadPoolExecutor를 사용하여 동기 함수를 비동기로 실행
-                # max_workers는 동시에 실행될 스레드 수를 나타냅니다. 너무 높으면 API 제한에 걸릴 수 있습니다.
-                # 🚀 성능 개선: 동시 작업 스레드 수를 15개로 늘려 번역 속도 향상 (DNB 방식 적용)
-                num_workers = 15
-                if app_instance:
-                    app_instance.log_message(
-                        f"🚀 정보: {num_workers}개의 스레드로 병렬 번역을 시작합니다.",
-                        level="INFO",
-                    )
-
-                with ThreadPoolExecutor(max_workers=num_workers) as executor:
-                    tasks = []
-                    unique_subjects_list = list(
-                        all_unique_subjects
-                    )  # 일관된 반복 순서를 위해 리스트로 변환
-                    for i, subject_to_translate in enumerate(unique_subjects_list):
-                        if app_instance and app_instance.stop_search_flag.is_set():
-                            break  # 중단 요청 시 루프 종료
-
-                        # ❗ 수정: translate_text에 db_manager 인스턴스 전달
-                        task = loop.run_in_executor(
-                            executor,
-                            translate_text,
-                            subject_to_translate,
-                            custom_glossary_map,
-                            db_manager,
-                        )
-                        tasks.append((subject_to_translate, task))
-
-                        # 진행률 업데이트 (예: 5개마다)
-                        if app_instance and (i + 1) % 5 == 0:
-                            progress = 85 + int(
-                                ((i + 1) / len(all_unique_subjects)) * 10
-                            )
-                            app_instance.root.after(
-                                0, app_instance.update_progress, progress
-                            )
-
-                    # 제출된 모든 작업이 완료될 때까지 기다림
-                    for original_subject, task in tasks:
-                        try:
-                            translated_in_hangul = (
-                                await task
-                            )  # translate_text에서 이미 한글 변환까지 완료됨
-                            translation_map[original_subject] = translated_in_hangul
-                        except Exception as e:
-                            translation_map[original_subject] = (
-                                f"{original_subject} (번역 오류)"
-                            )
-                            if app_instance:
-                                app_instance.log_message(
-                                    f'오류: 주제어 개별 번역 실패 ("{original_subject}"): {e}',
-                                    level="ERROR",
-                                )
-
-                if app_instance:
-                    app_instance.log_message(
-                        f"✅ 고유 주제어 개별 번역 완료! {len(translation_map)}개 주제어 완료",
-                        level="INFO",
-                    )
-
-            # _perform_individual_translations 코루틴 실행
-            # 이벤트 루프가 이미 실행 중인 경우 (예: GUI 메인 루프), 스케줄링하여 실행
-            if not loop.is_running():
-                loop.run_until_complete(_perform_individual_translations())
-            else:
-                # GUI의 메인 스레드에서 비동기 작업을 실행하기 위해 별도의 스레드를 생성하여 루프를 실행
-                # 이는 Tkinter와 같은 GUI 프레임워크의 메인 루프를 블로킹하지 않기 위함입니다.
-                threading.Thread(
-                    target=lambda: loop.run_until_complete(
-                        _perform_individual_translations()
-                    )
-                ).start()
+            # 2단계: ✅ [성능 개선] 번역 메모리 + 묶음 원격 번역
+            # (용어집/이전 번역은 메모리에서 바로, 나머지만 줄 단위로 묶어 호출 1회)
+            translation_map = translate_text_batch_async(
+                all_unique_subjects, app_instance, None, db_manager
+            )
 
         elif all_unique_subjects and app_instance:
             # 번역 비활성화 시 원문을 그대로 사용
@@ -589,19 +502,9 @@ def search_ndl_catalog(
                     all_unique_titles.add(item["제목_원문"])
 
             if all_unique_titles:
-                with ThreadPoolExecutor(max_workers=15) as executor:
-                    future_to_title = {
-                        executor.submit(
-                            translate_text, title, custom_glossary_map, db_manager
-                        ): title
-                        for title in all_unique_titles
-                    }
-                    for future in future_to_title:
-                        title = future_to_title[future]
-                        try:
-                            title_translation_map[title] = future.result()
-                        except Exception as exc:
-                            title_translation_map[title] = f"{title} (번역 오류)"
+                title_translation_map = translate_text_batch_async(
+                    all_unique_titles, app_instance, None, db_manager
+                )
 
             # 번역 활성화 시 결과 적용
             for item in all_results:
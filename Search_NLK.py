@@ -1,16 +1,19 @@
 # -*- coding: utf-8 -*-
 # 파일명: Search_NLK.py
-# Version: v6.0.0 (Refactored)
-# 수정일시: 2025-09-20 KST
+# Version: v6.2.0
+# 수정일시: 2025-10-31 KST
+# v6.2.0: 검색 결과 XML/MODS 응답을 marc_xml_parser 스트리밍(iterparse) 파싱으로 전환
+# v6.1.0: viewKey별 MARC/MODS 상세 정보 영구 캐시(search_cache) + 다운로드 세션 재사용
 # 설명: NLK OpenAPI 통합 검색 모듈. Search_UPenn.py 스타일의 계층적 구조로 리팩토링됨 by Gemini 2.5 Pro
 
 import requests
-import xml.etree.ElementTree as ET
 import re
 import time
 import urllib.parse
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from qt_api_clients import clean_text
+from search_cache import PersistentLRUCache
+from marc_xml_parser import MODS_NS, XML_PARSE_ERRORS, iter_elements, iter_mods_records
 
 # ✅ [추가] PyInstaller 환경에서 SSL 인증서 경로 설정
 from ssl_cert_utils import configure_ssl_certificates
@@ -30,10 +33,39 @@ NLK_CONFIG = {
     "TIMEOUT": 20,
     "MARC_MODS_MAX_WORKERS": 8,
     "MARC_MODS_TIMEOUT": 10,
+    # ✅ [성능 개선] viewKey별 상세 정보 영구 캐시 (search_cache.db)
+    "DETAIL_CACHE_MAX_MB": 32,
+    "DETAIL_CACHE_TTL_DAYS": 30,
+    "DETAIL_CACHE_MEMORY_ITEMS": 5000,
     "USER_AGENT": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/116.0.0.0 Safari/537.36",
 }
 
-_nlk_cache = {}
+# ✅ [성능 개선] 모듈 전역 dict(무제한, 재시작 시 소실) → 메모리 LRU + SQLite LRU/TTL 2단 캐시
+# 값: {"ddc", "kdc", "kac", "ksh"} (MARC/MODS 파싱 결과)
+_nlk_cache = PersistentLRUCache(
+    "nlk_marc_mods",
+    max_bytes=NLK_CONFIG["DETAIL_CACHE_MAX_MB"] * 1024 * 1024,
+    ttl_sec=NLK_CONFIG["DETAIL_CACHE_TTL_DAYS"] * 24 * 3600,
+    memory_items=NLK_CONFIG["DETAIL_CACHE_MEMORY_ITEMS"],
+)
+
+# ✅ [성능 개선] MARC/MODS 다운로드용 공유 세션 (요청마다 새 Session → 연결 재사용)
+_session = None
+
+
+def _get_session():
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=NLK_CONFIG["MARC_MODS_MAX_WORKERS"],
+            max_retries=0,
+        )
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+        _session.headers.update({"User-Agent": NLK_CONFIG["USER_AGENT"]})
+    return _session
 
 
 class NLKSearchError(Exception):
@@ -149,7 +181,7 @@ def _route_and_parse_search(api_params, app_instance):
         )
 
     response = _call_nlk_api(api_params, app_instance)
-    return _parse_nlk_xml_response(response.text, app_instance)
+    return _parse_nlk_xml_response(response.content, app_instance)
 
 
 # ==============================================================================
@@ -172,28 +204,27 @@ def _call_nlk_api(api_params, app_instance):
         raise NLKSearchError(f"API 네트워크 요청 실패: {e}")
 
 
-def _parse_nlk_xml_response(xml_text, app_instance):
-    """NLK API의 XML 응답을 파싱하여 기본 결과 리스트 생성"""
+def _parse_nlk_xml_response(xml_content, app_instance):
+    """NLK API의 XML 응답(bytes)을 파싱하여 기본 결과 리스트 생성"""
     try:
-        root = ET.fromstring(xml_text)
-        result_element = root.find("result")
-        if result_element is None:
+        # ✅ [성능 개선] iterparse 스트리밍 파싱 (item 단위로 매핑 후 즉시 해제)
+        results = [
+            _map_nlk_api_item_to_dict(item_element)
+            for item_element in iter_elements(xml_content, "item")
+        ]
+        if not results:
             if app_instance:
                 app_instance.log_message(
-                    "정보: NLK 검색 결과 없음 (result 엘리먼트 없음)", level="INFO"
+                    "정보: NLK 검색 결과 없음 (item 엘리먼트 없음)", level="INFO"
                 )
             return []
 
-        results = []
-        for item_element in result_element.findall("item"):
-            results.append(_map_nlk_api_item_to_dict(item_element))
-
         if app_instance:
             app_instance.log_message(
                 f"정보: NLK API 기본 파싱 완료. {len(results)}건", level="INFO"
             )
         return results
-    except ET.ParseError as e:
+    except XML_PARSE_ERRORS as e:
         raise NLKSearchError(f"XML 파싱 실패: {e}")
 
 
@@ -253,24 +284,28 @@ def _batch_fetch_marc_mods_data(view_keys, app_instance):
     """MARC/MODS 데이터를 병렬로 다운로드하고 파싱"""
     if not view_keys:
         return {}
+
+    # ✅ [성능 개선] 이전 세션에서 본 레코드는 영구 캐시에서 바로 반환 (전부 있으면 병렬 요청 생략)
+    results = _nlk_cache.get_many(list(dict.fromkeys(view_keys)))
+    keys_to_fetch = [vk for vk in dict.fromkeys(view_keys) if vk not in results]
+
+    if not keys_to_fetch:
+        if app_instance:
+            app_instance.log_message(
+                f"정보: MARC/MODS 상세 정보 {len(results)}건 모두 캐시 사용 (다운로드 생략)",
+                level="INFO",
+            )
+        return results
+
     if app_instance:
         app_instance.log_message(
-            f"정보: {len(view_keys)}개 레코드 MARC/MODS 상세 정보 병렬 요청 시작...",
+            f"정보: {len(keys_to_fetch)}개 레코드 MARC/MODS 상세 정보 병렬 요청 시작... "
+            f"(캐시 {len(results)}건)",
             level="INFO",
         )
 
     start_time = time.time()
-    results = {}
-
-    keys_to_fetch = []
-    for vk in view_keys:
-        if vk in _nlk_cache:
-            results[vk] = _nlk_cache[vk]
-        else:
-            keys_to_fetch.append(vk)
-
-    if not keys_to_fetch:
-        return results
+    fetched = {}
 
     with ThreadPoolExecutor(
         max_workers=NLK_CONFIG["MARC_MODS_MAX_WORKERS"]
@@ -285,11 +320,14 @@ def _batch_fetch_marc_mods_data(view_keys, app_instance):
             try:
                 data = future.result()
                 results[vk] = data
-                _nlk_cache[vk] = data  # 캐시에 저장
+                if _is_cacheable_detail(data):
+                    fetched[vk] = data
             except Exception as e:
                 _handle_nlk_error(e, app_instance, f"MARC/MODS 처리 ({vk})")
                 results[vk] = {"ddc": None, "kdc": None, "kac": [], "ksh": []}
 
+    _nlk_cache.put_many(fetched)  # 캐시에 저장 (한 트랜잭션)
+
     elapsed = time.time() - start_time
     if app_instance:
         app_instance.log_message(
@@ -300,6 +338,14 @@ def _batch_fetch_marc_mods_data(view_keys, app_instance):
     return results
 
 
+def _is_cacheable_detail(data):
+    """정상 응답을 파싱한 결과만 캐시 (HTTP 오류로 비어 있거나 파싱 오류 표시가 있으면 제외)."""
+    if not (data.get("ddc") or data.get("kdc") or data.get("kac") or data.get("ksh")):
+        return False
+    markers = list(data.get("kac") or []) + list(data.get("ksh") or [])
+    return not any("오류" in m for m in markers)
+
+
 def _fetch_and_parse_single_marc_mod(view_key, app_instance):
     """단일 viewKey에 대한 MARC 또는 MODS 데이터를 가져와 파싱"""
     if view_key.startswith("CNTS-"):
@@ -338,12 +384,10 @@ def _handle_nlk_error(error, app_instance, context=""):
 def _fetch_marc_data_single(view_key, app_instance):
     marc_url = NLK_CONFIG["MARC_DOWNLOAD_URL"].format(view_key=view_key)
     try:
-        with requests.Session() as session:
-            response = session.get(
-                marc_url,
-                headers={"User-Agent": NLK_CONFIG["USER_AGENT"]},
-                timeout=NLK_CONFIG["MARC_MODS_TIMEOUT"],
-            )
+        response = _get_session().get(
+            marc_url,
+            timeout=NLK_CONFIG["MARC_MODS_TIMEOUT"],
+        )
         if response.status_code == 200:
             response.encoding = "utf-8"
             marc_content = response.text
@@ -359,12 +403,10 @@ def _fetch_marc_data_single(view_key, app_instance):
 def _fetch_mods_data_single(view_key, app_instance):
     mods_url = NLK_CONFIG["MODS_DOWNLOAD_URL"].format(view_key=view_key)
     try:
-        with requests.Session() as session:
-            response = session.get(
-                mods_url,
-                headers={"User-Agent": NLK_CONFIG["USER_AGENT"]},
-                timeout=NLK_CONFIG["MARC_MODS_TIMEOUT"],
-            )
+        response = _get_session().get(
+            mods_url,
+            timeout=NLK_CONFIG["MARC_MODS_TIMEOUT"],
+        )
         if response.status_code == 200 and response.content:
             ddc, kdc, kac, ksh = _parse_mods_xml_content(response.content, app_instance)
             return {"ddc": ddc, "kdc": kdc, "kac": kac, "ksh": ksh}
@@ -426,44 +468,43 @@ def _parse_mods_xml_content(xml_content, app_instance):
         return None, None, [], []
     ddc_code, kdc_code, kac_authors, ksh_subjects = None, None, [], []
     try:
-        root = ET.fromstring(xml_content)
-        namespaces = {"mods": "http://www.loc.gov/mods/v3"}
-        classification_elements = root.findall(
-            './/mods:classification[@authority="DDC"]', namespaces
-        )
-        for classification in classification_elements:
-            if classification.text and classification.text.strip():
-                ddc_code = classification.text.strip()
-                break
-        kdc_elements = root.findall(
-            './/mods:classification[@authority="KDC"]', namespaces
-        )
-        for classification in kdc_elements:
-            if classification.text and classification.text.strip():
-                kdc_code = classification.text.strip()
-                break
-        name_elements = root.findall('.//mods:name[@type="personal"]', namespaces)
+        namespaces = {"mods": MODS_NS}
         processed_kac = set()
-        for name_element in name_elements:
-            kac_id = name_element.get("ID", "")
-            if kac_id and kac_id.startswith("KAC"):
-                name_part = name_element.find("mods:namePart", namespaces)
-                if name_part is not None and name_part.text:
-                    author_name = name_part.text.strip()
-                    if author_name and kac_id not in processed_kac:
-                        kac_authors.append(f"{author_name} {kac_id}")
-                        processed_kac.add(kac_id)
-        subject_elements = root.findall(".//mods:subject", namespaces)
         processed_ksh = set()
-        for subject_element in subject_elements:
-            ksh_id = subject_element.get("ID", "").strip()
-            if ksh_id and ksh_id.startswith("KSH"):
-                topic_element = subject_element.find("mods:topic", namespaces)
-                if topic_element is not None and topic_element.text:
-                    subject_text = topic_element.text.strip()
-                    if subject_text and ksh_id not in processed_ksh:
-                        ksh_subjects.append(f"▼a{subject_text}▼0{ksh_id}▲")
-                        processed_ksh.add(ksh_id)
+        # ✅ [성능 개선] mods 레코드 단위 스트리밍 파싱 (DDC/KDC는 처음 찾은 값 유지)
+        for root in iter_mods_records(xml_content):
+            if ddc_code is None:
+                for classification in root.iterfind(
+                    './/mods:classification[@authority="DDC"]', namespaces
+                ):
+                    if classification.text and classification.text.strip():
+                        ddc_code = classification.text.strip()
+                        break
+            if kdc_code is None:
+                for classification in root.iterfind(
+                    './/mods:classification[@authority="KDC"]', namespaces
+                ):
+                    if classification.text and classification.text.strip():
+                        kdc_code = classification.text.strip()
+                        break
+            for name_element in root.iterfind('.//mods:name[@type="personal"]', namespaces):
+                kac_id = name_element.get("ID", "")
+                if kac_id and kac_id.startswith("KAC"):
+                    name_part = name_element.find("mods:namePart", namespaces)
+                    if name_part is not None and name_part.text:
+                        author_name = name_part.text.strip()
+                        if author_name and kac_id not in processed_kac:
+                            kac_authors.append(f"{author_name} {kac_id}")
+                            processed_kac.add(kac_id)
+            for subject_element in root.iterfind(".//mods:subject", namespaces):
+                ksh_id = subject_element.get("ID", "").strip()
+                if ksh_id and ksh_id.startswith("KSH"):
+                    topic_element = subject_element.find("mods:topic", namespaces)
+                    if topic_element is not None and topic_element.text:
+                        subject_text = topic_element.text.strip()
+                        if subject_text and ksh_id not in processed_ksh:
+                            ksh_subjects.append(f"▼a{subject_text}▼0{ksh_id}▲")
+                            processed_ksh.add(ksh_id)
         return ddc_code, kdc_code, kac_authors, ksh_subjects
     except Exception as e:
         if app_instance:
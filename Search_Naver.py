@@ -1,11 +1,23 @@
 # -*- coding: utf-8 -*-
-# Version: v1.2.0
+# Version: v1.3.1
 # 생성일시: 2025-08-10 KST (GAS 네이버 API 로직을 파이썬으로 포팅)
-# 수정일시: 2025-10-29 KST
+# 수정일시: 2025-10-31 KST
 """
 Search_Naver.py - 네이버 검색을 위한 하이브리드 도서 정보 수집 모듈
 
 [변경 이력]
+v1.3.1 (2025-10-31)
+- [버그 수정] 빈 스크레이핑 결과(차단/네트워크 오류/항목 없음)는 영구 캐시에 저장하지 않고,
+  이미 저장된 빈 결과도 캐시 적중으로 보지 않음 (3일간 보강 정보가 비어 보이던 문제)
+
+v1.3.0 (2025-10-31)
+- [성능 개선] 보강 단계(_enrich_isbns): ISBN 검색 결과 전체의 ISBN을 정규화해 중복 제거 후
+  Yes24/교보문고를 모든 ISBN에 대해 동시에 스크레이핑 (사이트별 동시 요청 상한 SCRAPE_SITE_LIMITS)
+- [성능 개선] 스크레이핑 캐시를 search_cache.db 영구 LRU 캐시로 교체
+  (재시작 후에도 유지, 3일 TTL, 최대 100개/O(n) 제거 → 용량 기준 LRU)
+- [성능 개선] 스크레이핑 HTML 파서: lxml 설치 시 lxml 사용 (없으면 html.parser)
+- [성능 개선] 예스24 쿠키 획득용 홈페이지 방문은 세션에 쿠키가 없을 때만
+
 v1.2.0 (2025-10-29)
 - [개선] 네트워크 탄력성 강화: 단일 재시도 + 지수 백오프 로직 추가
   - 429/503 응답 및 타임아웃 시 자동 재시도 (0.6~1.2초 대기)
@@ -49,8 +61,13 @@ import time
 import urllib.parse
 import threading  # ✅ [추가] 병렬 처리를 위해 threading 모듈을 임포트합니다.
 import random  # ✅ [추가] 지수 백오프용
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal, Optional, Tuple  # ✅ [추가] 타입 힌트용
-from bs4 import BeautifulSoup  # ✅ 새로 추가
+from lazy_imports import lazy_attr
+BeautifulSoup = lazy_attr("bs4", "BeautifulSoup")  # ✅ [성능 개선] 첫 파싱 때 import
+from search_cache import PersistentLRUCache
+from sru_paging import stop_checker
 from qt_api_clients import clean_text
 from database_manager import DatabaseManager
 
@@ -62,6 +79,13 @@ from ssl_cert_utils import configure_ssl_certificates
 
 configure_ssl_certificates()
 
+# ✅ [성능 개선] 상세 페이지 파싱은 lxml이 있으면 lxml (html.parser보다 수 배 빠름)
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+# ✅ [성능 개선] 보강 단계: 사이트별 동시 스크레이핑 상한 + ISBN 수 상한
+SCRAPE_SITE_LIMITS = {"yes24": 2, "kyobo": 2}
+ENRICH_MAX_ISBNS = 10
+
 _MEDIA_STOPWORDS = (
     "뉴욕 타임스",
     "뉴욕타임스",
@@ -193,11 +217,23 @@ def get_http_session(site: Literal["naver", "yes24", "kyobo"]) -> requests.Sessi
 
 
 # ============================================================
-# 스크레이핑 결과 캐시 (2시간 TTL)
+# 스크레이핑 결과 캐시 (✅ [성능 개선] search_cache.db 영구 LRU, 3일 TTL)
 # ============================================================
-_SCRAPING_CACHE: dict[str, Tuple[dict, float]] = {}  # {isbn: (result, timestamp)}
-_CACHE_LOCK = threading.Lock()
-_CACHE_TTL = 7200  # 2시간 (초 단위)
+_SCRAPING_CACHE = PersistentLRUCache(
+    "naver_book_scrape",
+    max_bytes=32 * 1024 * 1024,
+    ttl_sec=3 * 24 * 3600,
+    memory_items=500,
+)
+
+
+def _scraping_cache_key(isbn: str, site: str) -> str:
+    return f"{site}:{normalize_isbn_digits(isbn)}"
+
+
+def _has_scraped_info(result) -> bool:
+    """추출된 값이 하나라도 있으면 True (모든 항목이 빈 결과는 캐시하지 않음)."""
+    return bool(result) and any(result.values())
 
 
 def _get_cached_scraping_result(isbn: str, site: str) -> Optional[dict]:
@@ -210,19 +246,8 @@ def _get_cached_scraping_result(isbn: str, site: str) -> Optional[dict]:
     Returns:
         캐시된 결과 딕셔너리 또는 None
     """
-    cache_key = f"{site}:{normalize_isbn_digits(isbn)}"
-
-    with _CACHE_LOCK:
-        if cache_key in _SCRAPING_CACHE:
-            result, timestamp = _SCRAPING_CACHE[cache_key]
-            # TTL 체크
-            if time.time() - timestamp < _CACHE_TTL:
-                return result.copy()  # 복사본 반환
-            else:
-                # 만료된 캐시 삭제
-                del _SCRAPING_CACHE[cache_key]
-
-    return None
+    cached = _SCRAPING_CACHE.get(_scraping_cache_key(isbn, site))
+    return dict(cached) if _has_scraped_info(cached) else None  # 복사본 반환
 
 
 def _set_cached_scraping_result(isbn: str, site: str, result: dict) -> None:
@@ -231,18 +256,12 @@ def _set_cached_scraping_result(isbn: str, site: str, result: dict) -> None:
     Args:
         isbn: ISBN 문자열
         site: 사이트 이름 ("yes24" 또는 "kyobo")
-        result: 저장할 결과 딕셔너리
+        result: 저장할 결과 딕셔너리 (모든 항목이 비어 있으면 저장하지 않음)
     """
-    cache_key = f"{site}:{normalize_isbn_digits(isbn)}"
-
-    with _CACHE_LOCK:
-        _SCRAPING_CACHE[cache_key] = (result.copy(), time.time())
-
-        # 캐시 크기 제한 (최대 100개)
-        if len(_SCRAPING_CACHE) > 100:
-            # 가장 오래된 항목 제거
-            oldest_key = min(_SCRAPING_CACHE.keys(), key=lambda k: _SCRAPING_CACHE[k][1])
-            del _SCRAPING_CACHE[oldest_key]
+    # 차단 페이지/일시 오류로 빈 결과가 3일 동안 남지 않도록 빈 결과는 다음 검색에서 다시 시도
+    if not _has_scraped_info(result):
+        return
+    _SCRAPING_CACHE.put(_scraping_cache_key(isbn, site), result)
 
 
 # ============================================================
@@ -639,41 +658,84 @@ def _parse_naver_api_response(response_text, search_type, primary_query, app_ins
             app_instance.log_message(f"오류: 네이버 API 응답 XML 파싱 실패: {e}", level="ERROR")
         return [_create_error_record("XML 파싱 오류", error_msg, search_type, primary_query)], None
 
-def _scrape_additional_info(isbn, app_instance=None):
-    """Yes24와 교보문고에서 병렬로 추가 정보를 스크레이핑합니다."""
-    if not isbn or isbn == "정보 없음":
-        return {}, {}
+def _scrape_isbn(isbn_field):
+    """레코드 ISBN 필드("ISBN10 ISBN13" 등)에서 스크레이핑에 쓸 ISBN 1개 (13자리 우선)."""
+    tokens = sorted(split_isbn_tokens(isbn_field), key=lambda t: (len(t) != 13, t))
+    return tokens[0] if tokens else ""
 
-    clean_isbn = isbn.strip()
-    if not clean_isbn:
-        return {}, {}
 
-    scraping_results = {"yes24": {}, "kyobo": {}}
+_SCRAPE_SLOTS = {
+    site: threading.BoundedSemaphore(limit) for site, limit in SCRAPE_SITE_LIMITS.items()
+}
 
-    def run_scraper(site, isbn_code):
-        scraper_func = scrape_yes24_book_info if site == "yes24" else scrape_kyobo_book_info
-        try:
-            scraping_results[site] = scraper_func(isbn_code, app_instance)
-        except Exception as e:
-            if app_instance:
-                app_instance.log_message(f"오류: {site} 스크레이핑 중 예외 발생: {e}", level="ERROR")
 
-    yes24_thread = threading.Thread(target=run_scraper, args=("yes24", clean_isbn))
-    kyobo_thread = threading.Thread(target=run_scraper, args=("kyobo", clean_isbn))
+def _enrich_isbns(isbn_fields, app_instance=None):
+    """여러 ISBN의 Yes24/교보문고 정보를 한 번에 수집합니다.
+
+    ✅ [성능 개선] ISBN 정규화로 중복 제거 → 캐시 일괄 조회 → 캐시에 없는 (사이트, ISBN)만
+    사이트별 상한(SCRAPE_SITE_LIMITS) 안에서 동시에 스크레이핑.
+
+    Returns:
+        dict: {정규화 ISBN: (yes24_info, kyobo_info)}
+    """
+    isbns = []
+    for field in isbn_fields:
+        isbn = _scrape_isbn(field)
+        if isbn and isbn not in isbns:
+            isbns.append(isbn)
+    if not isbns:
+        return {}
+
+    scrapers = {"yes24": scrape_yes24_book_info, "kyobo": scrape_kyobo_book_info}
+    results = {(site, isbn): {} for isbn in isbns for site in scrapers}
+    cached = _SCRAPING_CACHE.get_many(
+        [_scraping_cache_key(isbn, site) for site, isbn in results]
+    )
+    jobs = []
+    for site, isbn in results:
+        hit = cached.get(_scraping_cache_key(isbn, site))
+        if _has_scraped_info(hit):
+            results[(site, isbn)] = dict(hit)
+        else:
+            jobs.append((site, isbn))
+
+    if app_instance:
+        app_instance.log_message(
+            f"정보: 추가 정보 보강 - ISBN {len(isbns)}개, 캐시 {len(results) - len(jobs)}건, "
+            f"스크레이핑 {len(jobs)}건"
+        )
+
+    should_stop = stop_checker(app_instance)
+
+    def run_scraper(site, isbn):
+        with _SCRAPE_SLOTS[site]:
+            if should_stop():
+                return {}
+            return scrapers[site](isbn, app_instance)
+
+    if jobs:
+        with ThreadPoolExecutor(
+            max_workers=min(len(jobs), sum(SCRAPE_SITE_LIMITS.values())),
+            thread_name_prefix="NaverEnrich",
+        ) as executor:
+            futures = {executor.submit(run_scraper, site, isbn): (site, isbn) for site, isbn in jobs}
+            for future, (site, isbn) in futures.items():
+                try:
+                    results[(site, isbn)] = future.result() or {}
+                except Exception as e:
+                    if app_instance:
+                        app_instance.log_message(f"오류: {site} 스크레이핑 중 예외 발생: {e}", level="ERROR")
 
-    yes24_thread.start()
-    kyobo_thread.start()
+    return {isbn: (results[("yes24", isbn)], results[("kyobo", isbn)]) for isbn in isbns}
 
-    # 스레드 완료 대기 (타임아웃 설정)
-    yes24_thread.join(timeout=15)
-    kyobo_thread.join(timeout=15)
 
-    if yes24_thread.is_alive() and app_instance:
-        app_instance.log_message("경고: Yes24 스크레이핑 시간 초과", level="WARNING")
-    if kyobo_thread.is_alive() and app_instance:
-        app_instance.log_message("경고: 교보문고 스크레이핑 시간 초과", level="WARNING")
+def _scrape_additional_info(isbn, app_instance=None):
+    """Yes24와 교보문고에서 병렬로 추가 정보를 스크레이핑합니다."""
+    if not isbn or isbn == "정보 없음":
+        return {}, {}
 
-    return scraping_results["yes24"], scraping_results["kyobo"]
+    enriched = _enrich_isbns([isbn], app_instance)
+    return enriched.get(_scrape_isbn(isbn), ({}, {}))
 
 def _process_scraped_data(naver_record, yes24_info, kyobo_info):
     """스크레이핑된 데이터와 네이버 API 데이터를 병합하여 추가 레코드를 생성합니다."""
@@ -919,30 +981,32 @@ def search_naver_catalog(title_query, author_query, isbn_query, app_instance=Non
 
         # 기준 레코드를 찾은 경우 스크레이핑 및 병합 수행
         if base_idx >= 0:
-            base_rec = naver_records[base_idx]
-            isbn_to_scrape = base_rec.get("ISBN") # 실제 스크레이핑에 사용할 ISBN (공백 포함 가능)
-
-            if _valid_isbn(isbn_to_scrape): # 유효한 ISBN일 때만 스크레이핑 시도
-                yes24_info, kyobo_info = _scrape_additional_info(isbn_to_scrape, app_instance)
-                processed_scraped_data = _process_scraped_data(base_rec, yes24_info, kyobo_info)
-
-                # 최종 결과: 기준 Naver 레코드 + 가공 레코드 + 나머지 Naver 레코드
-                final_results.append(base_rec)
-                final_results.extend(processed_scraped_data)
-
-                # 기준 레코드 외 다른 Naver 결과도 보존 (중복 방지)
-                seen = {(base_rec.get("서명", ""), base_rec.get("ISBN", ""))}
-                for i, rec in enumerate(naver_records):
-                    if rec.get("검색소스") != "Naver" or i == base_idx:
-                        continue
-                    key = (rec.get("서명", ""), rec.get("ISBN", ""))
-                    if key in seen:
-                        continue
-                    seen.add(key)
-                    final_results.append(rec)
-            else:
-                 # 기준 레코드는 찾았으나 유효 ISBN이 없는 경우 (이론상 드묾)
-                 final_results.extend(naver_records)
+            # ✅ [성능 개선] 기준 레코드 + 나머지 유효 Naver 레코드의 ISBN을 한 번에 보강
+            # (같은 ISBN은 한 번만, 모든 사이트/ISBN 동시 스크레이핑)
+            order = [base_idx] + [i for i in range(len(naver_records)) if i != base_idx]
+            enrich_targets = [
+                i for i in order
+                if naver_records[i].get("검색소스") == "Naver"
+                and _valid_isbn(naver_records[i].get("ISBN"))
+            ][:ENRICH_MAX_ISBNS]
+            enriched = _enrich_isbns(
+                [naver_records[i].get("ISBN") for i in enrich_targets], app_instance
+            )
+
+            # 최종 결과: 기준 Naver 레코드 + 가공 레코드, 이후 나머지 Naver 레코드 (+ 가공 레코드)
+            seen = set()
+            for i in order:
+                rec = naver_records[i]
+                if rec.get("검색소스") != "Naver":
+                    continue
+                key = (rec.get("서명", ""), rec.get("ISBN", ""))
+                if key in seen:  # 중복 방지
+                    continue
+                seen.add(key)
+                final_results.append(rec)
+                scraped = enriched.get(_scrape_isbn(rec.get("ISBN"))) if i in enrich_targets else None
+                if scraped:
+                    final_results.extend(_process_scraped_data(rec, *scraped))
 
         else:
             # 유효한 Naver 레코드를 찾지 못한 경우 (API 오류 레코드만 있거나 빈 결과)
@@ -1026,21 +1090,23 @@ def scrape_yes24_book_info(isbn, app_instance=None):
         session = get_http_session("yes24")
 
         # 쿠키 획득을 위한 홈페이지 방문 (재시도 적용)
-        home_response, home_error = _retry_request(
-            session.get,
-            "https://www.yes24.com/",
-            timeout=10,
-            app_instance=app_instance
-        )
-
-        if home_response:
-            time.sleep(0.5)
-            session.headers.update({"Referer": "https://www.yes24.com/"})
-        elif app_instance:
-            app_instance.log_message(
-                f"경고: 예스24 홈페이지 방문 실패 (쿠키 획득 실패): {home_error}", level="WARNING"
+        # ✅ [성능 개선] 공유 세션에 이미 쿠키가 있으면 생략
+        if not session.cookies:
+            home_response, home_error = _retry_request(
+                session.get,
+                "https://www.yes24.com/",
+                timeout=10,
+                app_instance=app_instance
             )
 
+            if home_response:
+                time.sleep(0.5)
+                session.headers.update({"Referer": "https://www.yes24.com/"})
+            elif app_instance:
+                app_instance.log_message(
+                    f"경고: 예스24 홈페이지 방문 실패 (쿠키 획득 실패): {home_error}", level="WARNING"
+                )
+
         # 검색 페이지 요청 (재시도 적용)
         search_response, search_error = _retry_request(
             session.get,
@@ -1061,7 +1127,7 @@ def scrape_yes24_book_info(isbn, app_instance=None):
         # -------------------
         # ✅ [수정 1] 검색 결과 페이지의 인코딩을 'euc-kr'로 명시하여 파싱 오류를 방지합니다.
         search_response.encoding = "utf-8"
-        search_soup = BeautifulSoup(search_response.text, "html.parser")
+        search_soup = BeautifulSoup(search_response.text, HTML_PARSER)
         # -------------------
 
         product_link = None
@@ -1112,7 +1178,7 @@ def scrape_yes24_book_info(isbn, app_instance=None):
         # -------------------
         # ✅ [수정 3] 상세 페이지 역시 'euc-kr' 인코딩을 명시적으로 지정해야 문자가 깨지지 않습니다. (가장 핵심적인 수정)
         detail_response.encoding = "utf-8"
-        detail_soup = BeautifulSoup(detail_response.text, "html.parser")
+        detail_soup = BeautifulSoup(detail_response.text, HTML_PARSER)
         # -------------------
 
         # 여러 기여자(지은이/옮긴이)가 있을 수 있으므로 모두 수집
@@ -1131,7 +1197,7 @@ def scrape_yes24_book_info(isbn, app_instance=None):
             toc_textarea = toc_section.find("textarea", class_="txtContentText")
             if toc_textarea:
                 toc_html = toc_textarea.get_text()
-                toc_soup = BeautifulSoup(toc_html, "html.parser")
+                toc_soup = BeautifulSoup(toc_html, HTML_PARSER)
                 toc_text = toc_soup.get_text(separator="\n", strip=True)
                 if len(toc_text) > 20:
                     result["목차"] = toc_text
@@ -1152,7 +1218,7 @@ def scrape_yes24_book_info(isbn, app_instance=None):
                     review_textarea = next_div.find("textarea", class_="txtContentText")
                     if review_textarea:
                         review_html = review_textarea.get_text()
-                        review_soup = BeautifulSoup(review_html, "html.parser")
+                        review_soup = BeautifulSoup(review_html, HTML_PARSER)
                         review_text = review_soup.get_text(separator="\n", strip=True)
                         cleaned_review = (
                             review_text.replace("출판사 리뷰", "")
@@ -1251,7 +1317,7 @@ def scrape_kyobo_book_info(isbn, app_instance=None):
 
         search_response.raise_for_status()
 
-        search_soup = BeautifulSoup(search_response.content, "html.parser")
+        search_soup = BeautifulSoup(search_response.content, HTML_PARSER)
 
         # ✅ 교보문고 실제 구조: data-pid="S000217279197" data-bid="9788901296883"
         product_link = None
@@ -1311,7 +1377,7 @@ def scrape_kyobo_book_info(isbn, app_instance=None):
 
         detail_response.raise_for_status()
 
-        detail_soup = BeautifulSoup(detail_response.content, "html.parser")
+        detail_soup = BeautifulSoup(detail_response.content, HTML_PARSER)
 
         # ✅ 저자소개 추출: `writer_info_box`를 먼저 찾고, 그 안에서 `info_text` 클래스의 `p` 태그를 찾습니다.
         # -------------------
@@ -7,7 +7,8 @@
 import requests
 import re
 from qt_api_clients import translate_text_batch_async, extract_year
-from bs4 import BeautifulSoup
+from lazy_imports import lazy_attr
+BeautifulSoup = lazy_attr("bs4", "BeautifulSoup")  # ✅ [성능 개선] 첫 파싱 때 import
 import socket
 import functools
 
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+# 파일명: adaptive_fetch.py
+# 설명: 페이지 목록을 적응형 동시성(AIMD)으로 받아오는 엔진 (지터 재시도 + 완료 순서 스트리밍)
+# 생성일: 2025-10-31
+# 사용처: Search_ISNI_Detailed.py
+#
+# 배경:
+# - 전체 페이지를 고정 ThreadPoolExecutor(max_workers=10)에 한꺼번에 넣으면
+#   저작물이 많은 저자는 수십 페이지가 동시에 나가 서버가 요청을 막고(429/5xx),
+#   실패한 페이지는 그대로 빠졌다. 결과도 제출 순서로만 모아 첫 페이지를 늦게 보여줬다.
+#
+# 방식 (TCP 혼잡 제어와 같은 AIMD):
+# 1. 동시 요청 한도(limit)를 initial에서 시작.
+# 2. 응답이 target_latency 안에 오면 한도를 1/limit씩 늘림 (한 창(window)마다 약 +1).
+# 3. 실패하거나 느리면 한도를 절반으로 줄임 (동시에 실패한 요청들로 여러 번 줄지 않게
+#    최근 지연 시간 안에는 한 번만).
+# 4. 실패한 페이지는 지수 백오프 × 무작위 지터(0.5~1.5배) 후 재시도, max_retries 초과 시 failed에 기록.
+# 5. 도착한 페이지는 완료 순서대로 on_page(page, result)로 즉시 전달.
+#
+#     fetcher = AdaptivePageFetcher(fetch_page, range(1, total_pages + 1),
+#                                   on_page=deliver, should_stop=stop_checker(app_instance))
+#     results = fetcher.run()   # {page: result}, fetcher.failed = {page: 마지막 예외}
+
+import heapq
+import itertools
+import random
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class AIMDController:
+    """동시 요청 한도를 응답 지연/오류에 맞춰 조절합니다 (조정 스레드 1개에서만 호출)."""
+
+    def __init__(
+        self,
+        initial=4,
+        minimum=1,
+        maximum=10,
+        target_latency=2.0,
+        increase=1.0,
+        decrease=0.5,
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.increase = increase
+        self.decrease = decrease
+        self.limit = float(max(minimum, min(initial, maximum)))
+        self.latency = None  # 응답 시간 지수이동평균 (초)
+        self._last_decrease = 0.0
+
+    @property
+    def window(self):
+        """지금 동시에 보낼 수 있는 요청 수."""
+        return max(self.minimum, min(self.maximum, int(self.limit)))
+
+    def on_success(self, elapsed):
+        self.latency = elapsed if self.latency is None else 0.8 * self.latency + 0.2 * elapsed
+        if elapsed > self.target_latency:
+            self._back_off()
+        else:
+            self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+
+    def on_failure(self):
+        self._back_off()
+
+    def _back_off(self):
+        now = time.monotonic()
+        if now - self._last_decrease < (self.latency or 1.0):
+            return  # 같은 혼잡 구간의 연속 실패는 한 번만 반영
+        self._last_decrease = now
+        self.limit = max(float(self.minimum), self.limit * self.decrease)
+
+
+class AdaptivePageFetcher:
+    """fetch_page(page)를 AIMD 한도 안에서 병렬 실행하고 실패 페이지를 재시도합니다.
+
+    fetch_page(page): 한 페이지의 결과를 반환 (실패 시 예외).
+    is_retryable(exc): 재시도할 예외인지 (기본: 모두 재시도).
+    on_page(page, result): 성공한 페이지를 완료 순서대로 전달 (run()을 호출한 스레드에서 호출).
+    on_error(page, exc): 재시도를 모두 소진한 페이지 알림.
+    """
+
+    def __init__(
+        self,
+        fetch_page,
+        pages,
+        controller=None,
+        max_retries=3,
+        retry_base_delay=0.5,
+        retry_max_delay=8.0,
+        is_retryable=None,
+        on_page=None,
+        on_error=None,
+        should_stop=None,
+        thread_name_prefix="AdaptiveFetch",
+    ):
+        self.fetch_page = fetch_page
+        self.pages = list(pages)
+        self.controller = controller or AIMDController()
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.is_retryable = is_retryable or (lambda exc: True)
+        self.on_page = on_page
+        self.on_error = on_error
+        self.should_stop = should_stop or (lambda: False)
+        self.thread_name_prefix = thread_name_prefix
+        self.results = {}  # page → result
+        self.failed = {}  # page → 마지막 예외
+        self.retries = 0
+        self.peak_concurrency = 0
+        self.stopped_by_user = False
+
+    def _timed_fetch(self, page):
+        started = time.monotonic()
+        result = self.fetch_page(page)
+        return result, time.monotonic() - started
+
+    def _retry_delay(self, attempt):
+        delay = min(self.retry_max_delay, self.retry_base_delay * (2 ** (attempt - 1)))
+        return delay * random.uniform(0.5, 1.5)
+
+    def run(self):
+        ready = deque(self.pages)
+        delayed = []  # (재시도 시각, 순번, page) 힙
+        order = itertools.count()
+        attempts = {}
+        pending = {}
+        executor = ThreadPoolExecutor(
+            max_workers=self.controller.maximum,
+            thread_name_prefix=self.thread_name_prefix,
+        )
+        try:
+            while ready or delayed or pending:
+                if self.should_stop():
+                    self.stopped_by_user = True
+                    break
+
+                now = time.monotonic()
+                while delayed and delayed[0][0] <= now:
+                    ready.appendleft(heapq.heappop(delayed)[2])  # 재시도 페이지 우선
+
+                while ready and len(pending) < self.controller.window:
+                    page = ready.popleft()
+                    pending[executor.submit(self._timed_fetch, page)] = page
+                self.peak_concurrency = max(self.peak_concurrency, len(pending))
+
+                # 중지 요청 확인을 위해 최대 0.5초마다 깨어남
+                timeout = 0.5
+                if delayed:
+                    timeout = min(timeout, max(0.0, delayed[0][0] - now))
+                if not pending:
+                    time.sleep(timeout)
+                    continue
+
+                finished, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    page = pending.pop(future)
+                    try:
+                        result, elapsed = future.result()
+                    except Exception as e:
+                        self.controller.on_failure()
+                        attempt = attempts[page] = attempts.get(page, 0) + 1
+                        if attempt <= self.max_retries and self.is_retryable(e):
+                            self.retries += 1
+                            heapq.heappush(
+                                delayed,
+                                (time.monotonic() + self._retry_delay(attempt), next(order), page),
+                            )
+                        else:
+                            self.failed[page] = e
+                            if self.on_error is not None:
+                                self.on_error(page, e)
+                        continue
+
+                    self.controller.on_success(elapsed)
+                    self.results[page] = result
+                    if self.on_page is not None:
+                        try:
+                            self.on_page(page, result)
+                        except Exception:
+                            pass
+        finally:
+            # 중지 시 진행 중인 요청은 기다리지 않음 (결과는 버림)
+            executor.shutdown(wait=False, cancel_futures=True)
+        return self.results
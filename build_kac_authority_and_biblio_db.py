@@ -13,7 +13,9 @@ KAC/KAB Authority & NLK Biblio — Batch JSON → SQLite Builder (PySide6)
 - GUI 배치: 다수 파일 + 폴더(패턴, 재귀) → 한 DB로 연속 처리
 - 스키마: 정규화 + 보조 테이블 복합 PK + WITHOUT ROWID + 인덱스 + FTS5
 - PRAGMA 튜닝: WAL, NORMAL, cache, temp_store=MEMORY
-- 진행률: 총량 미지 시에도 1,000건마다 진행 로그/라벨 갱신
+- 병렬 파이프라인: 파일별 파서 프로세스(JSON → 컬럼 튜플) + 단일 writer(테이블별 executemany)
+- 진행률: 파일 크기 합계 대비 소비 바이트 오프셋으로 총량 확정 표시
+- 재개: build_checkpoint 테이블에 파일별 처리 레코드 수 기록 → 중단 지점부터 이어서 적재
 
 실행:
     python kac_biblio_builder_gui.py
@@ -22,9 +24,12 @@ KAC/KAB Authority & NLK Biblio — Batch JSON → SQLite Builder (PySide6)
     pip install PySide6
 """
 from __future__ import annotations
+import codecs
 import fnmatch
 import json
+import multiprocessing as mp
 import os
+import queue
 import sqlite3
 import sys
 import threading
@@ -32,6 +37,8 @@ import time
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
+import fts_maintenance
+
 # optional accelerators
 try:
     import ijson  # type: ignore
@@ -55,6 +62,7 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QProgressBar,
     QPushButton,
+    QSpinBox,
     QTextEdit,
     QVBoxLayout,
     QWidget,
@@ -306,6 +314,7 @@ def init_authority_db(path: str) -> sqlite3.Connection:
             pass
     _apply_sqlite_tuning(conn)
     conn.executescript(AUTHORITY_SCHEMA)
+    conn.executescript(CHECKPOINT_SCHEMA)  # resume=False 빌드도 체크포인트를 기록
     return conn
 
 
@@ -319,23 +328,111 @@ def init_biblio_db(path: str) -> sqlite3.Connection:
             pass
     _apply_sqlite_tuning(conn)
     conn.executescript(BIBLIO_SCHEMA)
+    conn.executescript(CHECKPOINT_SCHEMA)  # resume=False 빌드도 체크포인트를 기록
     return conn
 
 
 # =====================
 # Upserters
 # =====================
+# 레코드 → 테이블별 컬럼 튜플 변환(_authority_rows/_biblio_rows)과
+# 실제 쓰기(_write_rows)를 분리한다. 변환은 파서 프로세스에서, 쓰기는 단일
+# writer에서 테이블별 대용량 executemany로 수행하기 위함.
 
+AUTHORITY_WRITE_SQL: Dict[str, str] = {
+    "authority": """
+        INSERT INTO authority (
+        kac_id_full, kac_id, type, name, pref_label, label, gender,
+        associated_language, corporate_name, isni, birth_year, death_year,
+        date_published, modified, source_all, create_all, raw_json
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(kac_id_full) DO UPDATE SET
+        kac_id=excluded.kac_id,
+        type=excluded.type,
+        name=excluded.name,
+        pref_label=excluded.pref_label,
+        label=excluded.label,
+        gender=excluded.gender,
+        associated_language=excluded.associated_language,
+        corporate_name=excluded.corporate_name,
+        isni=excluded.isni,
+        birth_year=excluded.birth_year,
+        death_year=excluded.death_year,
+        date_published=excluded.date_published,
+        modified=excluded.modified,
+        source_all=excluded.source_all,
+        create_all=excluded.create_all,
+        raw_json=excluded.raw_json
+        """,
+    # child tables: OR IGNORE 로 누적 (중복 제거)
+    "authority_altlabel": "INSERT OR IGNORE INTO authority_altlabel (kac_id_full, alt_label) VALUES (?, ?)",
+    "authority_sameas": "INSERT OR IGNORE INTO authority_sameas (kac_id_full, uri) VALUES (?, ?)",
+    "authority_source": "INSERT OR IGNORE INTO authority_source (kac_id_full, source) VALUES (?, ?)",
+    "authority_job": "INSERT OR IGNORE INTO authority_job (kac_id_full, job_title) VALUES (?, ?)",
+    "authority_field": "INSERT OR IGNORE INTO authority_field (kac_id_full, field) VALUES (?, ?)",
+    "authority_create": "INSERT OR IGNORE INTO authority_create (kac_id_full, identifier) VALUES (?, ?)",
+    # rowid를 authority.rowid에 맞춰 두어야 fts_maintenance의 델타 반영이 가능
+    "authority_fts": "INSERT INTO authority_fts (rowid, kac_id_full, name, pref_label, label, alt_labels, job_titles, fields, sources) VALUES ((SELECT rowid FROM authority WHERE kac_id_full=?1), ?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8)",
+}
+
+BIBLIO_WRITE_SQL: Dict[str, str] = {
+    "biblio": """
+        INSERT INTO biblio (
+          identifier, type, title, remainder_of_title, label, dc_creator, creator_kac,
+          issued_year, ddc, edition_of_ddc, kdc, classification_nlk, publisher,
+          publication_place, place_uri, language_uri, type_of_data, item_number_nlk,
+          local_holding, title_of_series, uniform_title_of_series, volume_of_series,
+          bibliography, date_published, same_as, raw_json
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(identifier) DO UPDATE SET
+          type=excluded.type,
+          title=excluded.title,
+          remainder_of_title=excluded.remainder_of_title,
+          label=excluded.label,
+          dc_creator=excluded.dc_creator,
+          creator_kac=excluded.creator_kac,
+          issued_year=excluded.issued_year,
+          ddc=excluded.ddc,
+          edition_of_ddc=excluded.edition_of_ddc,
+          kdc=excluded.kdc,
+          classification_nlk=excluded.classification_nlk,
+          publisher=excluded.publisher,
+          publication_place=excluded.publication_place,
+          place_uri=excluded.place_uri,
+          language_uri=excluded.language_uri,
+          type_of_data=excluded.type_of_data,
+          item_number_nlk=excluded.item_number_nlk,
+          local_holding=excluded.local_holding,
+          title_of_series=excluded.title_of_series,
+          uniform_title_of_series=excluded.uniform_title_of_series,
+          volume_of_series=excluded.volume_of_series,
+          bibliography=excluded.bibliography,
+          date_published=excluded.date_published,
+          same_as=excluded.same_as,
+          raw_json=excluded.raw_json
+        """,
+    "biblio_isbn": "INSERT OR IGNORE INTO biblio_isbn (identifier, isbn) VALUES (?, ?)",
+    "biblio_subject": "INSERT OR IGNORE INTO biblio_subject (identifier, uri) VALUES (?, ?)",
+    "biblio_sameas": "INSERT OR IGNORE INTO biblio_sameas (identifier, uri) VALUES (?, ?)",
+    "biblio_fts": "INSERT INTO biblio_fts (identifier, title, remainder_of_title, series, publisher, place, dc_creator) VALUES (?, ?, ?, ?, ?, ?, ?)",
+}
 
-def upsert_authority(
-    conn: sqlite3.Connection, rec: Dict[str, Any], build_fts: bool = True
-):
+# FTS 행 교체 시 먼저 지울 키 (FTS 튜플의 첫 컬럼)
+FTS_DELETE_SQL: Dict[str, str] = {
+    "authority_fts": "DELETE FROM authority_fts WHERE kac_id_full=?",
+    "biblio_fts": "DELETE FROM biblio_fts WHERE identifier=?",
+}
+
+RowsByTable = Dict[str, List[Tuple[Any, ...]]]
+
+
+def _authority_rows(rec: Dict[str, Any]) -> Optional[RowsByTable]:
+    """Authority JSON 레코드 → 테이블별 컬럼 튜플. KAC/KAB가 아니면 None."""
     kac_id_full = rec.get("@id") or ""
     # Accept both KAC (persons) and KAB (corporate bodies). Skip others (e.g., FOAF without NLK id).
     if not (kac_id_full.startswith("nlk:KAC") or kac_id_full.startswith("nlk:KAB")):
-        return
+        return None
 
-    cur = conn.cursor()
     kac_id = _extract_kac_code(kac_id_full)
     atype = rec.get("@type") or rec.get("rdf:type")
 
@@ -361,93 +458,39 @@ def upsert_authority(
     create_all_json = json.dumps(creates, ensure_ascii=False) if creates else None
     source_all_json = json.dumps(sources, ensure_ascii=False) if sources else None
 
-    cur.execute(
-        """
-        INSERT INTO authority (
-        kac_id_full, kac_id, type, name, pref_label, label, gender,
-        associated_language, corporate_name, isni, birth_year, death_year,
-        date_published, modified, source_all, create_all, raw_json
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(kac_id_full) DO UPDATE SET
-        kac_id=excluded.kac_id,
-        type=excluded.type,
-        name=excluded.name,
-        pref_label=excluded.pref_label,
-        label=excluded.label,
-        gender=excluded.gender,
-        associated_language=excluded.associated_language,
-        corporate_name=excluded.corporate_name,
-        isni=excluded.isni,
-        birth_year=excluded.birth_year,
-        death_year=excluded.death_year,
-        date_published=excluded.date_published,
-        modified=excluded.modified,
-        source_all=excluded.source_all,
-        create_all=excluded.create_all,
-        raw_json=excluded.raw_json
-        """,
-        (
-            kac_id_full,
-            kac_id,
+    return {
+        "authority": [
             (
-                json.dumps(atype, ensure_ascii=False)
-                if isinstance(atype, list)
-                else str(atype) if atype else None
-            ),
-            name,
-            pref_label,
-            label,
-            gender,
-            associated_language,
-            corporate_name,
-            isni,
-            birth_year,
-            death_year,
-            date_published,
-            modified,
-            source_all_json,
-            create_all_json,
-            json.dumps(rec, ensure_ascii=False),
-        ),
-    )
-
-    # child tables: OR IGNORE 로 누적 (중복 제거)
-    if alt_labels:
-        cur.executemany(
-            "INSERT OR IGNORE INTO authority_altlabel (kac_id_full, alt_label) VALUES (?, ?)",
-            [(kac_id_full, v) for v in alt_labels],
-        )
-    if same_as:
-        cur.executemany(
-            "INSERT OR IGNORE INTO authority_sameas (kac_id_full, uri) VALUES (?, ?)",
-            [(kac_id_full, v) for v in same_as],
-        )
-    if sources:
-        cur.executemany(
-            "INSERT OR IGNORE INTO authority_source (kac_id_full, source) VALUES (?, ?)",
-            [(kac_id_full, v) for v in sources],
-        )
-    if job_titles:
-        cur.executemany(
-            "INSERT OR IGNORE INTO authority_job (kac_id_full, job_title) VALUES (?, ?)",
-            [(kac_id_full, v) for v in job_titles],
-        )
-    if fields:
-        cur.executemany(
-            "INSERT OR IGNORE INTO authority_field (kac_id_full, field) VALUES (?, ?)",
-            [(kac_id_full, v) for v in fields],
-        )
-    if creates:
-        cur.executemany(
-            "INSERT OR IGNORE INTO authority_create (kac_id_full, identifier) VALUES (?, ?)",
-            [(kac_id_full, v) for v in creates],
-        )
-
-    # FTS: 즉시 구축은 옵션 (대량 적재시 지연 재구축 권장)
-    if build_fts:
-        cur.execute("DELETE FROM authority_fts WHERE kac_id_full=?", (kac_id_full,))
-        cur.execute(
-            "INSERT INTO authority_fts (kac_id_full, name, pref_label, label, alt_labels, job_titles, fields, sources) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                kac_id_full,
+                kac_id,
+                (
+                    json.dumps(atype, ensure_ascii=False)
+                    if isinstance(atype, list)
+                    else str(atype) if atype else None
+                ),
+                name,
+                pref_label,
+                label,
+                gender,
+                associated_language,
+                corporate_name,
+                isni,
+                birth_year,
+                death_year,
+                date_published,
+                modified,
+                source_all_json,
+                create_all_json,
+                json.dumps(rec, ensure_ascii=False),
+            )
+        ],
+        "authority_altlabel": [(kac_id_full, v) for v in alt_labels],
+        "authority_sameas": [(kac_id_full, v) for v in same_as],
+        "authority_source": [(kac_id_full, v) for v in sources],
+        "authority_job": [(kac_id_full, v) for v in job_titles],
+        "authority_field": [(kac_id_full, v) for v in fields],
+        "authority_create": [(kac_id_full, v) for v in creates],
+        "authority_fts": [
             (
                 kac_id_full,
                 name or "",
@@ -457,17 +500,16 @@ def upsert_authority(
                 _join_non_empty(job_titles),
                 _join_non_empty(fields),
                 _join_non_empty(sources),
-            ),
-        )
+            )
+        ],
+    }
 
 
-def upsert_biblio(
-    conn: sqlite3.Connection, rec: Dict[str, Any], build_fts: bool = True
-):
-    cur = conn.cursor()
+def _biblio_rows(rec: Dict[str, Any]) -> Optional[RowsByTable]:
+    """Biblio JSON 레코드 → 테이블별 컬럼 튜플. identifier가 없으면 None."""
     identifier = rec.get("@id") or rec.get("identifier") or ""
     if not identifier:
-        return
+        return None
 
     atype = rec.get("@type") or rec.get("rdf:type")
     title = _pick_best_text(rec.get("title"))
@@ -505,100 +547,48 @@ def upsert_biblio(
 
     raw_json = json.dumps(rec, ensure_ascii=False)
 
-    cur.execute(
-        """
-        INSERT INTO biblio (
-          identifier, type, title, remainder_of_title, label, dc_creator, creator_kac,
-          issued_year, ddc, edition_of_ddc, kdc, classification_nlk, publisher,
-          publication_place, place_uri, language_uri, type_of_data, item_number_nlk,
-          local_holding, title_of_series, uniform_title_of_series, volume_of_series,
-          bibliography, date_published, same_as, raw_json
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(identifier) DO UPDATE SET
-          type=excluded.type,
-          title=excluded.title,
-          remainder_of_title=excluded.remainder_of_title,
-          label=excluded.label,
-          dc_creator=excluded.dc_creator,
-          creator_kac=excluded.creator_kac,
-          issued_year=excluded.issued_year,
-          ddc=excluded.ddc,
-          edition_of_ddc=excluded.edition_of_ddc,
-          kdc=excluded.kdc,
-          classification_nlk=excluded.classification_nlk,
-          publisher=excluded.publisher,
-          publication_place=excluded.publication_place,
-          place_uri=excluded.place_uri,
-          language_uri=excluded.language_uri,
-          type_of_data=excluded.type_of_data,
-          item_number_nlk=excluded.item_number_nlk,
-          local_holding=excluded.local_holding,
-          title_of_series=excluded.title_of_series,
-          uniform_title_of_series=excluded.uniform_title_of_series,
-          volume_of_series=excluded.volume_of_series,
-          bibliography=excluded.bibliography,
-          date_published=excluded.date_published,
-          same_as=excluded.same_as,
-          raw_json=excluded.raw_json
-        """,
-        (
-            identifier,
-            (
-                json.dumps(atype, ensure_ascii=False)
-                if isinstance(atype, list)
-                else str(atype) if atype else None
-            ),
-            title,
-            remainder,
-            label,
-            dc_creator,
-            creator_kac_repr,
-            issued_year,
-            ddc,
-            edition_of_ddc,
-            kdc,
-            classification_nlk,
-            publisher,
-            publication_place,
-            place_uri,
-            language_uri,
-            type_of_data,
-            item_number_nlk,
-            local_holding,
-            title_of_series,
-            uniform_title_of_series,
-            volume_of_series,
-            bibliography,
-            date_published,
-            json.dumps(sameas_list, ensure_ascii=False) if sameas_list else None,
-            raw_json,
-        ),
-    )
-
-    if isbns:
-        cur.executemany(
-            "INSERT OR IGNORE INTO biblio_isbn (identifier, isbn) VALUES (?, ?)",
-            [(identifier, v) for v in isbns],
-        )
-    if subjects:
-        cur.executemany(
-            "INSERT OR IGNORE INTO biblio_subject (identifier, uri) VALUES (?, ?)",
-            [(identifier, v) for v in subjects],
-        )
-    if sameas_list:
-        cur.executemany(
-            "INSERT OR IGNORE INTO biblio_sameas (identifier, uri) VALUES (?, ?)",
-            [(identifier, v) for v in sameas_list],
-        )
+    # FTS 요약
+    series_ = _join_non_empty([title_of_series or "", uniform_title_of_series or ""])
 
-    # FTS 요약 (옵션)
-    if build_fts:
-        series_ = _join_non_empty(
-            [title_of_series or "", uniform_title_of_series or ""]
-        )
-        cur.execute("DELETE FROM biblio_fts WHERE identifier=?", (identifier,))
-        cur.execute(
-            "INSERT INTO biblio_fts (identifier, title, remainder_of_title, series, publisher, place, dc_creator) VALUES (?, ?, ?, ?, ?, ?, ?)",
+    return {
+        "biblio": [
+            (
+                identifier,
+                (
+                    json.dumps(atype, ensure_ascii=False)
+                    if isinstance(atype, list)
+                    else str(atype) if atype else None
+                ),
+                title,
+                remainder,
+                label,
+                dc_creator,
+                creator_kac_repr,
+                issued_year,
+                ddc,
+                edition_of_ddc,
+                kdc,
+                classification_nlk,
+                publisher,
+                publication_place,
+                place_uri,
+                language_uri,
+                type_of_data,
+                item_number_nlk,
+                local_holding,
+                title_of_series,
+                uniform_title_of_series,
+                volume_of_series,
+                bibliography,
+                date_published,
+                json.dumps(sameas_list, ensure_ascii=False) if sameas_list else None,
+                raw_json,
+            )
+        ],
+        "biblio_isbn": [(identifier, v) for v in isbns],
+        "biblio_subject": [(identifier, v) for v in subjects],
+        "biblio_sameas": [(identifier, v) for v in sameas_list],
+        "biblio_fts": [
             (
                 identifier,
                 title or "",
@@ -607,8 +597,52 @@ def upsert_biblio(
                 publisher or "",
                 publication_place or "",
                 dc_creator or "",
-            ),
-        )
+            )
+        ],
+    }
+
+
+ROW_BUILDERS = {"authority": _authority_rows, "biblio": _biblio_rows}
+WRITE_SQL = {"authority": AUTHORITY_WRITE_SQL, "biblio": BIBLIO_WRITE_SQL}
+
+
+def _merge_rows(dst: RowsByTable, src: RowsByTable) -> None:
+    for table, rows in src.items():
+        if rows:
+            dst.setdefault(table, []).extend(rows)
+
+
+def _write_rows(
+    conn: sqlite3.Connection, kind: str, rows: RowsByTable, build_fts: bool = True
+) -> None:
+    """테이블별 튜플 묶음을 executemany로 기록 (커밋은 호출 측 책임)."""
+    cur = conn.cursor()
+    for table, sql in WRITE_SQL[kind].items():
+        table_rows = rows.get(table)
+        if not table_rows:
+            continue
+        if table in FTS_DELETE_SQL:
+            # FTS: 즉시 구축은 옵션 (대량 적재시 지연 재구축 권장)
+            if not build_fts:
+                continue
+            cur.executemany(FTS_DELETE_SQL[table], [(r[0],) for r in table_rows])
+        cur.executemany(sql, table_rows)
+
+
+def upsert_authority(
+    conn: sqlite3.Connection, rec: Dict[str, Any], build_fts: bool = True
+):
+    rows = _authority_rows(rec)
+    if rows:
+        _write_rows(conn, "authority", rows, build_fts=build_fts)
+
+
+def upsert_biblio(
+    conn: sqlite3.Connection, rec: Dict[str, Any], build_fts: bool = True
+):
+    rows = _biblio_rows(rec)
+    if rows:
+        _write_rows(conn, "biblio", rows, build_fts=build_fts)
 
 
 # =====================
@@ -632,17 +666,39 @@ def _yield_records_from_value(val):
             yield val
 
 
-def _iter_json_records(path: str, log: callable) -> Iterable[Dict[str, Any]]:
+class _CountingReader:
+    """Binary file wrapper that tracks how many bytes have been consumed.
+    파서가 얼마나 읽었는지(바이트 오프셋)로 파일 크기 대비 진행률을 계산한다."""
+
+    def __init__(self, f):
+        self._f = f
+        self.pos = 0
+
+    def read(self, n: int = -1) -> bytes:
+        data = self._f.read(n)
+        self.pos += len(data)
+        return data
+
+
+def _iter_json_records(
+    path: str, log: callable, reader_out: Optional[List[_CountingReader]] = None
+) -> Iterable[Dict[str, Any]]:
     """High-performance streaming reader.
     Uses ijson if available (fast, incremental),
     otherwise falls back to a robust raw_decode-based concatenated parser.
+
+    reader_out: if given, the active _CountingReader is appended so callers can
+    poll `.pos` (bytes consumed) for progress reporting.
     """
     if HAS_IJSON:
         try:
             # Try fast path: top-level array(s) OR concatenated values
             with open(path, "rb") as f:
+                rf = _CountingReader(f)
+                if reader_out is not None:
+                    reader_out.append(rf)
                 any_yielded = False
-                for obj in ijson.items(f, "item", multiple_values=True):
+                for obj in ijson.items(rf, "item", multiple_values=True):
                     if isinstance(obj, dict):
                         any_yielded = True
                         yield obj
@@ -650,7 +706,10 @@ def _iter_json_records(path: str, log: callable) -> Iterable[Dict[str, Any]]:
                     return
             # Try @graph streaming
             with open(path, "rb") as f:
-                for obj in ijson.items(f, "@graph.item", multiple_values=True):
+                rf = _CountingReader(f)
+                if reader_out is not None:
+                    reader_out.append(rf)
+                for obj in ijson.items(rf, "@graph.item", multiple_values=True):
                     if isinstance(obj, dict):
                         yield obj
                 return
@@ -658,16 +717,23 @@ def _iter_json_records(path: str, log: callable) -> Iterable[Dict[str, Any]]:
             log(f"[i] ijson fallback: {e}")
     # ---- fallback raw_decode (concatenated) ----
     dec = _json.JSONDecoder()
+    # utf-8-sig: strips a leading BOM
+    text_dec = codecs.getincrementaldecoder("utf-8-sig")()
     buf = ""
     pos = 0
     CHUNK = 4 * 1024 * 1024
-    with open(path, "r", encoding="utf-8") as f:
-        first = f.read(1)
-        if first and first != "﻿":
-            buf = first
+    with open(path, "rb") as f:
+        rf = _CountingReader(f)
+        if reader_out is not None:
+            reader_out.append(rf)
+
+        def _read_chunk() -> str:
+            raw = rf.read(CHUNK)
+            return text_dec.decode(raw, final=not raw)
+
         while True:
             if pos >= len(buf):
-                chunk = f.read(CHUNK)
+                chunk = _read_chunk()
                 if not chunk:
                     break
                 buf = buf[pos:] + chunk
@@ -679,7 +745,7 @@ def _iter_json_records(path: str, log: callable) -> Iterable[Dict[str, Any]]:
             try:
                 val, end = dec.raw_decode(buf, pos)
             except _json.JSONDecodeError:
-                more = f.read(CHUNK)
+                more = _read_chunk()
                 if more:
                     buf += more
                     continue
@@ -692,6 +758,102 @@ def _iter_json_records(path: str, log: callable) -> Iterable[Dict[str, Any]]:
             pos = end
 
 
+# =====================
+# Parallel pipeline: parser processes → single writer
+# =====================
+# - 파일 단위로 파서 프로세스를 띄워 JSON → 컬럼 튜플 변환을 병렬화 (GIL 회피)
+# - 메인(writer)은 테이블별 대용량 executemany + 주기적 커밋만 담당
+# - 진행률: 파일 크기 합계 대비 파서가 소비한 바이트 오프셋 (총량 확정)
+# - 재개: build_checkpoint 테이블에 파일별 처리 레코드 수를 데이터와 같은 트랜잭션으로 기록
+
+CHECKPOINT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS build_checkpoint (
+  kind         TEXT NOT NULL,
+  path         TEXT NOT NULL,
+  file_size    INTEGER NOT NULL,
+  file_mtime   REAL NOT NULL,
+  records_done INTEGER NOT NULL DEFAULT 0,
+  completed    INTEGER NOT NULL DEFAULT 0,
+  updated_at   TEXT,
+  PRIMARY KEY (kind, path)
+);
+"""
+
+
+def _load_checkpoints(
+    conn: sqlite3.Connection, kind: str
+) -> Dict[str, Tuple[int, float, int, int]]:
+    """path → (file_size, file_mtime, records_done, completed)
+    build_checkpoint 테이블은 init_authority_db/init_biblio_db에서 생성됩니다."""
+    cur = conn.execute(
+        "SELECT path, file_size, file_mtime, records_done, completed FROM build_checkpoint WHERE kind=?",
+        (kind,),
+    )
+    return {r[0]: (r[1], r[2], r[3], r[4]) for r in cur.fetchall()}
+
+
+def _save_checkpoint(
+    conn: sqlite3.Connection,
+    kind: str,
+    path: str,
+    records_done: int,
+    completed: bool,
+) -> None:
+    st = os.stat(path)
+    conn.execute(
+        """
+        INSERT INTO build_checkpoint (kind, path, file_size, file_mtime, records_done, completed, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
+        ON CONFLICT(kind, path) DO UPDATE SET
+          file_size=excluded.file_size,
+          file_mtime=excluded.file_mtime,
+          records_done=excluded.records_done,
+          completed=excluded.completed,
+          updated_at=excluded.updated_at
+        """,
+        (kind, path, st.st_size, st.st_mtime, records_done, 1 if completed else 0),
+    )
+
+
+def _parse_file_worker(path: str, kind: str, skip: int, chunk_records: int, out_q, cancel_ev):
+    """Parser process entry point.
+
+    Messages sent to the writer:
+      ("log",  path, text)
+      ("rows", path, records_seen_total, bytes_consumed, rows_by_table)
+      ("done", path, ok, error_or_None)
+    The first `skip` records were already written by a previous run (checkpoint);
+    they are parsed for position only and not converted.
+    """
+    build = ROW_BUILDERS[kind]
+    readers: List[_CountingReader] = []
+
+    def _log(m: str):
+        out_q.put(("log", path, m))
+
+    try:
+        chunk: RowsByTable = {}
+        seen = 0
+        last_sent = 0
+        for rec in _iter_json_records(path, _log, readers):
+            if cancel_ev.is_set():
+                break
+            seen += 1
+            if seen > skip:
+                rows = build(rec)
+                if rows:
+                    _merge_rows(chunk, rows)
+            if seen - last_sent >= chunk_records:
+                out_q.put(("rows", path, seen, readers[-1].pos, chunk))
+                chunk = {}
+                last_sent = seen
+        if seen > last_sent:
+            out_q.put(("rows", path, seen, readers[-1].pos if readers else 0, chunk))
+        out_q.put(("done", path, not cancel_ev.is_set(), None))
+    except Exception as e:
+        out_q.put(("done", path, False, f"{type(e).__name__}: {e}"))
+
+
 # =====================
 # Batch worker
 # =====================
@@ -703,8 +865,11 @@ class TaskConfig:
     authority_db: Optional[str]
     biblio_files: List[str]
     biblio_db: Optional[str]
-    batch_size: int = 2000
+    batch_size: int = 2000  # records per parser → writer chunk
     fast_mode: bool = False  # safer default for big files
+    parallel_workers: int = 0  # parser processes (0 = auto: CPU-1, ≤ file count)
+    write_batch: int = 50000  # records per writer commit
+    resume: bool = True  # skip records already recorded in build_checkpoint
 
 
 class BuildWorker(QThread):
@@ -728,8 +893,31 @@ class BuildWorker(QThread):
     def _process_many(self, files: List[str], db_path: str, kind: str) -> int:
         if not files:
             return 0
+        conn = init_authority_db(db_path) if kind == "authority" else init_biblio_db(db_path)
+        checkpoints = _load_checkpoints(conn, kind) if self.cfg.resume else {}
+        if not self.cfg.resume:
+            conn.execute("DELETE FROM build_checkpoint WHERE kind=?", (kind,))
+
+        # 파일별 시작 위치 결정 (크기/수정시각이 같을 때만 체크포인트 신뢰)
+        plan: List[Tuple[str, int]] = []
+        done_bytes: Dict[str, int] = {}
+        for path in files:
+            st = os.stat(path)
+            ck = checkpoints.get(path)
+            if ck and ck[0] == st.st_size and abs(ck[1] - st.st_mtime) < 1e-6:
+                if ck[3]:
+                    self._log(f"[i] resume: skip completed {os.path.basename(path)}")
+                    done_bytes[path] = st.st_size
+                    continue
+                self._log(
+                    f"[i] resume: {os.path.basename(path)} from record {ck[2]:,}"
+                )
+                plan.append((path, ck[2]))
+            else:
+                plan.append((path, 0))
+        resuming = len(plan) < len(files) or any(skip for _, skip in plan)
+
         if kind == "authority":
-            conn = init_authority_db(db_path)
             if self.cfg.fast_mode:
                 conn.executescript(
                     """
@@ -744,13 +932,23 @@ DROP INDEX IF EXISTS idx_authority_field_kac;
 DROP INDEX IF EXISTS idx_authority_create_kac;
 DROP INDEX IF EXISTS idx_authority_create_id;
 DROP INDEX IF EXISTS idx_authority_source_kac;
-DELETE FROM authority_fts;
 """
                 )
+            # authority_fts: 최초 구축이면 적재 후 1회 전체 구축, 기존 색인이 있으면
+            # 더티 추적 트리거로 변경된 전거만 델타 반영 (DB 전체 잠금 재구축 회피)
+            fts_empty = conn.execute("SELECT 1 FROM authority_fts LIMIT 1").fetchone() is None
+            authority_fts_delta = not fts_empty and fts_maintenance.is_rowid_aligned(
+                conn, "authority_fts"
+            )
+            if authority_fts_delta:
+                fts_maintenance.install_dirty_tracking(conn, "authority_fts")
             else:
-                conn.execute("DELETE FROM authority_fts;")
+                fts_maintenance.uninstall_dirty_tracking(conn, "authority_fts")
+            self._log(
+                "[i] authority_fts: "
+                + ("delta update (dirty tracking)" if authority_fts_delta else "full build after load")
+            )
         else:
-            conn = init_biblio_db(db_path)
             if self.cfg.fast_mode:
                 conn.executescript(
                     """
@@ -762,52 +960,20 @@ DROP INDEX IF EXISTS idx_biblio_isbn_id;
 DROP INDEX IF EXISTS idx_biblio_isbn_isbn;
 DROP INDEX IF EXISTS idx_biblio_subject_id;
 DROP INDEX IF EXISTS idx_biblio_sameas_id;
-DELETE FROM biblio_fts;
+INSERT INTO biblio_fts(biblio_fts) VALUES('delete-all');
 """
                 )
-            else:
-                conn.execute("DELETE FROM biblio_fts;")
+            elif not resuming:
+                conn.execute("INSERT INTO biblio_fts(biblio_fts) VALUES('delete-all');")
         conn.commit()
 
         processed = 0
-        self.sig_progress.emit(0, -1)  # unknown total → indeterminate
-
+        # authority_fts는 인라인 대신 적재 후 델타/전체 구축으로 처리
+        build_fts_inline = self._build_fts_inline and kind != "authority"
         try:
-            with conn:
-                for path in files:
-                    if self._cancel.is_set():
-                        self._log("[!] Cancel requested. Aborting…")
-                        break
-                    self.sig_phase.emit(f"{kind}: {os.path.basename(path)}")
-                    self._log(f"[*] {kind} → {path}")
-                    batch = 0
-                    for rec in _iter_json_records(path, self._log):
-                        if self._cancel.is_set():
-                            break
-                        if kind == "authority":
-                            upsert_authority(
-                                conn, rec, build_fts=self._build_fts_inline
-                            )
-                        else:
-                            upsert_biblio(conn, rec, build_fts=self._build_fts_inline)
-                        processed += 1
-                        batch += 1
-
-                        # show some heartbeat for unknown total
-                        if processed % 1000 == 0:
-                            self.sig_phase.emit(
-                                f"{kind}: {os.path.basename(path)} · {processed:,} rec"
-                            )
-                            self.sig_log.emit(
-                                f"[i] {kind} processed so far: {processed:,}"
-                            )
-                            self.sig_progress.emit(processed, -1)
-
-                        if batch >= self.cfg.batch_size:
-                            conn.commit()
-                            batch = 0
-                    if batch:
-                        conn.commit()
+            processed = self._run_pipeline(
+                conn, kind, files, plan, done_bytes, build_fts_inline
+            )
         finally:
             # post steps for fast mode: rebuild indexes & FTS
             if self.cfg.fast_mode:
@@ -825,27 +991,6 @@ CREATE INDEX IF NOT EXISTS idx_authority_field_kac   ON authority_field(kac_id_f
 CREATE INDEX IF NOT EXISTS idx_authority_create_kac  ON authority_create(kac_id_full);
 CREATE INDEX IF NOT EXISTS idx_authority_create_id   ON authority_create(identifier);
 CREATE INDEX IF NOT EXISTS idx_authority_source_kac  ON authority_source(kac_id_full);
--- bulk build FTS
-DELETE FROM authority_fts;
-
-INSERT INTO authority_fts
-  (kac_id_full, name, pref_label, label, alt_labels, job_titles, fields, sources)
-SELECT
-  a.kac_id_full,
-  COALESCE(a.name, ''),
-  COALESCE(a.pref_label, ''),
-  COALESCE(a.label, ''),
-  COALESCE((SELECT GROUP_CONCAT(alt_label, ', ')
-            FROM authority_altlabel x WHERE x.kac_id_full=a.kac_id_full), ''),
-  COALESCE((SELECT GROUP_CONCAT(job_title, ', ')
-            FROM authority_job x WHERE x.kac_id_full=a.kac_id_full), ''),
-  COALESCE((SELECT GROUP_CONCAT(field, ', ')
-            FROM authority_field x WHERE x.kac_id_full=a.kac_id_full), ''),
-  COALESCE((SELECT GROUP_CONCAT(source, ', ')
-            FROM authority_source x WHERE x.kac_id_full=a.kac_id_full), '')
-FROM authority AS a;   -- ← 이 줄 추가
-
-INSERT INTO authority_fts(authority_fts) VALUES('optimize');
 PRAGMA synchronous=NORMAL;
 """
                         )
@@ -861,7 +1006,7 @@ CREATE INDEX IF NOT EXISTS idx_biblio_isbn_isbn    ON biblio_isbn(isbn);
 CREATE INDEX IF NOT EXISTS idx_biblio_subject_id   ON biblio_subject(identifier);
 CREATE INDEX IF NOT EXISTS idx_biblio_sameas_id    ON biblio_sameas(identifier);
 -- bulk build FTS
-DELETE FROM biblio_fts;
+INSERT INTO biblio_fts(biblio_fts) VALUES('delete-all');
 INSERT INTO biblio_fts (identifier, title, remainder_of_title, series, publisher, place, dc_creator)
 SELECT b.identifier,
        COALESCE(b.title, ''),
@@ -882,10 +1027,162 @@ PRAGMA synchronous=NORMAL;
                     self._log(f"[WARN] post-build optimize failed: {e}")
                 finally:
                     conn.commit()
+            if kind == "authority":
+                try:
+                    self._finish_authority_fts(conn, authority_fts_delta)
+                except Exception as e:
+                    self._log(f"[WARN] authority_fts update failed: {e}")
             conn.close()
         self._log(f"[✓] {kind} processed: {processed}")
         return processed
 
+    def _finish_authority_fts(self, conn: sqlite3.Connection, delta: bool):
+        """적재 후 authority_fts 반영: 델타(변경 전거만) 또는 최초 1회 전체 구축."""
+        if delta:
+            self.sig_phase.emit("authority_fts: applying delta…")
+            n = fts_maintenance.apply_all_dirty(
+                conn,
+                "authority_fts",
+                batch=self.cfg.write_batch,
+                progress=lambda done, total: self.sig_log.emit(
+                    f"[i] authority_fts delta {done:,}/{total:,}"
+                ),
+            )
+            self._log(f"[✓] authority_fts delta applied: {n:,} rows")
+        else:
+            self.sig_phase.emit("authority_fts: full build…")
+            fts_maintenance.rebuild_full(conn, "authority_fts")
+            # 이후 실행부터는 변경분만 반영하도록 추적 트리거 설치
+            fts_maintenance.install_dirty_tracking(conn, "authority_fts")
+            self._log("[✓] authority_fts built (dirty tracking installed)")
+        # 'optimize' 대신 세그먼트 병합은 FtsMaintainer/merge_step에 맡김
+
+    def _run_pipeline(
+        self,
+        conn: sqlite3.Connection,
+        kind: str,
+        files: List[str],
+        plan: List[Tuple[str, int]],
+        done_bytes: Dict[str, int],
+        build_fts_inline: bool,
+    ) -> int:
+        """Parser processes → queue → this thread (single writer). Returns records written."""
+        total_bytes = sum(os.path.getsize(p) for p in files) or 1
+        # Qt int 시그널 범위를 넘지 않도록 진행률은 KiB 단위로 보고
+        total_kb = max(1, total_bytes // 1024)
+        self.sig_progress.emit(sum(done_bytes.values()) // 1024, total_kb)
+        if not plan:
+            return 0
+
+        n_workers = self.cfg.parallel_workers or max(1, (os.cpu_count() or 2) - 1)
+        n_workers = max(1, min(n_workers, len(plan)))
+        self._log(f"[*] {kind}: {len(plan)} file(s), {n_workers} parser process(es)")
+
+        ctx = mp.get_context("spawn")
+        out_q = ctx.Queue(maxsize=n_workers * 4)  # backpressure: 파서가 writer를 앞지르지 않게
+        cancel_ev = ctx.Event()
+        todo = list(plan)
+        active: Dict[str, Any] = {}
+
+        def _start_next():
+            while todo and len(active) < n_workers:
+                path, skip = todo.pop(0)
+                proc = ctx.Process(
+                    target=_parse_file_worker,
+                    args=(path, kind, skip, self.cfg.batch_size, out_q, cancel_ev),
+                    daemon=True,
+                )
+                proc.start()
+                active[path] = proc
+                self.sig_phase.emit(f"{kind}: {os.path.basename(path)}")
+                self._log(f"[*] {kind} → {path}")
+
+        pending: RowsByTable = {}
+        pending_records = 0
+        pending_ckpt: Dict[str, int] = {}
+        seen_by_file: Dict[str, int] = {p: skip for p, skip in plan}
+        processed = 0
+
+        def _flush(completed_path: Optional[str] = None):
+            nonlocal pending, pending_records, processed
+            if pending:
+                _write_rows(conn, kind, pending, build_fts=build_fts_inline)
+            for p, seen in pending_ckpt.items():
+                _save_checkpoint(conn, kind, p, seen, completed=(p == completed_path))
+            if completed_path and completed_path not in pending_ckpt:
+                _save_checkpoint(
+                    conn, kind, completed_path, seen_by_file[completed_path], True
+                )
+            conn.commit()
+            processed += pending_records
+            pending = {}
+            pending_records = 0
+            pending_ckpt.clear()
+
+        _start_next()
+        try:
+            while active:
+                if self._cancel.is_set() and not cancel_ev.is_set():
+                    self._log("[!] Cancel requested. Aborting…")
+                    cancel_ev.set()
+                try:
+                    msg = out_q.get(timeout=0.5)
+                except queue.Empty:
+                    # 메시지 없이 죽은 파서 프로세스 감지
+                    for path, proc in list(active.items()):
+                        if not proc.is_alive() and proc.exitcode not in (None, 0):
+                            self._log(f"[ERROR] parser died ({proc.exitcode}): {path}")
+                            active.pop(path)
+                    _start_next()
+                    continue
+
+                tag, path = msg[0], msg[1]
+                if tag == "log":
+                    self._log(msg[2])
+                elif tag == "rows":
+                    seen, pos, rows = msg[2], msg[3], msg[4]
+                    # 체크포인트 이전 구간(skip)을 지나는 동안에는 새로 쓴 레코드가 없음
+                    pending_records += max(0, seen - seen_by_file[path])
+                    seen_by_file[path] = max(seen, seen_by_file[path])
+                    done_bytes[path] = pos
+                    pending_ckpt[path] = seen_by_file[path]
+                    _merge_rows(pending, rows)
+                    if pending_records >= self.cfg.write_batch:
+                        _flush()
+                        self.sig_log.emit(
+                            f"[i] {kind} processed so far: {processed:,}"
+                        )
+                    self.sig_progress.emit(sum(done_bytes.values()) // 1024, total_kb)
+                elif tag == "done":
+                    ok, err = msg[2], msg[3]
+                    proc = active.pop(path, None)
+                    if proc is not None:
+                        proc.join()
+                    if ok:
+                        done_bytes[path] = os.path.getsize(path)
+                        _flush(completed_path=path)
+                        self._log(
+                            f"[✓] {os.path.basename(path)}: {seen_by_file[path]:,} rec"
+                        )
+                    else:
+                        _flush()
+                        if err:
+                            self._log(f"[ERROR] {path}: {err}")
+                    self.sig_phase.emit(
+                        f"{kind}: {len(files) - len(todo) - len(active)}/{len(files)} files · {processed:,} rec"
+                    )
+                    self.sig_progress.emit(sum(done_bytes.values()) // 1024, total_kb)
+                    if not self._cancel.is_set():
+                        _start_next()
+            _flush()
+        finally:
+            cancel_ev.set()
+            for proc in active.values():
+                proc.join(timeout=5)
+                if proc.is_alive():
+                    proc.terminate()
+        return processed
+
     def run(self):
         try:
             grand_total = 0
@@ -977,12 +1274,20 @@ class BuilderGUI(QWidget):
         self.btn_start = QPushButton("Start")
         self.btn_cancel = QPushButton("Cancel")
         self.chk_fast = QCheckBox("Turbo build (drop/rebuild indexes & FTS, sync=OFF)")
+        self.chk_resume = QCheckBox("Resume from checkpoint")
+        self.chk_resume.setChecked(True)
+        self.spin_workers = QSpinBox()
+        self.spin_workers.setRange(0, max(1, os.cpu_count() or 1))
+        self.spin_workers.setSpecialValueText("auto")
+        self.spin_workers.setPrefix("Parsers: ")
         self.btn_cancel.setEnabled(False)
 
         ctl = QHBoxLayout()
         ctl.addWidget(self.lbl_phase)
         ctl.addStretch(1)
         ctl.addWidget(self.chk_fast)
+        ctl.addWidget(self.chk_resume)
+        ctl.addWidget(self.spin_workers)
         ctl.addWidget(self.btn_start)
         ctl.addWidget(self.btn_cancel)
 
@@ -1114,6 +1419,8 @@ class BuilderGUI(QWidget):
             biblio_files=bib_files,
             biblio_db=self.bib_db.text() or None,
             fast_mode=self.chk_fast.isChecked(),
+            parallel_workers=self.spin_workers.value(),
+            resume=self.chk_resume.isChecked(),
         )
         self.worker = BuildWorker(cfg)
         self.worker.sig_log.connect(self.append_log)
@@ -1142,7 +1449,10 @@ class BuilderGUI(QWidget):
             if self.progress.maximum() != total:
                 self.progress.setRange(0, total)
             self.progress.setValue(current)
-            self.lbl_phase.setText(f"{current:,} / {total:,}")
+            # current/total: KiB (파서가 소비한 바이트 오프셋 기준)
+            self.lbl_phase.setText(
+                f"{current / 1024:,.0f} / {total / 1024:,.0f} MB ({current * 100 / total:.1f}%)"
+            )
 
     @Slot(str)
     def on_phase(self, text: str):
@@ -1169,4 +1479,5 @@ def main():
 
 
 if __name__ == "__main__":
+    mp.freeze_support()  # PyInstaller 빌드에서 파서 프로세스(spawn) 지원
     main()
@@ -1,7 +1,31 @@
 ﻿# -*- coding: utf-8 -*-
 """파일명: database_manager.py
-버전: v2.2.0
-수정일: 2025-10-19
+버전: v2.3.4
+수정일: 2025-10-31
+
+[2025-10-31 업데이트 내역 - v2.3.4]
+- 앱 시작 시 벡터 모델 프리로드 연결 해제 (qt_main_app은 다시 DatabaseManager 사용)
+  : 런타임 검색 경로가 벡터 검색을 호출하지 않으므로 preload_model_async()는 명시적 호출용으로만 유지
+
+[2025-10-31 업데이트 내역 - v2.3.3]
+- VectorDDCManager: faiss 인덱스 로드를 생성자에서 프리로드 스레드/첫 검색으로 이동
+  (앱이 시작 시 VectorDDCManager를 만들어도 faiss import/인덱스 읽기로 멈추지 않음)
+
+[2025-10-31 업데이트 내역 - v2.3.2]
+- 번역 메모리(translation_memory.py) 연동: translation_memory 속성, get_translations() 일괄 조회,
+  번역 쓰기 큐(enqueue_translations) + 전담 워커 스레드 (첫 기록 때 시작)
+
+[2025-10-31 업데이트 내역 - v2.3.1]
+- 로컬 전거 DB(NLK_Authorities.sqlite) 경로/연결 추가 (저자전거 검색 로컬 우선 검색용)
+
+[2025-10-31 업데이트 내역 - v2.3.0]
+⚡ 시작 경로에서 스키마/인덱스 구축 제거 - schema_migrations.py 도입
+- DB별 schema_version 테이블로 마이그레이션 버전 기록 (적용된 단계는 재실행 안 함)
+- 빠른 단계(glossary/settings/dewey 테이블)만 initialize_databases()에서 즉시 적용
+- Covering Index, literal_props_fts, mapping_data_fts 구축은 MigrationJob 백그라운드 스레드
+  * 진행 상황 로그 표시, 구축 중 검색은 IndexBuildingError("인덱스 구축 중")로 즉시 안내
+  * 앱 종료 시 중단 → 기록되지 않으므로 다음 실행 때 재개
+- COUNT(*) 레코드 수 로그는 백그라운드 구축 완료 후 실행
 
 [2025-10-19 업데이트 내역 - v2.2.0]
 ⚡ 검색 성능 극대화 - FTS5 인덱스 도입
@@ -35,7 +59,14 @@ import queue
 import threading
 
 import sqlite3
-from db_perf_tweaks import apply_sqlite_pragmas  # ✅ 추가: PRAGMA 유틸 임포트
+from db_perf_tweaks import apply_sqlite_pragmas, WarmupPlanner  # ✅ 추가: PRAGMA 유틸 임포트
+from fts_maintenance import FtsMaintainer, install_dirty_tracking, rebuild_full
+from schema_migrations import (
+    IndexBuildStatus,
+    Migration,
+    MigrationJob,
+    run_fast_migrations,
+)
 import pandas as pd  # 데이터를 DataFrame으로 반환할 때 유용
 import logging
 
@@ -59,6 +90,7 @@ class DatabaseManager:
         self.kdc_ddc_mapping_db_path = kdc_ddc_mapping_db_path
         self.glossary_db_path = "glossary.db"
         self.nlk_biblio_db_path = "nlk_biblio.sqlite"  # ✅ [신규] NLK 서지 DB 경로
+        self.kac_authority_db_path = "NLK_Authorities.sqlite"  # ✅ [신규] KAC 전거 DB 경로
 
         # ✅ [동시성 개선] 히트 카운트 비동기 배치 업데이트
         from collections import defaultdict
@@ -68,6 +100,9 @@ class DatabaseManager:
         self._hit_count_timer = None
         self.dewey_db_path = "dewey_cache.db"
 
+        # ✅ [성능 개선] FTS5 델타 반영 + 점진 병합 백그라운드 작업자
+        self._fts_maintainer = None
+
         # ✅ [동시성 개선] Dewey 캐시 쓰기 큐 + 전담 워커 스레드
         self._dewey_write_queue = queue.Queue()
         self._dewey_writer_running = True
@@ -90,100 +125,107 @@ class DatabaseManager:
         self._keyword_writer_thread.start()
         logger.info("✅ 키워드 추출 전담 스레드 시작됨")
 
-        # ⚡ Covering Index 생성 (성능 최적화)
-        self._create_covering_indexes()
+        # ✅ [성능 개선] 번역 메모리 + 번역 쓰기 큐 (워커는 첫 기록 때 시작)
+        self._translation_memory = None
+        self._translation_write_queue = queue.Queue()
+        self._translation_writer_lock = threading.Lock()
+        self._translation_writer_thread = None
+
+        # ✅ [성능 개선] 버전 관리 마이그레이션 - 대용량 인덱스/FTS는 백그라운드 구축
+        # (Covering Index 생성은 더 이상 생성자에서 동기 실행하지 않음)
+        self.index_status = IndexBuildStatus()
+        self._migration_job = None
+
+        # ✅ [성능 개선] 적응형 워밍업 - 실제 검색이 읽은 테이블/인덱스를 기록해 다음 시작 때 예열
+        self.warmup_planners = {
+            "mapping_data": WarmupPlanner(kdc_ddc_mapping_db_path),
+            "concepts": WarmupPlanner(concepts_db_path),
+        }
 
     def _get_concepts_connection(self):
         """개념 DB에 대한 새로운 연결을 반환합니다."""
         conn = sqlite3.connect(self.concepts_db_path)
         conn.row_factory = sqlite3.Row
         apply_sqlite_pragmas(conn)  # ⚡ PRAGMA 최적화 적용
+        self.warmup_planners["concepts"].attach(conn)  # 워밍업 접근 프로필 기록
         return conn
 
-    def _create_covering_indexes(self):
+    def _create_concepts_indexes(self, conn):
         """
         ⚡ Covering Index 생성: 검색 성능 최적화
         value_normalized로 검색 시 테이블 접근 없이 인덱스만으로 결과 반환
         """
-        try:
-            # 1. Concepts DB 인덱스
-            conn = self._get_concepts_connection()
-            cursor = conn.cursor()
+        cursor = conn.cursor()
 
-            # Covering Index: value_normalized + concept_id + prop + value
-            cursor.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_literal_props_covering
-                ON literal_props(value_normalized, concept_id, prop, value)
+        # Covering Index: value_normalized + concept_id + prop + value
+        cursor.execute(
             """
-            )
+            CREATE INDEX IF NOT EXISTS idx_literal_props_covering
+            ON literal_props(value_normalized, concept_id, prop, value)
+        """
+        )
 
-            # concept_id 기반 조회 최적화
-            cursor.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_literal_props_concept_id
-                ON literal_props(concept_id, prop)
+        # concept_id 기반 조회 최적화
+        cursor.execute(
             """
-            )
+            CREATE INDEX IF NOT EXISTS idx_literal_props_concept_id
+            ON literal_props(concept_id, prop)
+        """
+        )
 
-            conn.commit()
-            conn.close()
-            logger.info("Concepts DB Covering Index created")
+        conn.commit()
+        logger.info("Concepts DB Covering Index created")
 
-            # 2. Mapping DB (KDC-DDC) 인덱스
-            mapping_conn = self._get_mapping_connection()
-            mapping_cursor = mapping_conn.cursor()
+    def _create_mapping_indexes(self, conn):
+        """Mapping DB (KDC-DDC) 기본 인덱스"""
+        cursor = conn.cursor()
 
-            # DDC 컬럼 인덱스 (LIKE 전방 매칭 최적화)
-            mapping_cursor.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_mapping_ddc
-                ON mapping_data(ddc)
+        # DDC 컬럼 인덱스 (LIKE 전방 매칭 최적화)
+        cursor.execute(
             """
-            )
+            CREATE INDEX IF NOT EXISTS idx_mapping_ddc
+            ON mapping_data(ddc)
+        """
+        )
 
-            # KSH 컬럼 인덱스
-            mapping_cursor.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_mapping_ksh
-                ON mapping_data(ksh)
+        # KSH 컬럼 인덱스
+        cursor.execute(
             """
-            )
+            CREATE INDEX IF NOT EXISTS idx_mapping_ksh
+            ON mapping_data(ksh)
+        """
+        )
 
-            # 복합 인덱스: ddc + publication_year (정렬 최적화)
-            mapping_cursor.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_mapping_ddc_year
-                ON mapping_data(ddc, publication_year)
+        # 복합 인덱스: ddc + publication_year (정렬 최적화)
+        cursor.execute(
             """
-            )
-
-            # ✅ [추가] 키워드 검색 최적화를 위한 커버링 인덱스
-            logger.info(
-                "Creating Korean search covering index (may take a while)..."
-            )
-            mapping_cursor.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_mapping_data_korean_search_cover
-                ON mapping_data (
-                    ksh_korean,
-                    ddc,
-                    publication_year DESC,
-                    identifier,
-                    title,
-                    ksh,
-                    ksh_labeled
-                );
-                """
-            )
-            logger.info("Korean search covering index created")
+            CREATE INDEX IF NOT EXISTS idx_mapping_ddc_year
+            ON mapping_data(ddc, publication_year)
+        """
+        )
 
-            mapping_conn.commit()
-            mapping_conn.close()
-            logger.info("Mapping DB indexes created")
+        conn.commit()
+        logger.info("Mapping DB indexes created")
 
-        except Exception as e:
-            logger.warning(f"Covering Index creation error (ignorable): {e}")
+    def _create_mapping_korean_cover_index(self, conn):
+        """✅ [추가] 키워드 검색 최적화를 위한 커버링 인덱스"""
+        logger.info("Creating Korean search covering index (may take a while)...")
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_mapping_data_korean_search_cover
+            ON mapping_data (
+                ksh_korean,
+                ddc,
+                publication_year DESC,
+                identifier,
+                title,
+                ksh,
+                ksh_labeled
+            );
+            """
+        )
+        conn.commit()
+        logger.info("Korean search covering index created")
 
     def _get_glossary_connection(self):
         """용어집 데이터베이스에 대한 새로운 연결을 반환합니다."""
@@ -205,6 +247,7 @@ class DatabaseManager:
         conn = sqlite3.connect(self.kdc_ddc_mapping_db_path)
         conn.row_factory = sqlite3.Row
         apply_sqlite_pragmas(conn)  # ⚡ PRAGMA 최적화 적용
+        self.warmup_planners["mapping_data"].attach(conn)  # 워밍업 접근 프로필 기록
         return conn
 
     def _get_dewey_connection(self):
@@ -221,235 +264,369 @@ class DatabaseManager:
         apply_sqlite_pragmas(conn)  # ⚡ PRAGMA 최적화 적용
         return conn
 
-    def _create_dewey_cache_table(self):
+    def _get_kac_authority_connection(self):
+        """KAC 전거 데이터베이스에 대한 새로운 연결을 반환합니다."""
+        conn = sqlite3.connect(self.kac_authority_db_path)
+        conn.row_factory = sqlite3.Row
+        apply_sqlite_pragmas(conn)  # ⚡ PRAGMA 최적화 적용
+        return conn
+
+    def _create_dewey_cache_table(self, conn):
         """DDC 전용 데이터베이스에 테이블을 생성합니다."""
-        conn = None
-        try:
-            conn = self._get_dewey_connection()
-            cursor = conn.cursor()
+        cursor = conn.cursor()
 
-            # 1. DDC 캐시 테이블
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS dewey_cache (
-                    iri TEXT PRIMARY KEY,
-                    ddc_code TEXT,
-                    raw_json TEXT NOT NULL,
-                    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    hit_count INTEGER DEFAULT 1,
-                    file_size INTEGER DEFAULT 0
-                )
+        # 1. DDC 캐시 테이블
+        cursor.execute(
             """
+            CREATE TABLE IF NOT EXISTS dewey_cache (
+                iri TEXT PRIMARY KEY,
+                ddc_code TEXT,
+                raw_json TEXT NOT NULL,
+                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                hit_count INTEGER DEFAULT 1,
+                file_size INTEGER DEFAULT 0
             )
+        """
+        )
 
-            # 2. 인덱스 생성
-            cursor.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_dewey_cache_ddc_code
-                ON dewey_cache(ddc_code)
+        # 2. 인덱스 생성
+        cursor.execute(
             """
-            )
-            cursor.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_dewey_cache_updated
-                ON dewey_cache(last_updated)
+            CREATE INDEX IF NOT EXISTS idx_dewey_cache_ddc_code
+            ON dewey_cache(ddc_code)
+        """
+        )
+        cursor.execute(
             """
-            )
+            CREATE INDEX IF NOT EXISTS idx_dewey_cache_updated
+            ON dewey_cache(last_updated)
+        """
+        )
 
-            # 3. DDC 통계 테이블
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS dewey_stats (
-                    stat_date DATE PRIMARY KEY,
-                    total_entries INTEGER DEFAULT 0,
-                    cache_hits INTEGER DEFAULT 0,
-                    api_calls INTEGER DEFAULT 0,
-                    db_size_mb REAL DEFAULT 0.0
-                )
+        # 3. DDC 통계 테이블
+        cursor.execute(
             """
+            CREATE TABLE IF NOT EXISTS dewey_stats (
+                stat_date DATE PRIMARY KEY,
+                total_entries INTEGER DEFAULT 0,
+                cache_hits INTEGER DEFAULT 0,
+                api_calls INTEGER DEFAULT 0,
+                db_size_mb REAL DEFAULT 0.0
             )
+        """
+        )
 
-            # 4. 검색 히스토리 테이블
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS search_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    ddc_code TEXT NOT NULL,
-                    searched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
+        # 4. 검색 히스토리 테이블
+        cursor.execute(
             """
+            CREATE TABLE IF NOT EXISTS search_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ddc_code TEXT NOT NULL,
+                searched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
+        """
+        )
 
-            cursor.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_search_history_time
-                ON search_history(searched_at DESC)
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_search_history_time
+            ON search_history(searched_at DESC)
+        """
+        )
+
+        # 5. ✅ [누락 수정] ddc_keyword 테이블 (키워드 인덱스용)
+        cursor.execute(
             """
+            CREATE TABLE IF NOT EXISTS ddc_keyword (
+                iri TEXT NOT NULL,
+                ddc TEXT NOT NULL,
+                keyword TEXT NOT NULL,
+                term_type TEXT NOT NULL,
+                source TEXT DEFAULT 'auto', /* ✅ [핵심 추가] 데이터 출처 컬럼 */
+                PRIMARY KEY (iri, keyword, term_type)
             )
+        """
+        )
 
-            # 5. ✅ [누락 수정] ddc_keyword 테이블 (키워드 인덱스용)
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS ddc_keyword (
-                    iri TEXT NOT NULL,
-                    ddc TEXT NOT NULL,
-                    keyword TEXT NOT NULL,
-                    term_type TEXT NOT NULL,
-                    source TEXT DEFAULT 'auto', /* ✅ [핵심 추가] 데이터 출처 컬럼 */
-                    PRIMARY KEY (iri, keyword, term_type)
-                )
+        # 6. ✅ [누락 수정] FTS5 가상 테이블 (전문 검색용)
+        cursor.execute(
             """
+            CREATE VIRTUAL TABLE IF NOT EXISTS ddc_keyword_fts USING fts5(
+                ddc,
+                keyword,
+                term_type,
+                content='ddc_keyword',
+                content_rowid='rowid',
+                tokenize='porter unicode61'
             )
+        """
+        )
 
-            # 6. ✅ [누락 수정] FTS5 가상 테이블 (전문 검색용)
+        # 7. ✅ [누락 수정] FTS 동기화 트리거들
+        # 트리거 존재 확인 후 생성
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='trigger' AND name='ddc_keyword_ai'"
+        )
+        if not cursor.fetchone():
             cursor.execute(
                 """
-                CREATE VIRTUAL TABLE IF NOT EXISTS ddc_keyword_fts USING fts5(
-                    ddc,
-                    keyword,
-                    term_type,
-                    content='ddc_keyword',
-                    content_rowid='rowid',
-                    tokenize='porter unicode61'
-                )
+                CREATE TRIGGER ddc_keyword_ai AFTER INSERT ON ddc_keyword
+                BEGIN
+                    INSERT INTO ddc_keyword_fts(rowid, ddc, keyword, term_type)
+                    VALUES (new.rowid, new.ddc, new.keyword, new.term_type);
+                END
             """
             )
 
-            # 7. ✅ [누락 수정] FTS 동기화 트리거들
-            # 트리거 존재 확인 후 생성
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='trigger' AND name='ddc_keyword_ad'"
+        )
+        if not cursor.fetchone():
             cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='trigger' AND name='ddc_keyword_ai'"
-            )
-            if not cursor.fetchone():
-                cursor.execute(
-                    """
-                    CREATE TRIGGER ddc_keyword_ai AFTER INSERT ON ddc_keyword
-                    BEGIN
-                        INSERT INTO ddc_keyword_fts(rowid, ddc, keyword, term_type)
-                        VALUES (new.rowid, new.ddc, new.keyword, new.term_type);
-                    END
                 """
-                )
-
-            cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='trigger' AND name='ddc_keyword_ad'"
+                CREATE TRIGGER ddc_keyword_ad AFTER DELETE ON ddc_keyword
+                BEGIN
+                    INSERT INTO ddc_keyword_fts(ddc_keyword_fts, rowid, ddc, keyword, term_type)
+                    VALUES ('delete', old.rowid, old.ddc, old.keyword, old.term_type);
+                END
+            """
             )
-            if not cursor.fetchone():
-                cursor.execute(
-                    """
-                    CREATE TRIGGER ddc_keyword_ad AFTER DELETE ON ddc_keyword
-                    BEGIN
-                        INSERT INTO ddc_keyword_fts(ddc_keyword_fts, rowid, ddc, keyword, term_type)
-                        VALUES ('delete', old.rowid, old.ddc, old.keyword, old.term_type);
-                    END
-                """
-                )
 
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='trigger' AND name='ddc_keyword_au'"
+        )
+        if not cursor.fetchone():
             cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='trigger' AND name='ddc_keyword_au'"
-            )
-            if not cursor.fetchone():
-                cursor.execute(
-                    """
-                    CREATE TRIGGER ddc_keyword_au AFTER UPDATE ON ddc_keyword
-                    BEGIN
-                        INSERT INTO ddc_keyword_fts(ddc_keyword_fts, rowid, ddc, keyword, term_type)
-                        VALUES ('delete', old.rowid, old.ddc, old.keyword, old.term_type);
-                        INSERT INTO ddc_keyword_fts(rowid, ddc, keyword, term_type)
-                        VALUES (new.rowid, new.ddc, new.keyword, new.term_type);
-                    END
                 """
-                )
-
-            conn.commit()
-            print(f"✅ DDC 전용 데이터베이스 '{self.dewey_db_path}' 초기화 완료")
-            print("   - dewey_cache, dewey_stats, search_history 테이블 생성")
-            print("   - ddc_keyword, ddc_keyword_fts (FTS5) 테이블 생성")
-            print("   - FTS 동기화 트리거 3개 생성")
+                CREATE TRIGGER ddc_keyword_au AFTER UPDATE ON ddc_keyword
+                BEGIN
+                    INSERT INTO ddc_keyword_fts(ddc_keyword_fts, rowid, ddc, keyword, term_type)
+                    VALUES ('delete', old.rowid, old.ddc, old.keyword, old.term_type);
+                    INSERT INTO ddc_keyword_fts(rowid, ddc, keyword, term_type)
+                    VALUES (new.rowid, new.ddc, new.keyword, new.term_type);
+                END
+            """
+            )
 
-        except Exception as e:
-            print(f"❌ 오류: DDC 데이터베이스 테이블 생성 실패: {e}")
-        finally:
-            if conn:
-                conn.close()
+        conn.commit()
+        print(f"✅ DDC 전용 데이터베이스 '{self.dewey_db_path}' 초기화 완료")
+        print("   - dewey_cache, dewey_stats, search_history 테이블 생성")
+        print("   - ddc_keyword, ddc_keyword_fts (FTS5) 테이블 생성")
+        print("   - FTS 동기화 트리거 3개 생성")
 
-    def _create_glossary_table(self):
+    def _create_glossary_table(self, conn):
         """translations 테이블을 생성하고 초기 용어집 데이터를 삽입합니다."""
-        conn = None
-        try:
-            conn = self._get_glossary_connection()
-            cursor = conn.cursor()
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS translations (
+                original_term TEXT PRIMARY KEY COLLATE NOCASE,
+                translated_term TEXT NOT NULL
+            )
+            """
+        )
+        conn.commit()
+        # 초기 용어집 데이터 삽입 (예시, 이미 존재하는 경우 삽입하지 않음)
+        initial_terms = {
+            "正義": "정의",
+            "自由主義": "자유주의",
+            "Gerechtigkeit": "정의",
+            "Politische Philosophie": "정치 철학",
+            "Justice": "정의",
+            "Liberalism": "자유주의",
+            "Ethics": "윤리학",
+            "Values": "가치",
+        }
+        for original, translated in initial_terms.items():
             cursor.execute(
                 """
-                CREATE TABLE IF NOT EXISTS translations (
-                    original_term TEXT PRIMARY KEY COLLATE NOCASE,
-                    translated_term TEXT NOT NULL
+                INSERT OR IGNORE INTO translations (original_term, translated_term)
+                VALUES (?, ?)
+            """,
+                (original, translated),
+            )
+        conn.commit()
+        print(
+            f"정보: 용어집 데이터베이스 '{self.glossary_db_path}'의 'translations' 테이블 및 초기 용어 확인/생성 완료."
+        )
+
+    def initialize_databases(self):
+        """
+        모든 데이터베이스 테이블을 초기화합니다.
+        ✅ [성능 개선] 빠른 확인/마이그레이션만 시작 경로에서 수행하고,
+        대용량 인덱스·FTS 구축은 백그라운드 MigrationJob으로 넘깁니다.
+        """
+        background_plan = []
+        for label, connect, migrations in self._schema_migrations():
+            try:
+                remaining = run_fast_migrations(connect, migrations, label)
+            except Exception as e:
+                print(f"오류: {label} 스키마 마이그레이션 실패: {e}")
+                continue
+            background_plan.append((label, connect, remaining))
+        self._start_migration_job(background_plan)
+
+    def _schema_migrations(self):
+        """DB별 (라벨, 연결 함수, Migration 목록). 버전은 DB별 schema_version에 기록됩니다."""
+        plan = [
+            (
+                "glossary",
+                self._get_glossary_connection,
+                [
+                    Migration(1, "translations", self._create_glossary_table),
+                    Migration(2, "settings", self._create_settings_table),  # API 키 세팅용
+                ],
+            ),
+            (
+                "dewey",
+                self._get_dewey_connection,
+                [Migration(1, "dewey_cache_schema", self._create_dewey_cache_table)],
+            ),
+        ]
+        # 원본 데이터가 없는 DB(최소 스키마만 생성된 파일)는 인덱스 구축 대상에서 제외
+        if self._verify_concepts_db():
+            plan.append(
+                (
+                    "concepts",
+                    self._get_concepts_connection,
+                    [
+                        Migration(
+                            1,
+                            "literal_props_indexes",
+                            self._create_concepts_indexes,
+                            background=True,
+                            provides=("idx_literal_props_covering",),
+                        ),
+                        Migration(
+                            2,
+                            "literal_props_fts",
+                            self._create_concepts_fts5,
+                            background=True,
+                            provides=("literal_props_fts",),
+                        ),
+                    ],
                 )
-                """
             )
-            conn.commit()
-            # 초기 용어집 데이터 삽입 (예시, 이미 존재하는 경우 삽입하지 않음)
-            initial_terms = {
-                "正義": "정의",
-                "自由主義": "자유주의",
-                "Gerechtigkeit": "정의",
-                "Politische Philosophie": "정치 철학",
-                "Justice": "정의",
-                "Liberalism": "자유주의",
-                "Ethics": "윤리학",
-                "Values": "가치",
-            }
-            for original, translated in initial_terms.items():
-                cursor.execute(
-                    """
-                    INSERT OR IGNORE INTO translations (original_term, translated_term)
-                    VALUES (?, ?)
-                """,
-                    (original, translated),
+        if self._verify_mapping_db():
+            plan.append(
+                (
+                    "mapping",
+                    self._get_mapping_connection,
+                    [
+                        Migration(
+                            1,
+                            "mapping_indexes",
+                            self._create_mapping_indexes,
+                            background=True,
+                            provides=("idx_mapping_ddc", "idx_mapping_ksh"),
+                        ),
+                        Migration(
+                            2,
+                            "mapping_korean_search_cover",
+                            self._create_mapping_korean_cover_index,
+                            background=True,
+                            provides=("idx_mapping_data_korean_search_cover",),
+                        ),
+                        Migration(
+                            3,
+                            "mapping_data_fts",
+                            self._create_mapping_fts5,
+                            background=True,
+                            provides=("mapping_data_fts",),
+                        ),
+                    ],
                 )
-            conn.commit()
-            print(
-                f"정보: 용어집 데이터베이스 '{self.glossary_db_path}'의 'translations' 테이블 및 초기 용어 확인/생성 완료."
             )
-        except Exception as e:
-            print(f"오류: 용어집 테이블 생성 중 오류 발생: {e}")
-        finally:
-            if conn:
-                conn.close()
+        return plan
 
-    def initialize_databases(self):
-        """모든 데이터베이스 테이블을 초기화합니다."""
-        self._verify_concepts_db()  # 🆕 새 DB 존재 확인
-        self._verify_mapping_db()  # 👈 [누락된 부분 추가]
-        self._create_glossary_table()
-        self._create_settings_table()  # API 키 세팅용
-        self._create_dewey_cache_table()  # 🆕 DDC 캐시 테이블 생성
+    def _start_migration_job(self, background_plan):
+        """백그라운드 마이그레이션 시작. 완료 후 FTS 유지보수 작업자와 레코드 수 로그를 실행."""
+        if self._migration_job is not None:
+            return
+        self._migration_job = MigrationJob(
+            background_plan,
+            self.index_status,
+            progress=self._on_migration_progress,
+            on_finished=self._on_background_migrations_finished,
+        )
+        if self._migration_job.total_steps:
+            logger.info(
+                f"⏳ 인덱스 구축 {self._migration_job.total_steps}단계를 백그라운드에서 진행합니다. "
+                "완료 전까지 일부 검색은 '인덱스 구축 중'으로 표시됩니다."
+            )
+        self._migration_job.start()
 
-    def _create_concepts_fts5(self, cursor, conn):
+    def _on_migration_progress(self, label, name, done, total):
+        if done < total:
+            logger.info(f"🔨 인덱스 구축 중 ({done + 1}/{total}): [{label}] {name}")
+        else:
+            logger.info(f"✅ 인덱스 구축 완료 ({done}/{total})")
+
+    def _on_background_migrations_finished(self):
+        self._start_fts_maintainer()
+        self._log_database_counts()
+
+    def configure_warmup_budget(self, io_budget_mb=None, time_budget_sec=None):
+        """settings 테이블(warmup_io_budget_mb / warmup_time_budget_sec) 또는 인자로 예열 예산 설정."""
+        io_budget_mb = io_budget_mb or self.get_setting("warmup_io_budget_mb")
+        time_budget_sec = time_budget_sec or self.get_setting("warmup_time_budget_sec")
+        for planner in self.warmup_planners.values():
+            if io_budget_mb:
+                planner.io_budget_mb = float(io_budget_mb)
+            if time_budget_sec:
+                planner.time_budget_sec = float(time_budget_sec)
+
+    def _save_warmup_profiles(self):
+        connects = {
+            "mapping_data": self._get_mapping_connection,
+            "concepts": self._get_concepts_connection,
+        }
+        for key, planner in self.warmup_planners.items():
+            try:
+                saved = planner.save_profile(connects[key])
+                if saved:
+                    logger.info(f"💾 워밍업 접근 프로필 저장: {key} (쿼리 형태 {saved}개)")
+            except Exception as e:
+                logger.warning(f"⚠️ 워밍업 프로필 저장 실패 (무시 가능): {e}")
+
+    def raise_if_index_building(self, index_name, feature="검색"):
+        """검색에 필요한 인덱스가 백그라운드 구축 중이면 IndexBuildingError를 발생시킵니다."""
+        self.index_status.raise_if_building(index_name, feature)
+
+    def _start_fts_maintainer(self):
+        """mapping_data_fts 더티 로그를 주기적으로 반영하는 백그라운드 작업자 시작."""
+        if self._fts_maintainer is None:
+            self._fts_maintainer = FtsMaintainer(
+                self._get_mapping_connection, ["mapping_data_fts"]
+            ).start()
+
+    def _create_concepts_fts5(self, conn):
         """
         ✅ [신규 추가] literal_props 테이블용 FTS5 가상 테이블 생성
         - value_normalized 컬럼을 기준으로 전문 검색 인덱스를 생성합니다.
+        - 실패/중단 시 반쯤 채워진 FTS 테이블을 제거하여 다음 실행 때 다시 구축합니다.
         """
-        try:
-            # -------------------
-            # ✅ [핵심 수정] FTS5 테이블이 이미 존재하는지 먼저 확인합니다.
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='literal_props_fts'")
-            if cursor.fetchone():
-                print("✅ literal_props_fts 테이블이 이미 존재하여 재생성을 건너뜁니다.")
-                return  # 테이블이 존재하면 함수를 즉시 종료합니다.
-            # -------------------
-
-            print("⏳ literal_props_fts 테이블 재구성 시작... (value_normalized 기준)")
-
-            # 기존 FTS 테이블 및 트리거 삭제 (최초 생성 시 혹시 모를 잔여물 제거)
-            cursor.executescript("""
-                DROP TRIGGER IF EXISTS literal_props_ai;
-                DROP TRIGGER IF EXISTS literal_props_ad;
-                DROP TRIGGER IF EXISTS literal_props_au;
-                DROP TABLE IF EXISTS literal_props_fts;
-            """)
-            print("   - 기존 FTS 테이블 및 트리거 삭제 완료.")
+        cursor = conn.cursor()
+        # -------------------
+        # ✅ [핵심 수정] FTS5 테이블이 이미 존재하는지 먼저 확인합니다.
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='literal_props_fts'")
+        if cursor.fetchone():
+            logger.info("✅ literal_props_fts 테이블이 이미 존재하여 재생성을 건너뜁니다.")
+            return  # 테이블이 존재하면 함수를 즉시 종료합니다.
+        # -------------------
+
+        logger.info("⏳ literal_props_fts 테이블 재구성 시작... (value_normalized 기준)")
+
+        # 기존 FTS 테이블 및 트리거 삭제 (최초 생성 시 혹시 모를 잔여물 제거)
+        drop_script = """
+            DROP TRIGGER IF EXISTS literal_props_ai;
+            DROP TRIGGER IF EXISTS literal_props_ad;
+            DROP TRIGGER IF EXISTS literal_props_au;
+            DROP TABLE IF EXISTS literal_props_fts;
+        """
+        cursor.executescript(drop_script)
 
+        try:
             # FTS5 가상 테이블 생성 (value_normalized 컬럼만 인덱싱)
             cursor.execute("""
                 CREATE VIRTUAL TABLE literal_props_fts USING fts5(
@@ -458,7 +635,6 @@ class DatabaseManager:
                     content_rowid='rowid'
                 )
             """)
-            print("   - FTS5 가상 테이블 `literal_props_fts` 생성 완료.")
 
             # 기존 데이터로 FTS5 채우기
             cursor.execute("""
@@ -467,7 +643,6 @@ class DatabaseManager:
                 FROM literal_props
                 WHERE value_normalized IS NOT NULL AND value_normalized != ''
             """)
-            print("   - 기존 데이터 FTS5 인덱싱 완료.")
 
             # 동기화 트리거 생성
             cursor.executescript("""
@@ -484,25 +659,27 @@ class DatabaseManager:
                     VALUES (new.rowid, new.value_normalized);
                 END;
             """)
-            print("   - 동기화 트리거 3개 생성 완료.")
-            
             conn.commit()
-            print("✅ literal_props_fts 테이블 재구성 성공!")
-
-        except Exception as e:
-            print(f"⚠️ FTS5 테이블(concepts) 생성 실패 (무시 가능): {e}")
+        except Exception:
+            self._drop_partial_fts(conn, drop_script)
+            raise
+        logger.info("✅ literal_props_fts 테이블 재구성 성공!")
+
+    @staticmethod
+    def _drop_partial_fts(conn, drop_script):
+        """구축 도중 실패/중단된 FTS 테이블 정리 (중단용 progress handler는 해제 후 실행)."""
+        conn.set_progress_handler(None, 0)
+        if conn.in_transaction:
+            conn.rollback()
+        conn.executescript(drop_script)
 
     def _verify_concepts_db(self):
-        """새 개념 DB의 존재와 테이블 구조를 확인합니다."""
+        """새 개념 DB의 필수 테이블 존재 여부를 확인합니다 (sqlite_master만 조회하는 빠른 검사)."""
+        conn = None
         try:
             conn = self._get_concepts_connection()
             cursor = conn.cursor()
 
-            # -------------------
-            # ✅ [핵심 추가] DB 검증 시 FTS5 테이블을 재생성하는 함수 호출
-            self._create_concepts_fts5(cursor, conn)
-            # -------------------
-
             # 필수 테이블들 존재 확인
             required_tables = [
                 "concepts",
@@ -525,28 +702,23 @@ class DatabaseManager:
                 print("새로운 nlk_concepts.sqlite 파일을 확인해주세요.")
             else:
                 print("정보: 모든 필수 테이블이 존재합니다.")
-
-            # 데이터 개수 확인
-            cursor.execute(
-                "SELECT COUNT(*) FROM concepts WHERE concept_id LIKE 'nlk:KSH%'"
-            )
-            concept_count = cursor.fetchone()[0]
-            print(f"정보: KSH 개념 {concept_count:,}개가 로드되어 있습니다.")
-
-            conn.close()
+            return "literal_props" in existing_tables and "concepts" in existing_tables
 
         except Exception as e:
             print(f"오류: 개념 DB 확인 중 오류 발생: {e}")
             print("nlk_concepts.sqlite 파일이 올바른 위치에 있는지 확인해주세요.")
+            return False
+        finally:
+            if conn:
+                conn.close()
 
     def _verify_mapping_db(self):
-        """kdc_ddc_mapping.db의 존재와 테이블/인덱스 구조를 확인합니다."""
+        """kdc_ddc_mapping.db의 mapping_data 테이블 존재 여부를 확인합니다 (빠른 검사)."""
         conn = None
         try:
             conn = self._get_mapping_connection()
             cursor = conn.cursor()
 
-            # 1. 테이블 존재 확인
             cursor.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' AND name='mapping_data'"
             )
@@ -554,98 +726,95 @@ class DatabaseManager:
                 raise FileNotFoundError(
                     "'mapping_data' 테이블을 찾을 수 없습니다. kdc_ddc_mapping.db 파일이 올바른지 확인해주세요."
                 )
-
-            # 2. 데이터 개수 확인
-            cursor.execute("SELECT COUNT(*) FROM mapping_data")
-            record_count = cursor.fetchone()[0]
-            if record_count > 0:
-                print(
-                    f"정보: kdc_ddc_mapping.db 확인 완료. {record_count:,}개의 서지 데이터가 로드되었습니다."
-                )
-            else:
-                print("경고: kdc_ddc_mapping.db는 로드되었으나 서지 데이터가 없습니다.")
-
-            # 3. ✅ [성능 개선] FTS5 가상 테이블 생성 (한국어 주제명 검색 최적화)
-            self._create_mapping_fts5(cursor, conn)
+            return True
 
         except Exception as e:
             print(
                 f"❌ 치명적 오류: kdc_ddc_mapping.db를 열거나 검증하는 데 실패했습니다. 파일 경로와 파일 상태를 확인해주세요. 오류: {e}"
             )
+            return False
         finally:
             if conn:
                 conn.close()
 
-    def _create_mapping_fts5(self, cursor, conn):
+    def _log_database_counts(self):
+        """KSH 개념 수 / 서지 데이터 수 로그 (전체 스캔이므로 백그라운드 마이그레이션 이후 실행)."""
+        checks = [
+            (
+                self._get_concepts_connection,
+                "SELECT COUNT(*) FROM concepts WHERE concept_id LIKE 'nlk:KSH%'",
+                "정보: KSH 개념 {:,}개가 로드되어 있습니다.",
+            ),
+            (
+                self._get_mapping_connection,
+                "SELECT COUNT(*) FROM mapping_data",
+                "정보: kdc_ddc_mapping.db 확인 완료. {:,}개의 서지 데이터가 로드되었습니다.",
+            ),
+        ]
+        for connect, query, message in checks:
+            conn = None
+            try:
+                conn = connect()
+                count = conn.execute(query).fetchone()[0]
+                logger.info(message.format(count))
+            except Exception as e:
+                logger.debug(f"레코드 수 확인 생략: {e}")
+            finally:
+                if conn:
+                    conn.close()
+
+    def _create_mapping_fts5(self, conn):
         """
         ✅ [성능 개선] mapping_data 테이블용 FTS5 가상 테이블 생성
         - ksh_korean 컬럼 전문 검색 최적화
         - 380만 건에서 1초 이내 검색 가능
+        - 실패/중단 시 반쯤 채워진 FTS 테이블을 제거하여 다음 실행 때 다시 구축합니다.
         """
-        try:
-            # FTS5 가상 테이블 존재 확인
-            cursor.execute("""
-                SELECT name FROM sqlite_master
-                WHERE type='table' AND name='mapping_data_fts'
-            """)
-
-            if cursor.fetchone():
-                print("✅ mapping_data FTS5 테이블이 이미 존재합니다.")
-                return
-
-            print("⏳ mapping_data FTS5 테이블 생성 중... (수 분 소요 가능)")
-
-            # FTS5 가상 테이블 생성
-            cursor.execute("""
-                CREATE VIRTUAL TABLE mapping_data_fts USING fts5(
-                    identifier UNINDEXED,
-                    ksh_korean,
-                    content='mapping_data',
-                    content_rowid='rowid'
-                )
-            """)
-
-            # 기존 데이터로 FTS5 채우기
-            cursor.execute("""
-                INSERT INTO mapping_data_fts(rowid, identifier, ksh_korean)
-                SELECT rowid, identifier, ksh_korean
-                FROM mapping_data
-                WHERE ksh_korean IS NOT NULL AND ksh_korean != ''
-            """)
+        cursor = conn.cursor()
+        # FTS5 가상 테이블 존재 확인
+        cursor.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name='mapping_data_fts'
+        """)
+
+        if cursor.fetchone():
+            # 기존 DB의 즉시 동기화 트리거 → 더티 추적 트리거로 교체 (멱등)
+            install_dirty_tracking(conn, "mapping_data_fts")
+            logger.info("✅ mapping_data FTS5 테이블이 이미 존재합니다.")
+            return
 
-            # 동기화 트리거 생성
-            cursor.execute("""
-                CREATE TRIGGER mapping_data_fts_insert AFTER INSERT ON mapping_data BEGIN
-                    INSERT INTO mapping_data_fts(rowid, identifier, ksh_korean)
-                    VALUES (new.rowid, new.identifier, new.ksh_korean);
-                END
-            """)
+        logger.info("⏳ mapping_data FTS5 테이블 생성 중... (수 분 소요 가능)")
 
-            cursor.execute("""
-                CREATE TRIGGER mapping_data_fts_delete AFTER DELETE ON mapping_data BEGIN
-                    DELETE FROM mapping_data_fts WHERE rowid = old.rowid;
-                END
-            """)
-
-            cursor.execute("""
-                CREATE TRIGGER mapping_data_fts_update AFTER UPDATE ON mapping_data BEGIN
-                    DELETE FROM mapping_data_fts WHERE rowid = old.rowid;
-                    INSERT INTO mapping_data_fts(rowid, identifier, ksh_korean)
-                    VALUES (new.rowid, new.identifier, new.ksh_korean);
-                END
-            """)
+        # FTS5 가상 테이블 생성
+        cursor.execute("""
+            CREATE VIRTUAL TABLE mapping_data_fts USING fts5(
+                identifier UNINDEXED,
+                ksh_korean,
+                content='mapping_data',
+                content_rowid='rowid'
+            )
+        """)
 
-            conn.commit()
-            print("✅ mapping_data FTS5 테이블 및 트리거 생성 완료!")
+        try:
+            # 기존 데이터로 FTS5 채우기 (최초 1회 전체 구축)
+            rebuild_full(conn, "mapping_data_fts")
+        except Exception:
+            self._drop_partial_fts(conn, "DROP TABLE IF EXISTS mapping_data_fts;")
+            raise
 
-        except Exception as e:
-            print(f"⚠️ FTS5 테이블 생성 실패 (무시 가능): {e}")
-            # 실패해도 앱은 계속 실행 (기존 방식으로 검색)
+        # ✅ [성능 개선] 즉시 동기화 트리거 대신 더티 rowid 추적
+        # - 변경분은 FtsMaintainer가 백그라운드에서 델타 반영 + 점진 merge
+        install_dirty_tracking(conn, "mapping_data_fts")
+        logger.info("✅ mapping_data FTS5 테이블 및 더티 추적 트리거 생성 완료!")
 
     def close_connections(self):
         """
         경고: DatabaseManager.close_connections()는 더 이상 필요하지 않습니다. 각 작업마다 연결이 자동으로 닫힙니다.
         """
+        # ✅ [추가] 진행 중인 백그라운드 인덱스 구축 중단 (다음 실행 때 재개)
+        if self._migration_job is not None:
+            self._migration_job.stop()
+
         # ✅ [추가] 앱 종료 시 남은 히트 카운트 flush
         if self._hit_count_timer:
             self._hit_count_timer.cancel()
@@ -657,6 +826,17 @@ class DatabaseManager:
         # ✅ [추가] 키워드 워커 안전 종료
         self.stop_keyword_writer()
 
+        # ✅ [추가] 번역 쓰기 워커 종료 (남은 번역 기록 후)
+        self.stop_translation_writer()
+
+        # ✅ [추가] FTS 유지보수 작업자 종료
+        if self._fts_maintainer is not None:
+            self._fts_maintainer.stop()
+            self._fts_maintainer = None
+
+        # ✅ [추가] 이번 세션의 검색 접근 프로필 저장 (다음 시작 워밍업 계획에 사용)
+        self._save_warmup_profiles()
+
         print(
             "경고: DatabaseManager.close_connections()는 더 이상 필요하지 않습니다. 각 작업마다 연결이 자동으로 닫힙니다."
         )
@@ -967,6 +1147,53 @@ class DatabaseManager:
             if conn:
                 conn.close()
 
+    def get_translations(self, original_terms):
+        """
+        ✅ [성능 개선] 여러 원문의 번역을 연결 1개로 일괄 조회합니다.
+        Returns:
+            dict: {DB에 저장된 원문: 번역} (original_term은 NOCASE라 대소문자가 다를 수 있음)
+        """
+        terms = list(dict.fromkeys(t for t in original_terms if t))
+        translations = {}
+        if not terms:
+            return translations
+        conn = None
+        try:
+            conn = self._get_glossary_connection()
+            cursor = conn.cursor()
+            # SQLite 바인딩 변수 한도(999) 안에서 나눠 조회
+            for i in range(0, len(terms), 500):
+                chunk = terms[i : i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    "SELECT original_term, translated_term FROM translations "
+                    f"WHERE original_term IN ({placeholders})",
+                    chunk,
+                )
+                for row in cursor.fetchall():
+                    translations[row["original_term"]] = row["translated_term"]
+        except sqlite3.Error as e:
+            print(f"오류: 용어집에서 번역 일괄 조회 실패: {e}")
+        finally:
+            if conn:
+                conn.close()
+        return translations
+
+    @property
+    def translation_memory(self):
+        """
+        ✅ [성능 개선] 용어집 메모리 사본 (첫 접근 때 생성, 전체 적재는 백그라운드).
+        """
+        if self._translation_memory is None:
+            with self._translation_writer_lock:
+                if self._translation_memory is None:
+                    from translation_memory import TranslationMemory
+
+                    memory = TranslationMemory(self)
+                    memory.preload_async()
+                    self._translation_memory = memory
+        return self._translation_memory
+
     def get_all_custom_translations(self):
         """
         SQLite 용어집 데이터베이스에서 모든 맞춤형 번역 매핑을 가져옵니다.
@@ -1002,6 +1229,8 @@ class DatabaseManager:
                 (original, translated),
             )
             conn.commit()
+            if self._translation_memory is not None:
+                self._translation_memory.remember([(original, translated)], persist=False)
             return True
         except sqlite3.Error as e:
             print(f"오류: 용어집 번역 추가/업데이트 실패: {e}")
@@ -1022,6 +1251,8 @@ class DatabaseManager:
                 "DELETE FROM translations WHERE original_term = ?", (original,)
             )
             conn.commit()
+            if self._translation_memory is not None:
+                self._translation_memory.forget(original)
             print(f"정보: 용어집 번역 삭제 성공: '{original}'")
             return True
         except sqlite3.Error as e:
@@ -1031,30 +1262,22 @@ class DatabaseManager:
             if conn:
                 conn.close()
 
-    def _create_settings_table(self):
+    def _create_settings_table(self, conn):
         """API 설정 정보를 저장할 settings 테이블을 생성합니다."""
-        conn = None
-        try:
-            conn = self._get_glossary_connection()  # 용어집 DB에 설정도 함께 저장
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS settings (
-                    key TEXT PRIMARY KEY,
-                    value TEXT NOT NULL,
-                    description TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
+        cursor = conn.cursor()
+        cursor.execute(
             """
+            CREATE TABLE IF NOT EXISTS settings (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                description TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
-            conn.commit()
-            print(f"정보: 설정 테이블 'settings'가 생성되었습니다.")
-        except Exception as e:
-            print(f"오류: 설정 테이블 생성 중 오류 발생: {e}")
-        finally:
-            if conn:
-                conn.close()
+        """
+        )
+        conn.commit()
+        print(f"정보: 설정 테이블 'settings'가 생성되었습니다.")
 
     def get_setting(self, key):
         """설정값을 조회합니다."""
@@ -1550,6 +1773,91 @@ class DatabaseManager:
         else:
             logger.info("✅ 키워드 워커 이미 종료됨")
 
+    def _process_translation_write_queue(self):
+        """
+        ✅ [성능 개선] 번역 기록 전담 워커 스레드
+        큐에 쌓인 번역을 한 번에 꺼내 executemany + commit 1회로 저장합니다.
+        """
+        logger.info("🚀 번역 쓰기 워커 스레드 시작")
+        conn = None
+        try:
+            conn = self._get_glossary_connection()
+            cursor = conn.cursor()
+            stopping = False
+
+            while not stopping:
+                try:
+                    task = self._translation_write_queue.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+
+                pairs = []
+                while True:
+                    if task is None:  # 종료 신호 (앞서 쌓인 번역은 저장 후 종료)
+                        stopping = True
+                    else:
+                        pairs.extend(task)
+                    self._translation_write_queue.task_done()
+                    try:
+                        task = self._translation_write_queue.get_nowait()
+                    except queue.Empty:
+                        break
+
+                if not pairs:
+                    continue
+                try:
+                    cursor.executemany(
+                        """
+                        INSERT OR REPLACE INTO translations (original_term, translated_term)
+                        VALUES (?, ?)
+                        """,
+                        pairs,
+                    )
+                    conn.commit()
+                    logger.debug(f"📝 번역 {len(pairs)}건 용어집 DB 저장 완료")
+                except sqlite3.Error as e:
+                    logger.error(f"❌ 번역 저장 실패: {e}")
+
+        except Exception as e:
+            logger.error(f"❌ 번역 쓰기 워커 스레드 치명적 오류: {e}")
+        finally:
+            if conn:
+                conn.close()
+            logger.info("⏹️ 번역 쓰기 워커 스레드 종료됨")
+
+    def enqueue_translations(self, pairs):
+        """
+        ✅ [성능 개선] 번역 결과 [(원문, 번역), ...]를 쓰기 큐에 추가 (워커는 첫 호출 때 시작)
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return
+        with self._translation_writer_lock:
+            if self._translation_writer_thread is None:
+                self._translation_writer_thread = threading.Thread(
+                    target=self._process_translation_write_queue,
+                    daemon=False,  # 종료 시 남은 번역을 저장하도록 명시적 종료
+                    name="TranslationWriterThread",
+                )
+                self._translation_writer_thread.start()
+        self._translation_write_queue.put(pairs)
+
+    def stop_translation_writer(self):
+        """
+        ✅ [성능 개선] 번역 쓰기 워커를 남은 기록 저장 후 종료
+        """
+        with self._translation_writer_lock:
+            thread = self._translation_writer_thread
+            if thread is None or not thread.is_alive():
+                return
+            self._translation_write_queue.put(None)
+
+        thread.join(timeout=5.0)
+        if thread.is_alive():
+            logger.warning("⚠️ 번역 쓰기 워커가 5초 내 종료되지 않음")
+        else:
+            logger.info("✅ 번역 쓰기 워커 정상 종료됨")
+
     # --- Dewey Linked Data (DLD) API 자격 증명 저장/조회/삭제 ---
     def get_dewey_api_credentials(
         self,
@@ -2011,51 +2319,160 @@ if __name__ == "__main__":
     all_glossary = db.get_all_custom_translations()
     print(f"현재 용어집: {all_glossary}")
 
-import faiss
+from lazy_imports import lazy_import
+
+faiss = lazy_import("faiss")  # ✅ [성능 개선] 벡터 인덱스를 처음 읽을 때 import
 import numpy as np
 import json # ✅ json 임포트 추가
 from database_manager import DatabaseManager
 
+# ✅ [성능 개선] 벡터 모델 추론 백엔드
+# - "torch": 기존 FP32 SentenceTransformer (기본값)
+# - "int8": torch 동적 양자화 (nn.Linear → int8, CPU 전용, 정확도 손실 미미)
+# - "onnx": sentence-transformers의 ONNX Runtime 백엔드 (optimum/onnxruntime 필요)
+VECTOR_MODEL_NAME = "all-MiniLM-L6-v2"
+VECTOR_MODEL_BACKENDS = ("torch", "int8", "onnx")
+VECTOR_INDEX_FILE = "ddc_index_from_json.faiss"  # build_vector_db.py 출력
+VECTOR_MAPPING_FILE = "ddc_mapping_from_json.json"
+
+
+def load_sentence_transformer(backend: str = "torch", model_name: str = VECTOR_MODEL_NAME):
+    """
+    지정한 추론 백엔드로 SentenceTransformer 모델을 로드합니다.
+    VectorDDCManager와 벤치마크 스크립트(test_vector_model_speed.py)가 공유합니다.
+
+    Returns:
+        tuple: (model, device)
+    """
+    from sentence_transformers import SentenceTransformer
+    import torch
+
+    if backend not in VECTOR_MODEL_BACKENDS:
+        raise ValueError(f"지원하지 않는 벡터 모델 백엔드: {backend}")
+
+    if backend == "onnx":
+        # ONNX Runtime은 CPU 추론에 최적화된 그래프를 사용
+        return SentenceTransformer(model_name, device="cpu", backend="onnx"), "cpu"
+
+    if backend == "int8":
+        # 동적 양자화는 CPU에서만 동작
+        model = SentenceTransformer(model_name, device="cpu")
+        model = torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+        return model, "cpu"
+
+    # GPU 사용 가능하면 GPU 사용 (훨씬 빠름)
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    return SentenceTransformer(model_name, device=device), device
+
+
 class VectorDDCManager(DatabaseManager):
-    def __init__(self, concepts_db_path, kdc_ddc_mapping_db_path):
+    def __init__(self, concepts_db_path, kdc_ddc_mapping_db_path, model_backend=None):
         super().__init__(concepts_db_path, kdc_ddc_mapping_db_path)
         # ✅ 지연 로딩: 실제 검색 시점에 모델을 로드합니다
         self.vector_model = None
         self.vector_index = None
         self.ddc_mapping = {}
         self._model_loaded = False
+        # ✅ [성능 개선] 백그라운드 프리로드와 검색 스레드가 동시에 로드하지 않도록 잠금
+        self._model_lock = threading.Lock()
+        self._model_ready = threading.Event()
+        # None이면 settings 테이블의 'vector_model_backend' 값을 사용 (없으면 torch)
+        self.model_backend = model_backend
         # ✅ 앱 시작 시 생성 대신 '로드' 하도록 변경
-        self._load_vector_db()
+        # ✅ [성능 개선] faiss import + 인덱스 읽기도 프리로드 스레드(또는 첫 검색)에서 수행
+        self._index_lock = threading.Lock()
+        self._index_loaded = False
+
+    def _resolve_model_backend(self):
+        """추론 백엔드를 결정합니다 (생성자 인자 > settings 테이블 > 기본값)."""
+        backend = self.model_backend or self.get_setting("vector_model_backend") or "torch"
+        if backend not in VECTOR_MODEL_BACKENDS:
+            logger.warning(f"⚠️ 알 수 없는 벡터 모델 백엔드 '{backend}' → torch 사용")
+            backend = "torch"
+        return backend
 
     def _ensure_model_loaded(self):
         """필요할 때만 SentenceTransformer 모델을 로드합니다 (지연 로딩)"""
         if self._model_loaded:
             return
 
-        try:
-            from sentence_transformers import SentenceTransformer
-            import torch
-
-            # ✅ build_vector_db.py와 동일한 모델 사용 (모델 통일)
-            # GPU 사용 가능하면 GPU 사용 (훨씬 빠름)
-            device = 'cuda' if torch.cuda.is_available() else 'cpu'
-
-            # ⚡ 성능 최적화: all-MiniLM-L6-v2는 mpnet보다 5배 빠르고 정확도는 95% 유지
-            # mpnet: 109M params, 25초 | MiniLM: 22M params, ~1초
-            self.vector_model = SentenceTransformer('all-MiniLM-L6-v2', device=device)
-            self._model_loaded = True
-            print(f"✅ SentenceTransformer 모델을 로드했습니다 (all-MiniLM-L6-v2, device: {device})")
-        except ImportError:
-            print("⚠️ sentence-transformers 라이브러리가 설치되지 않았습니다.")
-            print("   벡터 검색 기능을 사용하려면 'pip install sentence-transformers'를 실행하세요.")
-        except Exception as e:
-            print(f"⚠️ 모델 로드 실패: {e}")
+        # ✅ [성능 개선] 프리로드가 진행 중이면 중복 로드 없이 완료를 기다림
+        with self._model_lock:
+            if self._model_loaded:
+                return
+            backend = self._resolve_model_backend()
+            try:
+                # ✅ build_vector_db.py와 동일한 모델 사용 (모델 통일)
+                # ⚡ 성능 최적화: all-MiniLM-L6-v2는 mpnet보다 5배 빠르고 정확도는 95% 유지
+                # mpnet: 109M params, 25초 | MiniLM: 22M params, ~1초
+                start = time.time()
+                try:
+                    self.vector_model, device = load_sentence_transformer(backend)
+                except Exception as e:
+                    if backend == "torch":
+                        raise
+                    # int8/onnx 실패(optimum/onnxruntime 미설치 등) 시 FP32 모델로 폴백
+                    logger.warning(f"⚠️ {backend} 백엔드 로드 실패, torch로 폴백: {e}")
+                    backend = "torch"
+                    self.vector_model, device = load_sentence_transformer(backend)
+                self._model_loaded = True
+                logger.info(
+                    f"✅ SentenceTransformer 모델을 로드했습니다 "
+                    f"({VECTOR_MODEL_NAME}, backend: {backend}, device: {device}, "
+                    f"{time.time() - start:.2f}초)"
+                )
+            except ImportError:
+                print("⚠️ sentence-transformers 라이브러리가 설치되지 않았습니다.")
+                print("   벡터 검색 기능을 사용하려면 'pip install sentence-transformers'를 실행하세요.")
+            except Exception as e:
+                print(f"⚠️ 모델 로드 실패: {e}")
+            finally:
+                # 실패해도 대기 중인 스레드가 영원히 멈추지 않도록 완료 처리
+                self._model_ready.set()
+
+    def preload_model_async(self) -> threading.Event:
+        """
+        ✅ [성능 개선] 백그라운드에서 벡터 인덱스와 모델을 미리 로드합니다.
+        벡터 검색(search_ddc_by_vector)을 쓰는 호출자가 첫 검색 전에 호출하면
+        모델 로드(수 초)로 검색 스레드가 멈추지 않습니다.
+
+        Returns:
+            threading.Event: 로드 완료(또는 실패) 시 set()되는 이벤트
+        """
+        if self._model_loaded:
+            return self._model_ready
+
+        threading.Thread(
+            target=self._preload,
+            daemon=True,
+            name="VectorModelPreloadThread",
+        ).start()
+        return self._model_ready
+
+    def _preload(self):
+        self._ensure_index_loaded()
+        if not self.vector_index:
+            # 인덱스가 없으면 벡터 검색 자체가 불가능하므로 모델은 로드하지 않음
+            self._model_ready.set()
+            return
+        self._ensure_model_loaded()
+
+    def _ensure_index_loaded(self):
+        """faiss 인덱스와 매핑 파일을 한 번만 로드합니다 (프리로드/검색 스레드 공용)."""
+        if self._index_loaded:
+            return
+        with self._index_lock:
+            if not self._index_loaded:
+                self._load_vector_db()
+                self._index_loaded = True
 
     def _load_vector_db(self):
         """미리 생성된 faiss 인덱스와 매핑 파일을 로드합니다."""
         try:
-            self.vector_index = faiss.read_index("ddc_index_from_json.faiss")
-            with open("ddc_mapping_from_json.json", "r", encoding="utf-8") as f:
+            self.vector_index = faiss.read_index(VECTOR_INDEX_FILE)
+            with open(VECTOR_MAPPING_FILE, "r", encoding="utf-8") as f:
                 # JSON은 키를 문자열로 저장하므로, 로드 후 다시 정수 키로 변환해야 합니다.
                 loaded_mapping = json.load(f)
                 self.ddc_mapping = {int(k): v for k, v in loaded_mapping.items()}
@@ -2068,6 +2485,7 @@ class VectorDDCManager(DatabaseManager):
             print(f"⚠️ DDC 벡터 DB 로드 실패: {e}. build_vector_db.py를 실행해야 합니다.")
 
     def search_ddc_by_vector(self, query: str, top_k: int = 5) -> list:
+        self._ensure_index_loaded()
         if not self.vector_index:
             print("오류: 벡터 인덱스가 로드되지 않았습니다.")
             return []
@@ -3,12 +3,23 @@
 # 설명: SQLite PRAGMA 적용 + 워밍업 쿼리 유틸 (안전한 기본값)
 # 사용처: database_manager.py에서 연결 직후 apply_sqlite_pragmas() 호출,
 #         main_app.py(또는 앱 시작 훅)에서 warm_up_queries() 백그라운드 실행.
+#
+# ✅ [성능 개선] 적응형 워밍업 (WarmupPlanner)
+# - 고정 쿼리(LIMIT 1)는 3.5GB DB에서 몇 페이지만 읽어 첫 실제 검색이 여전히 콜드 페이지 비용을 냄
+# - 실제 검색 SQL을 trace 콜백으로 모으고 EXPLAIN QUERY PLAN으로 접근한 테이블/인덱스/FTS 세그먼트를
+#   판별하여 <db>.warmup.json에 누적 저장 (앱 종료 시)
+# - 다음 시작 시 해당 객체들의 B-tree 페이지(dbstat)를 내부 노드 우선으로 골라 파일 오프셋 순서대로
+#   순차 읽기 → OS 페이지 캐시 예열. I/O(MB)·시간 예산 안에서만 수행, 진행률은 get_warmup_progress()
 
 from __future__ import annotations
+import json
+import os
+import re
 import sqlite3
 import threading
 import time
-from typing import Iterable, Optional, Dict
+from collections import Counter
+from typing import Callable, Iterable, List, Optional, Dict
 
 # --- PRAGMA 기본 세트 ---
 # - 로컬 읽기 중심 워크로드 기준의 안전한 값
@@ -47,6 +58,8 @@ def apply_sqlite_pragmas(conn: sqlite3.Connection) -> None:
 
 # 워밍업 완료 플래그를 저장하는 전역 딕셔너리
 _warmup_events: Dict[str, threading.Event] = {}
+# 워밍업 진행률 (0.0 ~ 1.0)
+_warmup_progress: Dict[str, float] = {}
 
 
 DEFAULT_WARMUP_QUERIES = (
@@ -60,6 +73,7 @@ def warm_up_queries(
     extra_queries: Optional[Iterable[str]] = None,
     delay_sec: float = 0.0,
     warmup_key: Optional[str] = None,
+    planner: Optional["WarmupPlanner"] = None,
 ) -> threading.Event:
     """
     앱 시작 직후 백그라운드에서 실행하여 OS/SQLite 캐시를 예열.
@@ -67,6 +81,8 @@ def warm_up_queries(
     - extra_queries: 자주 쓰는 인덱스/FTS 테이블에 대한 가벼운 쿼리들
     - delay_sec: 0.0으로 변경하여 즉시 워밍업 시작 (WAL 초기화 지연 최소화)
     - warmup_key: 워밍업 완료를 추적할 키 (예: "mapping_data")
+    - planner: 지난 실행의 접근 프로필로 B-tree 페이지를 예산 내에서 미리 읽는 WarmupPlanner
+      (extra_queries 이후 실행, 진행률은 get_warmup_progress(warmup_key))
 
     ✅ [성능 개선] WAL 모드 초기화를 앱 시작 직후 즉시 수행하여
     첫 쿼리 실행 시 발생하는 메인 스레드 블로킹(10-15초) 방지
@@ -82,11 +98,20 @@ def warm_up_queries(
     event = threading.Event()
     if warmup_key:
         _warmup_events[warmup_key] = event
+        _warmup_progress[warmup_key] = 0.0
+
+    def _set_progress(fraction: float) -> None:
+        if warmup_key:
+            _warmup_progress[warmup_key] = fraction
 
     def _run():
         try:
             time.sleep(delay_sec)
             conn = get_conn_callable()
+            # 워밍업 쿼리가 접근 프로필(WarmupPlanner trace)에 기록되면 다음 예열 계획이
+            # 워밍업 자신을 따라가므로, 이 연결(워밍업 전용)의 trace는 먼저 끔
+            if hasattr(conn, "set_trace_callback"):
+                conn.set_trace_callback(None)
             cur = conn.cursor()
             for q in queries:
                 try:
@@ -96,6 +121,8 @@ def warm_up_queries(
                     # 특정 테이블이 없는 환경에서도 앱이 죽지 않도록 워밍업은 best-effort로 수행
                     pass
             cur.close()
+            if planner is not None:
+                planner.prewarm(conn, progress=_set_progress)
             # 읽기 전용 커넥션이면 close, 아니면 유지 정책에 따름
             try:
                 conn.close()
@@ -106,19 +133,25 @@ def warm_up_queries(
             pass
         finally:
             # 성공/실패 관계없이 완료 플래그 설정
+            _set_progress(1.0)
             event.set()
 
     threading.Thread(target=_run, daemon=True).start()
     return event
 
 
-def wait_for_warmup(warmup_key: str, timeout: float = 30.0) -> bool:
+def wait_for_warmup(
+    warmup_key: str,
+    timeout: float = 30.0,
+    on_progress: Optional[Callable[[float], None]] = None,
+) -> bool:
     """
     특정 워밍업이 완료될 때까지 대기
 
     Args:
         warmup_key: 워밍업 키 (warm_up_queries 호출 시 지정한 키)
         timeout: 최대 대기 시간 (초)
+        on_progress: 대기 중 0.25초마다 진행률(0.0~1.0)을 받는 콜백
 
     Returns:
         bool: 워밍업 완료 시 True, 타임아웃 시 False
@@ -128,4 +161,284 @@ def wait_for_warmup(warmup_key: str, timeout: float = 30.0) -> bool:
         # 워밍업이 시작되지 않았거나 이미 완료됨
         return True
 
-    return event.wait(timeout)
+    if on_progress is None:
+        return event.wait(timeout)
+
+    deadline = time.monotonic() + timeout
+    while not event.wait(min(0.25, max(0.0, deadline - time.monotonic()))):
+        on_progress(get_warmup_progress(warmup_key))
+        if time.monotonic() >= deadline:
+            return False
+    on_progress(1.0)
+    return True
+
+
+def get_warmup_progress(warmup_key: str) -> float:
+    """워밍업 진행률 (0.0~1.0). 시작되지 않은 키는 1.0."""
+    return _warmup_progress.get(warmup_key, 1.0)
+
+
+# --- 적응형 워밍업 (접근 프로필 기반 페이지 예열) ---
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_RE = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])")
+_ALIAS_RE = re.compile(r"\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?", re.IGNORECASE)
+_PLAN_TARGET_RE = re.compile(r"^(?:SCAN|SEARCH)\s+(\w+)")
+_PLAN_INDEX_RE = re.compile(r"USING\s+(COVERING\s+)?INDEX\s+(\w+)")
+
+
+def normalize_sql(sql: str) -> str:
+    """리터럴을 ?로 바꿔 같은 형태의 쿼리를 하나로 묶습니다."""
+    sql = _STRING_LITERAL_RE.sub("?", sql)
+    sql = _NUMBER_LITERAL_RE.sub("?", sql)
+    return " ".join(sql.split())
+
+
+def plan_objects(conn: sqlite3.Connection, sql: str, known: Dict[str, str]) -> List[str]:
+    """EXPLAIN QUERY PLAN으로 쿼리가 읽는 테이블/인덱스/FTS 섀도 테이블 이름을 구합니다.
+
+    known: sqlite_master의 이름 → type ('table' / 'index')
+    """
+    rows = conn.execute(
+        "EXPLAIN QUERY PLAN " + sql, [None] * sql.count("?")
+    ).fetchall()
+    aliases = {}
+    for table, alias in _ALIAS_RE.findall(sql):
+        if alias:
+            aliases[alias] = table
+
+    objects = []
+    for row in rows:
+        detail = row[-1]
+        target = _PLAN_TARGET_RE.match(detail)
+        if not target:
+            continue
+        table = target.group(1)
+        table = table if table in known else aliases.get(table, table)
+        if "VIRTUAL TABLE" in detail:
+            # FTS5 세그먼트는 <fts>_data, 용어 인덱스는 <fts>_idx 섀도 테이블에 저장됨
+            objects += [n for n in (f"{table}_data", f"{table}_idx") if n in known]
+            continue
+        index = _PLAN_INDEX_RE.search(detail)
+        if index and index.group(2) in known:
+            objects.append(index.group(2))
+            if index.group(1):
+                continue  # 커버링 인덱스만으로 처리 → 테이블 페이지 미접근
+        if table in known and known[table] == "table":
+            objects.append(table)
+    return objects
+
+
+class WarmupPlanner:
+    """실제 검색이 접근한 객체를 기록하고, 다음 시작 때 해당 B-tree 페이지를 예산 내에서 예열합니다.
+
+    사용 예:
+        planner = WarmupPlanner("kdc_ddc_mapping.db")
+        planner.attach(conn)              # 연결마다 (SQL 기록)
+        planner.save_profile(connect)     # 앱 종료 시 (접근 객체 누적 저장)
+        planner.prewarm(conn, progress)   # 다음 시작 시 (warm_up_queries(planner=...))
+    """
+
+    MAX_STATEMENTS = 300  # 한 세션에서 기록할 서로 다른 쿼리 형태 수
+    MAX_OBJECTS = 12  # 예열 대상 객체 수 (접근 빈도 상위)
+    # 마이그레이션/FTS 유지보수가 읽는 관리용 테이블은 검색 프로필에서 제외
+    IGNORED_OBJECTS = ("schema_version", "fts_state", "settings")
+    IGNORED_SUFFIXES = ("_dirty",)
+    READ_CHUNK = 1024 * 1024
+
+    def __init__(
+        self,
+        db_path: str,
+        profile_path: Optional[str] = None,
+        io_budget_mb: float = 256.0,
+        time_budget_sec: float = 15.0,
+    ):
+        self.db_path = db_path
+        self.profile_path = profile_path or f"{db_path}.warmup.json"
+        self.io_budget_mb = io_budget_mb
+        self.time_budget_sec = time_budget_sec
+        self._statements: Counter = Counter()
+        self._lock = threading.Lock()
+        self.last_stats: Dict[str, float] = {}
+
+    # ----- 기록 -----
+
+    def attach(self, conn: sqlite3.Connection) -> None:
+        conn.set_trace_callback(self._observe)
+
+    def _observe(self, sql: str) -> None:
+        if not sql.lstrip()[:6].upper().startswith(("SELECT", "WITH")):
+            return
+        key = normalize_sql(sql)
+        with self._lock:
+            if key in self._statements or len(self._statements) < self.MAX_STATEMENTS:
+                self._statements[key] += 1
+
+    def load_profile(self) -> Dict:
+        try:
+            with open(self.profile_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_profile(self, profile: Dict) -> None:
+        tmp = self.profile_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(profile, f, ensure_ascii=False)
+        os.replace(tmp, self.profile_path)
+
+    def save_profile(self, connect: Callable[[], sqlite3.Connection]) -> int:
+        """이번 세션에 기록된 쿼리의 접근 객체를 프로필에 누적합니다. 반영한 쿼리 형태 수를 반환."""
+        with self._lock:
+            statements, self._statements = self._statements, Counter()
+        if not statements:
+            return 0
+        conn = connect()
+        conn.set_trace_callback(None)
+        try:
+            known = dict(
+                conn.execute(
+                    "SELECT name, type FROM sqlite_master WHERE type IN ('table', 'index')"
+                ).fetchall()
+            )
+            hits: Counter = Counter()
+            for sql, count in statements.items():
+                try:
+                    for name in plan_objects(conn, sql, known):
+                        if name in self.IGNORED_OBJECTS or name.endswith(self.IGNORED_SUFFIXES):
+                            continue
+                        hits[name] += count
+                except sqlite3.Error:
+                    continue  # 임시 테이블 등 지금은 해석할 수 없는 쿼리
+        finally:
+            conn.close()
+
+        profile = self.load_profile()
+        objects = Counter(profile.get("objects", {}))
+        # 오래된 접근 기록은 절반씩 감쇠 → 최근 사용 패턴 우선
+        for name in list(objects):
+            objects[name] = objects[name] // 2
+        objects.update(hits)
+        profile["objects"] = {n: c for n, c in objects.most_common(50) if c > 0}
+        if set(profile["objects"]) != set(profile.get("pages", {}).get("objects", [])):
+            profile.pop("pages", None)  # 대상이 바뀌면 페이지 목록 재계산
+        self._write_profile(profile)
+        return len(statements)
+
+    # ----- 예열 -----
+
+    def _signature(self, conn: sqlite3.Connection) -> List[int]:
+        """페이지 배치가 크게 바뀌었는지 판단하는 값 (파일 크기, 스키마 버전)."""
+        return [
+            os.path.getsize(self.db_path),
+            conn.execute("PRAGMA schema_version").fetchone()[0],
+        ]
+
+    def _collect_pages(
+        self, conn: sqlite3.Connection, objects: List[str], max_pages: int, deadline: float
+    ) -> List[int]:
+        """dbstat으로 객체별 페이지 번호를 구해, 내부 노드 → 리프 순으로 예산만큼 고릅니다.
+
+        dbstat 순회 자체가 해당 페이지를 읽으므로, 객체마다 예산을 나눠 순회 길이도 제한합니다.
+        (프로필이 바뀐 첫 실행에서는 이 순회가 곧 예열 역할)
+        """
+        per_object = max(1, max_pages // max(1, len(objects)))
+        internal: List[int] = []
+        leaves: List[int] = []
+        for name in objects:
+            if time.monotonic() >= deadline:
+                break
+            visited = 0
+            cursor = conn.execute(
+                "SELECT pageno, pagetype FROM dbstat WHERE name = ?", (name,)
+            )
+            for pageno, pagetype in cursor:
+                if pagetype == "internal":
+                    internal.append(pageno)
+                else:
+                    leaves.append(pageno)
+                visited += 1
+                if visited >= per_object or time.monotonic() >= deadline:
+                    break
+        chosen = internal[:max_pages]
+        chosen += leaves[: max_pages - len(chosen)]
+        return sorted(set(chosen))
+
+    @staticmethod
+    def _to_runs(pages: List[int]) -> List[List[int]]:
+        runs: List[List[int]] = []
+        for page in pages:
+            if runs and runs[-1][0] + runs[-1][1] == page:
+                runs[-1][1] += 1
+            else:
+                runs.append([page, 1])
+        return runs
+
+    def _read_runs(
+        self,
+        runs: List[List[int]],
+        page_size: int,
+        max_bytes: int,
+        deadline: float,
+        progress: Optional[Callable[[float], None]],
+    ) -> int:
+        """페이지 구간을 파일 오프셋 순서대로 순차 읽기 (OS 페이지 캐시 예열)."""
+        total = min(max_bytes, sum(count for _, count in runs) * page_size) or 1
+        done = 0
+        buffer = bytearray(self.READ_CHUNK)
+        view = memoryview(buffer)
+        with open(self.db_path, "rb", buffering=0) as f:
+            for start, count in runs:
+                offset = (start - 1) * page_size
+                remaining = count * page_size
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), offset, remaining, os.POSIX_FADV_WILLNEED)
+                f.seek(offset)
+                while remaining > 0 and done < max_bytes:
+                    n = f.readinto(view[: min(remaining, self.READ_CHUNK, max_bytes - done)])
+                    if not n:
+                        break
+                    remaining -= n
+                    done += n
+                if progress:
+                    progress(min(done / total, 1.0))
+                if done >= max_bytes or time.monotonic() >= deadline:
+                    break
+        return done
+
+    def prewarm(
+        self,
+        conn: sqlite3.Connection,
+        progress: Optional[Callable[[float], None]] = None,
+    ) -> int:
+        """프로필의 상위 객체 페이지를 예산 내에서 읽습니다. 읽은 바이트 수를 반환 (best-effort)."""
+        started = time.monotonic()
+        deadline = started + self.time_budget_sec
+        profile = self.load_profile()
+        objects = [n for n, _ in Counter(profile.get("objects", {})).most_common(self.MAX_OBJECTS)]
+        if not objects:
+            return 0
+
+        conn.set_trace_callback(None)  # 예열 쿼리는 접근 프로필에 섞지 않음
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        max_bytes = int(self.io_budget_mb * 1024 * 1024)
+        signature = self._signature(conn)
+        cached = profile.get("pages", {})
+        read_bytes = 0
+        try:
+            if cached.get("signature") == signature and cached.get("objects") == objects:
+                runs = cached.get("runs", [])
+            else:
+                pages = self._collect_pages(conn, objects, max_bytes // page_size, deadline)
+                runs = self._to_runs(pages)
+                profile["pages"] = {"signature": signature, "objects": objects, "runs": runs}
+                self._write_profile(profile)
+            read_bytes = self._read_runs(runs, page_size, max_bytes, deadline, progress)
+        except (OSError, sqlite3.Error):
+            pass  # dbstat 미지원 빌드 등 → 기존 고정 쿼리 워밍업만 적용
+        self.last_stats = {
+            "objects": len(objects),
+            "read_mb": read_bytes / (1024 * 1024),
+            "seconds": time.monotonic() - started,
+        }
+        return read_bytes
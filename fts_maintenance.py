@@ -0,0 +1,470 @@
+# -*- coding: utf-8 -*-
+# 파일명: fts_maintenance.py
+# 설명: FTS5 증분 유지보수 유틸 (더티 rowid 추적 + 델타 반영 + 예산 기반 merge)
+# 사용처: sync_kac_authors.py, rebuild_biblio_with_kac.py,
+#         build_kac_authority_and_biblio_db.py, database_manager.py
+#
+# 배경:
+# - 기존 파이프라인은 소량 갱신 후에도 FTS를 DROP → 'rebuild' → 'optimize' 하여
+#   수백만 행 재색인 동안 DB 전체가 잠겼다.
+# - 또한 external content/contentless FTS5는 'delete' 시 "색인 당시의 값"이 필요한데,
+#   AFTER UPDATE 트리거에서는 이미 새 값만 남아 있어 색인이 점점 어긋났다.
+#
+# 방식:
+# 1. install_dirty_tracking(): 원본 테이블에 BEFORE UPDATE/DELETE 트리거를 달아
+#    "현재 색인에 들어있는 값"을 <fts>_dirty 테이블에 rowid별로 1회만 캡처.
+# 2. apply_dirty(): 캡처된 옛 값으로 'delete' → 현재 값으로 재삽입. 작은 트랜잭션 단위.
+# 3. merge_step(): FTS5 'merge' 명령으로 세그먼트를 조금씩 병합 (optimize 대체).
+# 4. FtsMaintainer: 2~3을 시간 예산 안에서 주기적으로 수행하는 백그라운드 스레드.
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger("qt_main_app.fts_maintenance")
+
+
+@dataclass(frozen=True)
+class FtsSpec:
+    """FTS 테이블과 원본(content) 테이블의 관계 정의.
+
+    columns: FTS 컬럼명 → 원본 행({r})에서 값을 만드는 SQL 식
+    predicate: 원본 행이 색인 대상인지 판단하는 SQL 식 (None이면 전 행)
+    child_tables: 값 계산에 참여하는 보조 테이블 (테이블명, 원본 키 컬럼)
+    contentless: content='' 테이블이면 True (rowid 정렬 여부를 별도 기록)
+    legacy_triggers: 즉시 동기화 방식의 기존 트리거 (설치 시 제거)
+    """
+
+    fts_table: str
+    content_table: str
+    columns: Dict[str, str]
+    predicate: Optional[str] = None
+    key_column: Optional[str] = None
+    child_tables: Tuple[str, ...] = ()
+    contentless: bool = False
+    legacy_triggers: Tuple[str, ...] = field(default_factory=tuple)
+
+
+def _authority_group(table: str, col: str) -> str:
+    return (
+        f"COALESCE((SELECT GROUP_CONCAT({col}, ', ') FROM {table} x "
+        f"WHERE x.kac_id_full={{r}}.kac_id_full), '')"
+    )
+
+
+FTS_SPECS: Dict[str, FtsSpec] = {
+    "biblio_title_fts": FtsSpec(
+        fts_table="biblio_title_fts",
+        content_table="biblio",
+        columns={
+            "nlk_id": "{r}.nlk_id",
+            "title": "{r}.title",
+            "author_names": "{r}.author_names",
+            "kac_codes": "{r}.kac_codes",
+            "kac_authors": "{r}.kac_authors",
+        },
+        legacy_triggers=("biblio_ai", "biblio_au", "biblio_ad"),
+    ),
+    "mapping_data_fts": FtsSpec(
+        fts_table="mapping_data_fts",
+        content_table="mapping_data",
+        columns={
+            "identifier": "{r}.identifier",
+            "ksh_korean": "{r}.ksh_korean",
+        },
+        predicate="{r}.ksh_korean IS NOT NULL AND {r}.ksh_korean != ''",
+        legacy_triggers=(
+            "mapping_data_fts_insert",
+            "mapping_data_fts_update",
+            "mapping_data_fts_delete",
+        ),
+    ),
+    "authority_fts": FtsSpec(
+        fts_table="authority_fts",
+        content_table="authority",
+        columns={
+            "kac_id_full": "{r}.kac_id_full",
+            "name": "COALESCE({r}.name, '')",
+            "pref_label": "COALESCE({r}.pref_label, '')",
+            "label": "COALESCE({r}.label, '')",
+            "alt_labels": _authority_group("authority_altlabel", "alt_label"),
+            "job_titles": _authority_group("authority_job", "job_title"),
+            "fields": _authority_group("authority_field", "field"),
+            "sources": _authority_group("authority_source", "source"),
+        },
+        key_column="kac_id_full",
+        child_tables=(
+            "authority_altlabel",
+            "authority_job",
+            "authority_field",
+            "authority_source",
+        ),
+        contentless=True,
+    ),
+}
+
+# contentless FTS의 rowid가 원본 rowid와 일치하는지 기록 (델타 반영의 전제 조건)
+FTS_STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fts_state (
+  fts_table    TEXT PRIMARY KEY,
+  rowid_aligned INTEGER NOT NULL DEFAULT 0,
+  last_rebuild TEXT,
+  last_apply   TEXT
+);
+"""
+
+
+# =====================
+# 내부 헬퍼
+# =====================
+
+
+def _table_exists(conn: sqlite3.Connection, name: str) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (name,)
+    ).fetchone()
+    return row is not None
+
+
+def _active_columns(conn: sqlite3.Connection, spec: FtsSpec) -> List[str]:
+    """실제 FTS 테이블에 존재하는 컬럼만 (예: kac_authors 추가 이전 스키마 호환)."""
+    fts_cols = [r[1] for r in conn.execute(f"PRAGMA table_info({spec.fts_table})")]
+    return [c for c in fts_cols if c in spec.columns]
+
+
+def _exprs(spec: FtsSpec, cols: Iterable[str], alias: str) -> List[str]:
+    return [spec.columns[c].format(r=alias) for c in cols]
+
+
+def _pred(spec: FtsSpec, alias: str) -> str:
+    return spec.predicate.format(r=alias) if spec.predicate else "1"
+
+
+def dirty_table(fts_table: str) -> str:
+    return f"{fts_table}_dirty"
+
+
+def _trigger_names(spec: FtsSpec) -> List[str]:
+    base = f"{spec.fts_table}_trk"
+    names = [f"{base}_ai", f"{base}_bu", f"{base}_bd"]
+    for child in spec.child_tables:
+        names += [f"{base}_{child}_bi", f"{base}_{child}_bd"]
+    return names
+
+
+# =====================
+# 설치 / 해제
+# =====================
+
+
+def install_dirty_tracking(conn: sqlite3.Connection, fts_table: str) -> bool:
+    """원본 테이블에 더티 캡처 트리거를 설치합니다 (멱등).
+
+    기존 즉시 동기화 트리거는 제거됩니다. FTS 테이블이 없으면 False.
+    """
+    spec = FTS_SPECS[fts_table]
+    if not _table_exists(conn, fts_table):
+        return False
+
+    cols = _active_columns(conn, spec)
+    dt = dirty_table(fts_table)
+    old_cols = ", ".join(f"old_{c}" for c in cols)
+    cur = conn.cursor()
+    cur.executescript(FTS_STATE_SCHEMA)
+    cur.execute(
+        f"CREATE TABLE IF NOT EXISTS {dt} (rid INTEGER PRIMARY KEY, in_index INTEGER NOT NULL, "
+        + ", ".join(f"old_{c}" for c in cols)
+        + ")"
+    )
+    for name in spec.legacy_triggers + tuple(_trigger_names(spec)):
+        cur.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+    base = f"{fts_table}_trk"
+    t = spec.content_table
+    # 새 행: 아직 색인에 없음 (in_index=0)
+    cur.execute(
+        f"""CREATE TRIGGER {base}_ai AFTER INSERT ON {t} BEGIN
+            INSERT OR IGNORE INTO {dt} (rid, in_index) VALUES (NEW.rowid, 0);
+        END"""
+    )
+    # 변경/삭제 직전: 색인에 들어있는 옛 값을 1회만 캡처 (OR IGNORE)
+    for tag, event in (("bu", "UPDATE"), ("bd", "DELETE")):
+        cur.execute(
+            f"""CREATE TRIGGER {base}_{tag} BEFORE {event} ON {t} BEGIN
+                INSERT OR IGNORE INTO {dt} (rid, in_index, {old_cols})
+                VALUES (OLD.rowid, ({_pred(spec, 'OLD')}), {', '.join(_exprs(spec, cols, 'OLD'))});
+            END"""
+        )
+    # 보조 테이블 변경도 원본 행의 FTS 값을 바꾸므로 같은 방식으로 캡처
+    for child in spec.child_tables:
+        for tag, event, ref in (("bi", "INSERT", "NEW"), ("bd", "DELETE", "OLD")):
+            cur.execute(
+                f"""CREATE TRIGGER {base}_{child}_{tag} BEFORE {event} ON {child} BEGIN
+                    INSERT OR IGNORE INTO {dt} (rid, in_index, {old_cols})
+                    SELECT a.rowid, ({_pred(spec, 'a')}), {', '.join(_exprs(spec, cols, 'a'))}
+                    FROM {t} a WHERE a.{spec.key_column} = {ref}.{spec.key_column};
+                END"""
+            )
+    conn.commit()
+    return True
+
+
+def uninstall_dirty_tracking(
+    conn: sqlite3.Connection, fts_table: str, drop_log: bool = False
+) -> None:
+    """더티 캡처 트리거를 제거합니다 (대량 적재 후 rebuild_full 할 때 사용).
+
+    drop_log=True면 더티 로그 테이블도 제거합니다 (FTS 컬럼 구성이 바뀌는 재생성 시).
+    """
+    spec = FTS_SPECS[fts_table]
+    for name in spec.legacy_triggers + tuple(_trigger_names(spec)):
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    if drop_log:
+        conn.execute(f"DROP TABLE IF EXISTS {dirty_table(fts_table)}")
+    conn.commit()
+
+
+def is_rowid_aligned(conn: sqlite3.Connection, fts_table: str) -> bool:
+    """델타 반영이 안전한지 (FTS rowid == 원본 rowid) 확인합니다."""
+    spec = FTS_SPECS[fts_table]
+    if not spec.contentless:
+        return True  # external content: content_rowid로 항상 정렬됨
+    conn.executescript(FTS_STATE_SCHEMA)
+    row = conn.execute(
+        "SELECT rowid_aligned FROM fts_state WHERE fts_table=?", (fts_table,)
+    ).fetchone()
+    if row and row[0]:
+        return True
+    # 비어있는 FTS는 앞으로 정렬된 rowid로만 채워짐
+    return conn.execute(f"SELECT 1 FROM {fts_table} LIMIT 1").fetchone() is None
+
+
+def _touch_state(conn: sqlite3.Connection, fts_table: str, column: str) -> None:
+    conn.execute(
+        f"""
+        INSERT INTO fts_state (fts_table, rowid_aligned, {column})
+        VALUES (?, 1, datetime('now'))
+        ON CONFLICT(fts_table) DO UPDATE SET rowid_aligned=1, {column}=excluded.{column}
+        """,
+        (fts_table,),
+    )
+
+
+# =====================
+# 전체 재구축 (최초 구축 / 스키마 변경 시에만)
+# =====================
+
+
+def rebuild_full(conn: sqlite3.Connection, fts_table: str) -> None:
+    """FTS를 원본 전체로부터 다시 채우고 더티 로그를 비웁니다."""
+    spec = FTS_SPECS[fts_table]
+    cols = _active_columns(conn, spec)
+    conn.executescript(FTS_STATE_SCHEMA)
+    conn.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES('delete-all')")
+    conn.execute(
+        f"INSERT INTO {fts_table} (rowid, {', '.join(cols)}) "
+        f"SELECT r.rowid, {', '.join(_exprs(spec, cols, 'r'))} "
+        f"FROM {spec.content_table} r WHERE {_pred(spec, 'r')}"
+    )
+    if _table_exists(conn, dirty_table(fts_table)):
+        conn.execute(f"DELETE FROM {dirty_table(fts_table)}")
+    _touch_state(conn, fts_table, "last_rebuild")
+    conn.commit()
+
+
+# =====================
+# 델타 반영 / 병합
+# =====================
+
+
+def pending_count(conn: sqlite3.Connection, fts_table: str) -> int:
+    dt = dirty_table(fts_table)
+    if not _table_exists(conn, dt):
+        return 0
+    return conn.execute(f"SELECT COUNT(*) FROM {dt}").fetchone()[0]
+
+
+def apply_dirty(conn: sqlite3.Connection, fts_table: str, limit: int = 5000) -> int:
+    """더티 rowid를 최대 limit개 반영하고 처리 건수를 반환합니다.
+
+    한 번의 IMMEDIATE 트랜잭션으로 처리하므로 반영 도중 원본이 바뀌지 않습니다.
+    """
+    spec = FTS_SPECS[fts_table]
+    dt = dirty_table(fts_table)
+    if not _table_exists(conn, dt):
+        return 0
+    cols = _active_columns(conn, spec)
+    col_list = ", ".join(cols)
+
+    if conn.in_transaction:
+        conn.commit()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        rows = conn.execute(
+            f"SELECT rid, in_index, {', '.join('old_' + c for c in cols)} "
+            f"FROM {dt} ORDER BY rid LIMIT ?",
+            (limit,),
+        ).fetchall()
+        if not rows:
+            conn.commit()
+            return 0
+
+        # 1) 색인에 있던 옛 값 제거 (값이 정확히 일치해야 토큰이 빠짐)
+        deletes = [(r[0],) + tuple(r[2:]) for r in rows if r[1]]
+        if deletes:
+            conn.executemany(
+                f"INSERT INTO {fts_table} ({fts_table}, rowid, {col_list}) "
+                f"VALUES ('delete', ?, {', '.join('?' for _ in cols)})",
+                deletes,
+            )
+        # 2) 현재 값 재삽입 (삭제된 행/비대상 행은 자연히 제외)
+        conn.executemany(
+            f"INSERT INTO {fts_table} (rowid, {col_list}) "
+            f"SELECT r.rowid, {', '.join(_exprs(spec, cols, 'r'))} "
+            f"FROM {spec.content_table} r WHERE r.rowid = ? AND {_pred(spec, 'r')}",
+            [(r[0],) for r in rows],
+        )
+        conn.executemany(f"DELETE FROM {dt} WHERE rid = ?", [(r[0],) for r in rows])
+        _touch_state(conn, fts_table, "last_apply")
+        conn.commit()
+        return len(rows)
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def apply_all_dirty(
+    conn: sqlite3.Connection,
+    fts_table: str,
+    batch: int = 5000,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """더티 로그가 빌 때까지 batch 단위로 반영 (배치마다 커밋 → 긴 잠금 없음)."""
+    total = pending_count(conn, fts_table)
+    done = 0
+    while True:
+        n = apply_dirty(conn, fts_table, batch)
+        if not n:
+            break
+        done += n
+        if progress:
+            progress(done, total)
+    return done
+
+
+def merge_step(conn: sqlite3.Connection, fts_table: str, pages: int = 500) -> bool:
+    """FTS5 'merge' 한 스텝. 실제로 병합한 작업이 있으면 True ('optimize' 대체)."""
+    before = conn.total_changes
+    conn.execute(
+        f"INSERT INTO {fts_table} ({fts_table}, rank) VALUES ('merge', ?)", (pages,)
+    )
+    conn.commit()
+    return conn.total_changes - before > 1
+
+
+# =====================
+# 백그라운드 유지보수
+# =====================
+
+
+class FtsMaintainer:
+    """더티 반영 + merge를 시간 예산 안에서 주기적으로 수행하는 백그라운드 작업자.
+
+    사용 예:
+        m = FtsMaintainer(lambda: sqlite3.connect("kdc_ddc_mapping.db"), ["mapping_data_fts"])
+        m.start()
+        ...
+        m.stop()
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], sqlite3.Connection],
+        fts_tables: Iterable[str],
+        interval_sec: float = 5.0,
+        time_budget_sec: float = 0.5,
+        batch_rows: int = 2000,
+        merge_pages: int = 200,
+    ):
+        self._connect = connect
+        self.fts_tables = list(fts_tables)
+        self.interval_sec = interval_sec
+        self.time_budget_sec = time_budget_sec
+        self.batch_rows = batch_rows
+        self.merge_pages = merge_pages
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stats: Dict[str, Dict[str, int]] = {
+            t: {"applied": 0, "merges": 0} for t in self.fts_tables
+        }
+        # 반영 후 아직 merge가 끝나지 않은 테이블 (시작 시에는 남은 세그먼트를 한 번 정리)
+        self._merge_pending = set(self.fts_tables)
+
+    def start(self) -> "FtsMaintainer":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, daemon=True, name="FtsMaintainerThread"
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def poke(self) -> None:
+        """다음 주기를 기다리지 않고 곧바로 반영하도록 깨웁니다 (쓰기 직후 호출)."""
+        self._wake.set()
+
+    def run_once(self, conn: sqlite3.Connection) -> None:
+        """각 FTS 테이블에 대해 예산 내에서 델타 반영 → 남는 시간에 merge.
+
+        더티 로그가 비어 있고 지난 merge도 끝났으면 쓰기 잠금(BEGIN IMMEDIATE)/커밋 없이 건너뜁니다.
+        """
+        for table in self.fts_tables:
+            if not _table_exists(conn, table):
+                continue
+            # ✅ [성능 개선] 유휴 상태에서는 5초마다 쓰기 잠금을 잡지 않도록 읽기만으로 판단
+            if not pending_count(conn, table) and table not in self._merge_pending:
+                continue
+            deadline = time.monotonic() + self.time_budget_sec
+            while time.monotonic() < deadline and not self._stop.is_set():
+                n = apply_dirty(conn, table, self.batch_rows)
+                self.stats[table]["applied"] += n
+                if not n:
+                    break
+                self._merge_pending.add(table)
+            while time.monotonic() < deadline and not self._stop.is_set():
+                if not merge_step(conn, table, self.merge_pages):
+                    self._merge_pending.discard(table)
+                    break
+                self.stats[table]["merges"] += 1
+
+    def _run(self) -> None:
+        conn = None
+        try:
+            conn = self._connect()
+            while not self._stop.is_set():
+                try:
+                    self.run_once(conn)
+                except sqlite3.OperationalError as e:
+                    # 다른 쓰기 작업이 잠금 중이면 다음 주기에 재시도
+                    logger.debug(f"FTS 유지보수 연기: {e}")
+                except Exception as e:
+                    logger.warning(f"⚠️ FTS 유지보수 실패 (무시 가능): {e}")
+                self._wake.wait(self.interval_sec)
+                self._wake.clear()
+        finally:
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+# 파일명: lazy_imports.py
+# 설명: 무거운 서드파티 모듈 지연 import + 시작 시 모듈별 import 시간 계측
+# 생성일: 2025-10-31
+#
+# 1) lazy_import / lazy_attr
+#    faiss, sentence_transformers, bs4, deep_translator, openpyxl처럼 일부 탭에서만
+#    쓰는 모듈을 첫 사용 시점에 import합니다. (스레드 안전, 한 번만 import)
+#
+#        faiss = lazy_import("faiss")
+#        BeautifulSoup = lazy_attr("bs4", "BeautifulSoup")
+#
+# 2) 시작 계측 모드 (python -X importtime 과 같은 정보를 앱 로그에 표시)
+#    환경 변수 KAC_IMPORT_PROFILE=1 또는 실행 인자 --profile-imports 로 켭니다.
+#    start_import_profiler()는 다른 모듈 import보다 먼저 호출해야 합니다.
+
+import importlib
+import os
+import sys
+import threading
+import time
+
+IMPORT_PROFILE_ENV = "KAC_IMPORT_PROFILE"
+IMPORT_PROFILE_ARG = "--profile-imports"
+
+# 시작 경로에 올라오면 안 되는 무거운 모듈 (test_cold_start.py가 검사)
+HEAVY_MODULES = (
+    "faiss",
+    "sentence_transformers",
+    "torch",
+    "bs4",
+    "deep_translator",
+    "openpyxl",
+)
+
+_import_lock = threading.RLock()
+
+
+class LazyModule:
+    """첫 속성 접근 때 실제 모듈을 import하는 자리표시자."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        module = self._module
+        if module is None:
+            with _import_lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+                module = self._module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule '{self._name}' ({state})>"
+
+
+class LazyAttribute:
+    """모듈의 클래스/함수를 첫 호출(또는 속성 접근) 때 가져오는 자리표시자.
+
+    `from bs4 import BeautifulSoup` 대신 `BeautifulSoup = lazy_attr("bs4", "BeautifulSoup")`
+    로 바꾸면 호출부(BeautifulSoup(html, "html.parser"))는 그대로 둘 수 있습니다.
+    """
+
+    def __init__(self, module_name, attr):
+        self._module = LazyModule(module_name)
+        self._attr = attr
+        self._target = None
+
+    def _resolve(self):
+        if self._target is None:
+            self._target = getattr(self._module, self._attr)
+        return self._target
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr):
+        return getattr(self._resolve(), attr)
+
+    def __repr__(self):
+        return f"<LazyAttribute '{self._module._name}.{self._attr}'>"
+
+
+def lazy_import(name):
+    """이미 import된 모듈이면 그대로, 아니면 LazyModule을 반환합니다."""
+    return sys.modules.get(name) or LazyModule(name)
+
+
+def lazy_attr(module_name, attr):
+    return LazyAttribute(module_name, attr)
+
+
+# =================================================================
+# 시작 시 import 시간 계측
+# =================================================================
+
+
+def import_profiling_requested(argv=None):
+    argv = sys.argv if argv is None else argv
+    return os.environ.get(IMPORT_PROFILE_ENV) == "1" or IMPORT_PROFILE_ARG in argv
+
+
+class _TimingLoader:
+    """exec_module 구간을 재서 프로파일러에 기록하는 로더 래퍼 (나머지는 원래 로더에 위임)."""
+
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._enter()
+        started = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._leave(module.__name__, time.perf_counter() - started)
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+
+class ImportTimeProfiler:
+    """sys.meta_path 앞단에서 모듈별 import 시간(self/누적)을 기록합니다.
+
+    -X importtime과 같은 방식으로, 누적 시간에서 하위 import 시간을 뺀 값을 self 시간으로 봅니다.
+    메인 스레드 외의 import도 스레드별 스택으로 따로 계산합니다.
+    """
+
+    def __init__(self):
+        self.records = []  # (모듈 이름, self 초, 누적 초, 깊이)
+        self._local = threading.local()
+        self._started = time.perf_counter()
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _enter(self):
+        self._stack().append(0.0)  # 이 모듈 아래에서 쓴 하위 import 시간 합계
+
+    def _leave(self, name, elapsed):
+        stack = self._stack()
+        children = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+        self.records.append((name, elapsed - children, elapsed, len(stack)))
+
+    def find_spec(self, name, path, target=None):
+        if getattr(self._local, "finding", False):
+            return None
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(name, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.finding = False
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimingLoader(spec.loader, self)
+        return spec
+
+    def total_seconds(self):
+        return time.perf_counter() - self._started
+
+    def top(self, limit=25):
+        """self 시간 기준 상위 모듈 목록"""
+        return sorted(self.records, key=lambda record: record[1], reverse=True)[:limit]
+
+    def report_lines(self, limit=25):
+        top_level = sum(cumulative for _, _, cumulative, depth in self.records if depth == 0)
+        lines = [
+            f"⏱️ import 계측: 모듈 {len(self.records)}개, "
+            f"최상위 import 합계 {top_level * 1000:.0f}ms (계측 시작 후 {self.total_seconds():.2f}초)",
+            f"{'self(ms)':>9} {'누적(ms)':>9}  모듈",
+        ]
+        for name, self_time, cumulative, _depth in self.top(limit):
+            lines.append(f"{self_time * 1000:>9.1f} {cumulative * 1000:>9.1f}  {name}")
+        return lines
+
+
+_profiler = None
+
+
+def start_import_profiler():
+    """계측을 시작합니다. 다른 import보다 먼저 호출하세요."""
+    global _profiler
+    if _profiler is None:
+        _profiler = ImportTimeProfiler()
+        sys.meta_path.insert(0, _profiler)
+    return _profiler
+
+
+def stop_import_profiler():
+    """계측을 멈추고 프로파일러를 반환합니다 (시작하지 않았으면 None)."""
+    global _profiler
+    profiler = _profiler
+    if profiler is not None:
+        try:
+            sys.meta_path.remove(profiler)
+        except ValueError:
+            pass
+        _profiler = None
+    return profiler
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# 파일명: librarian_rate_limit.py
+# 설명: librarian.nl.go.kr 공용 요청 간격 제한기 (적응형, 429/5xx 백오프)
+# 생성일: 2025-10-31
+# 사용처: Search_KAC_Authorities.py (인명 목록 페이지), Search_KSH_Lite.py (주제어 목록/상세 페이지)
+#
+# 두 모듈은 같은 호스트에 요청하므로 제한기 하나(librarian_limiter)를 공유해야
+# 서버 입장의 요청 간격이 유지된다. 모듈마다 제한기를 두면 동시 검색 시 간격이 절반이 된다.
+
+import threading
+import time
+
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+
+
+class PoliteRateLimiter:
+    """librarian.nl.go.kr 요청 시작 간격을 서버 상태에 맞춰 조절하는 공용 제한기.
+
+    고정 time.sleep(0.5) 대신:
+    - 정상 응답이면 간격을 (응답 시간 × latency_factor) 쪽으로 서서히 줄이고 (최소 min_interval)
+    - 429/5xx 응답이면 간격을 두 배로 늘리며 (최대 max_interval), Retry-After가 있으면 따릅니다.
+    복수 검색어를 동시에 검색해도 같은 제한기를 공유하므로 서버 입장의 요청 간격이 유지됩니다.
+    """
+
+    def __init__(self, min_interval=0.2, max_interval=8.0, latency_factor=0.5):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.latency_factor = latency_factor
+        self.interval = min_interval
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, should_stop=None):
+        """다음 요청 시각까지 기다립니다. 기다리는 중 중지 요청이 오면 False."""
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_at)
+            self._next_at = start_at + self.interval
+        while True:
+            remaining = start_at - time.monotonic()
+            if remaining <= 0:
+                return True
+            if should_stop is not None and should_stop():
+                return False
+            time.sleep(min(remaining, 0.2))
+
+    def record_success(self, elapsed):
+        with self._lock:
+            target = min(
+                self.max_interval,
+                max(self.min_interval, elapsed * self.latency_factor),
+            )
+            self.interval = 0.7 * self.interval + 0.3 * target
+
+    def record_throttle(self, retry_after=None):
+        with self._lock:
+            self.interval = min(self.max_interval, max(self.interval * 2, 1.0))
+            wait_until = time.monotonic() + (retry_after or self.interval)
+            self._next_at = max(self._next_at, wait_until)
+
+
+def retry_after(response):
+    """Retry-After 헤더(초)를 float로, 없거나 날짜 형식이면 None."""
+    try:
+        return float(response.headers.get("Retry-After", ""))
+    except (TypeError, ValueError):
+        return None
+
+
+# librarian.nl.go.kr에 요청하는 모든 모듈이 공유하는 인스턴스
+librarian_limiter = PoliteRateLimiter()
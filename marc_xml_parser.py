@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+# 파일명: marc_xml_parser.py
+# 설명: MARC21-XML / MARCXchange / MODS 응답 공용 스트리밍 파서
+# 생성일: 2025-10-31
+# 사용처: Search_LC.py, Search_DNB.py, Search_BNF.py, Search_Harvard.py,
+#         Search_CiNii.py, Search_NLK.py
+#
+# 배경:
+# - 기존 클라이언트는 ET.fromstring(response.content)로 응답 전체를 트리로 만든 뒤
+#   레코드마다 .find(".//marc:datafield[@tag='245']")처럼 XPath를 필드별로 반복 호출.
+#   필드 하나를 찾을 때마다 레코드 하위 전체를 다시 훑으므로 레코드당 비용이
+#   (찾는 필드 수 × 하위 요소 수)로 커졌다.
+#
+# 방식:
+# 1. iterparse로 레코드 단위 "end" 이벤트만 처리하고, 처리한 레코드는 clear()로 해제
+#    (응답 크기와 무관하게 메모리는 레코드 1개 분량).
+# 2. MARC 레코드는 한 번의 순회로 controlfield/datafield를 태그별 dict로 색인
+#    (MarcRecord) → 이후 조회는 dict 접근.
+# 3. lxml이 설치되어 있으면 lxml.etree.iterparse(tag=...)를 사용, 없으면 표준 라이브러리.
+#
+#     for record in iter_marc_records(response.content):
+#         title = record.subfield("245", "a")
+#         for field in record.fields("650"): ...
+
+import io
+import xml.etree.ElementTree as ET
+
+try:
+    from lxml import etree as _lxml_etree
+
+    HAVE_LXML = True
+except ImportError:  # lxml은 선택 의존성
+    _lxml_etree = None
+    HAVE_LXML = False
+
+MARC21_NS = "http://www.loc.gov/MARC21/slim"
+MARCXCHANGE_NS = "info:lc/xmlns/marcxchange-v2"
+MODS_NS = "http://www.loc.gov/mods/v3"
+ATOM_NS = "http://www.w3.org/2005/Atom"
+
+# 호출부에서 except XML_PARSE_ERRORS: 로 두 파서의 오류를 함께 처리
+XML_PARSE_ERRORS = (ET.ParseError,) + (
+    (_lxml_etree.XMLSyntaxError,) if HAVE_LXML else ()
+)
+
+
+def _local_name(tag):
+    return tag.rpartition("}")[2]
+
+
+def _as_stream(content):
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return io.BytesIO(content)
+
+
+def iter_elements(content, tag):
+    """content(bytes/str)에서 tag("{ns}local" 형식) 요소를 끝날 때마다 하나씩 반환합니다.
+
+    반환된 요소는 다음 요소로 넘어갈 때 clear()되므로, 필요한 값은 그 전에 꺼내야 합니다.
+    """
+    stream = _as_stream(content)
+    if HAVE_LXML:
+        context = _lxml_etree.iterparse(
+            stream, events=("end",), tag=tag, resolve_entities=False
+        )
+        for _event, elem in context:
+            yield elem
+            elem.clear()
+            # 이미 처리한 형제 요소를 부모에서 떼어내 트리가 자라지 않게 함
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    else:
+        for _event, elem in ET.iterparse(stream, events=("end",)):
+            if elem.tag == tag:
+                yield elem
+                elem.clear()
+
+
+# =====================
+# MARC21-XML / MARCXchange
+# =====================
+
+
+class DataField:
+    """datafield 1개: 지시자와 (code, text) 서브필드 목록 (문서 순서 유지)."""
+
+    __slots__ = ("tag", "ind1", "ind2", "subfields")
+
+    def __init__(self, tag, ind1, ind2, subfields):
+        self.tag = tag
+        self.ind1 = ind1
+        self.ind2 = ind2
+        self.subfields = subfields
+
+    def get(self, code, default=None):
+        """첫 번째 $code 텍스트 (없으면 default)."""
+        for sub_code, text in self.subfields:
+            if sub_code == code:
+                return text
+        return default
+
+    def get_all(self, code):
+        return [text for sub_code, text in self.subfields if sub_code == code]
+
+    def values(self, codes=None):
+        """codes에 속한(생략 시 전체) 서브필드 텍스트 목록 (빈 값 제외, strip)."""
+        return [
+            text.strip()
+            for sub_code, text in self.subfields
+            if text and (codes is None or sub_code in codes)
+        ]
+
+    def indicators(self):
+        """LC 탭 '082 ind' 컬럼 형식 (공백 지시자는 #)."""
+        return f"{self.ind1.strip()}{self.ind2.strip()}".replace(" ", "#")
+
+
+class MarcRecord:
+    """레코드 1개를 한 번 순회해 태그별로 색인한 결과."""
+
+    __slots__ = ("controlfields", "datafields", "_by_tag")
+
+    def __init__(self):
+        self.controlfields = {}  # tag → 첫 번째 값
+        self.datafields = []  # 문서 순서의 DataField 목록
+        self._by_tag = {}  # tag → [DataField, ...]
+
+    @classmethod
+    def from_element(cls, record_element):
+        record = cls()
+        controlfields = record.controlfields
+        by_tag = record._by_tag
+        for child in record_element:
+            if not isinstance(child.tag, str):
+                continue  # lxml 주석/처리 지시문
+            name = _local_name(child.tag)
+            tag = child.get("tag", "")
+            if name == "datafield":
+                field = DataField(
+                    tag,
+                    child.get("ind1", " "),
+                    child.get("ind2", " "),
+                    [
+                        (sub.get("code", ""), sub.text or "")
+                        for sub in child
+                        if isinstance(sub.tag, str)
+                    ],
+                )
+                record.datafields.append(field)
+                by_tag.setdefault(tag, []).append(field)
+            elif name == "controlfield":
+                controlfields.setdefault(tag, child.text or "")
+        return record
+
+    def controlfield(self, tag, default=None):
+        return self.controlfields.get(tag, default)
+
+    def fields(self, tag):
+        return self._by_tag.get(tag, [])
+
+    def field(self, tag):
+        fields = self._by_tag.get(tag)
+        return fields[0] if fields else None
+
+    def subfield(self, tag, code, default=None):
+        """첫 번째 tag 필드의 첫 번째 $code 텍스트."""
+        field = self.field(tag)
+        if field is None:
+            return default
+        return field.get(code, default)
+
+
+def iter_marc_records(content, namespace=MARC21_NS):
+    """SRU 등 응답에서 MARC 레코드를 MarcRecord로 하나씩 반환합니다.
+
+    namespace: MARC21 slim(LC, DNB) 또는 MARCXCHANGE_NS(BNF UNIMARC)
+    """
+    for elem in iter_elements(content, f"{{{namespace}}}record"):
+        yield MarcRecord.from_element(elem)
+
+
+# =====================
+# MODS
+# =====================
+
+
+def iter_mods_records(content):
+    """MODS 응답(mods 단일 문서 또는 modsCollection)에서 mods 요소를 하나씩 반환합니다."""
+    return iter_elements(content, f"{{{MODS_NS}}}mods")
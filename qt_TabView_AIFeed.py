@@ -1,8 +1,9 @@
 # 파일명: qt_TabView_AIFeed.py
 # -*- coding: utf-8 -*-
 # 설명: AI 피드 검색 UI 탭 (API 설정 기능 추가)
-# 버전: v1.0.2
-# 수정일: 2025-10-27 - API 상태 표시 테마 대응
+# 버전: v1.0.3
+# 수정일: 2025-10-31 - AI 피드 전송 시 last_search_result(SearchResult)를 전송 관리자에 전달
+# 이전: v1.0.2 (2025-10-27) - API 상태 표시 테마 대응
 
 from PySide6.QtWidgets import QPushButton, QMessageBox, QLabel  # 👈 [1] QLabel 추가
 from PySide6.QtCore import Qt  # 👈 [1] Qt 추가
@@ -142,4 +143,4 @@ class QtAIFeedSearchTab(BaseSearchTab):
 
         # ✅ 전송만 수행 (재수집/재비교 없음)
         from qt_data_transfer_manager import handle_ai_feed_to_gemini
-        handle_ai_feed_to_gemini(self)
+        handle_ai_feed_to_gemini(self, self.last_search_result)
@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
 # 파일명: qt_TabView_Author_Check.py
 # 설명: 저자 확인 탭 (BaseSearchTab 상속)
-# 버전: 1.0.0
+# 버전: 1.1.1
 # 생성일: 2025-10-31
+# 변경: ✅ [성능 개선] 키셋 페이지네이션 + "더 보기" + 히트 수 추정
+#       v1.1.1: "더 보기" 추가 후 정렬 상태 유지 (추가 행은 정렬 위치로 병합)
 
-from PySide6.QtWidgets import QCheckBox
+import pandas as pd
+from PySide6.QtWidgets import QCheckBox, QPushButton
 from PySide6.QtCore import Qt
 from qt_base_tab import BaseSearchTab
-from qt_utils import SelectAllLineEdit
+from qt_utils import SelectAllLineEdit, SearchThread, SearchResult
+from Search_Author_Check import search_nlk_biblio_page
 
 
 class QtAuthorCheckTab(BaseSearchTab):
@@ -29,6 +33,13 @@ class QtAuthorCheckTab(BaseSearchTab):
         # 부모 클래스 초기화 (모든 기본 UI와 기능은 여기서 자동 생성됨)
         super().__init__(config, app_instance)
 
+        # ✅ [성능 개선] 페이지 상태: 첫 페이지 검색 파라미터, 다음 커서, 히트 수 추정치
+        self._page_params = None
+        self._next_cursor = None
+        self._total_estimate = None
+        self._load_more_thread = None
+        self.search_function = self._search_first_page
+
     def _create_extra_inputs(self):
         """
         ✅ [오버라이드] 저자 확인 탭 전용 추가 입력 필드 생성
@@ -71,6 +82,12 @@ class QtAuthorCheckTab(BaseSearchTab):
         self.input_layout.addWidget(self.search_button, 0, 10)
         self.input_layout.addWidget(self.stop_button, 0, 11)
 
+        # ✅ [성능 개선] 다음 페이지 지연 로드 버튼
+        self.load_more_button = QPushButton("더 보기")
+        self.load_more_button.setEnabled(False)
+        self.load_more_button.clicked.connect(self.load_more_results)
+        self.input_layout.addWidget(self.load_more_button, 0, 12)
+
     def get_search_params(self):
         """
         ✅ [오버라이드] 저자 확인 검색에 필요한 파라미터를 수집합니다.
@@ -125,3 +142,83 @@ class QtAuthorCheckTab(BaseSearchTab):
         # 저자 확인 탭 전용 필드 초기화
         if hasattr(self, "kac_input"):
             self.kac_input.clear()
+
+    # === ✅ [성능 개선] 페이지네이션 ===
+
+    def _search_first_page(self, app_instance=None, **params):
+        """SearchThread에서 실행: 첫 페이지 + 히트 수 추정치를 가져옵니다.
+
+        페이지 dict를 그대로 반환하면 SearchResult가 results와 메타데이터
+        (next_cursor, total_estimate)를 나눠 담습니다.
+        """
+        # 결과 시그널보다 먼저 기록되므로 load_more_results에서 안전하게 읽힘
+        self._page_params = params
+        return search_nlk_biblio_page(
+            app_instance=app_instance, with_count=True, **params
+        )
+
+    def start_search(self):
+        self._next_cursor = None
+        self._total_estimate = None
+        self.load_more_button.setEnabled(False)
+        super().start_search()
+
+    def on_search_completed(self, results):
+        if isinstance(results, SearchResult):
+            self._next_cursor = results.meta.get("next_cursor")
+            self._total_estimate = results.meta.get("total_estimate")
+        super().on_search_completed(results)
+        self._update_paging_status()
+
+    def load_more_results(self):
+        """다음 페이지를 백그라운드에서 가져와 테이블 끝에 덧붙입니다."""
+        if self.is_searching or not self._next_cursor or self._page_params is None:
+            return
+
+        params = dict(self._page_params)
+        params.update({"cursor": self._next_cursor, "app_instance": self.app_instance})
+
+        self.is_searching = True
+        self.load_more_button.setEnabled(False)
+        self.search_button.setEnabled(False)
+        self.status_label.setText("다음 페이지 불러오는 중...")
+
+        self._load_more_thread = SearchThread(
+            search_nlk_biblio_page, params, self.app_instance
+        )
+        self._load_more_thread.search_completed.connect(self._on_more_results)
+        self._load_more_thread.search_failed.connect(self.on_search_failed)
+        self._load_more_thread.start()
+
+    def _on_more_results(self, page):
+        self.is_searching = False
+        self.search_button.setEnabled(True)
+        page_frame = page.dataframe if isinstance(page, SearchResult) else None
+        self._next_cursor = (
+            page.meta.get("next_cursor") if isinstance(page, SearchResult) else None
+        )
+
+        if page_frame is not None and not page_frame.empty:
+            # 기존 행은 그대로 두고 끝에만 추가 (전체 리셋 없음)
+            self.table_model.append_dataframe(page_frame, column_keys=None)
+            self.current_dataframe = pd.concat(
+                [self.current_dataframe, page_frame], ignore_index=True
+            )
+            # 정렬 중이면 프록시가 추가 행을 정렬 위치로 병합하므로 정렬 상태를 지우지 않음
+            # (pre_analyze_all_columns()는 invalidate()로 정렬 컬럼까지 초기화함)
+
+        self._update_paging_status()
+
+    def _update_paging_status(self):
+        """상태 표시줄에 '로드 건수 / 추정 전체 건수'를 표시하고 더 보기 버튼을 갱신합니다."""
+        loaded = self.table_model.rowCount() if self.table_model else 0
+        self.load_more_button.setEnabled(bool(self._next_cursor))
+        if not loaded:
+            return
+
+        if self._total_estimate:
+            total, capped = self._total_estimate
+            total_text = f"{total:,}+" if capped else f"{total:,}"
+            self.status_label.setText(f"검색 완료: {loaded:,}건 표시 / 약 {total_text}건")
+        else:
+            self.status_label.setText(f"검색 완료: {loaded:,}건 표시")
@@ -4,7 +4,7 @@
 
 import re
 from qt_base_tab import BaseSearchTab, SelectAllLineEdit
-from qt_utils import open_url_safely
+from qt_utils import open_url_safely, unwrap_search_result
 from PySide6.QtCore import QModelIndex  # ✅ [수정] QModelIndex 임포트 추가
 from PySide6.QtWidgets import (
     QFrame,
@@ -138,6 +138,10 @@ class QtBriefWorksSearchTab(BaseSearchTab):
         테이블에 표시하기 위한 평탄한 데이터 리스트로 변환합니다.
         """
         flat_data = []
+        results = unwrap_search_result(results)
+        # SearchThread는 DataFrame을 변환 없이 전달하므로 중첩 구조 처리를 위해 records로 변환
+        if hasattr(results, "to_dict"):
+            results = results.to_dict("records")
         if results and isinstance(results, list):
             for author_data in results:
                 if not isinstance(author_data, dict):
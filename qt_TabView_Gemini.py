@@ -443,8 +443,7 @@ class QtGeminiTab(BaseSearchTab):
 
         # 하단 테이블에 결과 표시
         self.table_model.clear_data()
-        records = result_df.to_dict("records")
-        self.table_model.add_multiple_rows(records, column_keys=None)
+        self.table_model.append_dataframe(result_df, column_keys=None)
 
         # 테이블 컬럼 조정
         from view_displays import adjust_qtableview_columns
@@ -66,7 +66,7 @@ import re
 from functools import partial  # ✅ [수정] partial 함수를 임포트합니다.
 from qt_base_tab import BaseSearchTab, FastSearchResultModel
 from qt_proxy_models import SmartNaturalSortProxyModel
-from qt_utils import SelectAllLineEdit
+from qt_utils import SelectAllLineEdit, unwrap_search_result
 from ui_constants import U
 from qt_context_menus import setup_widget_context_menu
 from qt_widget_events import ExcelStyleTableHeaderView, focus_on_first_table_view_item
@@ -412,6 +412,7 @@ class QtKSHLocalSearchTab(BaseSearchTab):
             self.animation.start()
 
             # 결과 튜플 분해 (df_concepts, df_biblio, search_type)
+            results = unwrap_search_result(results)
             if isinstance(results, tuple) and len(results) == 3:
                 df_concepts, df_biblio, search_type = results
                 self.current_search_type = search_type
@@ -438,12 +439,11 @@ class QtKSHLocalSearchTab(BaseSearchTab):
             self.table_model.clear_data()
             if not df_concepts.empty:
                 self.proxy_model.invalidate()
-                records_concepts = df_concepts.to_dict("records")
                 # -------------------
                 # ✅ [버그 수정] 데이터의 컬럼 순서(df_cols) 대신, UI에 정의된 컬럼 순서를 사용하도록
                 # column_keys를 None으로 전달하여 add_multiple_rows가 self.column_headers를 사용하게 합니다.
                 df_cols = df_concepts.columns.tolist()
-                self.table_model.add_multiple_rows(records_concepts, column_keys=None)
+                self.table_model.append_dataframe(df_concepts, column_keys=None)
                 self.proxy_model.pre_analyze_all_columns()
                 adjust_qtableview_columns(
                     self.table_view, df_concepts, df_cols, self.column_headers
@@ -456,10 +456,7 @@ class QtKSHLocalSearchTab(BaseSearchTab):
             self.biblio_model.clear_data()
             if not df_biblio.empty:
                 self.biblio_proxy.invalidate()
-                records_biblio = df_biblio.to_dict("records")
-                self.biblio_model.add_multiple_rows(
-                    records_biblio, column_keys=self.biblio_keys
-                )
+                self.biblio_model.append_dataframe(df_biblio, column_keys=self.biblio_keys)
                 self.biblio_proxy.pre_analyze_all_columns()
                 adjust_qtableview_columns(
                     self.biblio_table, df_biblio, self.biblio_keys, self.biblio_headers
@@ -624,8 +621,7 @@ class QtKSHLocalSearchTab(BaseSearchTab):
         self.biblio_model.clear_data()
         if df_biblio is not None and not df_biblio.empty:
             self.biblio_proxy.invalidate()
-            records = df_biblio.to_dict("records")
-            self.biblio_model.add_multiple_rows(records, column_keys=self.biblio_keys)
+            self.biblio_model.append_dataframe(df_biblio, column_keys=self.biblio_keys)
             self.biblio_proxy.pre_analyze_all_columns()
             adjust_qtableview_columns(
                 self.biblio_table, df_biblio, self.biblio_keys, self.biblio_headers
@@ -731,8 +727,7 @@ class QtKSHLocalSearchTab(BaseSearchTab):
 
         self.biblio_model.clear_data()
         if df_biblio is not None and not df_biblio.empty:
-            records = df_biblio.to_dict("records")
-            self.biblio_model.add_multiple_rows(records, column_keys=self.biblio_keys)
+            self.biblio_model.append_dataframe(df_biblio, column_keys=self.biblio_keys)
             adjust_qtableview_columns(
                 table_view=self.biblio_table,
                 current_dataframe=df_biblio,
@@ -824,11 +819,10 @@ class QtKSHLocalSearchTab(BaseSearchTab):
         self.table_model.clear_data()  # 상단 테이블만 초기화
         if df_concepts is not None and not df_concepts.empty:
             self.proxy_model.invalidate()
-            records = df_concepts.to_dict("records")
             # -------------------
             # [일관성 적용 2] 연동 검색 경로: 주 검색과 '완벽하게 동일한 방식'으로 column_keys를 사용해 매핑합니다.
             df_cols = df_concepts.columns.tolist()
-            self.table_model.add_multiple_rows(records, column_keys=df_cols)
+            self.table_model.append_dataframe(df_concepts, column_keys=df_cols)
             # -------------------
             self.proxy_model.pre_analyze_all_columns()
             adjust_qtableview_columns(
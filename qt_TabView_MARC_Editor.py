@@ -172,6 +172,10 @@ class QtMARCEditorTab(QWidget):
 
     def run_custom_logic(self):
         extractor_tab = getattr(self.app_instance, "marc_extractor_tab", None)
+        main_window = getattr(self.app_instance, "main_window", None)
+        if not extractor_tab and main_window is not None:
+            # ✅ [성능 개선] 탭 지연 생성: MARC 추출 탭이 아직 없으면 이때 생성
+            extractor_tab = main_window.get_tab_by_name("MARC 추출")
         if not extractor_tab:
             QMessageBox.critical(self, "오류", "MARC 추출 탭을 찾을 수 없습니다.")
             return
@@ -3,36 +3,75 @@
 """
 모든 검색 탭의 설정을 중앙에서 관리하는 파일
 """
-# 각 탭이 사용할 검색 함수들을 임포트합니다.
-# (앞으로 추가될 모든 탭의 검색 함수를 이곳으로 가져옵니다)
-
-from Search_NLK import search_nlk_catalog
-from Search_Author_Check import search_nlk_biblio  # ✅ [추가] nlk_biblio.db 검색 함수
-from search_orchestrator import (
-    search_lc_orchestrated,
-    search_ndl_cinii_integrated,  # 👈 [수정] 임포트 경로 명확화
-    search_global_integrated,
-    search_western_integrated,
-)
-from Search_Legal_deposit import search_legal_deposit_catalog
-from Search_Naver import search_naver_catalog  # 👈 [추가] 네이버 검색 함수 임포트
-from search_orchestrator import search_kac_authorities_orchestrated  # 👈 [추가]
-from search_orchestrator import search_brief_works_orchestrated  # 👈 [추가]
-from Search_KSH_Lite import (
-    run_ksh_lite_extraction,
-)  # ✅ [핵심 수정] KSH Lite 검색 함수 임포트
-from Search_ISNI_Detailed import scrape_isni_detailed_full_data
-from Search_KSH_Local import search_ksh_local_orchestrated
-from search_query_manager import SearchQueryManager
+import importlib
 import re
 
+
+class _LazySearchFunction:
+    """✅ [성능 개선] 검색 함수 지연 import 래퍼.
+
+    Search_* 모듈(및 그 의존성)은 앱 시작 시가 아니라 해당 탭에서
+    처음 검색할 때 import됩니다. SearchThread 로그용 __name__은 원래 함수 이름.
+    streams_pages=True면 SearchThread가 on_page 콜백을 넘겨 페이지 단위로 결과를 받습니다.
+    """
+
+    def __init__(self, module_name, func_name, streams_pages=False):
+        self.module_name = module_name
+        self.__name__ = func_name
+        self.streams_pages = streams_pages
+        self._func = None
+
+    def __call__(self, *args, **kwargs):
+        if self._func is None:
+            self._func = getattr(importlib.import_module(self.module_name), self.__name__)
+        return self._func(*args, **kwargs)
+
+
+# 각 탭이 사용할 검색 함수들 (앞으로 추가될 모든 탭의 검색 함수를 이곳에 등록합니다)
+search_nlk_catalog = _LazySearchFunction("Search_NLK", "search_nlk_catalog")
+# ✅ [추가] nlk_biblio.db 검색 함수
+search_nlk_biblio = _LazySearchFunction("Search_Author_Check", "search_nlk_biblio")
+search_ndl_cinii_integrated = _LazySearchFunction(
+    "search_orchestrator", "search_ndl_cinii_integrated", streams_pages=True
+)
+search_global_integrated = _LazySearchFunction(
+    "search_orchestrator", "search_global_integrated", streams_pages=True
+)
+search_western_integrated = _LazySearchFunction(
+    "search_orchestrator", "search_western_integrated", streams_pages=True
+)
+search_legal_deposit_catalog = _LazySearchFunction(
+    "Search_Legal_deposit", "search_legal_deposit_catalog"
+)
+search_naver_catalog = _LazySearchFunction("Search_Naver", "search_naver_catalog")
+search_kac_authorities_orchestrated = _LazySearchFunction(
+    "search_orchestrator", "search_kac_authorities_orchestrated"
+)
+search_brief_works_orchestrated = _LazySearchFunction(
+    "search_orchestrator", "search_brief_works_orchestrated"
+)
+# ✅ [핵심 수정] KSH Lite 검색 함수
+run_ksh_lite_extraction = _LazySearchFunction(
+    "Search_KSH_Lite", "run_ksh_lite_extraction", streams_pages=True
+)
+scrape_isni_detailed_full_data = _LazySearchFunction(
+    "Search_ISNI_Detailed", "scrape_isni_detailed_full_data", streams_pages=True
+)
+search_ksh_local_orchestrated = _LazySearchFunction(
+    "Search_KSH_Local", "search_ksh_local_orchestrated"
+)
+
 # ✅ [핵심 수정] Mock/실제 서버 선택 로직을 tab_configs에도 적용
 USE_MOCK_DATA = False  # qt_TabView_Example.py와 동일하게 설정
 
 if USE_MOCK_DATA:
-    from mock_backend import search_lc_orchestrated_mock as search_lc_orchestrated
+    search_lc_orchestrated = _LazySearchFunction(
+        "mock_backend", "search_lc_orchestrated_mock"
+    )
 else:
-    from search_orchestrator import search_lc_orchestrated
+    search_lc_orchestrated = _LazySearchFunction(
+        "search_orchestrator", "search_lc_orchestrated", streams_pages=True
+    )
 
 
 # ========================================
@@ -55,6 +94,8 @@ def _add_ddc_labels_to_results(results, ddc_column_name, db_manager):
     if not results or not db_manager:
         return results
 
+    from search_query_manager import SearchQueryManager
+
     sqm = SearchQueryManager(db_manager)
 
     for result in results:
@@ -104,6 +145,9 @@ def search_western_integrated_with_labels(*args, **kwargs):
     return _add_ddc_labels_to_results(results, "082", db_manager)
 
 
+search_western_integrated_with_labels.streams_pages = True
+
+
 def search_global_integrated_with_labels(*args, **kwargs):
     """Global 검색 결과에 DDC Label을 추가하는 래퍼"""
     results = search_global_integrated(*args, **kwargs)
@@ -111,6 +155,9 @@ def search_global_integrated_with_labels(*args, **kwargs):
     return _add_ddc_labels_to_results(results, "082", db_manager)
 
 
+search_global_integrated_with_labels.streams_pages = True
+
+
 # 탭들의 '설계도'를 정의하는 중앙 딕셔너리
 TAB_CONFIGURATIONS = {
     # ✅ [추가] MARC 추출 및 편집 탭 설정
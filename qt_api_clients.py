@@ -1,27 +1,43 @@
 # -*- coding: utf-8 -*-
 """
 api_clients.py - 외부 API (NLK SPARQL, ISNI 등)와 통신하고 데이터를 추출하는 함수들을 포함합니다.
-버전: 2.1.1
+버전: 2.2.0
 생성일: 2025-07-19 12:05
-수정일시: 2025-08-19 23:55 KST (concurrent.futures import 추가)
+수정일시: 2025-10-31 KST (번역 메모리 + 묶음 원격 번역: translation_memory.py)
+v2.1.1: concurrent.futures import 추가
 """
 
 import requests
 import json
 import re
+import threading
 import time
 import concurrent.futures
-from concurrent.futures import ThreadPoolExecutor  # ✅ 추가
 from urllib.parse import unquote
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from deep_translator import GoogleTranslator
-import hanja
+from lazy_imports import lazy_attr, lazy_import
+
+# ✅ [성능 개선] 번역/한자 변환 모듈은 첫 번역 때 import
+GoogleTranslator = lazy_attr("deep_translator", "GoogleTranslator")
+hanja = lazy_import("hanja")
 from database_manager import DatabaseManager
-import asyncio
+from sru_paging import stop_checker
+from translation_memory import TranslationMemory
+
+# 번역기 인스턴스 (✅ [성능 개선] 첫 사용 시 생성)
+# GoogleTranslator.translate는 요청 파라미터를 인스턴스에 담아 두므로 스레드마다 따로 생성
+# (묶음 번역을 동시에 보낼 때 요청 문자열이 섞이지 않게)
+_translator_local = threading.local()
+_standalone_memory = None
 
-# 글로벌 번역기 인스턴스
-global_translator = GoogleTranslator(source="auto", target="ko")
+
+def get_global_translator():
+    translator = getattr(_translator_local, "translator", None)
+    if translator is None:
+        translator = GoogleTranslator(source="auto", target="ko")
+        _translator_local.translator = translator
+    return translator
 
 
 def clean_text(text):
@@ -845,6 +861,26 @@ def execute_sparql_query(sparql_query, app_instance):
     return []
 
 
+def _remote_translate(text):
+    """Google 번역 원격 호출 1회 (묶음 문자열도 그대로 전달)."""
+    return get_global_translator().translate(text)
+
+
+def _to_hangul(text):
+    """번역 결과의 한자를 한글로 변환합니다."""
+    return hanja.translate(text, "substitution")
+
+
+def _get_translation_memory(db_manager):
+    if db_manager is not None:
+        return db_manager.translation_memory
+    # DB 없이 호출된 경우에도 같은 실행 중에는 다시 번역하지 않음 (저장 안 함)
+    global _standalone_memory
+    if _standalone_memory is None:
+        _standalone_memory = TranslationMemory(None)
+    return _standalone_memory
+
+
 def translate_text(text, custom_glossary_map=None, db_manager: DatabaseManager = None):
     """
     텍스트를 번역하고, 사용자 정의 용어집을 적용하며, 한자를 한글로 변환합니다.
@@ -859,30 +895,29 @@ def translate_text(text, custom_glossary_map=None, db_manager: DatabaseManager =
         return ""
 
     try:
-        # 1. DB에서 용어집 조회 (캐싱된 결과가 없거나 DB 매니저가 제공될 때)
-        if db_manager:
-            # 먼저 전체 텍스트가 용어집에 있는지 확인
-            cached_translation = db_manager.get_translation(text)
-            if cached_translation:
-                return cached_translation  # 캐시된 번역 반환
+        # 1. 번역 메모리 조회 (✅ [성능 개선] 용어집 메모리 사본 - 조회마다 DB 연결 안 함)
+        memory = _get_translation_memory(db_manager)
+        cached_translation = memory.get(text)
+        if cached_translation:
+            return cached_translation
 
         # 2. 사용자 정의 용어집 적용 (미리 로드된 맵 사용)
         if custom_glossary_map and text in custom_glossary_map:
             return custom_glossary_map[text]
 
         # 3. 구글 번역 API 호출
-        translated_text = GoogleTranslator(source="auto", target="ko").translate(text)
+        translated_text = _remote_translate(text)
 
         # 4. 한자 -> 한글 변환
         # 번역 결과가 None이 아닐 경우에만 변환 시도
         if translated_text:
-            final_text = hanja.translate(translated_text, "substitution")
+            final_text = _to_hangul(translated_text)
         else:
             final_text = text  # 번역 실패 시 원본 텍스트 사용
 
-        # 5. 번역 결과를 DB에 저장 (성공적인 번역이고 DB 매니저가 있을 때)
-        if db_manager and translated_text:
-            db_manager.add_translation(text, final_text)
+        # 5. 번역 결과를 메모리에 반영 (DB 기록은 쓰기 큐에서 비동기로)
+        if translated_text:
+            memory.remember([(text, final_text)])
 
         return final_text
 
@@ -892,286 +927,65 @@ def translate_text(text, custom_glossary_map=None, db_manager: DatabaseManager =
         return f"{text} (번역 오류: {e})"
 
 
-# === 🔥 비동기 배치 번역 시스템 (DNB, BNF 전용) ===
+# === 🔥 묶음 번역 (DNB, BNF, NDL, Harvard 등 해외 도서관 주제어) ===
 
 
-async def translate_batch_async_safe(
-    subjects_batch,
-    batch_size=15,
-    max_concurrent=3,
-    app_instance=None,
-    custom_glossary_map=None,
-    db_manager=None,
+def translate_text_batch_async(
+    subjects_batch, app_instance=None, custom_glossary_map=None, db_manager=None
 ):
     """
-    요청 제한이 있는 안전한 비동기 배치 번역 (DNB, BNF 전용)
+    고유 주제어 집합을 번역 메모리 + 묶음 원격 호출로 번역합니다.
+
+    ✅ [성능 개선] (이름은 기존 호출부 호환용으로 유지)
+    - 용어집/이전 번역은 메모리에서 바로 반환 (DB 연결 없음)
+    - 나머지만 줄바꿈으로 묶어 묶음당 원격 호출 1회 (최대 3묶음 동시, 대기 없음)
+    - 새 번역은 메모리에 즉시 반영하고 DB에는 쓰기 큐로 기록
+    - 원격 번역에 실패한 주제어는 결과에서 빠짐 (호출부에서 원문 유지)
+
     Args:
-        subjects_batch (set): 번역할 고유 주제어 집합
-        batch_size (int): 한 배치당 주제어 개수 (15개)
-        max_concurrent (int): 동시 실행할 최대 배치 수 (3개)
-        app_instance: 로깅용 앱 인스턴스
-        custom_glossary_map: 용어집
-        db_manager: DB 매니저
+        subjects_batch (iterable): 번역할 고유 주제어
+        app_instance: 로깅/중지 플래그용 앱 인스턴스
+        custom_glossary_map: 용어집 딕셔너리 (선택, 메모리보다 우선)
+        db_manager: DB 매니저 인스턴스
+
     Returns:
         dict: {원문: 번역} 매핑 딕셔너리
     """
-    if not subjects_batch:
+    terms = [s for s in dict.fromkeys(subjects_batch or ()) if s and isinstance(s, str)]
+    if not terms:
         return {}
 
-    if app_instance:
-        app_instance.log_message(
-            f"🚀 안전한 비동기 배치 번역 시작! {len(subjects_batch)}개 주제어를 {batch_size}개씩 분할",
-            level="INFO",
-        )
-
-    # 주제어를 여러 배치로 분할
-    subjects_list = list(subjects_batch)
-    batches = [
-        subjects_list[i : i + batch_size]
-        for i in range(0, len(subjects_list), batch_size)
-    ]
-
-    if app_instance:
-        app_instance.log_message(
-            f"📦 {len(batches)}개 배치로 분할 완료! 동시 최대 {max_concurrent}개씩 처리",
-            level="INFO",
-        )
-
-    # 🛡️ 세마포어로 동시 실행 제한
-    semaphore = asyncio.Semaphore(max_concurrent)
-    final_translation_map = {}
-
-    async def process_batch_with_limit(batch_idx, batch):
-        """세마포어로 제한된 배치 처리"""
-        async with semaphore:
-            if app_instance and app_instance.stop_search_flag.is_set():
-                return {}
-
-            try:
-                # 배치 간 짧은 딜레이 (API 친화적)
-                if batch_idx > 0:
-                    await asyncio.sleep(0.3)  # 300ms 대기
-
-                result = await translate_single_batch_async_safe(
-                    batch, batch_idx, app_instance, custom_glossary_map, db_manager
-                )
-                return result
-
-            except Exception as e:
-                if app_instance:
-                    app_instance.log_message(
-                        f"⚠️ 배치 {batch_idx} 처리 실패: {e}", level="WARNING"
-                    )
-                return {}
+    translation_map = {}
+    if custom_glossary_map:
+        translation_map = {t: custom_glossary_map[t] for t in terms if t in custom_glossary_map}
 
     try:
-        # 🚀 제한된 동시 실행으로 모든 배치 처리
-        tasks = [
-            process_batch_with_limit(batch_idx, batch)
-            for batch_idx, batch in enumerate(batches)
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # 결과 병합
-        successful_batches = 0
-
-        for batch_idx, result in enumerate(results):
-            if isinstance(result, dict) and result:
-                final_translation_map.update(result)
-                successful_batches += 1
-            elif isinstance(result, Exception):
-                if app_instance:
-                    app_instance.log_message(
-                        f"⚠️ 배치 {batch_idx} 예외 발생: {result}", level="WARNING"
-                    )
-
-        if app_instance:
-            app_instance.log_message(
-                f"✅ 안전한 비동기 배치 번역 완료! {successful_batches}/{len(batches)} 배치 성공",
-                level="INFO",
+        memory = _get_translation_memory(db_manager)
+        before = memory.stats()
+        translation_map.update(
+            memory.translate_terms(
+                [t for t in terms if t not in translation_map],
+                _remote_translate,
+                finish=_to_hangul,
+                should_stop=stop_checker(app_instance),
             )
-
-        return final_translation_map
-
+        )
+        after = memory.stats()
     except Exception as e:
         if app_instance:
-            app_instance.log_message(
-                f"❌ 안전한 비동기 배치 번역 전체 실패: {e}", level="ERROR"
-            )
-        return {}
-
-
-async def translate_single_batch_async_safe(
-    batch, batch_idx, app_instance=None, custom_glossary_map=None, db_manager=None
-):
-    """
-    안전한 단일 배치 비동기 번역 - 재시도 로직 포함
-    """
-    max_retries = 2
-
-    for attempt in range(max_retries + 1):
-        try:
-            if app_instance:
-                retry_msg = f" (재시도 {attempt})" if attempt > 0 else ""
-                app_instance.log_message(
-                    f"🔄 배치 {batch_idx}: {len(batch)}개 주제어 번역 중...{retry_msg}",
-                    level="DEBUG",
-                )
-
-            # 더 안전한 구분자 사용
-            safe_delimiter = " || "
-            batch_text = safe_delimiter.join(batch)
-
-            # 동기 번역기를 ThreadPoolExecutor로 비동기 실행
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                translated_text = await loop.run_in_executor(
-                    executor, global_translator.translate, batch_text
-                )
-
-            # 번역 결과 분리
-            translated_batch = translated_text.split(safe_delimiter)
-
-            # 결과 검증 및 매핑
-            if len(translated_batch) == len(batch):
-                result = dict(zip(batch, [t.strip() for t in translated_batch]))
-                if app_instance:
-                    success_msg = f" (재시도 후 성공)" if attempt > 0 else ""
-                    app_instance.log_message(
-                        f"✅ 배치 {batch_idx} 완료: {len(result)}개 번역{success_msg}",
-                        level="DEBUG",
-                    )
-                return result
-            else:
-                if attempt < max_retries:
-                    if app_instance:
-                        app_instance.log_message(
-                            f"⚠️ 배치 {batch_idx} 개수 불일치, 재시도 중...",
-                            level="DEBUG",
-                        )
-                    await asyncio.sleep(0.5)  # 재시도 전 대기
-                    continue
-                else:
-                    # 최종 실패시 개별 번역으로 폴백
-                    if app_instance:
-                        app_instance.log_message(
-                            f"⚠️ 배치 {batch_idx} 최종 실패, 개별 번역으로 폴백",
-                            level="WARNING",
-                        )
-                    return await translate_batch_individually_async_safe(
-                        batch, batch_idx, app_instance, custom_glossary_map, db_manager
-                    )
-
-        except Exception as e:
-            if attempt < max_retries:
-                if app_instance:
-                    app_instance.log_message(
-                        f"⚠️ 배치 {batch_idx} 오류 발생, 재시도 중: {e}", level="DEBUG"
-                    )
-                await asyncio.sleep(1.0)  # 오류시 더 긴 대기
-                continue
-            else:
-                if app_instance:
-                    app_instance.log_message(
-                        f"❌ 배치 {batch_idx} 최종 실패: {e}", level="ERROR"
-                    )
-                # 최종 실패시 개별 번역 시도
-                return await translate_batch_individually_async_safe(
-                    batch, batch_idx, app_instance, custom_glossary_map, db_manager
-                )
-
-    return {}
-
-
-async def translate_batch_individually_async_safe(
-    batch, batch_idx, app_instance=None, custom_glossary_map=None, db_manager=None
-):
-    """
-    안전한 개별 번역 폴백 - 기존 translate_text 로직 사용 (DB 캐시, 용어집, 한자변환 포함)
-    """
-    result = {}
-    loop = asyncio.get_event_loop()
-
-    # 개별 번역은 더 보수적으로 (동시 2개까지만)
-    semaphore = asyncio.Semaphore(2)
-
-    async def translate_single_subject_safe(subject):
-        async with semaphore:
-            try:
-                # 개별 번역간 딜레이
-                await asyncio.sleep(0.1)
-
-                # 🔥 기존 translate_text 로직 사용 (DB 캐시, 용어집, 한자변환 모두 포함)
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    translated = await loop.run_in_executor(
-                        executor,
-                        translate_text,
-                        subject,
-                        custom_glossary_map,
-                        db_manager,
-                    )
-                return subject, translated.strip()
-            except Exception as e:
-                if app_instance:
-                    app_instance.log_message(
-                        f"개별 번역 실패: {subject} - {e}", level="WARNING"
-                    )
-                return subject, f"{subject} (번역 오류)"
-
-    # 모든 개별 번역을 제한된 병렬로 실행
-    tasks = [translate_single_subject_safe(subject) for subject in batch]
-    individual_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    for item in individual_results:
-        if isinstance(item, tuple):
-            subject, translation = item
-            result[subject] = translation
-        elif isinstance(item, Exception):
-            if app_instance:
-                app_instance.log_message(f"개별 번역 예외: {item}", level="WARNING")
+            app_instance.log_message(f"❌ 묶음 번역 실패: {e}", level="ERROR")
+        return translation_map
 
     if app_instance:
+        hits = (after["memory_hits"] + after["db_hits"]) - (
+            before["memory_hits"] + before["db_hits"]
+        )
+        remote_calls = after["remote_calls"] - before["remote_calls"]
+        failed = after["remote_failed"] - before["remote_failed"]
         app_instance.log_message(
-            f"✅ 배치 {batch_idx} 안전한 개별 번역 완료: {len(result)}개 (기존 로직 사용)",
-            level="DEBUG",
+            f"✅ 번역 완료: 고유 {len(terms)}개 중 번역 메모리 적중 {hits}개, "
+            f"원격 호출 {remote_calls}회, 실패 {failed}개",
+            level="INFO",
         )
-
-    return result
-
-
-def translate_text_batch_async(
-    subjects_batch, app_instance=None, custom_glossary_map=None, db_manager=None
-):
-    """
-    비동기 배치 번역을 동기 환경에서 실행하는 래퍼 함수 (DNB, BNF 전용)
-
-    Args:
-        subjects_batch (set): 번역할 고유 주제어 집합
-        app_instance: 로깅용 앱 인스턴스
-        custom_glossary_map: 용어집 딕셔너리
-        db_manager: DB 매니저 인스턴스
-
-    Returns:
-        dict: {원문: 번역} 매핑 딕셔너리
-    """
-    try:
-        # 새로운 이벤트 루프 생성 및 실행
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(
-                translate_batch_async_safe(
-                    subjects_batch,
-                    app_instance=app_instance,
-                    custom_glossary_map=custom_glossary_map,
-                    db_manager=db_manager,
-                )
-            )
-        finally:
-            loop.close()
-    except Exception as e:
-        if app_instance:
-            app_instance.log_message(
-                f"❌ 비동기 배치 번역 실행 실패: {e}", level="ERROR"
-            )
-        return {}
+        app_instance.log_message(f"📚 {memory.summary()}", level="DEBUG")
+    return translation_map
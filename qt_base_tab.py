@@ -1,11 +1,36 @@
 ﻿# -*- coding: utf-8 -*-
 # 파일명: qt_base_tab.py
 # 설명: 모든 검색 탭의 공통 기능과 UI를 정의하는 부모 클래스 (모델/뷰 아키텍처)
-# 버전: 3.0.6 - Find 매치 하이라이트 + BaseMatchHighlightDelegate 추가
+# 버전: 3.4.0 - 페이지 스트리밍
 # 생성일: 2025-09-25
-# 수정일: 2025-10-30
+# 수정일: 2025-10-31
 #
 # 변경 이력:
+# v3.4.0
+# - [성능 개선] SearchThread.page_ready로 먼저 도착한 페이지를 결과 테이블에 바로 추가
+#   : LC/Western/Global/NDL·CiNii 검색 함수가 sru_paging 페이지(또는 소스별 결과)를 on_page로 전달
+#   : 검색 완료 시에는 기존처럼 최종 결과(정렬/번역/DDC Label 반영)로 교체
+#
+# v3.3.0
+# - [성능 개선] SearchThread 결과를 SearchResult(컬럼형 payload + 메타데이터)로 수신
+#   : 레코드 → DataFrame 변환은 워커에서 1회, on_search_completed는 payload를 그대로 적재
+# - [성능 개선] Find 매치 카운트/이전·다음 찾기를 FindTextIndex로 처리
+#   : 소문자 연결 버퍼 + 셀 오프셋 테이블을 결과 적재 후 1회 구성 (데이터 변경 시 무효화)
+#   : 키 입력은 FIND_DEBOUNCE_MS 디바운스, 셀 수가 많으면 FindMatchThread에서 계산
+#   : 컬럼형 모델이 아닌 경우 기존 셀 순회 방식 유지
+#
+# v3.2.0
+# - [성능 개선] 대용량 결과(PROGRESSIVE_LOAD_THRESHOLD 이상) 점진적 적재
+#   : ResultPrepThread가 표시 컬럼 변환 + 샘플 기반 정렬 유형/컬럼 너비 추정을 워커에서 수행
+#   : ProgressiveRowFeeder가 첫 화면 분량을 즉시, 나머지를 타이머로 chunk 단위 추가
+#   : 프로그레스바는 실제 적재 행 수를 표시
+#
+# v3.1.0
+# - [성능 개선] FastSearchResultModel을 컬럼형(columnar) 모델로 교체
+#   : 컬럼별 표시 문자열 리스트만 보관 (행 dict 생성, paint 시 str() 제거)
+#   : append_dataframe()/set_dataframe()으로 DataFrame 컬럼 배열에서 직접 적재
+#   : SearchThread → on_search_completed 구간의 to_dict("records") 왕복 제거
+#
 # v3.0.6 (2025-10-30)
 # - [기능 추가] BaseMatchHighlightDelegate 클래스 추가
 #   : 델리게이트가 없는 탭(KSH Local, NLK 등)에 매치 하이라이트 제공
@@ -48,6 +73,7 @@
 
 import re
 import pandas as pd
+from bisect import bisect_left, bisect_right
 from functools import partial  # ✅ [수정] partial 함수를 임포트합니다.
 from PySide6.QtWidgets import (
     QWidget,
@@ -70,6 +96,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtGui import QStandardItemModel, QStandardItem, QPalette, QBrush, QColor
 from PySide6.QtCore import (
+    QObject,
     QThread,
     Signal,
     Qt,
@@ -84,7 +111,7 @@ from PySide6.QtCore import (
 
 # --- 프로젝트 모듈 import ---
 from ui_constants import U
-from qt_proxy_models import SmartNaturalSortProxyModel
+from qt_proxy_models import SmartNaturalSortProxyModel, analyze_sort_type
 from qt_widget_events import (
     load_column_settings,
     save_column_settings,
@@ -96,9 +123,12 @@ from qt_widget_events import (
 from view_displays import (
     show_in_dropdown_html_viewer,
     adjust_qtableview_columns,  # ✅ 추가
+    estimate_column_widths,
+    apply_column_widths,
 )
 from qt_utils import (
     SearchThread,
+    SearchResult,
     export_dataframe_to_excel,
     print_table_data,
     show_dataframe_statistics,
@@ -113,23 +143,66 @@ from qt_context_menus import setup_widget_context_menu, _format_text_for_detail_
 from qt_shortcuts import setup_shortcuts
 
 
+def _to_display(value):
+    """셀 표시 문자열로 변환 (None/NaN/pd.NA/NaT는 빈 문자열, 리스트/배열 등은 str())."""
+    if isinstance(value, str):
+        return value
+    # pd.isna는 스칼라에만 적용 (pd.NA는 != 비교가 TypeError, 배열은 배열을 반환)
+    if value is None or (pd.api.types.is_scalar(value) and pd.isna(value)):
+        return ""
+    return str(value)
+
+
+def _series_to_display(series):
+    """DataFrame 컬럼 하나를 표시 문자열 리스트로 한 번에 변환합니다."""
+    if series.dtype == object:
+        return [_to_display(v) for v in series.tolist()]
+    return series.astype(str).where(series.notna(), "").tolist()
+
+
+def build_display_columns(dataframe, header_keys):
+    """헤더 순서(header_keys)대로 DataFrame을 표시 문자열 컬럼 리스트로 변환합니다.
+
+    GUI 객체를 쓰지 않으므로 워커 스레드에서 호출할 수 있습니다.
+    """
+    count = len(dataframe)
+    columns = []
+    for key in header_keys:
+        if key is not None and key in dataframe.columns:
+            columns.append(_series_to_display(dataframe[key]))
+        else:
+            columns.append([""] * count)
+    return columns
+
+
 class FastSearchResultModel(QAbstractTableModel):
-    """빠른 검색 결과 모델 (사전 정렬 키 생성 로직 제거 버전)"""
+    """✅ [성능 개선] 컬럼형(columnar) 검색 결과 모델
+
+    - 컬럼마다 미리 문자열화한 표시값 리스트만 보관합니다.
+      (행마다 dict를 만들지 않고, data()에서 dict 조회 + str() 호출도 없음)
+    - DataFrame은 컬럼 배열에서 바로 적재합니다 (to_dict("records") 왕복 제거).
+    - get_row_data()는 필요할 때만 행 dict를 만들어 반환합니다.
+    """
 
     def __init__(self, headers, parent=None):
         super().__init__(parent)
         self.column_headers = headers
-        self._data = []
+        self._columns = [[] for _ in headers]
+        self._row_count = 0
+        self._source_order = []  # 현재 행 → 적재 당시 행 번호 (정렬 해제용)
         self.editable_columns = set()  # ✅ 편집 가능한 컬럼 인덱스 저장
 
     # -------------------
     def set_column_headers(self, headers):
         # -------------------
-        """테이블의 컬럼 헤더를 설정합니다."""
+        """테이블의 컬럼 헤더를 설정합니다 (기존 데이터는 헤더 이름으로 다시 매핑)."""
+        by_name = dict(zip(self.column_headers, self._columns))
+        empty = [""] * self._row_count
         self.column_headers = headers
+        self._columns = [list(by_name.get(h, empty)) for h in headers]
 
     def rowCount(self, parent=QModelIndex()):
-        return len(self._data)
+        return self._row_count
 
     def columnCount(self, parent=QModelIndex()):
         return len(self.column_headers)
@@ -138,13 +211,13 @@ class FastSearchResultModel(QAbstractTableModel):
         if not index.isValid():
             return None
         row, col = index.row(), index.column()
-        if row >= len(self._data) or col >= len(self.column_headers):
+        if row >= self._row_count or col >= len(self.column_headers):
             return None
 
         if role == Qt.DisplayRole or role == Qt.EditRole:
-            return str(self._data[row].get(self.column_headers[col], ""))
+            return self._columns[col][row]
         elif role == Qt.UserRole:
-            return self._data[row]
+            return self.get_row_data(row)
         return None
 
     def headerData(self, section, orientation, role=Qt.DisplayRole):
@@ -157,43 +230,129 @@ class FastSearchResultModel(QAbstractTableModel):
 
     def clear_data(self):
         self.beginResetModel()
-        self._data.clear()
+        self._columns = [[] for _ in self.column_headers]
+        self._row_count = 0
+        self._source_order = []
         self.endResetModel()
 
+    def header_keys(self, column_keys=None):
+        """헤더 순서대로 원본 데이터 키 목록 (키가 모자라면 None)."""
+        keys = list(column_keys) if column_keys else list(self.column_headers)
+        keys = keys[: len(self.column_headers)]
+        return keys + [None] * (len(self.column_headers) - len(keys))
+
+    def _append_columns(self, new_columns, count):
+        if not count:
+            return
+        self.beginInsertRows(
+            QModelIndex(), self._row_count, self._row_count + count - 1
+        )
+        for column, values in zip(self._columns, new_columns):
+            column.extend(values)
+        self._source_order.extend(range(self._row_count, self._row_count + count))
+        self._row_count += count
+        self.endInsertRows()
+
+    def append_column_slice(self, columns, start, end):
+        """미리 만든 표시 컬럼의 [start, end) 구간만 추가합니다 (점진적 적재용)."""
+        end = min(end, len(columns[0]) if columns else 0)
+        if end <= start:
+            return 0
+        self._append_columns([values[start:end] for values in columns], end - start)
+        return end - start
+
     def add_multiple_rows(self, data_list, column_keys=None):
+        if isinstance(data_list, pd.DataFrame):
+            self.append_dataframe(data_list, column_keys)
+            return
         if not data_list:
             return
 
-        keys_to_use = column_keys if column_keys else self.column_headers
-        mapping = dict(zip(keys_to_use, self.column_headers))
+        header_keys = self.header_keys(column_keys)
+        if all(isinstance(result, dict) for result in data_list):
+            # 컬럼 단위 리스트 컴프리헨션 (행 dict 재구성 없음)
+            new_columns = [
+                [_to_display(result.get(key, "")) for result in data_list]
+                if key is not None
+                else [""] * len(data_list)
+                for key in header_keys
+            ]
+        else:
+            new_columns = [[] for _ in self.column_headers]
+            for result in data_list:
+                for i, key in enumerate(header_keys):
+                    if isinstance(result, dict):
+                        value = result.get(key, "") if key is not None else ""
+                    elif isinstance(result, (list, tuple)) and i < len(result):
+                        value = result[i]
+                    else:
+                        value = ""
+                    new_columns[i].append(_to_display(value))
 
-        final_data = []
-        for result in data_list:
-            display_row = {}
-            if isinstance(result, dict):
-                for data_key, display_header in mapping.items():
-                    display_row[display_header] = result.get(data_key, "")
-            else:
-                for i, header in enumerate(self.column_headers):
-                    value = ""
-                    if isinstance(result, (list, tuple)) and i < len(result):
-                        value = result[i] if result[i] is not None else ""
-                    display_row[header] = value
+        self._append_columns(new_columns, len(data_list))
 
-            # ✅ [핵심] create_padded_sort_key() 호출 로직이 완전히 제거되었습니다.
-            final_data.append(display_row)
+    def append_dataframe(self, dataframe, column_keys=None):
+        """✅ [성능 개선] DataFrame 컬럼 배열을 그대로 표시 문자열 컬럼으로 적재합니다."""
+        if dataframe is None or dataframe.empty:
+            return
+        new_columns = build_display_columns(dataframe, self.header_keys(column_keys))
+        self._append_columns(new_columns, len(dataframe))
 
-        self.beginInsertRows(
-            QModelIndex(), len(self._data), len(self._data) + len(final_data) - 1
-        )
-        self._data.extend(final_data)
-        self.endInsertRows()
+    def set_dataframe(self, dataframe, column_keys=None):
+        """기존 데이터를 비우고 DataFrame으로 교체합니다."""
+        self.clear_data()
+        self.append_dataframe(dataframe, column_keys)
 
     def get_row_data(self, row):
-        if 0 <= row < len(self._data):
-            return self._data[row]
+        if 0 <= row < self._row_count:
+            return {
+                header: column[row]
+                for header, column in zip(self.column_headers, self._columns)
+            }
         return None
 
+    def get_column_values(self, col):
+        """컬럼 전체 표시값 리스트 (정렬/필터 등에서 셀 단위 data() 호출 회피용)."""
+        if 0 <= col < len(self._columns):
+            return self._columns[col]
+        return []
+
+    def apply_row_permutation(self, permutation):
+        """✅ [성능 개선] 행 순서를 한 번의 layoutChanged로 재배열합니다.
+
+        permutation[new_row] = old_row. 프록시의 lessThan 콜백을 O(n log n)번
+        부르는 대신 정렬 결과를 원본 모델에 직접 적용할 때 사용합니다.
+        """
+        if len(permutation) != self._row_count or not self._row_count:
+            return
+        self.layoutAboutToBeChanged.emit()
+
+        new_row_of = [0] * self._row_count
+        for new_row, old_row in enumerate(permutation):
+            new_row_of[old_row] = new_row
+        old_persistent = self.persistentIndexList()
+        new_persistent = [
+            self.index(new_row_of[idx.row()], idx.column()) for idx in old_persistent
+        ]
+
+        self._columns = [[column[i] for i in permutation] for column in self._columns]
+        self._source_order = [self._source_order[i] for i in permutation]
+
+        self.changePersistentIndexList(old_persistent, new_persistent)
+        self.layoutChanged.emit()
+
+    def restore_original_order(self):
+        """apply_row_permutation() 이전의 적재 순서로 되돌립니다."""
+        if any(i != row for row, i in enumerate(self._source_order)):
+            permutation = sorted(
+                range(self._row_count), key=self._source_order.__getitem__
+            )
+            self.apply_row_permutation(permutation)
+
+    def to_dataframe(self):
+        """표시 문자열 컬럼으로 DataFrame을 만듭니다 (행 단위 data() 호출 없음)."""
+        return pd.DataFrame(dict(zip(self.column_headers, self._columns)))
+
     def flags(self, index):
         """✅ [수정] 편집 가능한 컬럼은 ItemIsEditable 플래그 추가"""
         if not index.isValid():
@@ -219,17 +378,15 @@ class FastSearchResultModel(QAbstractTableModel):
         row = index.row()
         col = index.column()
 
-        if row < 0 or row >= len(self._data):
+        if row < 0 or row >= self._row_count:
             return False
 
-        # 컬럼 헤더 이름 가져오기
+        # 컬럼 범위 확인
         if col >= len(self.column_headers):
             return False
 
-        column_name = self.column_headers[col]
-
         # 데이터 업데이트
-        self._data[row][column_name] = str(value)
+        self._columns[col][row] = _to_display(value)
 
         # 변경 사항 알림
         self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
@@ -270,6 +427,153 @@ class FastSearchResultModel(QAbstractTableModel):
         return True
 
 
+class ResultPrepThread(QThread):
+    """✅ [성능 개선] 대용량 결과 준비를 GUI 스레드 밖에서 수행합니다.
+
+    - DataFrame → 표시 문자열 컬럼 변환
+    - 샘플 기반 정렬 유형 분석 (pre_analyze_all_columns 대체)
+    - 샘플 기반 컬럼 너비 추정 (resizeColumnsToContents 대체)
+    """
+
+    prepared = Signal(object)
+
+    def __init__(self, dataframe, header_keys, column_headers, parent=None):
+        super().__init__(parent)
+        self.dataframe = dataframe
+        self.header_keys = header_keys
+        self.column_headers = column_headers
+
+    def run(self):
+        columns = build_display_columns(self.dataframe, self.header_keys)
+        sort_types = {
+            col: analyze_sort_type(values) for col, values in enumerate(columns)
+        }
+        widths = estimate_column_widths(self.column_headers, columns)
+        self.prepared.emit(
+            {"columns": columns, "sort_types": sort_types, "widths": widths}
+        )
+
+
+class ProgressiveRowFeeder(QObject):
+    """✅ [성능 개선] 준비된 표시 컬럼을 타이머로 나눠 모델에 추가합니다.
+
+    첫 화면 분량은 즉시 넣고, 나머지는 이벤트 루프가 한 바퀴 돌 때마다
+    chunk_rows씩 추가하여 대량 결과에서도 창이 멈추지 않게 합니다.
+    """
+
+    progress = Signal(int, int)  # (적재 행 수, 전체 행 수)
+    finished = Signal()
+
+    def __init__(self, model, columns, chunk_rows=2000, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.columns = columns
+        self.total = len(columns[0]) if columns else 0
+        self.chunk_rows = chunk_rows
+        self.loaded = 0
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._feed_next)
+
+    def start(self, first_rows=200):
+        self._feed(first_rows)
+        if self.loaded < self.total:
+            self._timer.start()
+        else:
+            self.finished.emit()
+
+    def cancel(self):
+        self._timer.stop()
+
+    def is_running(self):
+        return self._timer.isActive()
+
+    def _feed(self, rows):
+        self.loaded += self.model.append_column_slice(
+            self.columns, self.loaded, self.loaded + rows
+        )
+        self.progress.emit(self.loaded, self.total)
+
+    def _feed_next(self):
+        self._feed(self.chunk_rows)
+        if self.loaded >= self.total:
+            self._timer.stop()
+            self.finished.emit()
+
+
+class FindTextIndex:
+    """✅ [성능 개선] Find용 소문자 연결 버퍼 + 셀 오프셋 테이블 (원본 행 순서, 행 우선).
+
+    결과를 적재한 뒤 한 번만 만들고, 매치 카운트와 이전/다음 찾기는 모두
+    버퍼에 대한 str.find()로 처리합니다. 셀 사이에는 구분 문자(NUL)를 넣어
+    검색어가 두 셀에 걸쳐 매치되지 않게 합니다. 만든 뒤에는 읽기만 하므로
+    워커 스레드에서 검색해도 안전합니다.
+    """
+
+    SEPARATOR = "\x00"
+
+    def __init__(self, columns, row_count):
+        self.column_count = len(columns)
+        self.row_count = row_count if self.column_count else 0
+        cells = [
+            str(value).lower()
+            for row_values in zip(*(column[:row_count] for column in columns))
+            for value in row_values
+        ]
+        self.offsets = []
+        position = 0
+        for cell in cells:
+            self.offsets.append(position)
+            position += len(cell) + 1
+        self.buffer = self.SEPARATOR.join(cells)
+
+    @property
+    def cell_count(self):
+        return len(self.offsets)
+
+    def find_cells(self, search_lower, row_mask=None):
+        """검색어를 포함하는 셀 번호(row * column_count + col) 목록 (오름차순).
+
+        row_mask가 있으면(헤더 필터) 마스크가 0인 행의 셀은 제외합니다.
+        """
+        if not search_lower or self.SEPARATOR in search_lower:
+            return []
+        buffer, offsets = self.buffer, self.offsets
+        last_cell = len(offsets) - 1
+        column_count = self.column_count
+        matches = []
+        position = buffer.find(search_lower)
+        while position != -1:
+            cell = bisect_right(offsets, position) - 1
+            if row_mask is None or row_mask[cell // column_count]:
+                matches.append(cell)
+            if cell >= last_cell:
+                break
+            # 같은 셀의 중복 매치는 한 번만 센다 → 다음 셀 시작부터 다시 검색
+            position = buffer.find(search_lower, offsets[cell + 1])
+        return matches
+
+    def cell_position(self, cell):
+        """셀 번호 → (원본 행, 컬럼)"""
+        return divmod(cell, self.column_count)
+
+
+class FindMatchThread(QThread):
+    """✅ [성능 개선] 셀 수가 많을 때 Find 매치 계산을 GUI 스레드 밖에서 수행합니다."""
+
+    matched = Signal(object, str, object)  # (FindTextIndex, 검색어(소문자), 셀 번호 목록)
+
+    def __init__(self, find_index, search_lower, row_mask=None, parent=None):
+        super().__init__(parent)
+        self.find_index = find_index
+        self.search_lower = search_lower
+        self.row_mask = row_mask
+
+    def run(self):
+        cells = self.find_index.find_cells(self.search_lower, self.row_mask)
+        self.matched.emit(self.find_index, self.search_lower, cells)
+
+
 # DataFrame에서 빠르게 로드하는 편의 함수
 def load_dataframe_to_model(model, dataframe, column_mapping=None):
     """
@@ -294,18 +598,10 @@ def load_dataframe_to_model(model, dataframe, column_mapping=None):
             elif i < len(dataframe.columns):
                 column_mapping[dataframe.columns[i]] = header
 
-    # DataFrame을 딕셔너리 리스트로 변환 (빠른 방법)
-    data_list = []
-    for _, row in dataframe.iterrows():
-        row_data = {}
-        for df_col, model_col in column_mapping.items():
-            if df_col in row:
-                row_data[model_col] = row[df_col]
-        data_list.append(row_data)
-
-    # 한 번에 모든 데이터 추가 (매우 빠름)
-    model.clear_data()
-    model.add_multiple_rows(data_list)
+    # ✅ [성능 개선] 헤더 순서대로 DataFrame 컬럼을 골라 컬럼 단위로 적재 (iterrows 제거)
+    header_to_df = {model_col: df_col for df_col, model_col in column_mapping.items()}
+    keys = [header_to_df.get(header) for header in model.column_headers]
+    model.set_dataframe(dataframe, keys)
 
 
 class BaseMatchHighlightDelegate(QStyledItemDelegate):
@@ -423,6 +719,14 @@ class BaseMatchHighlightDelegate(QStyledItemDelegate):
 
 
 class BaseSearchTab(QWidget):
+    # ✅ [성능 개선] 이 행 수 이상이면 결과를 점진적으로 적재
+    PROGRESSIVE_LOAD_THRESHOLD = 5000
+    PROGRESSIVE_FIRST_ROWS = 200
+    PROGRESSIVE_CHUNK_ROWS = 2000
+    # ✅ [성능 개선] Find 입력 디바운스(ms)와 워커 스레드로 넘길 셀 수 기준
+    FIND_DEBOUNCE_MS = 150
+    FIND_WORKER_CELL_THRESHOLD = 200000
+
     def __init__(self, config, app_instance):
         super().__init__()
         self.config = config
@@ -446,8 +750,26 @@ class BaseSearchTab(QWidget):
         self.proxy_model = None
 
         self.current_dataframe = pd.DataFrame()
+        self.last_search_result = None  # 마지막 SearchResult (소요 시간/잘림 여부 등 메타데이터)
         self.search_thread = None
         self.is_searching = False
+        self._streamed_rows = 0  # 현재 검색에서 페이지 단위로 먼저 표시한 행 수
+
+        # ✅ [성능 개선] 대용량 결과 점진적 적재 상태
+        self._prep_thread = None
+        self._row_feeder = None
+
+        # ✅ [성능 개선] Find 인덱스 (결과 적재/정렬/편집 시 무효화, 다음 Find 때 재구성)
+        self._find_index = None
+        self._find_source_model = None
+        self._find_matches = None  # (FindTextIndex, 검색어(소문자), 행 마스크, 셀 번호 목록)
+        self._find_thread = None
+        self._find_debounce_timer = QTimer(self)
+        self._find_debounce_timer.setSingleShot(True)
+        self._find_debounce_timer.setInterval(self.FIND_DEBOUNCE_MS)
+        self._find_debounce_timer.timeout.connect(
+            lambda: self._update_find_match_counter(self.find_entry.text().strip())
+        )
 
         self.setup_ui()
         self.setup_connections()
@@ -898,6 +1220,7 @@ class BaseSearchTab(QWidget):
 
         search_params["app_instance"] = self.app_instance
 
+        self._cancel_progressive_load()
         self.is_searching = True
         self.search_button.setEnabled(False)
         self.stop_button.setEnabled(True)
@@ -913,6 +1236,8 @@ class BaseSearchTab(QWidget):
         )
         self.search_thread.search_completed.connect(self.on_search_completed)
         self.search_thread.search_failed.connect(self.on_search_failed)
+        self.search_thread.page_ready.connect(self.on_search_page)
+        self._streamed_rows = 0
         self.search_thread.start()
 
     def stop_search(self):
@@ -992,25 +1317,50 @@ class BaseSearchTab(QWidget):
             self.animation.setEasingCurve(QEasingCurve.InOutCubic)
             self.animation.start()
 
-            data_list = []
             self.app_instance.log_message(
                 "▶️ on_search_completed: 결과 타입 확인 시작", "DEBUG"
             )
+            # ✅ [성능 개선] SearchResult의 컬럼형 payload(DataFrame)를 변환 없이 사용
+            # (SearchResult가 아니면 이전 검색의 것이 남지 않도록 비움)
+            self.last_search_result = (
+                results if isinstance(results, SearchResult) else None
+            )
+            if isinstance(results, SearchResult):
+                self.app_instance.log_message(
+                    f"⏱️ {results.source or '검색'}: {results.elapsed:.2f}초, "
+                    f"{results.row_count}건{' (일부)' if results.truncated else ''}",
+                    "DEBUG",
+                )
+                results = results.data
+
+            # ✅ [성능 개선] 결과는 DataFrame 한 벌로만 보관하고 모델은 컬럼 배열에서 적재
+            # (records 리스트 ↔ DataFrame 왕복 변환 제거)
             if isinstance(results, pd.DataFrame):
                 self.current_dataframe = results
-                if not results.empty:
-                    data_list = results.to_dict("records")
             elif isinstance(results, list) and results:
                 self.current_dataframe = pd.DataFrame(results)
-                data_list = results
             else:
                 self.current_dataframe = pd.DataFrame()
+            result_count = len(self.current_dataframe)
             self.app_instance.log_message(
-                f"▶️ on_search_completed: 데이터 리스트 변환 완료 ({len(data_list)}개)",
+                f"▶️ on_search_completed: 데이터 변환 완료 ({result_count}개)",
                 "DEBUG",
             )
 
-            if data_list:
+            self._cancel_progressive_load()
+            progressive = (
+                result_count >= self.PROGRESSIVE_LOAD_THRESHOLD
+                and isinstance(self.table_model, FastSearchResultModel)
+            )
+
+            if result_count and progressive:
+                # ✅ [성능 개선] 대용량: 준비는 워커에서, 적재는 타이머로 나눠서
+                self.table_model.clear_data()
+                if self.proxy_model and hasattr(self.proxy_model, "invalidate"):
+                    self.proxy_model.invalidate()
+                self._start_progressive_load(self.current_dataframe)
+
+            elif result_count:
                 self.app_instance.log_message(
                     "▶️ on_search_completed: 모델 업데이트 시작", "DEBUG"
                 )
@@ -1022,10 +1372,12 @@ class BaseSearchTab(QWidget):
                         self.app_instance.log_message("...프록시 모델 무효화", "DEBUG")
                         self.proxy_model.invalidate()
 
-                    self.app_instance.log_message("...add_multiple_rows 호출", "DEBUG")
+                    self.app_instance.log_message("...append_dataframe 호출", "DEBUG")
                     # ✅ [핵심 수정] column_keys 대신 None을 전달하여 모든 데이터 포함
-                    self.table_model.add_multiple_rows(data_list, column_keys=None)
-                    self.app_instance.log_message("...add_multiple_rows 완료", "DEBUG")
+                    self.table_model.append_dataframe(
+                        self.current_dataframe, column_keys=None
+                    )
+                    self.app_instance.log_message("...append_dataframe 완료", "DEBUG")
 
                     if self.proxy_model and hasattr(
                         self.proxy_model, "pre_analyze_all_columns"
@@ -1054,6 +1406,7 @@ class BaseSearchTab(QWidget):
                 focus_on_first_table_view_item(self.table_view, self.app_instance)
                 self.app_instance.log_message("...첫 항목 포커스 완료", "DEBUG")
 
+            if result_count:
                 # -------------------
                 # ✅ [핵심 수정] 탭 전환 전, DB에 저장된 사용자 설정을 확인하는 로직 추가
 
@@ -1075,7 +1428,7 @@ class BaseSearchTab(QWidget):
                 ):
                     self.app_instance.main_window.switch_to_tab_by_name(self.tab_name)
                     self.app_instance.log_message(
-                        f"✅ 검색 결과({len(data_list)}건)가 있어 우선순위 탭 '{self.tab_name}'(으)로 자동 전환합니다.",
+                        f"✅ 검색 결과({result_count}건)가 있어 우선순위 탭 '{self.tab_name}'(으)로 자동 전환합니다.",
                         "INFO",
                     )
 
@@ -1085,9 +1438,9 @@ class BaseSearchTab(QWidget):
                 # -------------------
 
                 self.app_instance.log_message(
-                    f"✅ 검색 완료: {len(data_list)}개 결과", "INFO"
+                    f"✅ 검색 완료: {result_count}개 결과", "INFO"
                 )
-                self.status_label.setText(f"검색 완료: {len(data_list)}개 결과")
+                self.status_label.setText(f"검색 완료: {result_count}개 결과")
 
             else:
                 if hasattr(self, "table_model") and self.table_model:
@@ -1118,6 +1471,21 @@ class BaseSearchTab(QWidget):
                 self._switch_priority = False
             # -------------------
 
+    def on_search_page(self, records):
+        """✅ [성능 개선] 검색 도중 도착한 페이지를 테이블 끝에 추가합니다 (완료 시 최종 결과로 교체)."""
+        if self.sender() is not self.search_thread or not self.is_searching:
+            return  # 이전 검색 또는 중지된 검색의 늦은 페이지
+        if not records or not isinstance(self.table_model, FastSearchResultModel):
+            return
+
+        if self._streamed_rows == 0:
+            self.table_model.clear_data()
+            if self.proxy_model and hasattr(self.proxy_model, "invalidate"):
+                self.proxy_model.invalidate()
+        self.table_model.add_multiple_rows(records)
+        self._streamed_rows += len(records)
+        self.status_label.setText(f"검색 중... {self._streamed_rows:,}건 수신")
+
     def on_search_failed(self, error_msg):
         """검색 실패 이벤트 처리"""
         self.reset_search_ui()
@@ -1133,23 +1501,85 @@ class BaseSearchTab(QWidget):
                 f"❌ {self.tab_name} 검색 실패: {error_msg}", "ERROR"
             )
 
+    # === ✅ [성능 개선] 대용량 결과 점진적 적재 ===
+
+    def _start_progressive_load(self, dataframe):
+        """표시 컬럼 준비(워커) → 첫 화면 즉시 표시 → 나머지는 타이머로 적재."""
+        self.app_instance.log_message(
+            f"▶️ 점진적 적재 시작: {len(dataframe):,}행", "DEBUG"
+        )
+        if getattr(self, "animation", None):
+            self.animation.stop()
+        self.progress_bar.setRange(0, len(dataframe))
+        self.progress_bar.setValue(0)
+        self.status_label.setText(f"결과 준비 중... ({len(dataframe):,}건)")
+
+        self._prep_thread = ResultPrepThread(
+            dataframe,
+            self.table_model.header_keys(None),
+            list(self.table_model.column_headers),
+            self,
+        )
+        self._prep_thread.prepared.connect(self._on_results_prepared)
+        self._prep_thread.finished.connect(self._prep_thread.deleteLater)
+        self._prep_thread.start()
+
+    def _on_results_prepared(self, prepared):
+        if self.sender() is not self._prep_thread:
+            return  # 이미 새 검색이 시작된 이전 준비 결과
+        self._prep_thread = None
+
+        if self.proxy_model and hasattr(self.proxy_model, "set_column_sort_types"):
+            self.proxy_model.set_column_sort_types(prepared["sort_types"])
+        apply_column_widths(self.table_view, prepared["widths"])
+
+        self._row_feeder = ProgressiveRowFeeder(
+            self.table_model, prepared["columns"], self.PROGRESSIVE_CHUNK_ROWS, self
+        )
+        self._row_feeder.progress.connect(self._on_feed_progress)
+        self._row_feeder.finished.connect(self._on_feed_finished)
+        self._row_feeder.start(self.PROGRESSIVE_FIRST_ROWS)
+        # 첫 화면 분량이 들어간 직후 포커스
+        focus_on_first_table_view_item(self.table_view, self.app_instance)
+
+    def _on_feed_progress(self, loaded, total):
+        self.progress_bar.setValue(loaded)
+        self.status_label.setText(f"결과 표시 중... {loaded:,} / {total:,}건")
+
+    def _on_feed_finished(self):
+        total = self.table_model.rowCount()
+        self._row_feeder = None
+        self.status_label.setText(f"검색 완료: {total}개 결과")
+        self.app_instance.log_message(f"✅ 점진적 적재 완료: {total:,}행", "DEBUG")
+
+    def _cancel_progressive_load(self):
+        """진행 중인 점진적 적재를 중단합니다 (새 검색 시작 시)."""
+        if self._row_feeder is not None:
+            self._row_feeder.cancel()
+            self._row_feeder = None
+        # 준비 스레드는 짧게 끝나므로 결과만 무시 (_on_results_prepared의 sender 확인)
+        self._prep_thread = None
+        self.progress_bar.setRange(0, 100)
+
     # === 데이터 관리 ===
 
     def update_table_data(self, data_list):
         """✅ [모델/뷰 전환] 완전히 새로운 데이터 업데이트 방식"""
-        if not data_list:
+        if data_list is None or len(data_list) == 0:
             self.table_model.clear_data()
             return
 
         # ✅ [성능 함정 해결] 1. 데이터 입력 전에 정렬 기능을 잠시 끕니다.
         self.table_view.setSortingEnabled(False)
 
-        # DataFrame 업데이트 (호환성 유지)
-        self.current_dataframe = pd.DataFrame(data_list)
+        # DataFrame 업데이트 (호환성 유지) - DataFrame이면 그대로 재사용
+        if isinstance(data_list, pd.DataFrame):
+            self.current_dataframe = data_list
+        else:
+            self.current_dataframe = pd.DataFrame(data_list)
 
-        # ✅ [핵심 변경] 모델에 데이터 추가
-        self.table_model.clear_data()
-        self.table_model.add_multiple_rows(data_list, self.column_keys)
+        # ✅ [핵심 변경] 모델에 데이터 추가 (컬럼 단위 적재)
+        self.table_model.set_dataframe(self.current_dataframe, self.column_keys)
 
         # 컬럼 너비 조정 (기존 함수 재사용)
         adjust_qtableview_columns(
@@ -1201,8 +1631,8 @@ class BaseSearchTab(QWidget):
 
     def _on_find_text_changed(self, text):
         """✅ [신규] Find 입력창의 텍스트가 변경될 때마다 호출 - 매치 카운터 업데이트 + 델리게이트 하이라이트"""
-        # 매치 카운터 업데이트
-        self._update_find_match_counter(text.strip())
+        # ✅ [성능 개선] 매치 카운트는 입력이 멈춘 뒤 한 번만 (키 입력마다 전체 스캔 방지)
+        self._find_debounce_timer.start()
 
         # ✅ [추가] 델리게이트에 검색어 전달 (매치 하이라이트용)
         if hasattr(self, "color_delegate") and hasattr(
@@ -1213,6 +1643,71 @@ class BaseSearchTab(QWidget):
             if hasattr(self, "table_view"):
                 self.table_view.viewport().update()
 
+    def _invalidate_find_index(self, *args):
+        """✅ [성능 개선] 원본 데이터/행 순서가 바뀌면 Find 인덱스와 매치 캐시를 버립니다."""
+        self._find_index = None
+        self._find_matches = None
+
+    def _get_find_index(self):
+        """✅ [성능 개선] 컬럼형 원본 모델이면 Find 인덱스를 반환(필요 시 1회 구성), 아니면 None"""
+        if not hasattr(self, "table_view") or not self.table_view.model():
+            return None
+        model = self.table_view.model()
+        source = model.sourceModel() if hasattr(model, "sourceModel") else model
+        if source is None or not hasattr(source, "get_column_values"):
+            return None
+
+        if source is not self._find_source_model:
+            self._find_source_model = source
+            self._find_index = None
+            self._find_matches = None
+            for signal in (
+                source.modelReset,
+                source.rowsInserted,
+                source.rowsRemoved,
+                source.layoutChanged,
+                source.dataChanged,
+            ):
+                signal.connect(self._invalidate_find_index)
+
+        if self._find_index is None:
+            columns = [
+                source.get_column_values(col) for col in range(source.columnCount())
+            ]
+            self._find_index = FindTextIndex(columns, source.rowCount())
+        return self._find_index
+
+    def _current_row_mask(self):
+        model = self.table_view.model()
+        if hasattr(model, "accepted_row_mask"):
+            return model.accepted_row_mask()
+        return None
+
+    def _get_find_matches(self, find_index, search_lower):
+        """캐시된 매치 목록을 재사용하고, 없으면 동기로 계산합니다."""
+        row_mask = self._current_row_mask()
+        cached = self._find_matches
+        if (
+            cached
+            and cached[0] is find_index
+            and cached[1] == search_lower
+            and cached[2] is row_mask
+        ):
+            return cached[3]
+        cells = find_index.find_cells(search_lower, row_mask)
+        self._find_matches = (find_index, search_lower, row_mask, cells)
+        return cells
+
+    def _current_find_cell(self, find_index):
+        """현재 선택 셀의 Find 셀 번호 (선택이 없으면 None)"""
+        current_index = self.table_view.currentIndex()
+        if not current_index.isValid():
+            return None
+        model = self.table_view.model()
+        if hasattr(model, "mapToSource"):
+            current_index = model.mapToSource(current_index)
+        return current_index.row() * find_index.column_count + current_index.column()
+
     def _update_find_match_counter(self, search_text):
         """Find 검색어에 매치되는 셀의 개수를 세고 상태 표시줄에 표시"""
         if not search_text:
@@ -1224,6 +1719,61 @@ class BaseSearchTab(QWidget):
         if not hasattr(self, "table_view") or not self.table_view.model():
             return
 
+        find_index = self._get_find_index()
+        if find_index is None:
+            total_matches, current_match = self._count_find_matches_by_scan(search_text)
+            self._show_find_match_counter(search_text, total_matches, current_match)
+            return
+
+        search_lower = search_text.lower()
+        row_mask = self._current_row_mask()
+        cached = self._find_matches
+        is_cached = (
+            cached
+            and cached[0] is find_index
+            and cached[1] == search_lower
+            and cached[2] is row_mask
+        )
+        if not is_cached and find_index.cell_count >= self.FIND_WORKER_CELL_THRESHOLD:
+            # ✅ [성능 개선] 대용량: 워커 스레드에서 계산 후 _on_find_matches_ready로 표시
+            if self._find_thread is not None:
+                self._find_thread.matched.disconnect()
+            self._find_thread = FindMatchThread(find_index, search_lower, row_mask, self)
+            self._find_thread.matched.connect(self._on_find_matches_ready)
+            self._find_thread.finished.connect(self._find_thread.deleteLater)
+            self._find_thread.start()
+            return
+
+        cells = self._get_find_matches(find_index, search_lower)
+        self._show_find_match_counter(
+            search_text, len(cells), self._find_match_ordinal(find_index, cells)
+        )
+
+    def _on_find_matches_ready(self, find_index, search_lower, cells):
+        """워커 스레드의 Find 매치 결과 수신 (그 사이 입력/데이터가 바뀌었으면 무시)"""
+        if self.sender() is not self._find_thread:
+            return
+        self._find_thread = None
+        search_text = self.find_entry.text().strip()
+        if find_index is not self._find_index or search_text.lower() != search_lower:
+            return
+        self._find_matches = (find_index, search_lower, self._current_row_mask(), cells)
+        self._show_find_match_counter(
+            search_text, len(cells), self._find_match_ordinal(find_index, cells)
+        )
+
+    def _find_match_ordinal(self, find_index, cells):
+        """현재 선택 셀이 몇 번째 매치인지 (매치가 아니면 0)"""
+        current_cell = self._current_find_cell(find_index)
+        if current_cell is None:
+            return 0
+        position = bisect_left(cells, current_cell)
+        if position < len(cells) and cells[position] == current_cell:
+            return position + 1
+        return 0
+
+    def _count_find_matches_by_scan(self, search_text):
+        """컬럼형 모델이 아닌 경우(QStandardItemModel 등)의 셀 순회 매치 카운트"""
         model = self.table_view.model()
         row_count = model.rowCount()
         col_count = model.columnCount()
@@ -1247,7 +1797,9 @@ class BaseSearchTab(QWidget):
                         and col == current_index.column()
                     ):
                         current_match = total_matches
+        return total_matches, current_match
 
+    def _show_find_match_counter(self, search_text, total_matches, current_match):
         # 상태 표시줄 업데이트
         if hasattr(self, "status_label"):
             if total_matches == 0:
@@ -1283,11 +1835,58 @@ class BaseSearchTab(QWidget):
         # QTableView에서 찾기 구현
         self._find_in_table_view(search_text, "backward")
 
+    def _select_find_index(self, index):
+        # ✅ [수정] 하이라이트를 위해 선택 모델 사용
+        self.table_view.setCurrentIndex(index)
+        self.table_view.selectionModel().select(
+            index, QItemSelectionModel.ClearAndSelect
+        )
+        self.table_view.scrollTo(index)
+
     def _find_in_table_view(self, search_text, direction="forward"):
         """✅ [새로 구현] QTableView에서 텍스트 찾기"""
         if not hasattr(self, "table_view") or not self.table_view.model():
             return
 
+        find_index = self._get_find_index()
+        if find_index is None:
+            found = self._find_in_table_view_by_scan(search_text, direction)
+        else:
+            # ✅ [성능 개선] 매치 셀 목록(원본 순서 = 화면 순서)에서 이분 탐색으로 이전/다음 결정
+            cells = self._get_find_matches(find_index, search_text.lower())
+            found = bool(cells)
+            if found:
+                current_cell = self._current_find_cell(find_index)
+                if direction == "forward":
+                    position = (
+                        0 if current_cell is None else bisect_right(cells, current_cell)
+                    )
+                    cell = cells[position % len(cells)]
+                else:
+                    position = (
+                        len(cells)
+                        if current_cell is None
+                        else bisect_left(cells, current_cell)
+                    )
+                    cell = cells[position - 1]
+                row, col = find_index.cell_position(cell)
+                model = self.table_view.model()
+                source = self._find_source_model
+                index = source.index(row, col)
+                if hasattr(model, "mapFromSource"):
+                    index = model.mapFromSource(index)
+                self._select_find_index(index)
+
+        if not found:
+            QMessageBox.information(
+                self, "찾기", f"'{search_text}'를 찾을 수 없습니다."
+            )
+        else:
+            # 찾기 성공 시 매치 카운터 업데이트
+            self._update_find_match_counter(search_text)
+
+    def _find_in_table_view_by_scan(self, search_text, direction="forward"):
+        """컬럼형 모델이 아닌 경우의 셀 순회 찾기 (찾으면 True)"""
         model = self.table_view.model()
         current_selection = self.table_view.currentIndex()
 
@@ -1297,93 +1896,47 @@ class BaseSearchTab(QWidget):
         # 검색 범위 설정
         row_count = model.rowCount()
         col_count = model.columnCount()
-
-        found = False
         search_lower = search_text.lower()
 
+        def matches(row, col):
+            index = model.index(row, col)
+            cell_text = str(model.data(index, Qt.DisplayRole) or "").lower()
+            if search_lower in cell_text:
+                self._select_find_index(index)
+                return True
+            return False
+
         if direction == "forward":
             # 다음 찾기: 현재 위치부터 끝까지, 그다음 처음부터 현재까지
             for row in range(start_row, row_count):
                 start_column = start_col + 1 if row == start_row else 0
                 for col in range(start_column, col_count):
-                    index = model.index(row, col)
-                    cell_text = str(model.data(index, Qt.DisplayRole) or "").lower()
-                    if search_lower in cell_text:
-                        # ✅ [수정] 하이라이트를 위해 선택 모델 사용
-                        self.table_view.setCurrentIndex(index)
-                        self.table_view.selectionModel().select(
-                            index, QItemSelectionModel.ClearAndSelect
-                        )
-                        self.table_view.scrollTo(index)
-                        found = True
-                        break
-                if found:
-                    break
+                    if matches(row, col):
+                        return True
 
             # 찾지 못했으면 처음부터 현재 위치까지 검색
-            if not found:
-                for row in range(0, start_row + 1):
-                    end_column = start_col if row == start_row else col_count
-                    for col in range(0, end_column):
-                        index = model.index(row, col)
-                        cell_text = str(model.data(index, Qt.DisplayRole) or "").lower()
-                        if search_lower in cell_text:
-                            # ✅ [수정] 하이라이트를 위해 선택 모델 사용
-                            self.table_view.setCurrentIndex(index)
-                            self.table_view.selectionModel().select(
-                                index, QItemSelectionModel.ClearAndSelect
-                            )
-                            self.table_view.scrollTo(index)
-                            found = True
-                            break
-                    if found:
-                        break
+            for row in range(0, start_row + 1):
+                end_column = start_col if row == start_row else col_count
+                for col in range(0, end_column):
+                    if matches(row, col):
+                        return True
 
         else:  # backward
             # 이전 찾기: 현재 위치부터 처음까지, 그다음 끝부터 현재까지
             for row in range(start_row, -1, -1):
                 end_column = start_col if row == start_row else col_count
                 for col in range(end_column - 1, -1, -1):
-                    index = model.index(row, col)
-                    cell_text = str(model.data(index, Qt.DisplayRole) or "").lower()
-                    if search_lower in cell_text:
-                        # ✅ [수정] 하이라이트를 위해 선택 모델 사용
-                        self.table_view.setCurrentIndex(index)
-                        self.table_view.selectionModel().select(
-                            index, QItemSelectionModel.ClearAndSelect
-                        )
-                        self.table_view.scrollTo(index)
-                        found = True
-                        break
-                if found:
-                    break
+                    if matches(row, col):
+                        return True
 
             # 찾지 못했으면 끝부터 현재 위치까지 검색
-            if not found:
-                for row in range(row_count - 1, start_row - 1, -1):
-                    start_column = start_col if row == start_row else -1
-                    for col in range(col_count - 1, start_column, -1):
-                        index = model.index(row, col)
-                        cell_text = str(model.data(index, Qt.DisplayRole) or "").lower()
-                        if search_lower in cell_text:
-                            # ✅ [수정] 하이라이트를 위해 선택 모델 사용
-                            self.table_view.setCurrentIndex(index)
-                            self.table_view.selectionModel().select(
-                                index, QItemSelectionModel.ClearAndSelect
-                            )
-                            self.table_view.scrollTo(index)
-                            found = True
-                            break
-                    if found:
-                        break
+            for row in range(row_count - 1, start_row - 1, -1):
+                start_column = start_col if row == start_row else -1
+                for col in range(col_count - 1, start_column, -1):
+                    if matches(row, col):
+                        return True
 
-        if not found:
-            QMessageBox.information(
-                self, "찾기", f"'{search_text}'를 찾을 수 없습니다."
-            )
-        else:
-            # 찾기 성공 시 매치 카운터 업데이트
-            self._update_find_match_counter(search_text)
+        return False
 
     def clear_all_filters_action(self):
         """✅ [복원] 모든 필터 지우기 버튼"""
@@ -1573,6 +2126,10 @@ class BaseSearchTab(QWidget):
             if row_count == 0:
                 return pd.DataFrame()
 
+            # ✅ [성능 개선] 컬럼형 모델은 표시 컬럼을 그대로 DataFrame으로
+            if hasattr(model, "to_dataframe"):
+                return model.to_dataframe()
+
             col_count = model.columnCount()
             data = []
             for row in range(row_count):
@@ -1892,9 +2449,8 @@ class BaseSearchTab(QWidget):
     def reset_table_order(self):
         """정렬을 해제하고 테이블의 행 순서를 원본 순서(DataFrame)대로 복원합니다."""
         if not self.current_dataframe.empty:
-            # DataFrame을 리스트 형태로 변환하여 update_table_data로 재로드
-            data_list = self.current_dataframe.to_dict("records")
-            self.update_table_data(data_list)
+            # DataFrame 그대로 update_table_data로 재로드 (records 변환 없음)
+            self.update_table_data(self.current_dataframe)
             self.app_instance.log_message(
                 "🔄 테이블 행 순서를 원본대로 복원했습니다.", "INFO"
             )
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*- 
 # 파일명: qt_data_transfer_manager.py
 # 설명: 탭 간 데이터 전송을 관리하는 중앙 모듈
+# 수정일시: 2025-10-31 - ✅ [성능 개선] AI 피드 → Gemini 전송은 SearchResult payload 컬럼에서 직접 수집
 
 import re
 from PySide6.QtCore import Qt
+from qt_utils import SearchResult
 
 
 def send_marc_data_to_tabs(app_instance, f_fields, raw_marc_text):
@@ -89,13 +91,17 @@ def send_marc_data_to_tabs(app_instance, f_fields, raw_marc_text):
         _transfer_to_tabs(app_instance, ["Dewey 분류 검색"], ddc=ddc_number)
 
 
-def handle_ai_feed_to_gemini(ai_feed_tab):
+def handle_ai_feed_to_gemini(ai_feed_tab, search_result=None):
     """
     AI 피드 탭의 검색 결과를 분석하여 Gemini 탭으로 전송합니다.
     ISBN 검색 완료 후 qt_TabView_AIFeed.py에서 호출됩니다.
+
+    ✅ [성능 개선] search_result(SearchResult, 기본값: 탭의 last_search_result)가 있으면
+    payload DataFrame 컬럼에서 바로 읽고, 없을 때만 테이블 모델을 셀 단위로 훑습니다.
     """
     app_instance = ai_feed_tab.app_instance
-    model = ai_feed_tab.table_model
+    if search_result is None:
+        search_result = getattr(ai_feed_tab, "last_search_result", None)
 
     # 1. 데이터 소스별(Naver, Yes24, Kyobo) '분류 정보 취합' 내용 수집
     source_map = {
@@ -104,6 +110,19 @@ def handle_ai_feed_to_gemini(ai_feed_tab):
         "Kyobo Book": "",
     }
 
+    frame = search_result.dataframe if isinstance(search_result, SearchResult) else None
+    if frame is not None and {"검색소스", "분류 정보 취합"} <= set(frame.columns):
+        for source, content in zip(frame["검색소스"], frame["분류 정보 취합"]):
+            if source in source_map and isinstance(content, str) and content:
+                source_map[source] = content
+    elif not _collect_from_model(app_instance, ai_feed_tab.table_model, source_map):
+        return
+
+    _send_ai_feed_text(app_instance, source_map)
+
+
+def _collect_from_model(app_instance, model, source_map):
+    """테이블 모델의 '검색소스'/'분류 정보 취합' 컬럼에서 내용을 수집합니다 (SearchResult가 없을 때)."""
     col_count = model.columnCount()
     source_col_idx = -1
     compile_col_idx = -1
@@ -120,7 +139,7 @@ def handle_ai_feed_to_gemini(ai_feed_tab):
         app_instance.log_message(
             "오류: '검색소스' 또는 '분류 정보 취합' 컬럼을 찾을 수 없습니다.", "ERROR"
         )
-        return
+        return False
 
     for row in range(model.rowCount()):
         source_index = model.index(row, source_col_idx)
@@ -132,7 +151,11 @@ def handle_ai_feed_to_gemini(ai_feed_tab):
         if source and content:
             if source in source_map:
                 source_map[source] = content
+    return True
+
 
+def _send_ai_feed_text(app_instance, source_map):
+    """수집한 소스별 내용을 조합해 Gemini 탭으로 전송합니다."""
     # 2. 데이터 조합 (Yes24, Kyobo 비교 후 Naver 추가)
     # 저자, 목차, 서평 분량이 가장 긴 조합을 선택
     yes24_content = source_map.get("Yes24", "")
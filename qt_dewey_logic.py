@@ -711,8 +711,7 @@ def _on_ksh_search_completed(tab, df_results):
         tab.app_instance.log_message(
             f"Dewey 탭: KSH 검색 완료 ({len(df_results)}개 결과)", "INFO"
         )
-        records = df_results.to_dict("records")
-        tab.ksh_model.add_multiple_rows(records, column_keys=tab.ksh_column_keys)
+        tab.ksh_model.append_dataframe(df_results, column_keys=tab.ksh_column_keys)
         adjust_qtableview_columns(
             tab.ksh_table,
             df_results,
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# 파일명: qt_lazy_tabs.py
+# 설명: 탭 지연 생성 - 자리표시자 위젯 + 탭 모듈 지연 import
+# 생성일: 2025-10-31
+#
+# 시작 시에는 TAB_CONFIGURATIONS 항목마다 빈 LazyTabPlaceholder만 만들고,
+# 실제 탭 모듈(qt_TabView_*)과 그 Search_* 모듈은 탭이 처음 표시되거나
+# qt_data_transfer_manager로 데이터를 받을 때 import/생성합니다.
+
+import importlib
+
+from PySide6.QtWidgets import QWidget
+
+# TAB_CONFIGURATIONS 키 → (모듈 이름, 탭 클래스 이름)
+TAB_CLASS_PATHS = {
+    "NLK_SEARCH": ("qt_TabView_NLK", "QtNLKSearchTab"),
+    "NDL_SEARCH": ("qt_TabView_NDL", "QtNDLSearchTab"),
+    "WESTERN_SEARCH": ("qt_TabView_Western", "QtWesternSearchTab"),
+    "GLOBAL_SEARCH": ("qt_TabView_Global", "QtGlobalSearchTab"),
+    "LEGAL_DEPOSIT_SEARCH": ("qt_TabView_LegalDeposit", "QtLegalDepositSearchTab"),
+    "AI_FEED_SEARCH": ("qt_TabView_AIFeed", "QtAIFeedSearchTab"),
+    "KAC_AUTHORITIES_SEARCH": ("qt_TabView_KACAuthorities", "QtKACAuthoritiesSearchTab"),
+    "BRIEF_WORKS_SEARCH": ("qt_TabView_BriefWorks", "QtBriefWorksSearchTab"),
+    "ISNI_DETAILED_SEARCH": ("qt_TabView_ISNI_Detailed", "QtISNIDetailedSearchTab"),
+    "KSH_HYBRID_SEARCH": ("qt_TabView_KSH_Lite", "QtKshHyridSearchTab"),
+    "KSH_LOCAL_SEARCH": ("qt_TabView_KSH_Local", "QtKSHLocalSearchTab"),
+    "MARC_EXTRACTOR": ("qt_TabView_MARC_Extractor", "QtMARCExtractorTab"),
+    "MARC_EDITOR": ("qt_TabView_MARC_Editor", "QtMARCEditorTab"),
+    "DEWEY_SEARCH": ("qt_TabView_Dewey", "QtDeweySearchTab"),
+    "PYTHON_TAB": ("qt_TabView_Python", "QtPythonTab"),
+    "SETTINGS": ("qt_TabView_Settings", "QtSettingsTab"),
+    "GEMINI_DDC_SEARCH": ("qt_TabView_Gemini", "QtGeminiTab"),
+    "AUTHOR_CHECK_SEARCH": ("qt_TabView_Author_Check", "QtAuthorCheckTab"),
+}
+
+# 다른 탭이 app_instance 속성으로 참조하는 탭 (키 → 속성 이름)
+APP_INSTANCE_TAB_ATTRS = {
+    "MARC_EXTRACTOR": "marc_extractor_tab",
+    "MARC_EDITOR": "marc_editor_tab",
+}
+
+
+def load_tab_class(tab_key):
+    """탭 키에 해당하는 클래스를 반환합니다 (모듈은 이때 처음 import)."""
+    module_name, class_name = TAB_CLASS_PATHS[tab_key]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def find_tab_key(tab_configs, tab_name):
+    """tab_name으로 TAB_CONFIGURATIONS 키를 찾습니다 (없으면 None)."""
+    for key, config in tab_configs.items():
+        if config.get("tab_name") == tab_name:
+            return key
+    return None
+
+
+def register_tab_instance(app_instance, tab_key, tab_name, tab):
+    """새로 생성된 탭을 앱에 등록: 상호 참조 속성 설정 + 저장된 스플리터 크기 복구."""
+    attr = APP_INSTANCE_TAB_ATTRS.get(tab_key)
+    if attr:
+        setattr(app_instance, attr, tab)
+
+    main_window = getattr(app_instance, "main_window", None)
+    if main_window is not None and hasattr(main_window, "restore_tab_layout"):
+        main_window.restore_tab_layout(tab_name, tab)
+
+
+class LazyTabPlaceholder(QWidget):
+    """실제 탭이 만들어지기 전까지 탭 자리를 차지하는 빈 위젯."""
+
+    def __init__(self, tab_key, config, parent=None):
+        super().__init__(parent)
+        self.tab_key = tab_key
+        self.config = config
+
+    @property
+    def tab_name(self):
+        return self.config.get("tab_name", "Untitled")
+
+    def create_tab(self, app_instance):
+        """실제 탭 인스턴스를 생성합니다 (호출 측에서 자리표시자와 교체)."""
+        TabClass = load_tab_class(self.tab_key)
+        app_instance.log_message(
+            f"🔨 탭 지연 생성: '{self.tab_name}' ({TabClass.__name__})", "DEBUG"
+        )
+        return TabClass(self.config, app_instance)
@@ -3,11 +3,31 @@
 """
 파일명: qt_main_app.py
 설명: Qt/PySide6 기반 통합 서지검색 시스템 메인 애플리케이션
-버전: 2.1.0
+버전: 2.2.3
 생성일: 2025-09-23
-수정일: 2025-10-18
+수정일: 2025-10-31
 
 변경 이력:
+v2.2.3 (2025-10-31)
+- 시작 시 VectorDDCManager 생성/벡터 모델 프리로드 제거 (v2.2.1 되돌림)
+  : 런타임 검색 경로(듀이/KSH/Gemini)는 search_ddc_by_multiple_keywords만 사용하므로
+    faiss/torch/SentenceTransformer를 백그라운드에서 읽어도 쓰이는 곳이 없었음
+
+v2.2.2 (2025-10-31)
+- 사용하지 않던 wait_for_warmup import 제거 (첫 검색 대기는 SearchCommonManager.wait_for_db_warmup)
+
+v2.2.1 (2025-10-31)
+- [성능 개선] DDC 벡터 인덱스(ddc_index_from_json.faiss)가 있으면 VectorDDCManager 사용
+  : mapping_data 워밍업 직후 벡터 인덱스/SentenceTransformer 모델 백그라운드 프리로드
+
+v2.2.0 (2025-10-31)
+- [성능 개선] 시작 import 계측 모드 (lazy_imports.ImportTimeProfiler, --profile-imports)
+- [성능 개선] 탭 지연 생성 (qt_lazy_tabs)
+  : 시작 시 TAB_CONFIGURATIONS 항목마다 LazyTabPlaceholder만 추가, 탭 모듈 import 제거
+  : 처음 표시(on_tab_changed)되거나 get_tab_by_name()으로 데이터를 받을 때 실제 탭 생성
+  : restore_tab_layout() 분리 - 늦게 생성된 탭도 저장된 스플리터 크기 복구
+  : qt_Tab_configs의 검색 함수도 첫 검색 시 import (_LazySearchFunction)
+
 v2.1.0 (2025-10-18)
 - [기능 추가] 모든 탭의 QSplitter 자동 저장/복구 기능 통합
   : save_layout_settings()에 모든 탭 스플리터 저장 로직 추가
@@ -32,6 +52,13 @@ v2.0.1 (2025-10-02)
   : BaseSearchTab 기반 탭의 search_thread도 안전하게 종료
 - [효과] 앱 종료 시 "QThread: Destroyed while thread is still running" 경고 제거
 """
+# ✅ [성능 개선] 시작 계측 모드(KAC_IMPORT_PROFILE=1 또는 --profile-imports):
+# 모듈별 import 시간을 기록해 앱 로그에 표시 (다른 import보다 먼저 시작해야 함)
+import lazy_imports
+
+if lazy_imports.import_profiling_requested():
+    lazy_imports.start_import_profiler()
+
 import sys
 import re
 import os
@@ -73,32 +100,20 @@ from ui_constants import U
 
 # 프로젝트 모듈 import
 from database_manager import DatabaseManager
-from db_perf_tweaks import warm_up_queries, wait_for_warmup  # ✅ WAL 워밍업 유틸
+from db_perf_tweaks import warm_up_queries  # ✅ WAL 워밍업 유틸 (대기는 SearchCommonManager.wait_for_db_warmup)
 from qt_shortcuts import show_shortcuts_help
 from qt_utils import (
     apply_dark_title_bar,
     enable_modal_close_on_outside_click,
     linkify_text,
 )
-from qt_TabView_NDL import QtNDLSearchTab
-from qt_TabView_Global import QtGlobalSearchTab
-from qt_TabView_Western import QtWesternSearchTab
-from qt_TabView_LegalDeposit import QtLegalDepositSearchTab
-from qt_TabView_AIFeed import QtAIFeedSearchTab
-from qt_TabView_KACAuthorities import QtKACAuthoritiesSearchTab
-from qt_TabView_BriefWorks import QtBriefWorksSearchTab
-from qt_TabView_KSH_Lite import QtKshHyridSearchTab
-from qt_TabView_ISNI_Detailed import QtISNIDetailedSearchTab
-from qt_TabView_NLK import QtNLKSearchTab
-from qt_TabView_KSH_Local import QtKSHLocalSearchTab
-from qt_TabView_MARC_Extractor import QtMARCExtractorTab
-from qt_TabView_MARC_Editor import QtMARCEditorTab
-from qt_TabView_Dewey import QtDeweySearchTab
-from qt_TabView_Settings import QtSettingsTab
-from qt_TabView_Python import QtPythonTab
+# ✅ [성능 개선] 탭 모듈(qt_TabView_*)은 탭이 처음 필요할 때 qt_lazy_tabs가 import
+from qt_lazy_tabs import (
+    TAB_CLASS_PATHS,
+    LazyTabPlaceholder,
+    register_tab_instance,
+)
 from qt_context_menus import setup_widget_context_menu
-from qt_TabView_Gemini import QtGeminiTab
-from qt_TabView_Author_Check import QtAuthorCheckTab
 
 
 def ensure_sqlite_db(db_path: str, schema_sql: str | None = None) -> None:
@@ -279,11 +294,16 @@ class IntegratedSearchApp:
                 # ksh_korean 인덱스 워밍업 (FTS5 사용하므로 가벼운 쿼리만)
                 "SELECT identifier, ksh_korean FROM mapping_data WHERE ksh_korean LIKE '태%' LIMIT 1",
             ]
+            # ✅ [성능 개선] 적응형 워밍업: 지난 실행에서 검색이 읽은 B-tree 페이지를 예산 내 예열
+            planners = getattr(db_manager, "warmup_planners", {})
+            if planners:
+                db_manager.configure_warmup_budget()
             warm_up_queries(
                 lambda: db_manager._get_mapping_connection(),
                 extra_queries=mapping_warmup_queries,
                 delay_sec=0.0,
                 warmup_key="mapping_data",  # 첫 검색 시 대기할 키
+                planner=planners.get("mapping_data"),
             )
 
             # KSH Concept DB 워밍업
@@ -296,6 +316,7 @@ class IntegratedSearchApp:
                 extra_queries=ksh_warmup_queries,
                 delay_sec=0.0,
                 warmup_key="concepts",
+                planner=planners.get("concepts"),
             )
 
         except Exception as e:
@@ -421,6 +442,12 @@ class IntegratedSearchApp:
         # 초기화 완료 메시지
         self.log_message("통합 서지검색 시스템이 시작되었습니다.", "INFO")
 
+        # ✅ [성능 개선] 시작 계측 모드: 모듈별 import 시간 상위 목록을 로그에 표시
+        import_profiler = lazy_imports.stop_import_profiler()
+        if import_profiler is not None:
+            for line in import_profiler.report_lines():
+                self.log_message(line, "INFO")
+
         # ✅ 스플래시 최소 표시 시간 보장 (총 1.5초)
         time.sleep(1.0)  # 추가 1초 대기
         app.processEvents()
@@ -631,47 +658,51 @@ class MainApplicationWindow(QMainWindow):
 
         # 일반 탭 위젯 모드일 때만 탭 생성
         if self.tab_widget is not None:
-            # 각 탭 클래스를 쉽게 찾을 수 있도록 매핑
-            tab_class_map = {
-                "NLK_SEARCH": QtNLKSearchTab,
-                "NDL_SEARCH": QtNDLSearchTab,
-                "WESTERN_SEARCH": QtWesternSearchTab,
-                "GLOBAL_SEARCH": QtGlobalSearchTab,
-                "LEGAL_DEPOSIT_SEARCH": QtLegalDepositSearchTab,
-                "AI_FEED_SEARCH": QtAIFeedSearchTab,
-                "KAC_AUTHORITIES_SEARCH": QtKACAuthoritiesSearchTab,
-                "BRIEF_WORKS_SEARCH": QtBriefWorksSearchTab,
-                "ISNI_DETAILED_SEARCH": QtISNIDetailedSearchTab,
-                "KSH_HYBRID_SEARCH": QtKshHyridSearchTab,
-                "KSH_LOCAL_SEARCH": QtKSHLocalSearchTab,
-                "MARC_EXTRACTOR": QtMARCExtractorTab,
-                "MARC_EDITOR": QtMARCEditorTab,
-                "DEWEY_SEARCH": QtDeweySearchTab,
-                "PYTHON_TAB": QtPythonTab,
-                "SETTINGS": QtSettingsTab,
-                "GEMINI_DDC_SEARCH": QtGeminiTab,
-                "AUTHOR_CHECK_SEARCH": QtAuthorCheckTab,
-            }
-            # 중앙 설정(TAB_CONFIGURATIONS)을 순회하며 동적으로 탭 생성
+            # ✅ [성능 개선] 중앙 설정(TAB_CONFIGURATIONS) 순서대로 자리표시자만 추가하고,
+            # 실제 탭은 처음 표시되거나 데이터를 받을 때 _materialize_tab()에서 생성
             for key, config in TAB_CONFIGURATIONS.items():
-                if key in tab_class_map:
-                    TabClass = tab_class_map[key]
-                    tab_instance = TabClass(config, self.app_instance)
+                if key in TAB_CLASS_PATHS:
                     self.tab_widget.addTab(
-                        tab_instance, config.get("tab_name", "Untitled")
+                        LazyTabPlaceholder(key, config),
+                        config.get("tab_name", "Untitled"),
                     )
 
-            # ✅ [추가] 탭 인스턴스 생성 후, 상호 참조를 위해 app_instance에 등록합니다.
-            for i in range(self.tab_widget.count()):
-                widget = self.tab_widget.widget(i)
-                if isinstance(widget, QtMARCExtractorTab):
-                    self.app_instance.marc_extractor_tab = widget
-                elif isinstance(widget, QtMARCEditorTab):
-                    self.app_instance.marc_editor_tab = widget
-
             # 탭 변경 이벤트 연결
             self.tab_widget.currentChanged.connect(self.on_tab_changed)
 
+            # 시작 시 보이는 첫 탭만 생성
+            self._materialize_tab(self.tab_widget.currentIndex())
+
+    def _materialize_tab(self, index):
+        """✅ [성능 개선] index 위치가 자리표시자면 실제 탭으로 교체하고, 탭 위젯을 반환합니다."""
+        widget = self.tab_widget.widget(index)
+        if not isinstance(widget, LazyTabPlaceholder):
+            return widget
+
+        tab_name = self.tab_widget.tabText(index)
+        try:
+            tab = widget.create_tab(self.app_instance)
+        except Exception as e:
+            import traceback
+
+            self.app_instance.log_message(
+                f"❌ '{tab_name}' 탭 생성 실패: {e}\n{traceback.format_exc()}", "ERROR"
+            )
+            return None
+
+        # 교체 중 currentChanged가 다시 들어오지 않도록 시그널 차단
+        was_current = self.tab_widget.currentIndex() == index
+        was_blocked = self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, tab, tab_name)
+        if was_current:
+            self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(was_blocked)
+        widget.deleteLater()
+
+        register_tab_instance(self.app_instance, widget.tab_key, tab_name, tab)
+        return tab
+
     def setup_menu_and_toolbar(self):
         """메뉴바와 툴바 설정"""
         menubar = self.menuBar()
@@ -837,6 +868,10 @@ class MainApplicationWindow(QMainWindow):
 
     def on_tab_changed(self, index):
         """✅ [모델/뷰 전환] 탭 변경 이벤트"""
+        if index < 0:
+            return
+        # ✅ [성능 개선] 처음 표시되는 탭이면 이 시점에 생성
+        self._materialize_tab(index)
         tab_name = self.tab_widget.tabText(index)
         clean_name = tab_name.replace("📚 ", "").replace("🇯🇵 ", "").replace("🇩🇪 ", "")
         self.app_instance.log_message(f"'{clean_name}' 탭으로 전환되었습니다.", "INFO")
@@ -931,13 +966,12 @@ class MainApplicationWindow(QMainWindow):
             # 탭 모드
             for i in range(self.tab_widget.count()):
                 if self.tab_widget.tabText(i) == name:
-                    return self.tab_widget.widget(i)
+                    # ✅ [성능 개선] 아직 자리표시자면 여기서 생성 (데이터 전송 대상 등)
+                    return self._materialize_tab(i)
         elif self.tree_navigation is not None:
-            # 트리메뉴 모드: 사전 로딩된 탭 찾기
-            # ✅ [수정] 사전 로딩 도입으로 모든 탭이 이미 생성되어 있음
-            # 자동 생성 로직 제거 (불필요)
-            if hasattr(self.tree_navigation, "tab_widgets"):
-                return self.tree_navigation.tab_widgets.get(name)
+            # 트리메뉴 모드: 없으면 지연 생성
+            if hasattr(self.tree_navigation, "get_or_create_tab"):
+                return self.tree_navigation.get_or_create_tab(name)
         return None
 
     # 메뉴 액션들
@@ -1230,64 +1264,13 @@ class MainApplicationWindow(QMainWindow):
                         self.bottom_splitter.setSizes(actual_sizes)
 
             # ✅ 각 탭의 QSplitter 설정 복구 (탭 모드/트리메뉴 모드 공통)
+            # (아직 생성되지 않은 탭은 생성 시 restore_tab_layout()으로 개별 복구)
             if tab_names:
                 for tab_name in tab_names:
                     tab = tabs_dict.get(tab_name)
                     if not tab:
                         continue
-
-                    # Gemini 탭: main_splitter
-                    if hasattr(tab, "main_splitter"):
-                        sizes = self.layout_settings_manager.load_splitter_sizes(
-                            tab_name, "main", [400, 200]
-                        )
-                        if sizes:
-                            tab.main_splitter.setSizes(sizes)
-
-                    # KSH_Local 탭: results_splitter
-                    if hasattr(tab, "results_splitter"):
-                        sizes = self.layout_settings_manager.load_splitter_sizes(
-                            tab_name, "results", [500, 500]
-                        )
-                        if sizes:
-                            tab.results_splitter.setSizes(sizes)
-
-                    # MARC_Extractor 탭: v_splitter, h_splitter
-                    if hasattr(tab, "v_splitter"):
-                        sizes = self.layout_settings_manager.load_splitter_sizes(
-                            tab_name, "vertical", [350, 450]
-                        )
-                        if sizes:
-                            tab.v_splitter.setSizes(sizes)
-
-                    if hasattr(tab, "h_splitter"):
-                        sizes = self.layout_settings_manager.load_splitter_sizes(
-                            tab_name, "horizontal", [500, 500]
-                        )
-                        if sizes:
-                            tab.h_splitter.setSizes(sizes)
-
-                    # Dewey 탭: master_splitter, left_content_splitter, right_content_splitter
-                    if hasattr(tab, "master_splitter"):
-                        sizes = self.layout_settings_manager.load_splitter_sizes(
-                            tab_name, "master", [600, 800]
-                        )
-                        if sizes:
-                            tab.master_splitter.setSizes(sizes)
-
-                    if hasattr(tab, "left_content_splitter"):
-                        sizes = self.layout_settings_manager.load_splitter_sizes(
-                            tab_name, "left_content", [500, 300]
-                        )
-                        if sizes:
-                            tab.left_content_splitter.setSizes(sizes)
-
-                    if hasattr(tab, "right_content_splitter"):
-                        sizes = self.layout_settings_manager.load_splitter_sizes(
-                            tab_name, "right_content", [500, 300]
-                        )
-                        if sizes:
-                            tab.right_content_splitter.setSizes(sizes)
+                    self.restore_tab_layout(tab_name, tab)
             else:
                 self.app_instance.log_message(
                     "ℹ️ 트리메뉴 모드: 탭 스플리터 설정은 탭 생성 시 개별 복구됩니다.",
@@ -1332,6 +1315,64 @@ class MainApplicationWindow(QMainWindow):
         except Exception as e:
             self.app_instance.log_message(f"❌ 레이아웃 설정 복구 실패: {e}", "ERROR")
 
+    def restore_tab_layout(self, tab_name, tab):
+        """탭 하나의 저장된 QSplitter 크기를 복구합니다. (탭 지연 생성 시에도 호출)"""
+        if not hasattr(self, "layout_settings_manager"):
+            return  # 앱 시작 직후: restore_layout_settings()에서 일괄 복구
+
+        # Gemini 탭: main_splitter
+        if hasattr(tab, "main_splitter"):
+            sizes = self.layout_settings_manager.load_splitter_sizes(
+                tab_name, "main", [400, 200]
+            )
+            if sizes:
+                tab.main_splitter.setSizes(sizes)
+
+        # KSH_Local 탭: results_splitter
+        if hasattr(tab, "results_splitter"):
+            sizes = self.layout_settings_manager.load_splitter_sizes(
+                tab_name, "results", [500, 500]
+            )
+            if sizes:
+                tab.results_splitter.setSizes(sizes)
+
+        # MARC_Extractor 탭: v_splitter, h_splitter
+        if hasattr(tab, "v_splitter"):
+            sizes = self.layout_settings_manager.load_splitter_sizes(
+                tab_name, "vertical", [350, 450]
+            )
+            if sizes:
+                tab.v_splitter.setSizes(sizes)
+
+        if hasattr(tab, "h_splitter"):
+            sizes = self.layout_settings_manager.load_splitter_sizes(
+                tab_name, "horizontal", [500, 500]
+            )
+            if sizes:
+                tab.h_splitter.setSizes(sizes)
+
+        # Dewey 탭: master_splitter, left_content_splitter, right_content_splitter
+        if hasattr(tab, "master_splitter"):
+            sizes = self.layout_settings_manager.load_splitter_sizes(
+                tab_name, "master", [600, 800]
+            )
+            if sizes:
+                tab.master_splitter.setSizes(sizes)
+
+        if hasattr(tab, "left_content_splitter"):
+            sizes = self.layout_settings_manager.load_splitter_sizes(
+                tab_name, "left_content", [500, 300]
+            )
+            if sizes:
+                tab.left_content_splitter.setSizes(sizes)
+
+        if hasattr(tab, "right_content_splitter"):
+            sizes = self.layout_settings_manager.load_splitter_sizes(
+                tab_name, "right_content", [500, 300]
+            )
+            if sizes:
+                tab.right_content_splitter.setSizes(sizes)
+
     def save_layout_settings(self):
         """
         현재 레이아웃 설정을 저장합니다. (앱 종료 시 호출)
@@ -1450,15 +1491,12 @@ class MainApplicationWindow(QMainWindow):
     def handle_kac_to_brief_works_search(self, kac_code):
         """'저자전거' 탭에서 받은 KAC 코드로 '간략 저작물 정보' 탭에서 검색을 실행합니다."""
         target_tab_name = "간략 저작물 정보"  # qt_Tab_configs.py에 정의된 이름
-        brief_works_tab = None
-
-        # 1. '간략 저작물 정보' 탭 찾기
-        for i in range(self.tab_widget.count()):
-            if self.tab_widget.tabText(i) == target_tab_name:
-                brief_works_tab = self.tab_widget.widget(i)
-                # 2. 해당 탭으로 화면 전환
-                self.tab_widget.setCurrentWidget(brief_works_tab)
-                break
+
+        # 1. '간략 저작물 정보' 탭 찾기 (지연 생성 탭이면 이때 생성)
+        brief_works_tab = self.get_tab_by_name(target_tab_name)
+        if brief_works_tab is not None:
+            # 2. 해당 탭으로 화면 전환
+            self.switch_to_tab_by_name(target_tab_name)
 
         # 3. 해당 탭의 검색 실행 메서드 호출
         if brief_works_tab and hasattr(brief_works_tab, "search_by_kac_code"):
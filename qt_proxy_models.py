@@ -3,8 +3,12 @@
 
 import re
 from enum import Enum, auto
+import pandas as pd
 from PySide6.QtCore import QSortFilterProxyModel, Qt
 
+_DIGITS_RE = re.compile(r"[0-9]+")
+NATURAL_DIGIT_WIDTH = 20  # 숫자 구간을 이 폭으로 0-패딩 → 문자열 비교 = 자연 정렬
+
 
 # 헬퍼 함수 정의 (SearchResultModel 클래스 외부에 추가)
 def natural_sort_key(s):
@@ -24,6 +28,164 @@ class SortType(Enum):
     NATURAL = auto()
 
 
+def natural_sort_text(s):
+    """자연 정렬용 고정폭 문자열 키 ("abc12" → "abc000...012").
+
+    숫자 구간을 같은 폭으로 0-패딩하므로 일반 문자열 비교만으로
+    natural_sort_key()와 같은 순서가 되어 배열 단위 argsort가 가능합니다.
+    """
+    return _DIGITS_RE.sub(
+        lambda m: m.group().zfill(NATURAL_DIGIT_WIDTH), str(s).lower()
+    )
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def sort_keys(values, sort_type):
+    """✅ [성능 개선] 컬럼 값으로 정렬 키 컬럼(pandas Series)을 만듭니다.
+
+    문자열 키는 object dtype으로 두어 고정폭 유니코드 배열로 복사하지 않습니다
+    (긴 텍스트 컬럼 하나 때문에 행 수 × 최대 길이만큼 메모리를 잡던 문제 방지).
+    """
+    if sort_type == SortType.NUMERIC:
+        return pd.Series([_to_float(v) for v in values], dtype="float64")
+    if sort_type == SortType.NATURAL:
+        return pd.Series([natural_sort_text(v) for v in values], dtype=object)
+    return pd.Series([str(v).lower() for v in values], dtype=object)  # SortType.TEXT
+
+
+def keys_permutation(keys, descending=False):
+    """정렬 키 컬럼의 안정(stable) argsort → 순열(permutation[new_row] = old_row).
+
+    내림차순도 동순위의 기존 순서를 유지합니다. 이미 정렬된 구간 뒤에 새 행이
+    붙은 키는 안정 정렬(timsort/mergesort)이 정렬된 구간을 그대로 활용합니다.
+    """
+    n = len(keys)
+    if descending:
+        # 뒤집은 키의 안정 정렬을 다시 뒤집으면 동순위는 원래 순서 유지
+        order = keys.iloc[::-1].argsort(kind="stable").to_numpy()[::-1]
+        return (n - 1 - order).tolist()
+    return keys.argsort(kind="stable").to_numpy().tolist()
+
+
+def analyze_sort_type(values, sample_size=100):
+    """값 샘플로 정렬 유형(TEXT, NUMERIC, NATURAL)을 결정합니다.
+
+    GUI 객체에 접근하지 않으므로 워커 스레드에서도 호출할 수 있습니다.
+    """
+    has_numbers, has_letters = False, False
+    all_numeric = True  # 모두 숫자라고 가정하고 시작
+
+    for value in values[:sample_size]:
+        data = str(value or "").strip()
+        if not data:
+            continue
+
+        # ✅ [핵심 로직] 현재 값이 숫자인지 확인. 아니라면 all_numeric 플래그를 False로 설정
+        if all_numeric:
+            try:
+                float(data)
+            except (ValueError, TypeError):
+                all_numeric = False
+
+        if not has_numbers and any(c.isdigit() for c in data):
+            has_numbers = True
+        if not has_letters and any(c.isalpha() for c in data):
+            has_letters = True
+
+    # --- 정렬 유형 결정 ---
+    if all_numeric and has_numbers:
+        return SortType.NUMERIC
+    elif has_numbers and has_letters:
+        return SortType.NATURAL
+    return SortType.TEXT
+
+
+class ColumnFilterIndex:
+    """✅ [성능 개선] 컬럼별 값 → 원본 행 목록 인덱스 (엑셀식 헤더 필터용).
+
+    컬럼을 처음 필터링할 때 한 번만 훑어 인덱스를 만들고, 이후에는
+    고유값 목록·체크박스 필터·텍스트 필터가 모두 인덱스만으로 계산됩니다.
+    행 마스크는 행당 1바이트(0/1) bytearray이며, 여러 컬럼은 정수 AND로 교집합합니다.
+    원본 데이터가 바뀌면(적재/추가/정렬 순열/편집) invalidate()로 비웁니다.
+    """
+
+    def __init__(self):
+        self._columns = {}  # column -> {값: [원본 행, ...]}
+        self._lowered = {}  # column -> [(소문자 값, 행 목록), ...] (텍스트 필터용)
+
+    def invalidate(self):
+        self._columns.clear()
+        self._lowered.clear()
+
+    def _column_index(self, source_model, column):
+        index = self._columns.get(column)
+        if index is not None:
+            return index
+
+        if hasattr(source_model, "get_column_values"):
+            values = source_model.get_column_values(column)
+        else:
+            values = [
+                str(source_model.data(source_model.index(row, column), Qt.DisplayRole) or "")
+                for row in range(source_model.rowCount())
+            ]
+
+        index = {}
+        for row, value in enumerate(values):
+            rows = index.get(value)
+            if rows is None:
+                index[value] = [row]
+            else:
+                rows.append(row)
+        self._columns[column] = index
+        return index
+
+    def unique_values(self, source_model, column):
+        """빈 값을 제외한 정렬된 고유값 목록 (인덱스 키 그대로)."""
+        return sorted(value for value in self._column_index(source_model, column) if value != "")
+
+    def _matching_rows(self, source_model, column, filter_values):
+        index = self._column_index(source_model, column)
+        if isinstance(filter_values, str):
+            # 텍스트 필터: 행이 아니라 고유값에 대해서만 부분 일치 검사
+            lowered = self._lowered.get(column)
+            if lowered is None:
+                lowered = [(value.lower(), rows) for value, rows in index.items()]
+                self._lowered[column] = lowered
+            needle = filter_values.lower()
+            return [rows for value, rows in lowered if needle in value]
+        # 체크박스 필터: 선택된 값의 행 목록을 바로 꺼냄
+        return [index[value] for value in set(filter_values) if value in index]
+
+    def row_mask(self, source_model, filters):
+        """활성 필터 전체를 AND한 원본 행 마스크. 필터가 없으면 None."""
+        row_count = source_model.rowCount()
+        column_count = source_model.columnCount()
+        combined = None
+        for column, filter_values in filters.items():
+            if column >= column_count:
+                continue
+            mask = bytearray(row_count)
+            for rows in self._matching_rows(source_model, column, filter_values):
+                for row in rows:
+                    mask[row] = 1
+            if combined is None:
+                combined = mask
+            else:
+                combined = bytearray(
+                    (
+                        int.from_bytes(combined, "little") & int.from_bytes(mask, "little")
+                    ).to_bytes(row_count, "little")
+                )
+        return combined
+
+
 class SmartNaturalSortProxyModel(QSortFilterProxyModel):
     """
     [업그레이드] 숫자, 자연정렬, 텍스트를 자동 감지하는 스마트 정렬 프록시 모델
@@ -38,9 +200,101 @@ class SmartNaturalSortProxyModel(QSortFilterProxyModel):
         self._sort_type = SortType.TEXT  # ✅ 현재 정렬 유형 저장
         # ✅ [추가] 컬럼별 필터 텍스트를 저장할 딕셔너리
         self.column_filters = {}
+        # ✅ [성능 개선] 헤더 필터: 값 인덱스 + 미리 계산한 원본 행 마스크
+        self._filter_index = ColumnFilterIndex()
+        self._row_mask = None
+        # ✅ [성능 개선] 컬럼형 정렬 키 (원본 현재 행 순서와 같은 순서, 추가 행 병합용)
+        self._sort_keys = None
+
+    def setSourceModel(self, source_model):
+        previous = self.sourceModel()
+        if previous is not None:
+            for signal, slot in self._source_connections(previous):
+                try:
+                    signal.disconnect(slot)
+                except (RuntimeError, TypeError):
+                    pass
+        super().setSourceModel(source_model)
+        self._filter_index.invalidate()
+        self._row_mask = None
+        self._sort_keys = None
+        if source_model is not None:
+            # 프록시 내부 처리 뒤에 호출되므로, 새 행/새 순서에 맞춰 마스크만 다시 계산
+            for signal, slot in self._source_connections(source_model):
+                signal.connect(slot)
+
+    def _source_connections(self, source_model):
+        return (
+            (source_model.modelReset, self._on_source_values_changed),
+            (source_model.rowsInserted, self._on_source_rows_inserted),
+            (source_model.rowsRemoved, self._on_source_values_changed),
+            (source_model.layoutChanged, self._on_source_data_changed),
+            (source_model.dataChanged, self._on_source_values_changed),
+        )
+
+    def _on_source_values_changed(self, *args):
+        self._sort_keys = None  # 값/행이 바뀌었으므로 다음 병합 때 키를 다시 계산
+        self._on_source_data_changed()
+
+    def _on_source_rows_inserted(self, parent, first, last):
+        """✅ [성능 개선] 컬럼형 정렬 중에 끝에 추가된 행(점진 적재/더 보기)을 정렬 위치로 병합.
+
+        정렬 표시가 켜진 채 새 행이 맨 아래에 정렬되지 않고 쌓이지 않도록,
+        기존 행의 키는 재사용하고 새 행의 키만 만들어 안정 정렬로 합칩니다.
+        """
+        source_model = self.sourceModel()
+        if self._sort_column >= 0 and hasattr(source_model, "apply_row_permutation"):
+            if self._merge_appended_rows(source_model, first, last):
+                return  # apply_row_permutation()의 layoutChanged가 마스크를 갱신함
+        self._on_source_data_changed()
+
+    def _on_source_data_changed(self, *args):
+        self._filter_index.invalidate()
+        if self.column_filters:
+            self._refresh_row_mask()
+
+    def _refresh_row_mask(self):
+        source_model = self.sourceModel()
+        if source_model is None or not self.column_filters:
+            self._row_mask = None
+        else:
+            self._row_mask = self._filter_index.row_mask(source_model, self.column_filters)
+        self.invalidateFilter()
+
+    def set_value_filters(self, filters):
+        """✅ [성능 개선] 헤더 필터 적용: {컬럼: [값,...](완전 일치) | "텍스트"(부분 일치)}.
+
+        행마다 data()/setRowHidden()을 호출하지 않고 인덱스로 마스크를 만든 뒤
+        filterAcceptsRow()가 마스크만 조회합니다. 표시되는 행 수를 반환합니다.
+        """
+        self.column_filters = dict(filters)
+        self._refresh_row_mask()
+        return self.rowCount()
+
+    def accepted_row_mask(self):
+        """현재 헤더 필터의 원본 행 마스크 (필터가 없으면 None). 읽기 전용으로 사용."""
+        return self._row_mask
+
+    def unique_values(self, column):
+        """필터 메뉴용 고유값 목록 (인덱스를 재사용하므로 메뉴를 다시 열어도 재스캔 없음)."""
+        source_model = self.sourceModel()
+        if source_model is None:
+            return []
+        return self._filter_index.unique_values(source_model, column)
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        mask = self._row_mask
+        if mask is None:
+            return super().filterAcceptsRow(source_row, source_parent)
+        return source_row < len(mask) and mask[source_row] == 1
 
     def sort(self, column, order):
         """정렬 시작 전, 컬럼 유형을 분석하고 정렬 키 캐시를 생성합니다."""
+        source_model = self.sourceModel()
+        if hasattr(source_model, "apply_row_permutation"):
+            self._sort_columnar(source_model, column, order)
+            return
+
         self._sort_column = column
         self._sort_order = order
         # ✅ 컬럼 유형 분석 결과를 self._sort_type에 저장
@@ -49,6 +303,48 @@ class SmartNaturalSortProxyModel(QSortFilterProxyModel):
         self._build_sort_key_cache()
         super().sort(column, order)
 
+    def _sort_columnar(self, source_model, column, order):
+        """✅ [성능 개선] 컬럼형 원본 모델: 컬럼 배열로 순열을 계산해 원본에 한 번에 적용.
+
+        프록시 자체는 정렬하지 않으므로(lessThan 호출 없음) 필터만 담당합니다.
+        column < 0 이면 적재 당시 순서로 되돌립니다.
+        """
+        if column < 0:
+            self._sort_column = -1
+            self._sort_keys = None
+            source_model.restore_original_order()
+            return
+
+        self._sort_column = column
+        self._sort_order = order
+        self._sort_type = self._analyze_column_sort_type(column)
+        keys = sort_keys(source_model.get_column_values(column), self._sort_type)
+        self._apply_sorted_keys(source_model, keys)
+
+    def _apply_sorted_keys(self, source_model, keys):
+        """키 컬럼을 정렬해 원본에 순열을 적용하고, 정렬된 키를 다음 병합용으로 보관합니다.
+
+        순열이 그대로(이미 정렬됨)이면 아무것도 적용하지 않고 False를 반환합니다.
+        """
+        permutation = keys_permutation(
+            keys, descending=(self._sort_order == Qt.DescendingOrder)
+        )
+        self._sort_keys = keys.take(permutation).reset_index(drop=True)
+        if all(old_row == new_row for new_row, old_row in enumerate(permutation)):
+            return False
+        source_model.apply_row_permutation(permutation)
+        return True
+
+    def _merge_appended_rows(self, source_model, first, last):
+        values = source_model.get_column_values(self._sort_column)
+        keys = self._sort_keys
+        if keys is None or len(keys) != first or last + 1 != len(values):
+            keys = sort_keys(values, self._sort_type)
+        else:
+            new_keys = sort_keys(values[first : last + 1], self._sort_type)
+            keys = pd.concat([keys, new_keys], ignore_index=True)
+        return self._apply_sorted_keys(source_model, keys)
+
     def _build_sort_key_cache(self):
         """분석된 정렬 유형에 따라 최적화된 정렬 키를 미리 계산하여 캐시에 저장합니다."""
         self._sort_key_cache.clear()
@@ -94,35 +390,11 @@ class SmartNaturalSortProxyModel(QSortFilterProxyModel):
             return SortType.TEXT
 
         sample_size = min(100, source_model.rowCount())
-        has_numbers, has_letters = False, False
-        all_numeric = True  # 모두 숫자라고 가정하고 시작
-
-        for row in range(sample_size):
-            data = str(
-                source_model.data(source_model.index(row, column), Qt.DisplayRole) or ""
-            ).strip()
-            if not data:
-                continue
-
-            # ✅ [핵심 로직] 현재 값이 숫자인지 확인. 아니라면 all_numeric 플래그를 False로 설정
-            if all_numeric:
-                try:
-                    float(data)
-                except (ValueError, TypeError):
-                    all_numeric = False
-
-            if not has_numbers and any(c.isdigit() for c in data):
-                has_numbers = True
-            if not has_letters and any(c.isalpha() for c in data):
-                has_letters = True
-
-        # --- 정렬 유형 결정 ---
-        if all_numeric and has_numbers:
-            result_type = SortType.NUMERIC
-        elif has_numbers and has_letters:
-            result_type = SortType.NATURAL
-        else:
-            result_type = SortType.TEXT
+        values = [
+            source_model.data(source_model.index(row, column), Qt.DisplayRole)
+            for row in range(sample_size)
+        ]
+        result_type = analyze_sort_type(values, sample_size)
 
         self._column_analysis_cache[column] = result_type
 
@@ -138,6 +410,7 @@ class SmartNaturalSortProxyModel(QSortFilterProxyModel):
         """모든 캐시(정렬 키, 컬럼 분석)를 무효화합니다."""
         self._column_analysis_cache.clear()
         self._sort_key_cache.clear()
+        self._sort_keys = None
         self._sort_column = -1
         self._sort_type = SortType.TEXT
 
@@ -149,3 +422,12 @@ class SmartNaturalSortProxyModel(QSortFilterProxyModel):
         self.invalidate()
         for col in range(source_model.columnCount()):
             self._analyze_column_sort_type(col)  # 이 함수는 결과를 캐시에 저장함
+
+    def set_column_sort_types(self, sort_types):
+        """✅ [성능 개선] 워커 스레드에서 미리 분석한 정렬 유형으로 캐시를 채웁니다.
+
+        점진적 적재 중에는 행이 아직 다 들어오지 않았으므로 GUI 스레드에서
+        pre_analyze_all_columns()를 다시 돌리지 않고 이 결과를 사용합니다.
+        """
+        self.invalidate()
+        self._column_analysis_cache.update(sort_types)
@@ -1,10 +1,18 @@
 # -*- coding: utf-8 -*-
 # 파일명: qt_tree_menu_navigation.py
-# 버전: v1.2.2
+# 버전: v1.3.0
 # 설명: QTreeWidget 기반 사이드바 네비게이션
 # 생성일: 2025-10-02
 #
 # 변경 이력:
+# v1.3.0 (2025-10-31)
+# - [성능 개선] 탭 지연 생성 재도입 (preload_all_tabs = False)
+#   : 탭 모듈은 qt_lazy_tabs.load_tab_class()로 처음 표시/데이터 수신 시 import
+#   : get_or_create_tab() - 데이터 전송·상호 참조용 생성 경로 (레이아웃 추가 + 스타일 적용 + 등록)
+#   : 생성 시 register_tab_instance()로 MARC 탭 참조 등록 및 스플리터 크기 복구
+#     (v1.1.0에서 사전 로딩으로 바꾼 이유였던 레이아웃 복원/데이터 전송 문제 해결)
+#   : "저자 확인" 탭도 TAB_CLASS_PATHS로 생성 가능
+#
 # v1.2.2 (2025-10-28)
 # - [수정] 스타일 강제 적용 방법 개선: show/hide 트릭 사용
 #   : hide() 전에 show()를 호출하여 Qt 스타일 polish가 완전히 이루어지도록 함
@@ -72,6 +80,12 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QFont, QCursor
 from ui_constants import UI_CONSTANTS as U
+from qt_lazy_tabs import (
+    TAB_CLASS_PATHS,
+    find_tab_key,
+    load_tab_class,
+    register_tab_instance,
+)
 
 
 class QtTreeMenuNavigation(QWidget):
@@ -84,8 +98,8 @@ class QtTreeMenuNavigation(QWidget):
         self.current_tab_widget = None
         self.tab_widgets = {}  # 탭 이름 -> 위젯 매핑
 
-        # ✅ [수정] 모든 탭을 미리 생성 (지연 로딩 제거)
-        self.preload_all_tabs = True
+        # ✅ [성능 개선] 탭은 처음 표시되거나 데이터를 받을 때 생성 (get_or_create_tab)
+        self.preload_all_tabs = False
 
         # 탭 그룹 정의 (qt_Tab_configs.py의 tab_name과 정확히 일치)
         self.tab_groups = {
@@ -323,46 +337,17 @@ class QtTreeMenuNavigation(QWidget):
             item.setExpanded(True)
 
     def preload_tabs_and_show_first(self):
-        """✅ [추가] 모든 탭을 미리 생성하고 첫 번째 탭을 표시합니다."""
+        """모든 탭을 미리 생성하고 첫 번째 탭을 표시합니다. (preload_all_tabs=True일 때)"""
         self.app_instance.log_message(
             "🔨 트리메뉴 모드: 모든 탭 사전 로딩 시작...", "INFO"
         )
 
-        # 탭 클래스 import (탭뷰 모드와 동일하게 참조 저장을 위해)
-        from qt_TabView_MARC_Extractor import QtMARCExtractorTab
-        from qt_TabView_MARC_Editor import QtMARCEditorTab
-
-        # 모든 탭 생성
         for group_name, tab_names in self.tab_groups.items():
             for tab_name in tab_names:
-                if tab_name not in self.tab_widgets:
+                if self.get_or_create_tab(tab_name) is None:
                     self.app_instance.log_message(
-                        f"  🔨 탭 생성 중: '{tab_name}'", "DEBUG"
+                        f"  ⚠️ '{tab_name}' 탭 생성 실패 - 건너뜁니다.", "WARNING"
                     )
-                    tab_widget = self.create_tab_widget(tab_name)
-                    if tab_widget is None:
-                        self.app_instance.log_message(
-                            f"  ⚠️ '{tab_name}' 탭 생성 실패 - 건너뜁니다.", "WARNING"
-                        )
-                        continue
-                    self.tab_widgets[tab_name] = tab_widget
-
-                    # ✅ [수정] 스타일시트 적용을 위해 레이아웃에 추가 후 숨김
-                    # 탭을 레이아웃에 추가해야 부모의 스타일시트를 상속받음
-                    self.content_layout.addWidget(tab_widget)
-
-                    # ✅ [추가] objectName 기반 스타일 강제 적용을 위한 show/hide 트릭
-                    # Qt는 위젯이 show()될 때 스타일을 완전히 적용하므로, 한 번 보여줬다가 숨김
-                    # 이렇게 하면 QTextEdit#MARC_Gemini_Input 같은 ID 선택자가 확실히 적용됨
-                    tab_widget.show()
-                    tab_widget.style().polish(tab_widget)
-                    tab_widget.hide()
-
-                    # ✅ [추가] 탭뷰 모드와 동일: 특정 탭을 app_instance에 등록
-                    if isinstance(tab_widget, QtMARCExtractorTab):
-                        self.app_instance.marc_extractor_tab = tab_widget
-                    elif isinstance(tab_widget, QtMARCEditorTab):
-                        self.app_instance.marc_editor_tab = tab_widget
 
         total_tabs = len(self.tab_widgets)
         self.app_instance.log_message(
@@ -372,46 +357,52 @@ class QtTreeMenuNavigation(QWidget):
         # 첫 번째 탭 표시
         self.show_first_tab()
 
+    def get_or_create_tab(self, tab_name):
+        """✅ [성능 개선] 탭 위젯을 반환하고, 아직 없으면 생성해서 (숨긴 채로) 레이아웃에 추가합니다."""
+        tab_widget = self.tab_widgets.get(tab_name)
+        if tab_widget is not None:
+            return tab_widget
+
+        self.app_instance.log_message(f"  🔨 탭 생성 중: '{tab_name}'", "DEBUG")
+        tab_widget = self.create_tab_widget(tab_name)
+        if tab_widget is None:
+            return None
+        self.tab_widgets[tab_name] = tab_widget
+
+        # ✅ [수정] 스타일시트 적용을 위해 레이아웃에 추가 후 숨김
+        # 탭을 레이아웃에 추가해야 부모의 스타일시트를 상속받음
+        self.content_layout.addWidget(tab_widget)
+
+        # ✅ [추가] objectName 기반 스타일 강제 적용을 위한 show/hide 트릭
+        # Qt는 위젯이 show()될 때 스타일을 완전히 적용하므로, 한 번 보여줬다가 숨김
+        # 이렇게 하면 QTextEdit#MARC_Gemini_Input 같은 ID 선택자가 확실히 적용됨
+        tab_widget.show()
+        tab_widget.style().polish(tab_widget)
+        tab_widget.hide()
+
+        # ✅ [추가] 탭뷰 모드와 동일: 특정 탭을 app_instance에 등록 + 스플리터 복구
+        register_tab_instance(
+            self.app_instance,
+            find_tab_key(self.tab_configs, tab_name),
+            tab_name,
+            tab_widget,
+        )
+        return tab_widget
+
     def show_tab(self, tab_name):
-        """✅ [수정] 지정된 탭을 표시합니다. (사전 로딩 모드: 탭뷰와 동일하게 hide/show만 사용)"""
+        """✅ [수정] 지정된 탭을 표시합니다. (처음 표시되는 탭은 이때 생성, 이후 hide/show만 사용)"""
         self.app_instance.log_message(
             f"🔍 [DEBUG] show_tab 호출: '{tab_name}'", "DEBUG"
         )
 
-        # 탭 위젯 가져오기
-        if tab_name in self.tab_widgets:
-            tab_widget = self.tab_widgets[tab_name]
-            self.app_instance.log_message(
-                f"✅ [DEBUG] 기존 탭 전환: '{tab_name}'", "DEBUG"
-            )
-        else:
-            # ✅ 사전 로딩 모드에서는 여기에 도달하지 않아야 함
-            if self.preload_all_tabs:
-                self.app_instance.log_message(
-                    f"⚠️ [DEBUG] 사전 로딩 모드인데 탭이 없음: '{tab_name}'", "WARNING"
-                )
-
-            # 탭 위젯 생성 (fallback - 지연 로딩 모드용)
+        tab_widget = self.get_or_create_tab(tab_name)
+        if tab_widget is None:
             self.app_instance.log_message(
-                f"🔨 [DEBUG] 새 탭 생성 시도: '{tab_name}'", "DEBUG"
-            )
-            tab_widget = self.create_tab_widget(tab_name)
-            if tab_widget is None:
-                self.app_instance.log_message(
-                    f"⚠️ '{tab_name}' 탭을 생성할 수 없습니다.", "WARNING"
-                )
-                return
-            self.tab_widgets[tab_name] = tab_widget
-            # 지연 로딩으로 생성된 탭은 레이아웃에 추가
-            self.content_layout.addWidget(tab_widget)
-            # ✅ [추가] 스타일 polish 강제 적용
-            tab_widget.style().polish(tab_widget)
-            self.app_instance.log_message(
-                f"✅ [DEBUG] 탭 생성 성공: '{tab_name}'", "DEBUG"
+                f"⚠️ '{tab_name}' 탭을 생성할 수 없습니다.", "WARNING"
             )
+            return
 
         # ✅ [수정] 탭뷰 모드와 동일하게 동작: 레이아웃에서 제거하지 않고 hide/show만 사용
-        # 사전 로딩된 모든 탭이 레이아웃에 유지되며, 단순히 보이기/숨기기만 전환
 
         # 현재 탭 숨기기
         if self.current_tab_widget:
@@ -428,95 +419,34 @@ class QtTreeMenuNavigation(QWidget):
             tab_widget.set_initial_focus()
 
     def create_tab_widget(self, tab_name):
-        """탭 위젯을 생성합니다."""
-        # qt_main_app.py의 tab_class_map 참조
-        from qt_TabView_NDL import QtNDLSearchTab
-        from qt_TabView_Global import QtGlobalSearchTab
-        from qt_TabView_Western import QtWesternSearchTab
-        from qt_TabView_LegalDeposit import QtLegalDepositSearchTab
-        from qt_TabView_AIFeed import QtAIFeedSearchTab
-        from qt_TabView_KACAuthorities import QtKACAuthoritiesSearchTab
-        from qt_TabView_BriefWorks import QtBriefWorksSearchTab
-        from qt_TabView_KSH_Lite import QtKshHyridSearchTab
-        from qt_TabView_ISNI_Detailed import QtISNIDetailedSearchTab
-        from qt_TabView_NLK import QtNLKSearchTab
-        from qt_TabView_KSH_Local import QtKSHLocalSearchTab
-        from qt_TabView_MARC_Extractor import QtMARCExtractorTab
-        from qt_TabView_MARC_Editor import QtMARCEditorTab
-        from qt_TabView_Dewey import QtDeweySearchTab
-        from qt_TabView_Gemini import QtGeminiTab
-        from qt_TabView_Settings import QtSettingsTab
-        from qt_TabView_Python import QtPythonTab  # ✅ [추가] Python 탭 임포트
-
-        # 탭 이름 -> 클래스 매핑 (qt_Tab_configs.py의 tab_name과 일치)
-        tab_class_map = {
-            "NLK 검색": QtNLKSearchTab,
-            "NDL + CiNii 검색": QtNDLSearchTab,
-            "Western 검색": QtWesternSearchTab,
-            "Global 통합검색": QtGlobalSearchTab,
-            "납본 ID 검색": QtLegalDepositSearchTab,
-            "AI 피드": QtAIFeedSearchTab,
-            "저자전거 검색": QtKACAuthoritiesSearchTab,
-            "간략 저작물 정보": QtBriefWorksSearchTab,
-            "상세 저작물 정보": QtISNIDetailedSearchTab,
-            "KSH Hybrid": QtKshHyridSearchTab,
-            "KSH Local": QtKSHLocalSearchTab,
-            "MARC 추출": QtMARCExtractorTab,
-            "MARC 로직 편집": QtMARCEditorTab,
-            "Dewey 분류 검색": QtDeweySearchTab,
-            "Gemini DDC 분류": QtGeminiTab,
-            "🐍 Python": QtPythonTab,  # ✅ [추가] Python 탭 매핑
-            "설정": QtSettingsTab,
-        }
-
-        # 해당 탭의 config 찾기
-        tab_config = None
-        for key, config in self.tab_configs.items():
-            if config.get("tab_name") == tab_name:
-                tab_config = config
-                self.app_instance.log_message(
-                    f"✅ [DEBUG] Config 찾음: '{tab_name}' -> {key}", "DEBUG"
-                )
-                break
-
-        if tab_config is None:
+        """탭 위젯을 생성합니다. (탭 모듈은 이때 처음 import)"""
+        tab_key = find_tab_key(self.tab_configs, tab_name)
+        if tab_key is None or tab_key not in TAB_CLASS_PATHS:
             self.app_instance.log_message(
-                f"❌ [DEBUG] Config 없음: '{tab_name}'", "ERROR"
+                f"❌ [DEBUG] 생성할 수 없는 탭: '{tab_name}'", "ERROR"
             )
             self.app_instance.log_message(
                 f"📋 [DEBUG] 사용 가능한 탭: {[c.get('tab_name') for c in self.tab_configs.values()]}",
                 "DEBUG",
             )
+            return None
+
+        try:
+            TabClass = load_tab_class(tab_key)
+            self.app_instance.log_message(
+                f"🔨 [DEBUG] 탭 클래스 인스턴스화: {TabClass.__name__}", "DEBUG"
+            )
+            widget = TabClass(self.tab_configs[tab_key], self.app_instance)
+            self.app_instance.log_message(
+                f"✅ [DEBUG] 탭 인스턴스화 성공: '{tab_name}'", "DEBUG"
+            )
+            return widget
+        except Exception as e:
+            import traceback
 
-        if tab_name in tab_class_map:
-            if tab_config is None:
-                self.app_instance.log_message(
-                    f"⚠️ [DEBUG] Config 없이 탭 생성 시도: '{tab_name}'", "WARNING"
-                )
-                # Config 없어도 최소 설정으로 시도
-                tab_config = {"tab_name": tab_name}
-
-            TabClass = tab_class_map[tab_name]
-            try:
-                self.app_instance.log_message(
-                    f"🔨 [DEBUG] 탭 클래스 인스턴스화: {TabClass.__name__}", "DEBUG"
-                )
-                widget = TabClass(tab_config, self.app_instance)
-                self.app_instance.log_message(
-                    f"✅ [DEBUG] 탭 인스턴스화 성공: '{tab_name}'", "DEBUG"
-                )
-                return widget
-            except Exception as e:
-                import traceback
-
-                self.app_instance.log_message(
-                    f"❌ '{tab_name}' 탭 생성 실패: {e}\n{traceback.format_exc()}",
-                    "ERROR",
-                )
-                return None
-        else:
             self.app_instance.log_message(
-                f"❌ [DEBUG] tab_class_map에 없음: '{tab_name}'", "ERROR"
+                f"❌ '{tab_name}' 탭 생성 실패: {e}\n{traceback.format_exc()}",
+                "ERROR",
             )
             return None
 
@@ -7,6 +7,9 @@ import re
 import html
 import ctypes as ct
 import threading
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from PySide6.QtWidgets import (
     QFileDialog,
     QMessageBox,
@@ -28,14 +31,75 @@ from PySide6.QtCore import (
     Qt,
     QEvent,
 )
+from search_page import SearchPage  # ✅ 페이지 단위 결과 타입 (dict 키 추측 대신 isinstance)
 
 
 # =================================================================
 # 1. 범용 백그라운드 스레드
 # =================================================================
+@dataclass(frozen=True)
+class SearchResult:
+    """✅ [성능 개선] SearchThread → 탭으로 넘기는 결과 컨테이너 (읽기 전용).
+
+    - data: 검색 함수 결과. 레코드(dict) 리스트는 워커에서 DataFrame으로 한 번만 만들어
+      컬럼형으로 보관하고, 튜플 등 탭 전용 형식은 그대로 둡니다.
+    - source/elapsed/truncated/meta: 검색 함수 이름, 소요 시간(초), 잘림(다음 페이지 있음) 여부,
+      페이지 커서·추정 건수 같은 부가 정보
+    수신 측은 data를 제자리에서 수정하지 않습니다 (필요하면 새 객체를 만들어 사용).
+    """
+
+    data: object
+    source: str = ""
+    elapsed: float = 0.0
+    truncated: bool = False
+    meta: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))
+
+    @classmethod
+    def from_return(cls, value, source="", elapsed=0.0):
+        """검색 함수 반환값을 컨테이너로 감쌉니다 (워커 스레드에서 호출)."""
+        meta = {}
+        # 페이지 단위 결과(SearchPage)는 레코드와 메타데이터(커서/추정 건수)로 분리
+        if isinstance(value, SearchPage):
+            meta = value.meta()
+            value = value.results
+        # 레코드(dict)만으로 된 리스트만 DataFrame으로 (튜플 등 탭 전용 형식은 그대로)
+        if (
+            isinstance(value, list)
+            and value
+            and all(isinstance(record, dict) for record in value)
+        ):
+            value = pd.DataFrame(value)
+        return cls(
+            data=value,
+            source=source,
+            elapsed=elapsed,
+            truncated=bool(meta.get("next_cursor")),
+            meta=MappingProxyType(meta),
+        )
+
+    @property
+    def dataframe(self):
+        """표 형태 결과면 DataFrame, 아니면 None"""
+        return self.data if isinstance(self.data, pd.DataFrame) else None
+
+    @property
+    def row_count(self):
+        frame = self.dataframe
+        if frame is not None:
+            return len(frame)
+        return len(self.data) if isinstance(self.data, (list, tuple)) else 0
+
+
+def unwrap_search_result(results):
+    """SearchResult면 data를, 아니면 받은 값을 그대로 반환 (직접 호출되는 슬롯 호환용)."""
+    return results.data if isinstance(results, SearchResult) else results
+
+
 class SearchThread(QThread):
-    search_completed = Signal(object)
+    search_completed = Signal(object)  # SearchResult
     search_failed = Signal(str)
+    # ✅ [성능 개선] 페이지 단위로 먼저 도착한 레코드 목록 (검색 함수가 streams_pages일 때)
+    page_ready = Signal(object)
 
     def __init__(self, search_function, search_params, app_instance):
         super().__init__()
@@ -48,19 +112,24 @@ class SearchThread(QThread):
             if self.app_instance and hasattr(self.app_instance, "stop_search_flag"):
                 self.app_instance.stop_search_flag.clear()
 
-            results = self.search_function(**self.search_params)
+            started = time.perf_counter()
+            params = self.search_params
+            if getattr(self.search_function, "streams_pages", False):
+                params = {**params, "on_page": self.page_ready.emit}
+            results = self.search_function(**params)
 
             # -------------------
-            # ✅ [핵심 수정] 스레드 간 데이터 전달 안정성 확보
-            import pandas as pd
-
-            if isinstance(results, pd.DataFrame):
-                # DataFrame을 안전한 '딕셔너리 리스트'로 변환 후 전달
-                results_to_emit = results.to_dict("records")
-            else:
-                results_to_emit = results
-
-            self.search_completed.emit(results_to_emit)
+            # ✅ [성능 개선] 결과는 SearchResult로 감싸 참조 전달 (zero-copy)
+            # - 워커는 emit 이후 결과를 건드리지 않으므로 참조 전달로 충분
+            # - 레코드 → DataFrame 변환은 필요할 때 워커에서 한 번만 수행
+            # - 모델이 컬럼 배열에서 직접 적재 (records 변환 → DataFrame 재생성 왕복 제거)
+            self.search_completed.emit(
+                SearchResult.from_return(
+                    results,
+                    source=getattr(self.search_function, "__name__", ""),
+                    elapsed=time.perf_counter() - started,
+                )
+            )
             # -------------------
 
         except Exception as e:
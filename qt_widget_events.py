@@ -1,9 +1,10 @@
 ﻿# -*- coding: utf-8 -*-
 # 파일명: qt_widget_events.py
 # 설명: Qt 위젯 이벤트 관련 유틸리티 함수들 (QTableWidget 30% 교체)
-# 버전: 2.1.1 - Dark/Light 테마 전환 대응
+# 버전: 2.2.0 - 헤더 필터를 프록시 값 인덱스/행 마스크 방식으로 전환
 # 생성일: 2025-09-24
 # 수정일: 2025-10-27 - paintSection 메서드의 모든 색상을 UI_CONSTANTS로 동적 로드하여 테마 전환 대응
+#         2.2.0 - apply_filters/고유값 추출이 SmartNaturalSortProxyModel의 ColumnFilterIndex 사용
 
 import json
 from PySide6.QtWidgets import (
@@ -685,8 +686,22 @@ class ExcelStyleTableHeaderView(QHeaderView):
                 self.viewport().update()
                 print(f"🗑️ 텍스트 필터 제거: '{column_name}'")
 
+    def _indexed_filter_proxy(self):
+        """✅ [성능 개선] 인덱스 기반 필터를 지원하는 프록시 모델(없으면 None)"""
+        if not getattr(self, "table_view", None):
+            return None
+        model = self.table_view.model()
+        if model is not None and hasattr(model, "set_value_filters"):
+            return model
+        return None
+
     def get_unique_values_from_model(self, column_index):
         """[버그 수정] Proxy 모델 뒤의 Source 모델에 직접 접근하여 고유값을 초고속으로 추출합니다."""
+        proxy = self._indexed_filter_proxy()
+        if proxy is not None:
+            # ✅ [성능 개선] 프록시의 컬럼 값 인덱스 키를 그대로 사용 (메뉴를 열 때마다 재스캔하지 않음)
+            return proxy.unique_values(column_index)
+
         try:
             # -------------------
             # ✅ [핵심 수정 1] 프록시 모델 여부를 확인하여 적절한 모델 선택
@@ -758,10 +773,13 @@ class ExcelStyleTableHeaderView(QHeaderView):
                 )
 
             # 현재 보이는 행 수 계산
-            visible_count = 0
-            for row in range(model.rowCount()):
-                if not self.table_view.isRowHidden(row):
-                    visible_count += 1
+            if self._indexed_filter_proxy() is not None:
+                visible_count = model.rowCount()  # 프록시 행 수 = 필터 통과 행 수
+            else:
+                visible_count = 0
+                for row in range(model.rowCount()):
+                    if not self.table_view.isRowHidden(row):
+                        visible_count += 1
             print(f"📊 현재 보이는 행 수: {visible_count}")
 
         print("=" * 50)
@@ -775,6 +793,19 @@ class ExcelStyleTableHeaderView(QHeaderView):
         if not model:
             return
 
+        proxy = self._indexed_filter_proxy()
+        if proxy is not None:
+            # ✅ [성능 개선] 값 인덱스로 행 마스크를 계산 → filterAcceptsRow가 마스크만 조회
+            visible_count = proxy.set_value_filters(self.column_filters)
+            if self.column_filters:
+                print(
+                    f"🔍 필터 적용 완료: {visible_count}개 행 표시, {len(self.column_filters)}개 필터 활성"
+                )
+            else:
+                print("🗑️ 모든 필터 제거 - 전체 행 표시")
+            self.table_view.viewport().update()
+            return
+
         if not self.column_filters:
             # 필터가 없으면 모든 행 표시
             for row in range(model.rowCount()):
@@ -831,8 +862,12 @@ class ExcelStyleTableHeaderView(QHeaderView):
             return
 
         # 모든 행을 표시
-        for row in range(model.rowCount()):
-            self.table_view.setRowHidden(row, False)
+        proxy = self._indexed_filter_proxy()
+        if proxy is not None:
+            proxy.set_value_filters({})
+        else:
+            for row in range(model.rowCount()):
+                self.table_view.setRowHidden(row, False)
 
         # 뷰 업데이트
         self.table_view.viewport().update()
@@ -14,6 +14,8 @@ import sqlite3
 import time
 from pathlib import Path
 
+import fts_maintenance
+
 
 def main():
     print("=" * 70)
@@ -177,39 +179,12 @@ def main():
         """
         )
 
-        # 트리거 생성
-        new_cursor.execute(
-            """
-            CREATE TRIGGER biblio_ai AFTER INSERT ON biblio BEGIN
-                INSERT INTO biblio_title_fts(rowid, nlk_id, title, author_names, kac_codes)
-                VALUES (new.rowid, new.nlk_id, new.title, new.author_names, new.kac_codes);
-            END
-        """
-        )
-
-        new_cursor.execute(
-            """
-            CREATE TRIGGER biblio_ad AFTER DELETE ON biblio BEGIN
-                DELETE FROM biblio_title_fts WHERE rowid = old.rowid;
-            END
-        """
-        )
-
-        new_cursor.execute(
-            """
-            CREATE TRIGGER biblio_au AFTER UPDATE ON biblio BEGIN
-                UPDATE biblio_title_fts
-                SET title = new.title,
-                    author_names = new.author_names,
-                    kac_codes = new.kac_codes
-                WHERE rowid = new.rowid;
-            END
-        """
-        )
-
-        # FTS5 인덱스 빌드
+        # FTS5 인덱스 빌드 (새 DB이므로 1회 전체 구축)
         new_cursor.execute("INSERT INTO biblio_title_fts(biblio_title_fts) VALUES('rebuild')")
         new_conn.commit()
+
+        # 이후 변경은 더티 추적 트리거 → fts_maintenance 델타 반영
+        fts_maintenance.install_dirty_tracking(new_conn, "biblio_title_fts")
         print("   [OK] FTS5 인덱스 생성 완료")
         print()
 
@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+# 파일명: schema_migrations.py
+# 설명: DB별 버전 관리 스키마 마이그레이션 + 인덱스/FTS 백그라운드 구축
+# 사용처: database_manager.py (initialize_databases)
+#
+# 배경:
+# - 기존 initialize_databases()는 매 실행마다 CREATE INDEX / FTS 구축 / COUNT(*)를
+#   메인 스레드에서 수행하여, 3.5GB mapping_data에 인덱스가 없으면 창이 뜨기 전
+#   수 분간 멈췄다.
+#
+# 방식:
+# 1. 각 DB 파일에 schema_version 테이블을 두고 적용된 마이그레이션 버전을 기록.
+# 2. Migration.background=False (빠른 스키마 확인/작은 테이블 생성)는 시작 시 즉시 적용.
+# 3. background=True (대용량 인덱스, FTS 채우기)는 MigrationJob 스레드에서 적용하고
+#    진행 상황을 콜백으로 알림. 중단되면 기록되지 않으므로 다음 실행 때 이어서 수행.
+# 4. IndexBuildStatus: 구축 중인 인덱스 이름을 추적. 검색 코드는
+#    raise_if_building()으로 "인덱스 구축 중" 오류를 즉시 알리고 대기하지 않음.
+#    이미 DB에 있는 인덱스/FTS는 대기로 표시하지 않고, 구축에 실패한 단계는
+#    "구축 실패"로 남겨 없는 인덱스로 검색하지 않게 함 (다음 실행 때 재시도).
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger("qt_main_app.schema_migrations")
+
+SCHEMA_VERSION_DDL = """
+CREATE TABLE IF NOT EXISTS schema_version (
+  version     INTEGER PRIMARY KEY,
+  name        TEXT NOT NULL,
+  applied_at  TEXT NOT NULL DEFAULT (datetime('now')),
+  duration_ms INTEGER
+);
+"""
+
+# 진행 콜백: (DB 라벨, 마이그레이션 이름, 완료 단계 수, 전체 단계 수)
+ProgressCallback = Callable[[str, str, int, int], None]
+
+
+class IndexBuildingError(RuntimeError):
+    """검색에 필요한 인덱스가 아직 백그라운드에서 구축 중이거나 구축에 실패했을 때 발생."""
+
+
+@dataclass(frozen=True)
+class Migration:
+    """하나의 스키마 변경 단계.
+
+    apply: 연결을 받아 변경을 수행 (멱등 권장, 실패 시 예외 전파)
+    background: True면 시작 경로가 아닌 MigrationJob에서 적용
+    provides: 이 단계가 만드는 인덱스/FTS 이름 (검색 측 구축 중 판단용)
+    """
+
+    version: int
+    name: str
+    apply: Callable[[sqlite3.Connection], None]
+    background: bool = False
+    provides: Tuple[str, ...] = ()
+
+
+# =====================
+# 버전 기록
+# =====================
+
+
+def applied_versions(conn: sqlite3.Connection) -> Set[int]:
+    conn.executescript(SCHEMA_VERSION_DDL)
+    return {row[0] for row in conn.execute("SELECT version FROM schema_version")}
+
+
+def pending_migrations(
+    conn: sqlite3.Connection, migrations: Iterable[Migration]
+) -> List[Migration]:
+    """아직 적용되지 않은 마이그레이션 (버전 순)."""
+    done = applied_versions(conn)
+    return sorted(
+        (m for m in migrations if m.version not in done), key=lambda m: m.version
+    )
+
+
+def apply_migration(conn: sqlite3.Connection, migration: Migration) -> float:
+    """마이그레이션 1개를 적용하고 schema_version에 기록합니다. 소요 초를 반환."""
+    started = time.perf_counter()
+    migration.apply(conn)
+    elapsed = time.perf_counter() - started
+    if conn.in_transaction:
+        conn.commit()
+    conn.execute(
+        "INSERT OR REPLACE INTO schema_version (version, name, duration_ms) VALUES (?, ?, ?)",
+        (migration.version, migration.name, int(elapsed * 1000)),
+    )
+    conn.commit()
+    return elapsed
+
+
+def existing_objects(conn: sqlite3.Connection, names: Iterable[str]) -> Set[str]:
+    """names 중 이미 DB에 있는 인덱스/테이블(FTS 가상 테이블 포함) 이름."""
+    names = list(names)
+    if not names:
+        return set()
+    rows = conn.execute(
+        f"SELECT name FROM sqlite_master WHERE type IN ('index', 'table') "
+        f"AND name IN ({','.join('?' * len(names))})",
+        names,
+    )
+    return {row[0] for row in rows}
+
+
+def run_fast_migrations(
+    connect: Callable[[], sqlite3.Connection],
+    migrations: Sequence[Migration],
+    label: str,
+) -> List[Migration]:
+    """시작 경로용: 빠른 마이그레이션만 적용하고, 남은 백그라운드 대상을 반환합니다."""
+    conn = connect()
+    try:
+        pending = pending_migrations(conn, migrations)
+        for migration in pending:
+            if migration.background:
+                continue
+            elapsed = apply_migration(conn, migration)
+            logger.info(
+                f"🧩 [{label}] 스키마 v{migration.version} '{migration.name}' 적용 ({elapsed * 1000:.0f}ms)"
+            )
+        return [m for m in pending if m.background]
+    finally:
+        conn.close()
+
+
+# =====================
+# 구축 상태
+# =====================
+
+
+class IndexBuildStatus:
+    """백그라운드에서 구축 예정/진행 중인 인덱스 이름과 진행률을 추적합니다 (스레드 안전)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._building: Dict[str, str] = {}  # 인덱스 이름 → 상태 메시지
+        self._failed: Dict[str, str] = {}  # 구축 실패한 인덱스 이름 → 오류 메시지
+
+    def mark_pending(self, names: Iterable[str], message: str = "구축 대기 중") -> None:
+        with self._lock:
+            for name in names:
+                self._building[name] = message
+
+    def update(self, names: Iterable[str], message: str) -> None:
+        with self._lock:
+            for name in names:
+                if name in self._building:
+                    self._building[name] = message
+
+    def finish(self, names: Iterable[str]) -> None:
+        with self._lock:
+            for name in names:
+                self._building.pop(name, None)
+                self._failed.pop(name, None)
+
+    def fail(self, names: Iterable[str], error: str) -> None:
+        """구축 실패: 사용할 수 없는 인덱스로 남김 (검색 시 IndexBuildingError)."""
+        with self._lock:
+            for name in names:
+                self._building.pop(name, None)
+                self._failed[name] = error
+
+    def message(self, name: str) -> Optional[str]:
+        """구축 중이면 상태 메시지, 사용 가능하면 None."""
+        with self._lock:
+            return self._building.get(name)
+
+    def is_building(self, name: str) -> bool:
+        return self.message(name) is not None
+
+    def raise_if_building(self, name: str, feature: str = "검색") -> None:
+        with self._lock:
+            error = self._failed.get(name)
+        if error is not None:
+            raise IndexBuildingError(
+                f"⚠️ {feature} 인덱스({name}) 구축에 실패했습니다 ({error}). "
+                "앱을 다시 시작하면 구축을 다시 시도합니다."
+            )
+        message = self.message(name)
+        if message is not None:
+            raise IndexBuildingError(
+                f"⏳ {feature} 인덱스({name})를 구축하는 중입니다 ({message}). "
+                "완료 후 다시 검색해 주세요."
+            )
+
+
+# =====================
+# 백그라운드 작업
+# =====================
+
+
+class MigrationJob:
+    """백그라운드 마이그레이션을 DB별로 순차 적용하는 작업자.
+
+    plan: (DB 라벨, 연결 함수, 적용할 Migration 목록) 튜플들
+    stop()을 호출하면 진행 중인 SQL 문을 progress handler로 중단시키고,
+    중단된 단계는 기록되지 않아 다음 실행 때 다시 적용됩니다.
+    """
+
+    PROGRESS_OPS = 100000  # progress handler 호출 간격 (SQLite VM 명령 수)
+
+    def __init__(
+        self,
+        plan: Sequence[Tuple[str, Callable[[], sqlite3.Connection], Sequence[Migration]]],
+        status: IndexBuildStatus,
+        progress: Optional[ProgressCallback] = None,
+        on_finished: Optional[Callable[[], None]] = None,
+    ):
+        self.plan = [(label, connect, list(ms)) for label, connect, ms in plan if ms]
+        self.status = status
+        self.progress = progress
+        self.on_finished = on_finished
+        self.failures: List[Tuple[str, str, str]] = []  # (DB 라벨, 이름, 오류)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.total_steps = sum(len(ms) for _, _, ms in self.plan)
+        self.done_steps = 0
+        for label, connect, migrations in self.plan:
+            provides = [name for m in migrations for name in m.provides]
+            # 기존 DB에 첫 실행: 이미 있는 인덱스/FTS는 버전만 기록하면 되므로 대기로 표시하지 않음
+            status.mark_pending(set(provides) - self._existing(label, connect, provides))
+
+    @staticmethod
+    def _existing(label, connect, names) -> Set[str]:
+        if not names:
+            return set()
+        try:
+            conn = connect()
+        except Exception:
+            return set()  # 연결 실패는 _run_database에서 실패로 처리
+        try:
+            return existing_objects(conn, names)
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ [{label}] 기존 인덱스 확인 실패: {e}")
+            return set()
+        finally:
+            conn.close()
+
+    def start(self) -> "MigrationJob":
+        # 적용할 단계가 없어도 on_finished는 같은 스레드에서 실행 (시작 경로를 막지 않음)
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, daemon=True, name="SchemaMigrationThread"
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _report(self, label: str, name: str) -> None:
+        if self.progress is not None:
+            try:
+                self.progress(label, name, self.done_steps, self.total_steps)
+            except Exception:
+                pass
+
+    def _run(self) -> None:
+        try:
+            for label, connect, migrations in self.plan:
+                if self._stop.is_set():
+                    break
+                self._run_database(label, connect, migrations)
+            if self.total_steps and not self._stop.is_set():
+                self._report("", "")
+        finally:
+            if self.on_finished is not None and not self._stop.is_set():
+                try:
+                    self.on_finished()
+                except Exception as e:
+                    logger.warning(f"⚠️ 마이그레이션 후속 작업 실패: {e}")
+
+    def _run_database(self, label, connect, migrations) -> None:
+        try:
+            conn = connect()
+        except Exception as e:
+            logger.warning(f"⚠️ [{label}] 마이그레이션용 DB 연결 실패: {e}")
+            for migration in migrations:
+                self.failures.append((label, migration.name, str(e)))
+                self.status.fail(migration.provides, f"DB 연결 실패: {e}")
+            return
+
+        # 중단 요청 시 오래 걸리는 CREATE INDEX / INSERT ... SELECT도 즉시 멈춤
+        conn.set_progress_handler(lambda: 1 if self._stop.is_set() else 0, self.PROGRESS_OPS)
+        try:
+            for migration in migrations:
+                if self._stop.is_set():
+                    break
+                step = f"{self.done_steps + 1}/{self.total_steps}"
+                self.status.update(migration.provides, f"{step} 단계 진행 중")
+                self._report(label, migration.name)
+                try:
+                    if migration.version in applied_versions(conn):
+                        elapsed = 0.0  # 다른 프로세스가 먼저 적용
+                    else:
+                        elapsed = apply_migration(conn, migration)
+                except Exception as e:
+                    if conn.in_transaction:
+                        conn.rollback()
+                    if self._stop.is_set():
+                        logger.info(f"⏹️ [{label}] '{migration.name}' 중단됨 (다음 실행 시 재개)")
+                        break
+                    # 실패한 단계의 인덱스/FTS는 없으므로 사용 가능으로 풀지 않고 실패로 남김
+                    self.failures.append((label, migration.name, str(e)))
+                    self.status.fail(migration.provides, str(e))
+                    logger.warning(
+                        f"⚠️ [{label}] 스키마 v{migration.version} '{migration.name}' 실패 "
+                        f"(해당 검색은 다음 실행 때 재시도): {e}"
+                    )
+                else:
+                    self.status.finish(migration.provides)
+                    logger.info(
+                        f"🧩 [{label}] 스키마 v{migration.version} '{migration.name}' "
+                        f"백그라운드 적용 완료 ({elapsed:.1f}초)"
+                    )
+                self.done_steps += 1
+        finally:
+            conn.set_progress_handler(None, 0)
+            conn.close()
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+# 파일명: search_cache.py
+# 설명: 검색 상세정보용 영구 캐시 (메모리 LRU + SQLite LRU/TTL 2단)
+# 생성일: 2025-10-31
+# 사용처: Search_NLK.py (viewKey별 MARC/MODS 상세 정보)
+#
+# - 메모리 계층: OrderedDict LRU (memory_items개 상한)
+# - 디스크 계층: search_cache.db의 cache_entries 테이블 (namespace별로 분리)
+#   * 항목마다 JSON 크기를 기록하고, namespace 합계가 max_bytes를 넘으면
+#     last_access가 오래된 순으로 삭제 (목표치 90%까지)
+#   * created_at + ttl_sec가 지난 항목은 조회 시 무시하고 정리 때 삭제
+# - 모든 메서드는 스레드 안전 (작업마다 새 연결, 메모리 계층은 잠금)
+#
+#     cache = PersistentLRUCache("nlk_marc_mods", ttl_sec=30 * 86400)
+#     hits = cache.get_many(view_keys)
+#     cache.put_many({vk: data for vk, data in fetched.items()})
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_CACHE_DB = "search_cache.db"
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    namespace   TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    value       TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    created_at  REAL NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_cache_entries_lru
+    ON cache_entries(namespace, last_access);
+"""
+
+_schema_lock = threading.Lock()
+_schema_ready = set()  # 스키마를 확인한 DB 경로
+
+
+class PersistentLRUCache:
+    """namespace 단위의 메모리 + SQLite 2단 LRU 캐시 (값은 JSON 직렬화 가능한 객체)."""
+
+    SQL_CHUNK = 500  # IN (...) 파라미터 묶음 크기
+
+    def __init__(
+        self,
+        namespace,
+        db_path=DEFAULT_CACHE_DB,
+        max_bytes=64 * 1024 * 1024,
+        ttl_sec=30 * 24 * 3600,
+        memory_items=2000,
+    ):
+        self.namespace = namespace
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.ttl_sec = ttl_sec
+        self.memory_items = memory_items
+        self._memory = OrderedDict()  # key → (created_at, value)
+        self._lock = threading.Lock()
+        self._disk_bytes = None  # namespace 합계 크기 (처음 쓰기 때 조회)
+        self.hits = 0
+        self.misses = 0
+
+    # ---------- 내부 ----------
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        if self.db_path not in _schema_ready:
+            with _schema_lock:
+                if self.db_path not in _schema_ready:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(CACHE_SCHEMA)
+                    _schema_ready.add(self.db_path)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _is_fresh(self, created_at, now):
+        return not self.ttl_sec or created_at + self.ttl_sec > now
+
+    def _remember(self, key, created_at, value):
+        """메모리 계층에 넣고 상한을 넘으면 가장 오래 안 쓴 항목부터 제거 (잠금 보유 상태에서 호출)."""
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    # ---------- 조회 ----------
+
+    def get(self, key):
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys):
+        """캐시에 있는 항목만 {key: value}로 반환합니다 (만료 항목 제외)."""
+        now = time.time()
+        found = {}
+        missing = []
+        with self._lock:
+            for key in keys:
+                entry = self._memory.get(key)
+                if entry is not None and self._is_fresh(entry[0], now):
+                    self._memory.move_to_end(key)
+                    found[key] = entry[1]
+                else:
+                    missing.append(key)
+
+        if missing:
+            try:
+                found.update(self._load_from_disk(missing, now))
+            except sqlite3.Error:
+                pass  # 캐시는 best-effort (손상/잠금 시 네트워크 경로로 진행)
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def _load_from_disk(self, keys, now):
+        loaded = {}
+        conn = self._connect()
+        try:
+            for i in range(0, len(keys), self.SQL_CHUNK):
+                chunk = keys[i : i + self.SQL_CHUNK]
+                rows = conn.execute(
+                    f"SELECT key, value, created_at FROM cache_entries "
+                    f"WHERE namespace = ? AND key IN ({','.join('?' * len(chunk))})",
+                    [self.namespace, *chunk],
+                ).fetchall()
+                for key, value, created_at in rows:
+                    if self._is_fresh(created_at, now):
+                        loaded[key] = (created_at, json.loads(value))
+            if loaded:
+                conn.executemany(
+                    "UPDATE cache_entries SET last_access = ? WHERE namespace = ? AND key = ?",
+                    [(now, self.namespace, key) for key in loaded],
+                )
+                conn.commit()
+        finally:
+            conn.close()
+
+        with self._lock:
+            for key, (created_at, value) in loaded.items():
+                self._remember(key, created_at, value)
+        return {key: value for key, (_, value) in loaded.items()}
+
+    # ---------- 저장 ----------
+
+    def put(self, key, value):
+        self.put_many({key: value})
+
+    def put_many(self, items):
+        if not items:
+            return
+        now = time.time()
+        rows = []
+        with self._lock:
+            for key, value in items.items():
+                self._remember(key, now, value)
+                payload = json.dumps(value, ensure_ascii=False)
+                rows.append((self.namespace, key, payload, len(payload.encode("utf-8")), now, now))
+        try:
+            conn = self._connect()
+            try:
+                if self._disk_bytes is None:
+                    self._disk_bytes = self._namespace_bytes(conn)
+                replaced = self._existing_bytes(conn, [row[1] for row in rows])
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cache_entries "
+                    "(namespace, key, value, size, created_at, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._disk_bytes += sum(row[3] for row in rows) - replaced
+                if self._disk_bytes > self.max_bytes:
+                    self._evict(conn, now)
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+
+    def _namespace_bytes(self, conn):
+        row = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache_entries WHERE namespace = ?",
+            (self.namespace,),
+        ).fetchone()
+        return row[0]
+
+    def _existing_bytes(self, conn, keys):
+        total = 0
+        for i in range(0, len(keys), self.SQL_CHUNK):
+            chunk = keys[i : i + self.SQL_CHUNK]
+            row = conn.execute(
+                f"SELECT COALESCE(SUM(size), 0) FROM cache_entries "
+                f"WHERE namespace = ? AND key IN ({','.join('?' * len(chunk))})",
+                [self.namespace, *chunk],
+            ).fetchone()
+            total += row[0]
+        return total
+
+    def _evict(self, conn, now):
+        """만료 항목 삭제 후, 여전히 크면 LRU 순으로 max_bytes의 90%까지 삭제."""
+        if self.ttl_sec:
+            conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND created_at <= ?",
+                (self.namespace, now - self.ttl_sec),
+            )
+            self._disk_bytes = self._namespace_bytes(conn)
+
+        target = int(self.max_bytes * 0.9)
+        if self._disk_bytes <= target:
+            return
+        excess = self._disk_bytes - target
+        victims = []
+        freed = 0
+        for key, size in conn.execute(
+            "SELECT key, size FROM cache_entries WHERE namespace = ? ORDER BY last_access",
+            (self.namespace,),
+        ):
+            victims.append((self.namespace, key))
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany(
+            "DELETE FROM cache_entries WHERE namespace = ? AND key = ?", victims
+        )
+        self._disk_bytes -= freed
+        with self._lock:
+            for _, key in victims:
+                self._memory.pop(key, None)
+
+    # ---------- 관리 ----------
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,))
+            conn.commit()
+        finally:
+            conn.close()
+        self._disk_bytes = 0
+
+    def stats(self):
+        conn = self._connect()
+        try:
+            count, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries WHERE namespace = ?",
+                (self.namespace,),
+            ).fetchone()
+        finally:
+            conn.close()
+        return {
+            "namespace": self.namespace,
+            "disk_entries": count,
+            "disk_bytes": size,
+            "memory_entries": len(self._memory),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -33,7 +33,9 @@ import time
 import logging
 from typing import List, Dict, Tuple
 from database_manager import DatabaseManager
-from db_perf_tweaks import wait_for_warmup  # ✅ 워밍업 완료 대기
+from db_perf_tweaks import get_warmup_progress, wait_for_warmup  # ✅ 워밍업 완료 대기
+from schema_migrations import IndexBuildingError
+from search_page import SearchPage  # ✅ 페이지 단위 결과 타입
 import inflection
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -123,9 +125,33 @@ class SearchCommonManager:
     - 유틸리티 메서드
     """
 
+    # ✅ [성능 개선] 첫 검색은 앱 시작 시 백그라운드 워밍업(WAL 초기화 + 페이지 예열)이 끝난 뒤 실행
+    WARMUP_KEYS = ("mapping_data", "concepts")
+    WARMUP_WAIT_SEC = 15.0
+
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
 
+    def wait_for_db_warmup(self, on_progress=None, timeout=WARMUP_WAIT_SEC):
+        """
+        첫 검색 전에 로컬 DB 워밍업이 끝날 때까지 기다립니다.
+        - 워밍업이 끝난 키는 건너뛰므로 두 번째 검색부터는 즉시 반환
+        - on_progress: 대기 중 전체 진행률(0.0~1.0, WARMUP_KEYS 평균)을 받는 콜백
+
+        Returns:
+            bool: 모든 워밍업이 끝났으면 True, 하나라도 타임아웃이면 False
+        """
+        keys = self.WARMUP_KEYS
+        ready = True
+        for i, key in enumerate(keys):
+            if get_warmup_progress(key) >= 1.0:
+                continue
+            report = None
+            if on_progress is not None:
+                report = lambda fraction, i=i: on_progress((i + fraction) / len(keys))
+            ready = wait_for_warmup(key, timeout=timeout, on_progress=report) and ready
+        return ready
+
     # ---------------------------------------------------
     # 아래는 database_manager.py에서 옮겨온 검색 관련 메서드들입니다.
     # self.메서드() 호출은 self.db_manager.메서드() 로 변경됩니다.
@@ -1047,6 +1073,8 @@ class SearchCommonManager:
             else:
                 return pd.DataFrame()
 
+        except IndexBuildingError:
+            raise  # "인덱스 구축 중"은 호출 측에서 사용자에게 알림
         except Exception as e:
             print(f"오류: 최적화된 서지 검색 중 오류 발생: {e}")
             return pd.DataFrame()
@@ -1054,6 +1082,47 @@ class SearchCommonManager:
             if conn:
                 conn.close()
 
+    # ✅ [성능 개선] NLK 서지 검색 페이지 크기 / 건수 추정 상한
+    NLK_BIBLIO_PAGE_SIZE = 500
+    NLK_BIBLIO_COUNT_CAP = 100000
+
+    def _build_nlk_biblio_match(self, title_query=None, author_query=None, kac_query=None):
+        """제목/저자/KAC 검색어로 biblio_title_fts MATCH 식을 만듭니다 (없으면 None)."""
+        fts_conditions = []
+
+        # 제목 검색 (FTS5)
+        if title_query and title_query.strip():
+            # 줄바꿈으로 여러 제목 분리
+            titles = [t.strip() for t in title_query.split("\n") if t.strip()]
+            if titles:
+                # FTS5 OR 쿼리 생성: "제목1" OR "제목2" OR "제목3"
+                title_fts_query = " OR ".join([f'title:"{t}"' for t in titles])
+                fts_conditions.append(f"({title_fts_query})")
+                logger.info(
+                    f"제목 검색 ({len(titles)}개): {', '.join(titles[:3])}..."
+                )
+
+        # 저자 검색 (FTS5) - kac_authors 사용
+        if author_query and author_query.strip():
+            fts_conditions.append(f'kac_authors:"{author_query.strip()}"')
+
+        # KAC 코드 검색 (FTS5) - ✅ 복수 입력 지원
+        if kac_query and kac_query.strip():
+            # 줄바꿈으로 여러 KAC 코드 분리
+            kac_codes = [k.strip() for k in kac_query.split("\n") if k.strip()]
+            if kac_codes:
+                # FTS5 OR 쿼리: "코드1" OR "코드2" OR "코드3"
+                kac_fts_query = " OR ".join(
+                    [f'kac_codes:"{k}"' for k in kac_codes]
+                )
+                fts_conditions.append(f"({kac_fts_query})")
+                logger.info(
+                    f"KAC 코드 검색 ({len(kac_codes)}개): "
+                    f"{', '.join(kac_codes[:3])}..."
+                )
+
+        return " AND ".join(fts_conditions) if fts_conditions else None
+
     def search_nlk_biblio(
         self,
         title_query=None,
@@ -1075,58 +1144,66 @@ class SearchCommonManager:
             year_query (str): 연도 검색어
 
         Returns:
-            list[dict]: 검색 결과 레코드 리스트
+            list[dict]: 검색 결과 레코드 리스트 (첫 페이지, 최대 500건)
+        """
+        page = self.search_nlk_biblio_page(
+            title_query=title_query,
+            author_query=author_query,
+            kac_query=kac_query,
+            year_query=year_query,
+        )
+        return page.results
+
+    def search_nlk_biblio_page(
+        self,
+        title_query=None,
+        author_query=None,
+        kac_query=None,
+        year_query=None,
+        page_size=None,
+        cursor=None,
+    ):
+        """
+        ✅ [성능 개선] NLK 서지 검색 - rowid 키셋(keyset) 페이지네이션
+
+        기존 GROUP BY nlk_id + ORDER BY kac_codes 방식은 히트 전체를 정렬해야
+        첫 500건을 돌려줄 수 있었습니다. ORDER BY rank도 모든 히트의 bm25를 계산/정렬하므로
+        FTS5가 원래 내놓는 rowid 순서로 LIMIT만큼만 읽고(rowid > 커서),
+        rank는 읽은 창(window) 안의 행에만 계산해 페이지 안에서만 관련도순으로 정렬합니다.
+
+        nlk_id 중복은 커서에 담긴 이미 반환한 nlk_id 집합으로 페이지를 넘어서도 걸러냅니다.
+
+        Args:
+            page_size (int): 페이지당 건수 (기본 NLK_BIBLIO_PAGE_SIZE)
+            cursor (dict): 이전 페이지의 next_cursor (None이면 첫 페이지)
+                {"after_rowid": 마지막으로 읽은 rowid, "seen_ids": 반환한 nlk_id 집합}
+
+        Returns:
+            SearchPage: results(list[dict]), next_cursor(dict | None)
         """
+        page_size = page_size or self.NLK_BIBLIO_PAGE_SIZE
+        empty = SearchPage([])
         conn = None
         try:
             # 입력 검증
             if not any([title_query, author_query, kac_query, year_query]):
                 logger.warning("검색어가 입력되지 않았습니다.")
-                return []
+                return empty
 
             # DB 연결
             conn = self.db_manager._get_nlk_biblio_connection()
-            cursor = conn.cursor()
-
-            # ✅ FTS5 쿼리 구성
-            fts_conditions = []
-            sql_conditions = []
-            params = []
-
-            # 제목 검색 (FTS5)
-            if title_query and title_query.strip():
-                # 줄바꿈으로 여러 제목 분리
-                titles = [t.strip() for t in title_query.split("\n") if t.strip()]
-                if titles:
-                    # FTS5 OR 쿼리 생성: "제목1" OR "제목2" OR "제목3"
-                    title_fts_query = " OR ".join([f'title:"{t}"' for t in titles])
-                    fts_conditions.append(f"({title_fts_query})")
-                    logger.info(
-                        f"제목 검색 ({len(titles)}개): {', '.join(titles[:3])}..."
-                    )
+            db_cursor = conn.cursor()
 
-            # 저자 검색 (FTS5) - kac_authors 사용
-            if author_query and author_query.strip():
-                fts_conditions.append(f'kac_authors:"{author_query.strip()}"')
-
-            # KAC 코드 검색 (FTS5) - ✅ 복수 입력 지원
-            if kac_query and kac_query.strip():
-                # 줄바꿈으로 여러 KAC 코드 분리
-                kac_codes = [k.strip() for k in kac_query.split("\n") if k.strip()]
-                if kac_codes:
-                    # FTS5 OR 쿼리: "코드1" OR "코드2" OR "코드3"
-                    kac_fts_query = " OR ".join(
-                        [f'kac_codes:"{k}"' for k in kac_codes]
-                    )
-                    fts_conditions.append(f"({kac_fts_query})")
-                    logger.info(
-                        f"KAC 코드 검색 ({len(kac_codes)}개): "
-                        f"{', '.join(kac_codes[:3])}..."
-                    )
+            fts_match = self._build_nlk_biblio_match(title_query, author_query, kac_query)
+            year = int(year_query.strip()) if year_query and year_query.strip() else None
+            after_rowid = cursor["after_rowid"] if cursor else 0
+            # 커서의 집합은 복사해서 사용 (같은 커서로 다시 요청해도 결과가 같도록)
+            seen_ids = set(cursor["seen_ids"]) if cursor else set()
 
             # ✅ FTS5 쿼리 실행
-            if fts_conditions:
-                fts_match = " AND ".join(fts_conditions)
+            if fts_match:
+                # rowid 순서 + rowid > 커서: FTS5 doclist를 앞에서부터 LIMIT만큼만 읽음
+                # (rank는 반환되는 창의 행에만 계산됨)
                 query = """
                     SELECT
                         b.nlk_id,
@@ -1134,51 +1211,53 @@ class SearchCommonManager:
                         b.kac_authors,
                         b.kac_codes,
                         b.year,
-                        MIN(rank) as min_rank
+                        fts.rank,
+                        fts.rowid
                     FROM biblio_title_fts fts
                     JOIN biblio b ON fts.rowid = b.rowid
-                    WHERE biblio_title_fts MATCH ?
+                    WHERE biblio_title_fts MATCH ? AND fts.rowid > ?
                 """
-                params.append(fts_match)
+                params = [fts_match, after_rowid]
 
                 # 연도 필터 (SQL WHERE)
-                if year_query and year_query.strip():
+                if year is not None:
                     query += " AND b.year = ?"
-                    params.append(int(year_query.strip()))
+                    params.append(year)
 
-                # ✅ [중복 제거] nlk_id로 GROUP BY + rank 유지
-                query += """
-                    GROUP BY b.nlk_id
-                    ORDER BY b.kac_codes, min_rank
-                    LIMIT 500
-                """
+                query += " ORDER BY fts.rowid LIMIT ?"
+                params.append(page_size)
 
-                logger.debug(f"FTS5 쿼리 실행: {fts_match}")
-                cursor.execute(query, params)
+                logger.debug(f"FTS5 쿼리 실행: {fts_match} (after_rowid={after_rowid})")
+                db_cursor.execute(query, params)
 
+            elif year is not None:
+                # FTS5 조건이 없고 연도만 있는 경우: rowid 키셋
+                query = """
+                    SELECT nlk_id, title, kac_authors, kac_codes, year, 0, rowid
+                    FROM biblio
+                    WHERE year = ? AND rowid > ?
+                    ORDER BY rowid
+                    LIMIT ?
+                """
+                db_cursor.execute(query, (year, after_rowid, page_size))
             else:
-                # FTS5 조건이 없고 연도만 있는 경우
-                if year_query and year_query.strip():
-                    query = """
-                        SELECT nlk_id, title, kac_authors, kac_codes, year
-                        FROM biblio
-                        WHERE year = ?
-                        LIMIT 500
-                    """
-                    cursor.execute(query, (int(year_query.strip()),))
-                else:
-                    return []
+                return empty
 
             # ✅ 결과 처리
-            rows = cursor.fetchall()
+            rows = db_cursor.fetchall()
+            next_cursor = None
+            if len(rows) == page_size:
+                next_cursor = {"after_rowid": rows[-1][6], "seen_ids": seen_ids}
+
+            # 창 안에서만 관련도(rank) → rowid 순으로 정렬
+            rows.sort(key=lambda row: (row[5], row[6]))
 
             results = []
-            for row in rows:
-                # ✅ GROUP BY 쿼리는 6개 컬럼 반환 (min_rank 포함)
-                if len(row) == 6:
-                    nlk_id, title, kac_authors, kac_codes, year, _ = row
-                else:
-                    nlk_id, title, kac_authors, kac_codes, year = row
+            for nlk_id, title, kac_authors, kac_codes, year_value, _, _ in rows:
+                # ✅ [중복 제거] GROUP BY 대신 이전 페이지까지 포함해 nlk_id 중복을 걸러냄
+                if nlk_id in seen_ids:
+                    continue
+                seen_ids.add(nlk_id)
 
                 # ✅ DB에서 이미 "nlk:" 프리픽스가 제거되어 있음 (더 이상 replace 불필요)
                 results.append(
@@ -1186,7 +1265,7 @@ class SearchCommonManager:
                         "제목": title or "",
                         "저자": kac_authors or "",  # author_names → kac_authors
                         "KAC 코드": kac_codes or "",
-                        "연도": str(year) if year else "",
+                        "연도": str(year_value) if year_value else "",
                         "식별자": nlk_id or "",
                         "상세 링크": (
                             f"https://www.nl.go.kr/NL/contents/search.do?"
@@ -1198,14 +1277,59 @@ class SearchCommonManager:
                     }
                 )
 
-            logger.info(f"검색 완료. {len(results)}건 결과 반환.")
-            return results
+            logger.info(
+                f"검색 완료. {len(results)}건 결과 반환."
+                + (" (다음 페이지 있음)" if next_cursor else "")
+            )
+            return SearchPage(results, next_cursor)
 
         except Exception as e:
             logger.error(f"NLK Biblio 검색 중 오류 발생: {e}")
             import traceback
             traceback.print_exc()
-            return []
+            return empty
+        finally:
+            if conn:
+                conn.close()
+
+    def estimate_nlk_biblio_count(
+        self,
+        title_query=None,
+        author_query=None,
+        kac_query=None,
+        year_query=None,
+        cap=None,
+    ):
+        """
+        ✅ [성능 개선] NLK 서지 검색 히트 수를 빠르게 추정합니다.
+
+        FTS doclist만 세고(biblio 조인 없음) cap에서 멈추므로 광범위한 검색어도
+        즉시 끝납니다. 연도 필터는 FTS 조건이 없을 때만 반영됩니다.
+
+        Returns:
+            tuple: (건수, 상한 도달 여부) - 실패 시 (0, False)
+        """
+        cap = cap or self.NLK_BIBLIO_COUNT_CAP
+        conn = None
+        try:
+            conn = self.db_manager._get_nlk_biblio_connection()
+            fts_match = self._build_nlk_biblio_match(title_query, author_query, kac_query)
+            if fts_match:
+                sql = (
+                    "SELECT COUNT(*) FROM (SELECT rowid FROM biblio_title_fts "
+                    "WHERE biblio_title_fts MATCH ? LIMIT ?)"
+                )
+                params = (fts_match, cap + 1)
+            elif year_query and year_query.strip():
+                sql = "SELECT COUNT(*) FROM (SELECT 1 FROM biblio WHERE year = ? LIMIT ?)"
+                params = (int(year_query.strip()), cap + 1)
+            else:
+                return 0, False
+            count = conn.execute(sql, params).fetchone()[0]
+            return min(count, cap), count > cap
+        except Exception as e:
+            logger.warning(f"NLK Biblio 건수 추정 실패: {e}")
+            return 0, False
         finally:
             if conn:
                 conn.close()
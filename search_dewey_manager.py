@@ -918,20 +918,27 @@ class SearchDeweyManager(SearchCommonManager):
             df_sql['match_type'] = 'exact'
 
         # 벡터 결과에는 유사도 점수와 타입 부여 (벡터 점수는 0~1 사이)
+        # ✅ [수정] search_ddc_by_vector는 'similarity'/'label'을 반환하고 'keyword'/'term_type'이 없음
+        # → SQL 결과와 같은 열 구성(ddc, keyword, term_type, score)으로 맞춤
         if not df_vec.empty:
-            df_vec.rename(columns={'distance': 'score'}, inplace=True)
+            df_vec = df_vec.rename(columns={'similarity': 'score'})
+            df_vec['keyword'] = df_vec['label'] if 'label' in df_vec else ''
+            df_vec['term_type'] = ''
             df_vec['match_type'] = 'semantic'
+            # SQL이 이미 찾은 DDC는 벡터 결과에서 제외 (SQL 결과를 우선적으로 유지)
+            if not df_sql.empty:
+                df_vec = df_vec[~df_vec['ddc'].isin(df_sql['ddc'])]
 
         # 두 결과 병합
         df_combined = pd.concat([df_sql, df_vec], ignore_index=True)
-        
-        # 'ddc'와 'keyword' 기준으로 중복 제거 (SQL 결과를 우선적으로 유지)
+
+        # 'ddc'와 'keyword' 기준으로 중복 제거 (같은 소스 안의 중복)
         df_combined.drop_duplicates(subset=['ddc', 'keyword'], keep='first', inplace=True)
-        
-        # 최종 정렬: score 높은 순 (정확 일치 > 의미 유사)
-        df_combined.sort_values(by=['score'], ascending=False, inplace=True)
-        
-        return df_combined.head(limit).to_dict('records')
+
+        # 최종 정렬: score 높은 순 (정확 일치 > 의미 유사), 동점은 원래 순서 유지
+        df_combined.sort_values(by=['score'], ascending=False, kind='stable', inplace=True)
+
+        return df_combined.head(limit).fillna('').to_dict('records')
 
 
     def search_ddc_by_multiple_keywords(
@@ -8,6 +8,7 @@ import logging
 from typing import List
 from database_manager import DatabaseManager
 from search_common_manager import SearchCommonManager
+from schema_migrations import IndexBuildingError
 
 logger = logging.getLogger("qt_main_app.database_manager")
 
@@ -348,6 +349,8 @@ class SearchKshManager(SearchCommonManager):
         kdc_to_dd DB에서 한국어 주제명으로 직접 검색
         ✅ [성능 개선] 2단계 검색(CTE)을 통해 FTS5와 SQL 정렬의 장점을 모두 활용합니다.
         """
+        # ✅ [성능 개선] FTS가 백그라운드 구축 중이면 대기하지 않고 "인덱스 구축 중" 알림
+        self.db_manager.raise_if_index_building("mapping_data_fts", "한국어 주제명 검색")
         conn = None
         try:
             conn = self.db_manager._get_mapping_connection()
@@ -905,6 +908,8 @@ class SearchKshManager(SearchCommonManager):
         Returns:
             검색 결과 DataFrame
         """
+        # ✅ [성능 개선] FTS가 백그라운드 구축 중이면 대기하지 않고 "인덱스 구축 중" 알림
+        self.db_manager.raise_if_index_building("literal_props_fts", "KSH 개념 검색")
         conn = None
         try:
             conn = self.db_manager._get_concepts_connection()
@@ -1309,6 +1314,8 @@ class SearchKshManager(SearchCommonManager):
                 searcher = KshLocalSearcher(self.db_manager)
                 # search_concepts -> get_ksh_entries는 콤마로 구분된 문자열을 OR 조건으로 처리하는 기능이 이미 구현되어 있습니다.
                 df_concept_search = searcher.search_concepts(keyword=search_term)
+            except IndexBuildingError:
+                raise  # "인덱스 구축 중"은 빈 결과 대신 호출 측에서 사용자에게 알림
             except Exception as e:
                 logger.error(f"오류: '{search_term}' 컨셉 DB 검색 중 오류: {e}")
                 df_concept_search = (
@@ -1324,8 +1331,12 @@ class SearchKshManager(SearchCommonManager):
                         df_b = self.get_bibliographic_by_subject_name(kw)
                         if not df_b.empty:
                             bibliographic_dfs.append(df_b)
+                    except IndexBuildingError:
+                        raise
                     except Exception as e:
                         logger.error(f"오류: '{kw}' 서지 DB 검색 중 오류: {e}")
+            except IndexBuildingError:
+                raise
             except Exception as e:
                 logger.error(f"오류: 서지 DB 검색 중 오류: {e}")
 
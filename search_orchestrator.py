@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
-# Version: v2.0.1
-# 수정일시: 2025-08-03 19:17 KST (NDL 검색 시 db_manager 인자 전달)
+# Version: v2.2.1
+# 수정일시: 2025-10-31 KST (저자전거 복수 검색어 분리용 re import 누락 수정)
+# v2.2.0: 저자전거 검색: 로컬 전거 DB 우선 + 네트워크 폴백
+# v2.1.0: LC/Western/Global 검색 결과를 on_page로 페이지·소스 단위 스트리밍
+# v2.0.1: NDL 검색 시 db_manager 인자 전달
 
 """
 search_orchestrator.py - 다양한 검색 로직 (ISBN/ISNI/KAC, LC, NDL)을 통합하고 조정합니다.
@@ -10,6 +13,7 @@ search_orchestrator.py - 다양한 검색 로직 (ISBN/ISNI/KAC, LC, NDL)을 통
 """
 import Search_Naver
 import Search_CiNii
+import re
 import time
 import requests.exceptions
 from concurrent.futures import (
@@ -23,7 +27,7 @@ import qt_api_clients
 # LC 및 NDL 검색 로직 모듈 임포트
 import Search_LC
 import Search_NDL
-from Search_KAC_Authorities import run_full_extraction, run_multiple_kac_search
+from Search_KAC_Local import search_kac_local_first
 
 # ✅ [추가] Global 통합검색에 필요한 모든 검색 모듈을 임포트합니다.
 from Search_DNB import search_dnb_catalog
@@ -39,6 +43,27 @@ from Search_NLK import search_nlk_catalog
 from Search_Cornell import search_cornell_library
 
 
+# ✅ [성능 개선] sru_paging으로 여러 페이지를 받는 소스 (페이지 단위로 on_page 전달)
+PAGED_SOURCES = {"LC", "Harvard", "DNB", "BNF"}
+
+
+def _source_page_callback(on_page, source_name):
+    """페이지 레코드에 출처를 붙여 탭으로 전달하는 콜백을 만듭니다."""
+
+    def deliver(page):
+        for record in page:
+            record["출처"] = source_name
+        on_page(page)
+
+    return deliver
+
+
+def _emit_completed_source(on_page, source_name, results):
+    """페이지 단위가 아닌 소스는 검색이 끝났을 때 결과 전체를 한 번에 전달합니다."""
+    if on_page and results and source_name not in PAGED_SOURCES:
+        on_page([dict(result) for result in results])
+
+
 def search_by_isbn(isbn_to_search, app_instance):
     """
     ISBN을 사용하여 저자의 ISNI 및 KAC 코드를 검색하고,
@@ -161,7 +186,12 @@ def search_by_kac(kac_code, app_instance, isni_code="없음"):
 
 
 def search_lc_orchestrated(
-    title_query, author_query, isbn_query, year_query=None, app_instance=None
+    title_query,
+    author_query,
+    isbn_query,
+    year_query=None,
+    app_instance=None,
+    on_page=None,
 ):
     """
     LC 검색을 오케스트레이션합니다.
@@ -171,12 +201,13 @@ def search_lc_orchestrated(
         isbn_query (str): 검색할 ISBN 쿼리.
         year_query (str, optional): 검색할 출판연도 쿼리. 기본값: None
         app_instance (object, optional): GUI 애플리케이션 인스턴스.
+        on_page (callable, optional): 페이지가 도착할 때마다 레코드 목록을 받는 콜백.
     Returns:
         list: LC 검색 결과 레코드 목록.
     """
     app_instance.log_message("정보: LC 검색 오케스트레이션 시작.")
     results = Search_LC.search_lc_catalog(
-        isbn_query, title_query, author_query, year_query, app_instance
+        isbn_query, title_query, author_query, year_query, app_instance, on_page
     )
     if app_instance.stop_search_flag.is_set():
         app_instance.log_message(
@@ -252,7 +283,13 @@ def search_naver_orchestrated(title_query, author_query, isbn_query, app_instanc
 
 # ✅ [새로운 통합 검색 함수 추가]
 def search_ndl_cinii_integrated(
-    title_query, author_query, isbn_query, year_query, app_instance, db_manager
+    title_query,
+    author_query,
+    isbn_query,
+    year_query,
+    app_instance,
+    db_manager,
+    on_page=None,
 ):
     """NDL과 CiNii 검색을 병렬로 실행하고 결과를 통합하여 반환하는 오케스트레이터"""
     if (
@@ -267,6 +304,8 @@ def search_ndl_cinii_integrated(
         """검색 실행 및 출처 추가를 위한 래퍼 함수"""
         try:
             app_instance.log_message(f"정보: {source_name} 검색 시작 (병렬)")
+            if on_page and source_name in PAGED_SOURCES:
+                kwargs["on_page"] = _source_page_callback(on_page, source_name)
             results = search_func(**kwargs)
             for result in results:
                 result["출처"] = source_name
@@ -307,7 +346,9 @@ def search_ndl_cinii_integrated(
             ):
                 break
             try:
-                all_results.extend(future.result())
+                source_results = future.result()
+                all_results.extend(source_results)
+                _emit_completed_source(on_page, future_to_source[future], source_results)
             except Exception as e:
                 source_name = future_to_source[future]
                 app_instance.log_message(
@@ -346,6 +387,7 @@ def search_global_integrated(
     ddc_query,
     app_instance,
     db_manager,
+    on_page=None,
 ):
     """13개 이상의 국내외 도서관 DB를 병렬로 검색하고 결과를 통합하여 반환하는 오케스트레이터"""
     if (
@@ -365,6 +407,8 @@ def search_global_integrated(
             ):
                 return []
             app_instance.log_message(f"정보: {source_name} 검색 시작 (병렬)")
+            if on_page and source_name in PAGED_SOURCES:
+                kwargs["on_page"] = _source_page_callback(on_page, source_name)
             results = search_func(**kwargs)
             for result in results:
                 result["출처"] = source_name
@@ -455,7 +499,9 @@ def search_global_integrated(
             ):
                 break
             try:
-                all_results.extend(future.result())
+                source_results = future.result()
+                all_results.extend(source_results)
+                _emit_completed_source(on_page, future_to_source[future], source_results)
             except Exception as e:
                 source_name = future_to_source[future]
                 app_instance.log_message(
@@ -508,6 +554,7 @@ def search_western_integrated(
     ddc_query,
     app_instance,
     db_manager,
+    on_page=None,
 ):
     """서양권 주요 도서관 DB를 병렬로 검색하고 결과를 통합하여 반환하는 오케스트레이터"""
     if (
@@ -527,6 +574,8 @@ def search_western_integrated(
             ):
                 return []
             app_instance.log_message(f"정보: {source_name} 검색 시작 (병렬)")
+            if on_page and source_name in PAGED_SOURCES:
+                kwargs["on_page"] = _source_page_callback(on_page, source_name)
             results = search_func(**kwargs)
             for result in results:
                 result["출처"] = source_name
@@ -601,7 +650,9 @@ def search_western_integrated(
             ):
                 break
             try:
-                all_results.extend(future.result())
+                source_results = future.result()
+                all_results.extend(source_results)
+                _emit_completed_source(on_page, future_to_source[future], source_results)
             except Exception as e:
                 source_name = future_to_source[future]
                 app_instance.log_message(
@@ -644,25 +695,27 @@ def search_western_integrated(
 
 # ✅ [새로운 저자전거 검색 오케스트레이터 함수 추가]
 def search_kac_authorities_orchestrated(search_term, app_instance, db_manager):
-    """입력된 검색어에 따라 단일 또는 복수 KAC 검색을 실행합니다."""
+    """입력된 검색어에 따라 단일 또는 복수 KAC 검색을 실행합니다.
+
+    ✅ [성능 개선] 로컬 전거 DB(NLK_Authorities.sqlite)에서 먼저 찾고,
+    로컬에 없는 검색어만 librarian.nl.go.kr 스크레이핑으로 검색합니다.
+    """
     search_term = search_term.strip()
     if not search_term:
         return []
 
+    search_terms = [search_term]
     # 쉼표나 세미콜론으로 구분된 복수 검색어 감지
     if "," in search_term or ";" in search_term:
         search_terms = [
             term.strip() for term in re.split(r"[,;]", search_term) if term.strip()
         ]
-        if len(search_terms) > 1:
-            if app_instance:
-                app_instance.log_message(
-                    f"정보: KAC 복수 검색 감지 - {len(search_terms)}개", level="INFO"
-                )
-            return run_multiple_kac_search(search_terms, app_instance)
+        if len(search_terms) > 1 and app_instance:
+            app_instance.log_message(
+                f"정보: KAC 복수 검색 감지 - {len(search_terms)}개", level="INFO"
+            )
 
-    # 단일 검색어 처리
-    return run_full_extraction(search_term, app_instance)
+    return search_kac_local_first(search_terms, app_instance, db_manager)
 
 
 # ✅ [새로운 간략 저작물 정보 오케스트레이터 함수 추가]
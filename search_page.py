@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+# 파일명: search_page.py
+# 설명: 페이지 단위 검색 결과 타입 (키셋 페이지네이션 "더 보기"용)
+# 생성일: 2025-10-31
+# 사용처: search_common_manager.py, Search_Author_Check.py, qt_utils.SearchResult
+#
+# 검색 함수가 한 페이지와 다음 페이지 커서를 함께 돌려줄 때 dict 대신 이 타입을 반환합니다.
+# SearchResult.from_return()은 dict 키("results")를 보고 추측하지 않고
+# isinstance(value, SearchPage)로 페이지 결과를 구분해 메타데이터를 분리합니다.
+# Qt/DB 모듈을 import하지 않으므로 검색 모듈과 GUI 모듈 양쪽에서 가볍게 사용할 수 있습니다.
+
+from typing import NamedTuple, Optional
+
+
+class SearchPage(NamedTuple):
+    """한 페이지 분량의 검색 결과.
+
+    - results: 레코드(dict) 리스트
+    - next_cursor: 다음 페이지 요청에 넘길 커서 (없으면 None = 마지막 페이지)
+    - total_estimate: (추정 건수, 상한 도달 여부) 또는 None
+    """
+
+    results: list
+    next_cursor: Optional[dict] = None
+    total_estimate: Optional[tuple] = None
+
+    def meta(self):
+        """results를 뺀 부가 정보 dict (SearchResult.meta용)."""
+        return {"next_cursor": self.next_cursor, "total_estimate": self.total_estimate}
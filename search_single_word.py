@@ -4,27 +4,170 @@
 # =====================================
 
 # -*- coding: utf-8 -*-
-# Version: v1.0.0
-# 수정일시: 2025-08-03 01:19 KST (한 글자 검색 로직 분리)
+# Version: v1.1.0
+# 수정일시: 2025-10-31 KST (장기 세션 + 쿠키 만료 시에만 갱신, 한 글자 결과 SQLite 캐시 + 백그라운드 갱신)
+# v1.0.0: 2025-08-03 01:19 KST (한 글자 검색 로직 분리)
+#
+# ✅ [성능 개선]
+# - 기존: 검색마다 새 requests.Session → 메인 페이지 GET(쿠키) → AJAX POST (왕복 2회, 30초 타임아웃),
+#   재시도 시 이 과정을 통째로 반복 (5초 대기).
+# - 변경: NlSessionManager가 세션/쿠키를 유지하고, 쿠키가 없거나 만료됐거나 오래 쓰지 않았을 때만
+#   메인 페이지를 다시 방문. 세션 만료로 보이는 응답이면 쿠키를 새로 받아 POST를 1회 재시도.
+# - 한 글자 주제명 목록은 거의 바뀌지 않으므로 파싱 결과를 글자별로 search_cache.db에 저장.
+#   SINGLE_WORD_REFRESH_SEC이 지난 항목은 캐시를 바로 반환하고 백그라운드 스레드에서 갱신.
 
 import requests
 import re
+import threading
 import time
 import pandas as pd
-from bs4 import BeautifulSoup
+from lazy_imports import lazy_attr
+BeautifulSoup = lazy_attr("bs4", "BeautifulSoup")  # ✅ [성능 개선] 첫 파싱 때 import
 from urllib.parse import quote_plus
+from search_cache import PersistentLRUCache
 
 # 상세 페이지 접속을 위한 기본 URL
 SINGLE_WORD_BASE_URL = "https://librarian.nl.go.kr"
+MAIN_PAGE_URL = "https://librarian.nl.go.kr/LI/contents/L20202000000.do"  # 주제명 브라우징 페이지
+AJAX_URL = "https://librarian.nl.go.kr/LI/module/isni/subjectList1depth.ajax"
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36"
+REQUEST_TIMEOUT = (5, 20)  # (연결, 읽기) 초
+SESSION_IDLE_SEC = 20 * 60  # 서버 세션(JSESSIONID) 만료 전에 쿠키를 새로 받음
+
+SINGLE_WORD_REFRESH_SEC = 7 * 24 * 3600  # 이보다 오래된 캐시는 백그라운드에서 갱신
+_subject_cache = PersistentLRUCache(
+    "ksh_single_word",
+    max_bytes=16 * 1024 * 1024,
+    ttl_sec=90 * 24 * 3600,
+    memory_items=200,
+)
+_refreshing = set()  # 백그라운드 갱신 중인 글자
+_refreshing_lock = threading.Lock()
+
+# AJAX 요청 헤더 (쿠키는 세션이 관리)
+AJAX_HEADERS = {
+    "Accept": "text/html, */*; q=0.01",
+    "Accept-Language": "ko,en-US;q=0.9,en;q=0.8",
+    "Connection": "keep-alive",
+    "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+    "Origin": "https://librarian.nl.go.kr",
+    "Referer": MAIN_PAGE_URL,
+    "Sec-Fetch-Dest": "empty",
+    "Sec-Fetch-Mode": "cors",
+    "Sec-Fetch-Site": "same-origin",
+    "User-Agent": USER_AGENT,
+    "X-Requested-With": "XMLHttpRequest",
+    "sec-ch-ua": '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
+    "sec-ch-ua-mobile": "?0",
+    "sec-ch-ua-platform": '"Windows"',
+    "Accept-Encoding": "gzip, deflate, br, zstd",
+}
+
+
+class NlSessionManager:
+    """librarian.nl.go.kr 세션 1개를 유지하고 쿠키는 만료됐을 때만 새로 받습니다 (스레드 안전)."""
+
+    def __init__(self, idle_sec=SESSION_IDLE_SEC):
+        self.idle_sec = idle_sec
+        self._session = None
+        self._last_used = 0.0
+        self._lock = threading.Lock()
+        self.cookie_refreshes = 0
+
+    def _new_session(self):
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0)
+        session.mount("https://", adapter)
+        return session
+
+    def _cookies_valid(self, now):
+        session = self._session
+        if session is None or not session.cookies:
+            return False
+        if now - self._last_used > self.idle_sec:
+            return False  # 서버 쪽 세션이 만료됐을 가능성
+        return not any(c.expires is not None and c.expires <= now for c in session.cookies)
+
+    def _refresh_cookies(self, app_instance=None):
+        """메인 페이지 GET으로 쿠키를 새로 받습니다 (잠금 안에서 호출)."""
+        if self._session is None:
+            self._session = self._new_session()
+        self._session.cookies.clear()
+        self.cookie_refreshes += 1
+        try:
+            if app_instance:
+                app_instance.log_message(
+                    "  [scrape_nl_go_kr_ajax] 메인 페이지에 GET 요청을 보내 쿠키를 얻는 중 (자동 관리).."
+                )
+            response = self._session.get(
+                MAIN_PAGE_URL,
+                headers={
+                    "User-Agent": USER_AGENT,
+                    "Accept-Language": "ko,en-US;q=0.9,en;q=0.8",
+                    "Accept-Encoding": "gzip, deflate, br, zstd",
+                },
+                timeout=REQUEST_TIMEOUT,
+            )
+            if app_instance:
+                app_instance.log_message(
+                    f"  [scrape_nl_go_kr_ajax] 메인 페이지 응답 코드: {response.status_code}"
+                )
+        except requests.exceptions.RequestException as e:
+            if app_instance:
+                app_instance.log_message(
+                    f"  [scrape_nl_go_kr_ajax] 메인 페이지 요청 중 오류 발생 (쿠키 획득 시도): {e}",
+                    level="ERROR",
+                )
+            # 오류 발생해도 다음 단계 진행 (쿠키 없이 시도)
+        self._last_used = time.time()
+
+    def session(self, app_instance=None):
+        """쿠키가 유효한 세션 (필요할 때만 메인 페이지 재방문)."""
+        with self._lock:
+            if not self._cookies_valid(time.time()):
+                self._refresh_cookies(app_instance)
+            return self._session
+
+    def invalidate(self):
+        """다음 요청 때 쿠키를 새로 받도록 표시합니다."""
+        with self._lock:
+            if self._session is not None:
+                self._session.cookies.clear()
+
+    def post(self, url, data, headers, app_instance=None):
+        response = self.session(app_instance).post(
+            url, data=data, headers=headers, timeout=REQUEST_TIMEOUT
+        )
+        if _looks_like_expired_session(response):
+            # 세션 만료 응답이면 쿠키를 새로 받아 1회 재시도
+            self.invalidate()
+            response = self.session(app_instance).post(
+                url, data=data, headers=headers, timeout=REQUEST_TIMEOUT
+            )
+        self._last_used = time.time()
+        return response
+
+
+def _looks_like_expired_session(response):
+    """세션 만료 시 서버가 돌려주는 응답(인증 오류, 메인/로그인 페이지로 이동)인지."""
+    if response.status_code in (401, 403, 419, 440):
+        return True
+    if response.history and response.url.rstrip("/") != AJAX_URL:
+        return True  # AJAX 대신 다른 페이지로 리다이렉트됨
+    return False
+
+
+_session_manager = NlSessionManager()
 
 
 def scrape_nl_go_kr_ajax(search_term, app_instance=None):
     """
-    ✅ 1. 먼저 기본 함수를 정의 (30초 타임아웃)
+    ✅ 1. 먼저 기본 함수를 정의
 
     librarian.nl.go.kr의 AJAX 엔드포인트에 POST 요청을 보내 데이터를 스크레이핑하는 함수입니다.
-    이 함수는 먼저 메인 페이지에 GET 요청을 보내 유효한 쿠키를 획득한 후,
-    requests 세션의 자동 쿠키 관리에 의존하여 AJAX POST 요청을 보냅니다.
+    ✅ [성능 개선] 장기 세션(NlSessionManager)을 사용하므로 메인 페이지 GET(쿠키 획득)은
+    쿠키가 없거나 만료됐을 때만 수행합니다.
 
     Args:
         search_term (str): 검색할 주제어 (예: "물", "레시피")
@@ -32,38 +175,6 @@ def scrape_nl_go_kr_ajax(search_term, app_instance=None):
     Returns:
         str or None: 서버로부터 받은 응답 텍스트 (일반적으로 HTML 또는 JSON) 또는 오류 발생 시 None.
     """
-    main_page_url = "https://librarian.nl.go.kr/LI/contents/L20202000000.do"  # 주제명 브라우징 페이지
-    ajax_url = "https://librarian.nl.go.kr/LI/module/isni/subjectList1depth.ajax"
-
-    session = requests.Session()
-
-    # 1. 메인 페이지에 GET 요청을 보내 쿠키 획득 (requests 세션이 내부적으로 쿠키를 관리하도록 함)
-    try:
-        if app_instance:
-            app_instance.log_message(
-                "  [scrape_nl_go_kr_ajax] 메인 페이지에 GET 요청을 보내 쿠키를 얻는 중 (자동 관리).."
-            )
-        main_page_response = session.get(
-            main_page_url,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
-                "Accept-Language": "ko,en-US;q=0.9,en;q=0.8",
-                "Accept-Encoding": "gzip, deflate, br, zstd",
-            },
-            timeout=30,
-        )  # ✅ 30초 타임아웃
-        if app_instance:
-            app_instance.log_message(
-                f"  [scrape_nl_go_kr_ajax] 메인 페이지 응답 코드: {main_page_response.status_code}"
-            )
-    except requests.exceptions.RequestException as e:
-        if app_instance:
-            app_instance.log_message(
-                f"  [scrape_nl_go_kr_ajax] 메인 페이지 요청 중 오류 발생 (쿠키 획득 시도): {e}",
-                level="ERROR",
-            )
-        # 오류 발생해도 다음 단계 진행 (쿠키 없이 시도)
-
     if app_instance:
         app_instance.log_message(
             f'  [scrape_nl_go_kr_ajax] 실제 검색어: "{search_term}" (타입: {type(search_term)})'
@@ -72,33 +183,12 @@ def scrape_nl_go_kr_ajax(search_term, app_instance=None):
     # POST 요청 본문에 포함될 데이터 (kwd만 포함)
     payload = {"kwd": search_term}  # 실제 전달받은 search_term 사용
 
-    # HTTP 헤더 설정
-    headers = {
-        "Accept": "text/html, */*; q=0.01",
-        "Accept-Language": "ko,en-US;q=0.9,en;q=0.8",
-        "Connection": "keep-alive",
-        "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-        "Origin": "https://librarian.nl.go.kr",
-        "Referer": "https://librarian.nl.go.kr/LI/contents/L20202000000.do",
-        "Sec-Fetch-Dest": "empty",
-        "Sec-Fetch-Mode": "cors",
-        "Sec-Fetch-Site": "same-origin",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
-        "X-Requested-With": "XMLHttpRequest",
-        "sec-ch-ua": '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
-        "sec-ch-ua-mobile": "?0",
-        "sec-ch-ua-platform": '"Windows"',
-        "Accept-Encoding": "gzip, deflate, br, zstd",
-    }
-
     try:
         if app_instance:
             app_instance.log_message(
-                f"  [scrape_nl_go_kr_ajax] AJAX POST 요청 URL: {ajax_url}"
+                f"  [scrape_nl_go_kr_ajax] AJAX POST 요청 URL: {AJAX_URL}"
             )
-        response = session.post(
-            ajax_url, data=payload, headers=headers, timeout=30
-        )  # ✅ 30초 타임아웃
+        response = _session_manager.post(AJAX_URL, payload, AJAX_HEADERS, app_instance)
         response.raise_for_status()  # 200 이외의 응답 코드에 대해 예외 발생
 
         response_text = response.text
@@ -116,14 +206,15 @@ def scrape_nl_go_kr_ajax(search_term, app_instance=None):
                 f"  [scrape_nl_go_kr_ajax] 스크레이핑 중 오류 발생: {e}", level="ERROR"
             )
         raise e
-    finally:
-        session.close()
 
 
 def scrape_nl_go_kr_ajax_with_retry(search_term, app_instance=None, max_retries=3):
     """
     재시도 로직이 포함된 AJAX 스크레이핑 함수
 
+    ✅ [성능 개선] 재시도는 AJAX POST만 다시 보냄 (쿠키는 실패 후에만 새로 받음),
+    대기는 1초 → 2초 지수 백오프.
+
     Args:
         search_term (str): 검색할 주제어
         app_instance: 앱 인스턴스
@@ -138,15 +229,17 @@ def scrape_nl_go_kr_ajax_with_retry(search_term, app_instance=None, max_retries=
             return scrape_nl_go_kr_ajax(search_term, app_instance)
         except Exception as e:
             if attempt < max_retries - 1:
+                delay = 2 ** attempt
                 if app_instance:
                     app_instance.log_message(
                         f"  [재시도 {attempt + 1}/{max_retries}] 오류: {e}",
                         level="WARNING",
                     )
                     app_instance.log_message(
-                        f"  [재시도] 5초 후 다시 시도합니다...", level="INFO"
+                        f"  [재시도] {delay}초 후 다시 시도합니다...", level="INFO"
                     )
-                time.sleep(5)
+                _session_manager.invalidate()  # 다음 시도는 쿠키부터 새로
+                time.sleep(delay)
                 continue
             else:
                 raise e
@@ -240,6 +333,53 @@ def parse_ajax_response_for_subjects(html, search_term=""):
     return subjects
 
 
+def _fetch_subjects(search_term, app_instance=None):
+    """원격 조회 + 파싱 후 캐시에 저장합니다."""
+    response_text = scrape_nl_go_kr_ajax_with_retry(search_term, app_instance, max_retries=3)
+    subjects = parse_ajax_response_for_subjects(response_text or "", search_term)
+    if subjects:
+        _subject_cache.put(search_term, {"fetched_at": time.time(), "subjects": subjects})
+    return subjects
+
+
+def _refresh_in_background(search_term):
+    """오래된 캐시 항목을 백그라운드 스레드에서 갱신합니다 (글자당 1개만)."""
+    with _refreshing_lock:
+        if search_term in _refreshing:
+            return
+        _refreshing.add(search_term)
+
+    def worker():
+        try:
+            _fetch_subjects(search_term)
+        except Exception:
+            pass  # 다음 검색 때 다시 시도 (기존 캐시는 그대로 사용)
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(search_term)
+
+    threading.Thread(target=worker, name="SingleWordRefresh", daemon=True).start()
+
+
+def get_single_word_subjects(search_term, app_instance=None):
+    """
+    한 글자 주제명 목록 (parse_ajax_response_for_subjects 결과).
+    ✅ [성능 개선] 글자별 SQLite 캐시를 먼저 사용하고, 오래된 항목은 캐시를 반환한 뒤 백그라운드 갱신.
+    """
+    cached = _subject_cache.get(search_term)
+    if cached and cached.get("subjects"):
+        age = time.time() - cached.get("fetched_at", 0)
+        if app_instance:
+            app_instance.log_message(
+                f"정보: '{search_term}' 한 글자 주제명 {len(cached['subjects'])}개를 캐시에서 로드했습니다.",
+                level="INFO",
+            )
+        if age > SINGLE_WORD_REFRESH_SEC:
+            _refresh_in_background(search_term)
+        return [dict(subject) for subject in cached["subjects"]]  # 호출부 수정이 캐시에 남지 않게
+    return _fetch_subjects(search_term, app_instance)
+
+
 def run_single_word_search(search_term, app_instance=None):
     """
     주어진 검색어로 국립중앙도서관 웹사이트에서 한 글자 주제명 데이터를 추출합니다.
@@ -262,11 +402,7 @@ def run_single_word_search(search_term, app_instance=None):
         app_instance.update_progress(0)
 
     try:
-        html_response = scrape_nl_go_kr_ajax(search_term, app_instance)
-        if not html_response:
-            return pd.DataFrame()
-
-        subjects = parse_ajax_response_for_subjects(html_response, search_term)
+        subjects = get_single_word_subjects(search_term, app_instance)
 
         if subjects:
             df = pd.DataFrame(subjects)
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+# 파일명: sru_paging.py
+# 설명: SRU/REST 검색 결과 페이지 엔진 (호스트별 동시 요청 제한 + 페이지 스트리밍 + 조기 종료)
+# 생성일: 2025-10-31
+# 사용처: Search_LC.py, Search_DNB.py, Search_BNF.py, Search_Harvard.py
+#
+# 배경:
+# - 각 클라이언트가 maximumRecords=50(또는 limit=50) 한 번만 요청해서
+#   저자명처럼 넓은 검색은 51번째 이후 결과가 조용히 잘렸다.
+#
+# 방식:
+# 1. 첫 페이지를 받아 전체 건수(SRU numberOfRecords / Harvard numFound)를 확인.
+# 2. 전체 건수와 결과 예산(result_budget) 중 작은 값까지 남은 페이지를
+#    호스트별 동시 요청 수(HOST_CONCURRENCY) 안에서 미리 요청.
+# 3. 도착한 페이지는 on_page 콜백으로 즉시 전달 (탭에 먼저 표시).
+# 4. 사용자 중지(stop_search_flag) 또는 예산 도달 시 남은 페이지는 요청하지 않음.
+# 5. 레코드 ID(record_key)로 페이지 간 중복 제거. 최종 결과는 페이지 순서대로 반환.
+#
+#     paging = PagedSearch(fetch_page, page_size=50, host="lx2.loc.gov",
+#                          budget=result_budget(app_instance), record_key=lambda r: r["LCCN"],
+#                          on_page=on_page, should_stop=stop_checker(app_instance))
+#     records = paging.run()   # fetch_page(offset) → (레코드 목록, 전체 건수 또는 None)
+
+import re
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# 호스트별 동시 요청 상한 (여러 탭/통합검색이 동시에 같은 서버를 호출해도 공유)
+HOST_CONCURRENCY = {
+    "lx2.loc.gov": 2,
+    "services.dnb.de": 3,
+    "catalogue.bnf.fr": 2,
+    "api.lib.harvard.edu": 3,
+}
+DEFAULT_HOST_CONCURRENCY = 2
+
+RESULT_BUDGET_SETTING = "foreign_search_result_budget"
+DEFAULT_RESULT_BUDGET = 200
+MAX_RESULT_BUDGET = 2000
+
+_host_slots = {}
+_host_slots_lock = threading.Lock()
+
+_SRU_TOTAL_RE = re.compile(rb"<(?:[\w.-]+:)?numberOfRecords>\s*(\d+)\s*<")
+_NUM_FOUND_RE = re.compile(rb"<numFound>\s*(\d+)\s*<")
+_MISSING_KEYS = (None, "", "없음")
+
+
+def host_slot(host):
+    """호스트별 동시 요청 제한용 세마포어 (with host_slot(host): ...)."""
+    with _host_slots_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = threading.BoundedSemaphore(
+                HOST_CONCURRENCY.get(host, DEFAULT_HOST_CONCURRENCY)
+            )
+            _host_slots[host] = slot
+        return slot
+
+
+def sru_total(content):
+    """SRU 응답의 numberOfRecords (없으면 None)."""
+    match = _SRU_TOTAL_RE.search(content[:4096])
+    return int(match.group(1)) if match else None
+
+
+def num_found_total(content):
+    """Harvard LibraryCloud 응답 pagination/numFound (없으면 None)."""
+    match = _NUM_FOUND_RE.search(content[:4096])
+    return int(match.group(1)) if match else None
+
+
+def result_budget(app_instance, default=DEFAULT_RESULT_BUDGET):
+    """설정(foreign_search_result_budget)의 소스별 최대 결과 수."""
+    db_manager = getattr(app_instance, "db_manager", None)
+    if db_manager is not None:
+        try:
+            value = db_manager.get_setting(RESULT_BUDGET_SETTING)
+            if value:
+                return max(1, min(int(value), MAX_RESULT_BUDGET))
+        except Exception:
+            pass  # 잘못된 값/설정 DB 오류 시 기본값
+    return default
+
+
+def stop_checker(app_instance):
+    """app_instance.stop_search_flag 확인 함수 (플래그가 없으면 항상 False)."""
+    flag = getattr(app_instance, "stop_search_flag", None)
+    if flag is None:
+        return lambda: False
+    return flag.is_set
+
+
+class PagedSearch:
+    """offset 단위 페이지를 호스트 제한 안에서 병렬로 받아 합치는 엔진.
+
+    fetch_page(offset): offset(0부터)에서 시작하는 한 페이지를 받아
+        (레코드 dict 목록, 전체 건수 또는 None)을 반환. 첫 페이지 예외는 그대로 전파하고,
+        이후 페이지 예외는 on_error(offset, exc)로 알린 뒤 건너뜁니다.
+    on_page(records): 새로 도착한(중복 제거된) 레코드 사본 목록. 작업 스레드에서 호출됩니다.
+    """
+
+    def __init__(
+        self,
+        fetch_page,
+        page_size,
+        host,
+        budget=DEFAULT_RESULT_BUDGET,
+        record_key=None,
+        on_page=None,
+        should_stop=None,
+        on_error=None,
+    ):
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.host = host
+        self.budget = budget
+        self.record_key = record_key
+        self.on_page = on_page
+        self.should_stop = should_stop or (lambda: False)
+        self.on_error = on_error
+        self.total = None  # 서버가 알려준 전체 건수
+        self.pages_fetched = 0
+        self.stopped_by_user = False
+        self._pages = {}  # offset → 레코드 목록
+        self._seen = set()
+        self._delivered = 0
+
+    @property
+    def truncated(self):
+        """예산 때문에 서버 결과를 다 받지 않았는지 여부."""
+        return self.total is not None and self.total > self.budget
+
+    def _fetch(self, offset):
+        with host_slot(self.host):
+            if self.should_stop():
+                return [], self.total
+            return self.fetch_page(offset)
+
+    def _is_new(self, record):
+        key = self.record_key(record) if self.record_key else None
+        if key in _MISSING_KEYS:
+            return True
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        return True
+
+    def _accept(self, offset, records):
+        """페이지를 보관하고 새 레코드만 on_page로 전달합니다. 예산에 도달하면 True."""
+        self.pages_fetched += 1
+        self._pages[offset] = records
+        fresh = [record for record in records if self._is_new(record)]
+        fresh = fresh[: max(0, self.budget - self._delivered)]
+        self._delivered += len(fresh)
+        if fresh and self.on_page is not None:
+            try:
+                # 작업 스레드가 이후 레코드를 수정(번역 등)해도 화면 쪽 사본은 그대로
+                self.on_page([dict(record) for record in fresh])
+            except Exception:
+                pass
+        return self._delivered >= self.budget
+
+    def _remaining_offsets(self, first_count):
+        if self.total is not None:
+            limit = min(self.total, self.budget)
+        elif first_count >= self.page_size:
+            limit = self.budget  # 전체 건수를 모르면 짧은 페이지가 올 때까지
+        else:
+            limit = 0
+        return list(range(self.page_size, limit, self.page_size))
+
+    def run(self):
+        records, self.total = self._fetch(0)
+        done = self._accept(0, records)
+        offsets = [] if done else self._remaining_offsets(len(records))
+
+        if offsets and not self.should_stop():
+            workers = min(
+                len(offsets), HOST_CONCURRENCY.get(self.host, DEFAULT_HOST_CONCURRENCY)
+            )
+            executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="PagedSearch"
+            )
+            pending = {}
+            queue = iter(offsets)
+
+            def submit_next():
+                offset = next(queue, None)
+                if offset is not None:
+                    pending[executor.submit(self._fetch, offset)] = offset
+
+            try:
+                for _ in range(workers):
+                    submit_next()
+
+                while pending:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        offset = pending.pop(future)
+                        try:
+                            page, _total = future.result()
+                        except Exception as e:
+                            if self.on_error is not None:
+                                self.on_error(offset, e)
+                            continue
+                        done = self._accept(offset, page) or done
+                        if self.total is None and len(page) < self.page_size:
+                            done = True  # 마지막 페이지
+                    if self.should_stop():
+                        self.stopped_by_user = True
+                        done = True
+                    if done:
+                        break
+                    while len(pending) < workers:
+                        before = len(pending)
+                        submit_next()
+                        if len(pending) == before:
+                            break
+            finally:
+                # 중지/예산 도달 시 진행 중인 요청은 기다리지 않음 (결과는 버림)
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        # 최종 결과: 페이지 순서대로, 중복 제거, 예산 이내
+        results = []
+        seen = set()
+        for offset in sorted(self._pages):
+            for record in self._pages[offset]:
+                key = self.record_key(record) if self.record_key else None
+                if key not in _MISSING_KEYS:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                results.append(record)
+                if len(results) >= self.budget:
+                    return results
+        return results
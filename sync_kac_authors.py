@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 """
 파일명: sync_kac_authors.py
-Version: 1.0.0
+Version: 1.1.0
 생성일: 2025-11-01
 
 KAC 저자명 동기화 스크립트
@@ -23,14 +23,23 @@ KAC 순서대로 정확한 저자명을 kac_authors 컬럼에 추가
 - authority DB에서 직접 조회한 정확한 저자명
 - FTS5 검색 가능
 
+실행 모드:
+- python sync_kac_authors.py            : 집합 기반 증분 동기화 (ATTACH + SQL 조인)
+- python sync_kac_authors.py --full     : 집합 기반 전체 재계산
+- python sync_kac_authors.py --mode row : 기존 행 단위 동기화
+
 작업자: Claude Code
 """
+import argparse
 import sqlite3
 import logging
+import time
 from typing import List, Optional
 from pathlib import Path
 from tqdm import tqdm
 
+import fts_maintenance
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -151,15 +160,13 @@ class KACAuthorSyncer:
         cursor = conn.cursor()
 
         try:
-            # [1단계] 기존 FTS5 및 트리거 제거
-            logger.info("  [1/5] 기존 FTS5 테이블 제거 중...")
-            cursor.execute("DROP TRIGGER IF EXISTS biblio_ai")
-            cursor.execute("DROP TRIGGER IF EXISTS biblio_au")
-            cursor.execute("DROP TRIGGER IF EXISTS biblio_ad")
+            # [1단계] 기존 FTS5, 트리거, 더티 로그 제거 (컬럼 구성이 바뀌므로)
+            logger.info("  [1/4] 기존 FTS5 테이블 제거 중...")
+            fts_maintenance.uninstall_dirty_tracking(conn, "biblio_title_fts", drop_log=True)
             cursor.execute("DROP TABLE IF EXISTS biblio_title_fts")
 
             # [2단계] 새 FTS5 테이블 생성 (kac_authors 포함)
-            logger.info("  [2/5] 새 FTS5 테이블 생성 중 (kac_authors 포함)...")
+            logger.info("  [2/4] 새 FTS5 테이블 생성 중 (kac_authors 포함)...")
             cursor.execute(
                 """
                 CREATE VIRTUAL TABLE biblio_title_fts USING fts5(
@@ -175,49 +182,18 @@ class KACAuthorSyncer:
             """
             )
 
-            # [3단계] 트리거 생성
-            logger.info("  [3/5] 트리거 생성 중...")
-            cursor.execute(
-                """
-                CREATE TRIGGER biblio_ai AFTER INSERT ON biblio BEGIN
-                    INSERT INTO biblio_title_fts(rowid, nlk_id, title, author_names, kac_codes, kac_authors)
-                    VALUES (new.rowid, new.nlk_id, new.title, new.author_names, new.kac_codes, new.kac_authors);
-                END
-            """
-            )
-
-            cursor.execute(
-                """
-                CREATE TRIGGER biblio_ad AFTER DELETE ON biblio BEGIN
-                    DELETE FROM biblio_title_fts WHERE rowid = old.rowid;
-                END
-            """
-            )
-
-            cursor.execute(
-                """
-                CREATE TRIGGER biblio_au AFTER UPDATE ON biblio BEGIN
-                    UPDATE biblio_title_fts
-                    SET title = new.title,
-                        author_names = new.author_names,
-                        kac_codes = new.kac_codes,
-                        kac_authors = new.kac_authors
-                    WHERE rowid = new.rowid;
-                END
-            """
-            )
-
-            # [4단계] REBUILD (기존 데이터 인덱싱)
-            logger.info("  [4/5] FTS5 인덱스 재구축 중... (시간이 걸릴 수 있습니다)")
+            # [3단계] REBUILD (스키마가 바뀐 경우에만 필요한 전체 색인)
+            logger.info("  [3/4] FTS5 인덱스 재구축 중... (시간이 걸릴 수 있습니다)")
             cursor.execute(
                 "INSERT INTO biblio_title_fts(biblio_title_fts) VALUES('rebuild')"
             )
 
-            # [5단계] 최적화
-            logger.info("  [5/5] 최적화 중...")
-            cursor.execute(
-                "INSERT INTO biblio_title_fts(biblio_title_fts) VALUES('optimize')"
-            )
+            # [4단계] 더티 추적 트리거 설치
+            # ✅ [성능 개선] 이후 변경은 트리거 대신 더티 로그 → 델타 반영,
+            # 'optimize'(전체 세그먼트 재작성)는 제거하고 점진 병합(merge_step)에 맡김
+            logger.info("  [4/4] 더티 추적 트리거 설치 중...")
+            fts_maintenance.install_dirty_tracking(conn, "biblio_title_fts")
+            fts_maintenance.merge_step(conn, "biblio_title_fts")
 
             conn.commit()
 
@@ -296,6 +272,12 @@ class KACAuthorSyncer:
                 )
                 conn.commit()
 
+                # FTS가 이미 kac_authors를 포함하면 변경 rowid만 더티 로그에 기록
+                fts_delta = self._fts_has_kac_authors(cursor)
+                if fts_delta:
+                    fts_maintenance.install_dirty_tracking(conn, "biblio_title_fts")
+                conn.commit()
+
                 # 2. 전체/대상 레코드 수 확인
                 cursor.execute(
                     "SELECT COUNT(*) FROM biblio WHERE kac_codes IS NOT NULL AND kac_codes != ''"
@@ -393,10 +375,15 @@ class KACAuthorSyncer:
                     f"처리 결과: 총 {processed:,}개 처리, {updated:,}개 업데이트"
                 )
 
-                # 4. FTS5에 kac_authors 자동 추가
-                logger.info("\n🔧 FTS5 인덱스에 kac_authors 추가 중...")
-                self._rebuild_fts5_with_kac_authors(conn)
-                logger.info("✅ FTS5 인덱스 재구축 완료!")
+                # 4. FTS5 반영: 컬럼이 있으면 델타, 없으면 1회 재구축
+                if fts_delta:
+                    logger.info("\n🔧 FTS5 인덱스 델타 반영 중...")
+                    n = fts_maintenance.apply_all_dirty(conn, "biblio_title_fts")
+                    logger.info(f"✅ FTS5 델타 반영 완료: {n:,}개 rowid")
+                else:
+                    logger.info("\n🔧 FTS5 인덱스에 kac_authors 추가 중...")
+                    self._rebuild_fts5_with_kac_authors(conn)
+                    logger.info("✅ FTS5 인덱스 재구축 완료!")
 
                 return processed, updated
 
@@ -404,6 +391,230 @@ class KACAuthorSyncer:
             logger.error(f"KAC 저자명 동기화 실패: {e}")
             raise
 
+    # ------------------------------------------------------------------
+    # ⚡ 집합 기반(set-based) 동기화
+    # ------------------------------------------------------------------
+    # Python 루프 대신 ATTACH + SQL 조인으로 kac_authors를 한 번에 계산한다.
+    # - kac_sync_state: 마지막 동기화 시점의 (rowid, kac_codes) 스냅샷
+    #   → 다음 실행에서는 kac_codes가 바뀐 행만 다시 계산 (증분 동기화)
+    # - FTS5는 더티 추적 트리거(fts_maintenance)로 변경 rowid만 델타 반영
+    #   (kac_authors 컬럼이 없는 구 스키마일 때만 전체 재구축)
+
+    def _select_sync_targets(self, cursor, incremental: bool) -> int:
+        """temp.kac_target에 재계산 대상 (rowid, kac_codes)를 채우고 건수를 반환합니다."""
+        cursor.execute("DROP TABLE IF EXISTS temp.kac_target")
+        cursor.execute(
+            "CREATE TEMP TABLE kac_target (rid INTEGER PRIMARY KEY, kac_codes TEXT)"
+        )
+        if incremental:
+            # 스냅샷에 없는 KAC 보유 행 + 스냅샷과 kac_codes가 달라진 행
+            cursor.execute(
+                """
+                INSERT INTO temp.kac_target (rid, kac_codes)
+                SELECT b.rowid, b.kac_codes
+                FROM biblio b
+                LEFT JOIN kac_sync_state s ON s.rid = b.rowid
+                WHERE (s.rid IS NULL AND b.kac_codes IS NOT NULL AND b.kac_codes != '')
+                   OR (s.rid IS NOT NULL AND COALESCE(s.kac_codes, '') != COALESCE(b.kac_codes, ''))
+                """
+            )
+        else:
+            cursor.execute(
+                """
+                INSERT INTO temp.kac_target (rid, kac_codes)
+                SELECT rowid, kac_codes FROM biblio
+                WHERE (kac_codes IS NOT NULL AND kac_codes != '')
+                   OR (kac_authors IS NOT NULL AND kac_authors != '')
+                """
+            )
+        cursor.execute("SELECT COUNT(*) FROM temp.kac_target")
+        return cursor.fetchone()[0]
+
+    def _compute_kac_authors_set_based(self, cursor):
+        """temp.kac_target → temp.kac_result(rid, kac_authors) 계산 (KAC 순서 보존)."""
+        # [1] kac_codes 분해: "A;B;C" → (rid, pos, code)
+        cursor.execute("DROP TABLE IF EXISTS temp.kac_exploded")
+        cursor.execute(
+            "CREATE TEMP TABLE kac_exploded (rid INTEGER, pos INTEGER, code TEXT)"
+        )
+        cursor.execute(
+            """
+            WITH RECURSIVE split(rid, pos, code, rest) AS (
+                SELECT rid, 0, '', COALESCE(kac_codes, '') || ';' FROM temp.kac_target
+                UNION ALL
+                SELECT rid, pos + 1,
+                       TRIM(SUBSTR(rest, 1, INSTR(rest, ';') - 1)),
+                       SUBSTR(rest, INSTR(rest, ';') + 1)
+                FROM split WHERE rest != ''
+            )
+            INSERT INTO temp.kac_exploded (rid, pos, code)
+            SELECT rid, pos, code FROM split WHERE pos > 0 AND code != ''
+            """
+        )
+        cursor.execute("CREATE INDEX temp.idx_kac_exploded ON kac_exploded(rid, pos)")
+
+        # [2] 고유 KAC 코드 → 저자명 (기존 _get_kac_author와 동일 규칙: 첫 행의 pref_label)
+        cursor.execute("DROP TABLE IF EXISTS temp.kac_names")
+        cursor.execute(
+            """
+            CREATE TEMP TABLE kac_names AS
+            SELECT c.code AS code,
+                   (SELECT TRIM(a.pref_label) FROM auth.authority a
+                    WHERE a.kac_id = c.code LIMIT 1) AS name
+            FROM (SELECT DISTINCT code FROM temp.kac_exploded) c
+            """
+        )
+        cursor.execute("CREATE UNIQUE INDEX temp.idx_kac_names ON kac_names(code)")
+
+        # [3] 순서 보존 group_concat: "저자명 KAC코드;..." (저자명 없으면 코드만)
+        part = (
+            "CASE WHEN n.name IS NOT NULL AND n.name != '' "
+            "THEN n.name || ' ' || e.code ELSE e.code END"
+        )
+        cursor.execute("DROP TABLE IF EXISTS temp.kac_result")
+        if sqlite3.sqlite_version_info >= (3, 44, 0):
+            cursor.execute(
+                f"""
+                CREATE TEMP TABLE kac_result AS
+                SELECT e.rid AS rid, GROUP_CONCAT({part}, ';' ORDER BY e.pos) AS kac_authors
+                FROM temp.kac_exploded e LEFT JOIN temp.kac_names n ON n.code = e.code
+                GROUP BY e.rid
+                """
+            )
+        else:
+            # 3.44 미만: 정렬된 서브쿼리 순서대로 집계되는 SQLite 동작에 의존
+            cursor.execute(
+                f"""
+                CREATE TEMP TABLE kac_result AS
+                SELECT rid, GROUP_CONCAT(part, ';') AS kac_authors
+                FROM (
+                    SELECT e.rid AS rid, {part} AS part
+                    FROM temp.kac_exploded e LEFT JOIN temp.kac_names n ON n.code = e.code
+                    ORDER BY e.rid, e.pos
+                )
+                GROUP BY rid
+                """
+            )
+        cursor.execute("CREATE UNIQUE INDEX temp.idx_kac_result ON kac_result(rid)")
+
+    def _fts_has_kac_authors(self, cursor) -> bool:
+        """biblio_title_fts가 kac_authors 컬럼을 포함하는지 확인합니다."""
+        cursor.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name='biblio_title_fts'"
+        )
+        row = cursor.fetchone()
+        return bool(row and row[0] and "kac_authors" in row[0])
+
+    def sync_kac_authors_set_based(self, incremental: bool = True):
+        """
+        ⚡ 집합 기반 KAC 저자명 동기화 (add_kac_authors_column의 고속 대체 경로).
+
+        Args:
+            incremental: True면 지난 실행 이후 kac_codes가 바뀐 행만 재계산
+
+        Returns:
+            (처리 행 수, 저자명이 채워진 행 수)
+        """
+        logger.info(
+            f"KAC 저자명 집합 기반 동기화 시작 ({'증분' if incremental else '전체'})"
+        )
+        start = time.time()
+
+        with sqlite3.connect(self.biblio_db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL;")
+            cursor.execute("PRAGMA synchronous=NORMAL;")
+            cursor.execute("PRAGMA temp_store=MEMORY;")
+            cursor.execute("PRAGMA mmap_size=268435456;")  # 256MB
+
+            try:
+                cursor.execute("ALTER TABLE biblio ADD COLUMN kac_authors TEXT")
+                logger.info("kac_authors 컬럼 추가 완료")
+            except sqlite3.OperationalError as e:
+                if "duplicate column name" not in str(e).lower():
+                    raise
+            cursor.execute(
+                "CREATE TABLE IF NOT EXISTS kac_sync_state (rid INTEGER PRIMARY KEY, kac_codes TEXT)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_biblio_kac_authors ON biblio(kac_authors);"
+            )
+            conn.commit()
+
+            cursor.execute("ATTACH DATABASE ? AS auth", (self.authority_db_path,))
+            try:
+                # [1] 대상 행 선정
+                target_count = self._select_sync_targets(cursor, incremental)
+                logger.info(f"  [1/4] 재계산 대상: {target_count:,}개")
+                if target_count == 0:
+                    logger.info("변경된 kac_codes가 없습니다. 동기화할 대상이 없습니다.")
+                    conn.commit()
+                    return 0, 0
+
+                # [2] 분해 + 조인 + 순서 보존 집계
+                self._compute_kac_authors_set_based(cursor)
+                logger.info(f"  [2/4] kac_authors 계산 완료 ({time.time() - start:.1f}초)")
+
+                fts_delta = self._fts_has_kac_authors(cursor)
+                if fts_delta:
+                    fts_maintenance.install_dirty_tracking(conn, "biblio_title_fts")
+
+                # [3] biblio 갱신 (변경 rowid는 트리거가 더티 로그에 기록)
+                cursor.execute(
+                    """
+                    UPDATE biblio
+                    SET kac_authors = CASE
+                        WHEN kac_codes IS NULL OR kac_codes = '' THEN NULL
+                        ELSE COALESCE(
+                            (SELECT r.kac_authors FROM temp.kac_result r WHERE r.rid = biblio.rowid),
+                            '')
+                        END
+                    WHERE rowid IN (SELECT rid FROM temp.kac_target)
+                    """
+                )
+
+                # [4] 스냅샷 갱신 (다음 증분 동기화 기준점)
+                cursor.execute(
+                    """
+                    INSERT OR REPLACE INTO kac_sync_state (rid, kac_codes)
+                    SELECT t.rid, b.kac_codes
+                    FROM temp.kac_target t JOIN biblio b ON b.rowid = t.rid
+                    """
+                )
+                if not incremental:
+                    cursor.execute(
+                        "DELETE FROM kac_sync_state WHERE rid NOT IN (SELECT rowid FROM biblio)"
+                    )
+                conn.commit()
+                logger.info(f"  [3/4] biblio 갱신 완료 ({time.time() - start:.1f}초)")
+
+                cursor.execute(
+                    """
+                    SELECT COUNT(*) FROM biblio
+                    WHERE rowid IN (SELECT rid FROM temp.kac_target)
+                      AND kac_authors IS NOT NULL AND kac_authors != ''
+                    """
+                )
+                updated = cursor.fetchone()[0]
+            finally:
+                for tbl in ("kac_target", "kac_exploded", "kac_names", "kac_result"):
+                    cursor.execute(f"DROP TABLE IF EXISTS temp.{tbl}")
+                conn.commit()
+                cursor.execute("DETACH DATABASE auth")
+
+            if fts_delta:
+                n = fts_maintenance.apply_all_dirty(conn, "biblio_title_fts")
+                logger.info(f"  [4/4] FTS5 델타 반영 완료: {n:,}개 rowid")
+            else:
+                logger.info("  [4/4] FTS5 전체 재구축 (kac_authors 컬럼 없음)")
+                self._rebuild_fts5_with_kac_authors(conn)
+
+        logger.info(
+            f"✅ 집합 기반 동기화 완료: {target_count:,}개 처리, {updated:,}개 업데이트 "
+            f"({time.time() - start:.1f}초)"
+        )
+        return target_count, updated
+
     def get_statistics(self):
         """동기화 통계 정보를 반환합니다."""
         stats = {
@@ -493,6 +704,20 @@ class KACAuthorSyncer:
 
 def main():
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="KAC 저자명 동기화")
+    parser.add_argument(
+        "--mode",
+        choices=["set", "row"],
+        default="set",
+        help="set: ATTACH + SQL 조인 집합 기반(기본), row: 기존 행 단위 Python 루프",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="set 모드에서 증분 대신 전체 행을 재계산",
+    )
+    args = parser.parse_args()
+
     try:
         # KAC 저자명 동기화 생성
         syncer = KACAuthorSyncer()
@@ -510,6 +735,15 @@ def main():
             logger.info("  - kac_authors 컬럼: 아직 생성되지 않음")
             logger.info(f"  - 동기화 필요: {stats['kac_records']:,}개")
 
+        if args.mode == "set":
+            # 집합 기반 증분 동기화는 변경이 없으면 곧바로 끝나므로 확인 없이 실행
+            syncer.sync_kac_authors_set_based(incremental=not args.full)
+            final_stats = syncer.get_statistics()
+            logger.info(f"  - 동기화 완료: {final_stats['synced_records']:,}개")
+            logger.info(f"  - 동기화 필요: {final_stats['unsynced_records']:,}개")
+            syncer.sample_results(5)
+            return 0
+
         # 동기화 실행 여부 확인
         needs_sync = stats["unsynced_records"] > 0 or not stats["column_exists"]
 
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+콜드 스타트 회귀 벤치마크
+- 새 인터프리터에서 `import qt_main_app` 소요 시간을 측정 (python -X importtime)
+- 시작 경로에 무거운 모듈(lazy_imports.HEAVY_MODULES)이 올라오면 실패
+- 측정값(반복 중 최솟값)이 예산(COLD_START_BUDGET 초)을 넘으면 종료 코드 1
+- 환경 변수 COLD_START_BUDGET 으로 예산 조정 가능
+"""
+import os
+import sys
+import io
+import re
+import subprocess
+import time
+
+if sys.platform == "win32":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+from lazy_imports import HEAVY_MODULES
+
+COLD_START_BUDGET = float(os.environ.get("COLD_START_BUDGET", "3.0"))
+REPEAT = 3
+TOP_N = 15
+
+PROBE = (
+    "import sys, qt_main_app; "
+    f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+)
+IMPORTTIME_RE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+here = os.path.dirname(os.path.abspath(__file__))
+timings = []
+loaded_heavy = ""
+importtime_log = ""
+
+for i in range(REPEAT):
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=here,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        print(f"❌ import 실패:\n{proc.stderr[-2000:]}")
+        sys.exit(1)
+    timings.append(elapsed)
+    loaded_heavy = proc.stdout.strip()
+    importtime_log = proc.stderr
+    print(f"  {i + 1}회차: {elapsed:.2f}s")
+
+# -X importtime 출력에서 self 시간 상위 모듈
+rows = []
+for line in importtime_log.splitlines():
+    match = IMPORTTIME_RE.match(line)
+    if match:
+        rows.append((int(match.group(1)), int(match.group(2)), match.group(4)))
+rows.sort(reverse=True)
+
+print(f"\n{'self(ms)':>9} {'누적(ms)':>9}  모듈 (상위 {TOP_N})")
+print("-" * 50)
+for self_us, cumulative_us, name in rows[:TOP_N]:
+    print(f"{self_us / 1000:>9.1f} {cumulative_us / 1000:>9.1f}  {name}")
+
+best = min(timings)
+print("\n" + "=" * 50)
+print(f"콜드 스타트(최솟값): {best:.2f}s / 예산 {COLD_START_BUDGET:.2f}s")
+print(f"시작 시 로드된 무거운 모듈: {loaded_heavy or '없음'}")
+print("=" * 50)
+
+failed = False
+if loaded_heavy:
+    print(f"❌ 지연 import 대상이 시작 경로에서 로드됨: {loaded_heavy}")
+    failed = True
+if best > COLD_START_BUDGET:
+    print(f"❌ 콜드 스타트 예산 초과: {best:.2f}s > {COLD_START_BUDGET:.2f}s")
+    failed = True
+
+sys.exit(1 if failed else 0)
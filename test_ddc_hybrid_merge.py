@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+DDC 하이브리드 검색 병합 회귀 테스트
+- SearchDeweyManager.search_ddc_by_keyword()가 SQL(FTS) 결과와
+  search_ddc_by_vector() 결과('similarity'/'label', 'keyword' 없음)를 병합
+- 벡터 결과만 있는 경우, SQL만 있는 경우, 둘이 같은 DDC를 찾은 경우를 검사
+- 하나라도 어긋나면 종료 코드 1
+"""
+import io
+import sys
+
+if sys.platform == "win32":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+from search_dewey_manager import SearchDeweyManager
+
+VECTOR_HITS = [
+    {"ddc": "006.3", "label": "Artificial intelligence", "document": "...", "similarity": 0.82},
+    {"ddc": "004", "label": "Computer science", "document": "...", "similarity": 0.61},
+]
+SQL_HITS = [
+    {"ddc": "006.3", "keyword": "artificial intelligence", "term_type": "pref"},
+    {"ddc": "006.31", "keyword": "machine learning", "term_type": "alt"},
+]
+
+
+class FakeVectorDbManager:
+    """search_ddc_by_vector만 제공하는 DB 관리자 대역 (faiss/모델 불필요)."""
+
+    def __init__(self, hits):
+        self.hits = hits
+
+    def search_ddc_by_vector(self, query, top_k=5):
+        return list(self.hits[:top_k])
+
+
+def make_manager(sql_hits, vector_hits):
+    manager = SearchDeweyManager(FakeVectorDbManager(vector_hits))
+    manager._search_ddc_by_sql_fts = lambda keyword, pref_only=False, limit=20: list(sql_hits)
+    return manager
+
+
+def report(label, ok):
+    print(f"  {label:<36} {'✅' if ok else '❌'}")
+    return ok
+
+
+def main():
+    results = []
+
+    try:
+        rows = make_manager([], VECTOR_HITS).search_ddc_by_keyword("AI")
+        ok = (
+            [r["ddc"] for r in rows] == ["006.3", "004"]
+            and [r["score"] for r in rows] == [0.82, 0.61]
+            and all(r["match_type"] == "semantic" for r in rows)
+            and rows[0]["keyword"] == "Artificial intelligence"
+        )
+    except Exception as e:
+        print(f"    예외: {type(e).__name__}: {e}")
+        ok = False
+    results.append(report("벡터 결과만 있는 경우", ok))
+
+    rows = make_manager(SQL_HITS, []).search_ddc_by_keyword("AI")
+    results.append(
+        report(
+            "SQL 결과만 있는 경우",
+            [r["ddc"] for r in rows] == ["006.3", "006.31"]
+            and all(r["score"] == 2.0 and r["match_type"] == "exact" for r in rows),
+        )
+    )
+
+    rows = make_manager(SQL_HITS, VECTOR_HITS).search_ddc_by_keyword("AI")
+    results.append(
+        report(
+            "SQL + 벡터 병합 (SQL 우선)",
+            [(r["ddc"], r["match_type"]) for r in rows]
+            == [("006.3", "exact"), ("006.31", "exact"), ("004", "semantic")],
+        )
+    )
+
+    rows = make_manager(SQL_HITS, VECTOR_HITS).search_ddc_by_keyword("AI", limit=2)
+    results.append(report("limit 적용", len(rows) == 2))
+    return all(results)
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("DDC 하이브리드 검색 병합 회귀 테스트")
+    print("=" * 60)
+    all_ok = main()
+    print("\n" + ("✅ 모든 경우 통과" if all_ok else "❌ 실패한 경우가 있습니다."))
+    sys.exit(0 if all_ok else 1)
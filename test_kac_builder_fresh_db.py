@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+KAC/Biblio 빌더 새 DB 회귀 테스트 (resume=False / resume=True)
+- 빈 임시 폴더에 작은 전거(JSONL)/서지(JSON 배열) 파일을 만들고
+  BuildWorker._process_many()로 새 DB를 구축 (파서 프로세스 + 단일 writer 경로 그대로)
+- resume=False로 새 DB를 만들 때 build_checkpoint 테이블이 없어 실패하던 문제 확인
+- 적재 건수와 파일별 체크포인트(completed=1) 기록을 검사, 하나라도 어긋나면 종료 코드 1
+"""
+import io
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+
+if sys.platform == "win32":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+from PySide6.QtCore import QCoreApplication
+
+from build_kac_authority_and_biblio_db import BuildWorker, TaskConfig
+
+RECORDS = 5
+
+
+def write_fixtures(folder):
+    authority_path = os.path.join(folder, "authority.jsonl")
+    with open(authority_path, "w", encoding="utf-8") as f:
+        for i in range(RECORDS):
+            rec = {
+                "@id": f"nlk:KAC2020{i:06d}",
+                "@type": "nlon:Author",
+                "name": f"저자{i}",
+                "prefLabel": f"저자{i}",
+                "altLabel": [f"Author {i}"],
+                "create": [f"nlk:CNTS-{i:08d}"],
+            }
+            f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+
+    biblio_path = os.path.join(folder, "biblio.json")
+    with open(biblio_path, "w", encoding="utf-8") as f:
+        json.dump(
+            [
+                {
+                    "@id": f"nlk:CNTS-{i:08d}",
+                    "title": f"도서 {i}",
+                    "creator": f"nlk:KAC2020{i:06d}",
+                    "dc:creator": f"저자{i} 지음",
+                }
+                for i in range(RECORDS)
+            ],
+            f,
+            ensure_ascii=False,
+        )
+    return authority_path, biblio_path
+
+
+def check_db(db_path, kind, table, files):
+    with sqlite3.connect(db_path) as conn:
+        count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        done = conn.execute(
+            "SELECT COUNT(*) FROM build_checkpoint WHERE kind=? AND completed=1",
+            (kind,),
+        ).fetchone()[0]
+    ok = count == RECORDS and done == len(files)
+    print(f"  {kind:<9} {table}={count} (기대 {RECORDS}), 완료 체크포인트={done}/{len(files)} {'✅' if ok else '❌'}")
+    return ok
+
+
+def run_case(resume):
+    print(f"\n[resume={resume}] 새 DB 구축")
+    with tempfile.TemporaryDirectory() as folder:
+        authority_path, biblio_path = write_fixtures(folder)
+        cfg = TaskConfig(
+            authority_files=[authority_path],
+            authority_db=os.path.join(folder, "kac_authority.sqlite"),
+            biblio_files=[biblio_path],
+            biblio_db=os.path.join(folder, "kac_biblio.sqlite"),
+            parallel_workers=1,
+            resume=resume,
+        )
+        worker = BuildWorker(cfg)
+        worker.sig_log.connect(lambda m: print(f"    {m}"))
+        results = []
+        for kind, files, db_path, table in (
+            ("authority", cfg.authority_files, cfg.authority_db, "authority"),
+            ("biblio", cfg.biblio_files, cfg.biblio_db, "biblio"),
+        ):
+            try:
+                worker._process_many(files, db_path, kind)
+                results.append(check_db(db_path, kind, table, files))
+            except Exception as e:
+                print(f"  {kind:<9} ❌ {type(e).__name__}: {e}")
+                results.append(False)
+        return all(results)
+
+
+if __name__ == "__main__":  # 파서 프로세스(spawn)가 이 모듈을 다시 실행하지 않도록
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    print("=" * 60)
+    print("KAC/Biblio 빌더 새 DB 회귀 테스트")
+    print("=" * 60)
+    all_ok = all([run_case(False), run_case(True)])
+    print("\n" + ("✅ 모든 경우 통과" if all_ok else "❌ 실패한 경우가 있습니다."))
+    sys.exit(0 if all_ok else 1)
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+저자전거 복수 검색어(쉼표/세미콜론) 회귀 테스트
+- 임시 폴더에 작은 로컬 전거 DB(init_authority_db + upsert_authority)를 만들고
+  search_kac_authorities_orchestrated()에 "이름, KAC코드; 없는이름" 형태의 검색어를 전달
+- 복수 검색어 경로(re.split)가 예외 없이 search_kac_local_first까지 가는지,
+  로컬에서 찾은 인명은 결과에 들어가고 못 찾은 검색어만 네트워크 검색으로 넘어가는지 확인
+- 네트워크 검색 함수는 호출된 검색어만 기록하도록 교체 (librarian.nl.go.kr에 요청하지 않음)
+- 하나라도 어긋나면 종료 코드 1
+"""
+import io
+import os
+import sys
+import tempfile
+import threading
+
+if sys.platform == "win32":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+import pandas as pd
+
+import Search_KAC_Local
+from build_kac_authority_and_biblio_db import init_authority_db, upsert_authority
+from search_orchestrator import search_kac_authorities_orchestrated
+
+RECORDS = 5
+
+
+class FakeApp:
+    def __init__(self):
+        self.stop_search_flag = threading.Event()
+
+    def log_message(self, message, level="INFO"):
+        print(f"    [{level}] {message}")
+
+
+class LocalDbManager:
+    """search_kac_local()이 사용하는 DatabaseManager 속성만 제공"""
+
+    def __init__(self, folder):
+        self.kac_authority_db_path = os.path.join(folder, "NLK_Authorities.sqlite")
+        self.nlk_biblio_db_path = os.path.join(folder, "nlk_biblio.sqlite")  # 없음
+
+    def _get_kac_authority_connection(self):
+        import sqlite3
+
+        return sqlite3.connect(self.kac_authority_db_path)
+
+    def get_setting(self, key):
+        return None
+
+
+def build_authority_db(db_manager):
+    conn = init_authority_db(db_manager.kac_authority_db_path)
+    for i in range(RECORDS):
+        upsert_authority(
+            conn,
+            {
+                "@id": f"nlk:KAC2020{i:06d}",
+                "@type": "nlon:Author",
+                "name": f"홍길동{i}",
+                "prefLabel": f"홍길동{i}",
+                "altLabel": [f"Hong Gildong {i}"],
+            },
+        )
+    conn.commit()
+    conn.close()
+
+
+def report(label, ok):
+    print(f"  {label:<40} {'✅' if ok else '❌'}")
+    return ok
+
+
+def main():
+    network_calls = []
+
+    def fake_multiple(terms, app_instance):
+        network_calls.append(list(terms))
+        return pd.DataFrame()
+
+    def fake_single(term, app_instance):
+        network_calls.append([term])
+        return pd.DataFrame()
+
+    Search_KAC_Local.run_multiple_kac_search = fake_multiple
+    Search_KAC_Local.run_full_extraction = fake_single
+
+    results = []
+    with tempfile.TemporaryDirectory() as folder:
+        db_manager = LocalDbManager(folder)
+        build_authority_db(db_manager)
+        app = FakeApp()
+
+        for query in ("홍길동1, KAC2020000003; 없는이름", "홍길동2;KAC2020000004"):
+            print(f"\n[검색어] {query}")
+            network_calls.clear()
+            try:
+                df = search_kac_authorities_orchestrated(query, app, db_manager)
+            except Exception as e:
+                results.append(report(f"예외 없음 ({type(e).__name__}: {e})", False))
+                continue
+            codes = set(df["제어번호"]) if "제어번호" in df.columns else set()
+            print(f"    로컬 결과 제어번호: {sorted(codes)}, 네트워크 검색: {network_calls}")
+            if query.startswith("홍길동1"):
+                results.append(report("로컬 인명 2건", codes == {"KAC2020000001", "KAC2020000003"}))
+                results.append(report("못 찾은 검색어만 네트워크", network_calls == [["없는이름"]]))
+            else:
+                results.append(report("로컬 인명 2건", codes == {"KAC2020000002", "KAC2020000004"}))
+                results.append(report("네트워크 검색 없음", network_calls == []))
+    return all(results)
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("저자전거 복수 검색어 회귀 테스트")
+    print("=" * 60)
+    all_ok = main()
+    print("\n" + ("✅ 모든 경우 통과" if all_ok else "❌ 실패한 경우가 있습니다."))
+    sys.exit(0 if all_ok else 1)
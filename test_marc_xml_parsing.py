@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+MARCXML 파싱 벤치마크 (기존 fromstring + XPath 반복 vs marc_xml_parser 스트리밍)
+- 기존 방식: ET.fromstring 후 레코드마다 .find(".//marc:datafield[@tag='...']") 반복
+- 새 방식: iter_marc_records (iterparse + 레코드별 태그 색인 1회 + clear)
+- 두 방식의 추출 결과가 같은지 확인하고, 레코드당 비용과 최대 메모리를 비교
+- 저장해 둔 SRU 응답 파일을 인자로 주면 그 파일로 측정:
+    python test_marc_xml_parsing.py lc_response.xml [dnb_response.xml ...]
+  인자가 없으면 LC SRU 형식의 응답(레코드 50건/2000건)을 만들어 측정
+"""
+import io
+import os
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+if sys.platform == "win32":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+from marc_xml_parser import HAVE_LXML, MARC21_NS, iter_marc_records
+
+REPEAT = 5
+NS = {"marc": MARC21_NS}
+WANTED_TAGS = ("245", "100", "700", "010", "020", "082", "250", "260", "264", "650")
+
+
+def build_sru_response(record_count):
+    """LC SRU(marcxml) 응답과 같은 구조의 픽스처를 만듭니다."""
+    records = []
+    for i in range(record_count):
+        subjects = "".join(
+            f'<datafield tag="650" ind1=" " ind2="0">'
+            f'<subfield code="a">Subject {i}-{j}</subfield>'
+            f'<subfield code="x">History</subfield></datafield>'
+            for j in range(6)
+        )
+        notes = "".join(
+            f'<datafield tag="5{j:02d}" ind1=" " ind2=" ">'
+            f'<subfield code="a">Note {j} for record {i}</subfield></datafield>'
+            for j in range(20)
+        )
+        records.append(
+            "<zs:record><zs:recordSchema>info:srw/schema/1/marcxml-v1.1</zs:recordSchema>"
+            "<zs:recordPacking>xml</zs:recordPacking><zs:recordData>"
+            f'<record xmlns="{MARC21_NS}">'
+            f"<leader>01234cam a2200349 a 4500</leader>"
+            f'<controlfield tag="001">{20000000 + i}</controlfield>'
+            f'<controlfield tag="008">230101s{2000 + i % 25}    nyu      b    001 0 eng  </controlfield>'
+            f'<datafield tag="010" ind1=" " ind2=" "><subfield code="a">  {2023000000 + i}</subfield></datafield>'
+            f'<datafield tag="020" ind1=" " ind2=" "><subfield code="a">97800000{i:05d} (hardcover)</subfield></datafield>'
+            f'<datafield tag="082" ind1="0" ind2="0"><subfield code="a">{i % 1000:03d}.{i % 97}/2</subfield>'
+            f'<subfield code="2">23</subfield></datafield>'
+            f'<datafield tag="100" ind1="1" ind2=" "><subfield code="a">Author {i},</subfield></datafield>'
+            f'<datafield tag="245" ind1="1" ind2="0"><subfield code="a">Title number {i} :</subfield>'
+            f'<subfield code="b">a subtitle /</subfield><subfield code="c">by Author {i}.</subfield></datafield>'
+            f'<datafield tag="250" ind1=" " ind2=" "><subfield code="a">{i % 5 + 1}nd ed.</subfield></datafield>'
+            f'<datafield tag="264" ind1=" " ind2="1"><subfield code="a">New York :</subfield>'
+            f'<subfield code="b">Publisher {i % 30},</subfield><subfield code="c">2023.</subfield></datafield>'
+            f"{notes}{subjects}"
+            f'<datafield tag="700" ind1="1" ind2=" "><subfield code="a">Editor {i},</subfield></datafield>'
+            "</record></zs:recordData></zs:record>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<zs:searchRetrieveResponse xmlns:zs="http://www.loc.gov/zing/srw/">'
+        f"<zs:version>1.1</zs:version><zs:numberOfRecords>{record_count}</zs:numberOfRecords>"
+        f"<zs:records>{''.join(records)}</zs:records></zs:searchRetrieveResponse>"
+    ).encode("utf-8")
+
+
+def parse_legacy(content):
+    """기존 클라이언트 방식: 전체 트리 + 필드마다 XPath 탐색"""
+    root = ET.fromstring(content)
+    results = []
+    for record in root.findall(".//marc:record", NS):
+        row = {}
+        for tag in WANTED_TAGS:
+            row[tag] = [
+                [sf.text or "" for sf in field.findall("marc:subfield", NS)]
+                for field in record.findall(f".//marc:datafield[@tag='{tag}']", NS)
+            ]
+        field_008 = record.find(".//marc:controlfield[@tag='008']", NS)
+        row["008"] = field_008.text if field_008 is not None else None
+        results.append(row)
+    return results
+
+
+def parse_streaming(content):
+    """marc_xml_parser 방식: iterparse + 레코드별 태그 색인"""
+    results = []
+    for record in iter_marc_records(content):
+        row = {}
+        for tag in WANTED_TAGS:
+            row[tag] = [[text for _, text in field.subfields] for field in record.fields(tag)]
+        row["008"] = record.controlfield("008")
+        results.append(row)
+    return results
+
+
+def measure(func, content):
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = func(content)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def run_case(label, content):
+    legacy_time, legacy_peak, legacy_rows = measure(parse_legacy, content)
+    stream_time, stream_peak, stream_rows = measure(parse_streaming, content)
+    count = len(legacy_rows)
+    same = legacy_rows == stream_rows
+
+    print(f"\n[{label}] 응답 {len(content) / 1024:.0f}KB, 레코드 {count}건")
+    print(f"{'방식':<14} {'전체(ms)':>10} {'레코드당(µs)':>13} {'최대 메모리(KB)':>16}")
+    print("-" * 58)
+    for name, elapsed, peak in (
+        ("fromstring", legacy_time, legacy_peak),
+        ("iterparse", stream_time, stream_peak),
+    ):
+        per_record = elapsed / count * 1e6 if count else 0
+        print(f"{name:<14} {elapsed * 1000:>10.2f} {per_record:>13.1f} {peak / 1024:>16.0f}")
+    if stream_time > 0:
+        print(f"속도 향상: {legacy_time / stream_time:.2f}배, 결과 일치: {'✅' if same else '❌'}")
+    return same
+
+
+print("=" * 58)
+print(f"MARCXML 파싱 벤치마크 (파서: {'lxml' if HAVE_LXML else 'xml.etree'})")
+print("=" * 58)
+
+cases = []
+for path in sys.argv[1:]:
+    with open(path, "rb") as f:
+        cases.append((os.path.basename(path), f.read()))
+if not cases:
+    cases = [
+        ("LC SRU 50건", build_sru_response(50)),
+        ("LC SRU 2000건", build_sru_response(2000)),
+    ]
+
+all_same = all([run_case(label, content) for label, content in cases])
+if not all_same:
+    print("\n❌ 기존 방식과 추출 결과가 다릅니다.")
+sys.exit(0 if all_same else 1)
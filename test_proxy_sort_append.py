@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+컬럼형 정렬 + 행 추가 회귀 테스트
+- FastSearchResultModel + SmartNaturalSortProxyModel로 정렬한 뒤
+  add_multiple_rows()("더 보기")와 append_column_slice()(점진 적재)로 행을 추가
+- 추가된 행이 맨 아래에 정렬되지 않은 채 쌓이지 않고 정렬 위치로 병합되는지 확인
+- 동순위는 적재 순서 유지, 편집/필터 후 추가, 정렬 해제 후 적재 순서 복원까지 검사
+- 하나라도 어긋나면 종료 코드 1
+"""
+import io
+import random
+import sys
+
+if sys.platform == "win32":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+from PySide6.QtCore import QCoreApplication, Qt
+
+from qt_base_tab import FastSearchResultModel
+from qt_proxy_models import SmartNaturalSortProxyModel
+
+HEADERS = ["ID", "제목", "연도"]
+
+
+def make_rows(start, end):
+    return [
+        {
+            "ID": f"r{i}",
+            "제목": random.choice(["가", "나", "다", "Alpha", "beta"]) * random.randint(1, 3),
+            "연도": str(random.randint(1990, 2000)),
+        }
+        for i in range(start, end)
+    ]
+
+
+def column(proxy, col):
+    return [proxy.data(proxy.index(row, col)) for row in range(proxy.rowCount())]
+
+
+def is_sorted(proxy, descending):
+    years = [int(v) for v in column(proxy, 2)]
+    loads = [int(v[1:]) for v in column(proxy, 0)]
+    ordered = years == sorted(years, reverse=descending)
+    stable = all(
+        loads[i] < loads[i + 1]
+        for i in range(len(years) - 1)
+        if years[i] == years[i + 1]
+    )
+    return ordered and stable
+
+
+def report(label, ok):
+    print(f"  {label:<36} {'✅' if ok else '❌'}")
+    return ok
+
+
+def main():
+    random.seed(33)
+    model = FastSearchResultModel(HEADERS)
+    proxy = SmartNaturalSortProxyModel()
+    proxy.setSourceModel(model)
+    model.add_multiple_rows(make_rows(0, 300))
+
+    results = []
+    proxy.sort(2, Qt.DescendingOrder)
+    results.append(report("정렬 (내림차순)", is_sorted(proxy, True)))
+
+    model.add_multiple_rows(make_rows(300, 500))
+    results.append(report("더 보기 추가 후 정렬 유지", is_sorted(proxy, True)))
+
+    extra = make_rows(500, 600)
+    columns = [[row[h] for row in extra] for h in HEADERS]
+    model.append_column_slice(columns, 0, 50)
+    model.append_column_slice(columns, 50, 100)
+    results.append(report("점진 적재 추가 후 정렬 유지", is_sorted(proxy, True)))
+
+    model.setData(model.index(0, 2), "1980")
+    model.add_multiple_rows(make_rows(600, 620))
+    results.append(report("편집 후 추가 (키 재계산)", is_sorted(proxy, True)))
+
+    proxy.set_value_filters({1: "가"})
+    model.add_multiple_rows(make_rows(620, 700))
+    results.append(
+        report(
+            "필터 중 추가",
+            is_sorted(proxy, True) and all("가" in v for v in column(proxy, 1)),
+        )
+    )
+    proxy.set_value_filters({})
+
+    proxy.sort(2, Qt.AscendingOrder)
+    model.add_multiple_rows(make_rows(700, 750))
+    results.append(report("오름차순 정렬 후 추가", is_sorted(proxy, False)))
+
+    proxy.sort(-1, Qt.AscendingOrder)
+    model.add_multiple_rows(make_rows(750, 760))
+    results.append(
+        report(
+            "정렬 해제 → 적재 순서",
+            column(proxy, 0) == [f"r{i}" for i in range(760)],
+        )
+    )
+    return all(results)
+
+
+if __name__ == "__main__":
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    print("=" * 60)
+    print("컬럼형 정렬 + 행 추가 회귀 테스트")
+    print("=" * 60)
+    all_ok = main()
+    print("\n" + ("✅ 모든 경우 통과" if all_ok else "❌ 실패한 경우가 있습니다."))
+    sys.exit(0 if all_ok else 1)
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+SearchThread → 탭 결과 전달 비용 벤치마크
+- 기존: to_dict("records") → pd.DataFrame(records) → iterrows()로 행 dict 생성
+- 신규: SearchResult 참조 전달 → build_display_columns()로 컬럼 배열 적재
+- 지표: 결과 크기별 전달+적재 소요 시간 (반복 측정 중 최솟값)
+"""
+import sys
+import io
+import time
+import random
+
+if sys.platform == "win32":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+import pandas as pd
+from qt_utils import SearchResult
+from qt_base_tab import build_display_columns
+
+ROW_COUNTS = [1000, 10000, 50000]
+REPEAT = 3
+random.seed(42)
+
+COLUMNS = ["제목", "저자", "출판사", "연도", "KAC", "ISBN", "상세 링크", "nlk_id"]
+
+
+def make_frame(rows):
+    return pd.DataFrame({
+        "제목": [f"도서 제목 {i} " + "가나다" * random.randint(1, 5) for i in range(rows)],
+        "저자": [f"저자{random.randint(1, 5000)}" for _ in range(rows)],
+        "출판사": [f"출판사{random.randint(1, 300)}" for _ in range(rows)],
+        "연도": [random.randint(1950, 2025) for _ in range(rows)],
+        "KAC": [f"KAC{random.randint(100000, 999999)}" for _ in range(rows)],
+        "ISBN": [f"97889{random.randint(10000000, 99999999)}" for _ in range(rows)],
+        "상세 링크": [f"https://www.nl.go.kr/detail/{i}" for i in range(rows)],
+        "nlk_id": [f"CNTS-{i:08d}" for i in range(rows)],
+    })
+
+
+def legacy_handoff(df):
+    records = df.to_dict("records")  # 워커: emit 전 변환
+    rebuilt = pd.DataFrame(records)  # GUI: on_search_completed에서 재생성
+    return [row.to_dict() for _, row in rebuilt.iterrows()]  # GUI: 모델 적재
+
+
+def columnar_handoff(df):
+    result = SearchResult.from_return(df, source="bench")  # 워커: 참조만 감쌈
+    return build_display_columns(result.dataframe, COLUMNS)  # GUI: 컬럼 배열 적재
+
+
+def best_of(func, df):
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func(df)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+print(f"{'행 수':>8} {'기존(records)':>14} {'SearchResult':>14} {'배율':>8}")
+print("-" * 50)
+for rows in ROW_COUNTS:
+    df = make_frame(rows)
+    legacy = best_of(legacy_handoff, df)
+    columnar = best_of(columnar_handoff, df)
+    print(f"{rows:>8,} {legacy*1000:>12.1f}ms {columnar*1000:>12.1f}ms {legacy/columnar:>7.1f}x")
+
+print("\n" + "=" * 50)
+print("테스트 완료! (GUI 스레드 몫은 신규 방식에서 build_display_columns뿐)")
+print("=" * 50)
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+벡터 모델 추론 백엔드 벤치마크: torch(FP32) vs int8(동적 양자화) vs onnx
+- 캐시된 DDC 벡터 DB(ddc_index_from_json.faiss / ddc_mapping_from_json.json) 사용
+- 쿼리: 매핑 파일의 prefLabel 샘플
+- 지표: 모델 로드 시간, 쿼리당 평균/p95 지연, FP32 대비 recall@k, 자기 DDC 적중률
+"""
+import sys
+import io
+import json
+import time
+import random
+
+if sys.platform == "win32":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+import faiss
+import numpy as np
+from database_manager import load_sentence_transformer, VECTOR_MODEL_BACKENDS
+
+TOP_K = 10
+SAMPLE_SIZE = 300
+random.seed(42)
+
+index = faiss.read_index("ddc_index_from_json.faiss")
+with open("ddc_mapping_from_json.json", "r", encoding="utf-8") as f:
+    mapping = {int(k): v for k, v in json.load(f).items()}
+
+queries = [(i, v.get("prefLabel", "")) for i, v in mapping.items() if v.get("prefLabel")]
+queries = random.sample(queries, min(SAMPLE_SIZE, len(queries)))
+print(f"DDC 벡터 {index.ntotal:,}개, 쿼리 {len(queries)}개, top_k={TOP_K}")
+
+
+def run_backend(backend):
+    start = time.time()
+    model, device = load_sentence_transformer(backend)
+    load_time = time.time() - start
+
+    # 첫 호출은 그래프/커널 초기화 비용이 섞이므로 제외
+    model.encode(["warm up"], convert_to_numpy=True, normalize_embeddings=True)
+
+    latencies = []
+    top_ids = []
+    for _, label in queries:
+        t0 = time.perf_counter()
+        emb = model.encode([label], convert_to_numpy=True, normalize_embeddings=True)
+        _, idx = index.search(emb.astype('float32'), TOP_K)
+        latencies.append(time.perf_counter() - t0)
+        top_ids.append(idx[0].tolist())
+    return load_time, device, np.array(latencies), top_ids
+
+
+results = {}
+for backend in VECTOR_MODEL_BACKENDS:
+    try:
+        results[backend] = run_backend(backend)
+    except Exception as e:
+        print(f"⚠️ {backend} 백엔드 건너뜀: {e}")
+
+baseline = results.get("torch")
+
+print(f"\n{'백엔드':<8} {'장치':<6} {'로드':>8} {'평균':>9} {'p95':>9} {f'recall@{TOP_K}':>11} {'자기적중':>8}")
+print("-" * 70)
+for backend, (load_time, device, lat, top_ids) in results.items():
+    if baseline:
+        recall = np.mean([
+            len(set(ids) & set(base_ids)) / TOP_K
+            for ids, base_ids in zip(top_ids, baseline[3])
+        ])
+    else:
+        recall = float("nan")
+    self_hit = np.mean([q_id in ids for (q_id, _), ids in zip(queries, top_ids)])
+    print(
+        f"{backend:<8} {device:<6} {load_time:>7.2f}s {lat.mean()*1000:>7.1f}ms "
+        f"{np.percentile(lat, 95)*1000:>7.1f}ms {recall:>11.3f} {self_hit:>8.3f}"
+    )
+
+print("\n" + "=" * 70)
+print("테스트 완료! (recall은 torch FP32 top-k 대비 겹치는 비율)")
+print("=" * 70)
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+# 파일명: translation_memory.py
+# 설명: 해외 도서관 주제어/제목 번역 메모리 (용어집 메모리 적재 + 일괄 조회 + 묶음 원격 번역 + 비동기 기록)
+# 생성일: 2025-10-31
+# 사용처: qt_api_clients.py (translate_text, translate_text_batch_async),
+#         database_manager.py (DatabaseManager.translation_memory)
+#
+# 배경:
+# - translate_text는 문자열마다 glossary.db 연결을 새로 열어 get_translation을 조회하고,
+#   없으면 GoogleTranslator를 문자열마다 호출했다.
+# - 배치 번역(translate_batch_async_safe)은 용어집을 건너뛰고 매 검색마다 전체를 다시 번역했으며,
+#   결과를 저장하지 않았고 배치마다 300ms씩 쉬었다.
+# - DNB/BNF/NDL/Harvard는 검색마다 get_all_custom_translations()로 용어집 전체를 다시 읽었다.
+#
+# 방식:
+# 1. translations 테이블(용어집 + 이전 번역 결과)을 백그라운드에서 한 번 메모리로 적재.
+#    적재가 끝나기 전에는 DatabaseManager.get_translations()로 연결 1개에서 일괄 조회.
+# 2. 메모리에 없는 문자열만 글자 수 예산(BATCH_MAX_CHARS) 안에서 줄바꿈으로 이어 붙여
+#    묶음당 원격 호출 1회. 줄 수가 맞지 않으면 묶음을 반으로 나눠 다시 시도.
+# 3. 새 번역은 즉시 메모리에 반영하고, DB 기록은 DatabaseManager 번역 쓰기 큐로 넘김.
+# 4. 조회/적중/원격 호출 수를 stats()로 제공 (검색 로그에 적중률 표시).
+#
+#     memory = db_manager.translation_memory
+#     translation_map = memory.translate_terms(subjects, translate_remote, finish=hangulize)
+
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+BATCH_DELIMITER = "\n"
+BATCH_MAX_CHARS = 4500  # Google 번역 요청 1회 한도(5000자)보다 여유 있게
+BATCH_MAX_ITEMS = 60
+REMOTE_CONCURRENCY = 3
+
+# translations.original_term은 COLLATE NOCASE (ASCII 대소문자만 무시)
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def memory_key(term):
+    """용어집 조회 키 (SQLite NOCASE와 같은 규칙)."""
+    return term.strip().translate(_ASCII_LOWER)
+
+
+def pack_batches(terms, max_chars=BATCH_MAX_CHARS, max_items=BATCH_MAX_ITEMS):
+    """원격 호출 1회에 보낼 묶음으로 나눕니다 (글자 수 + 개수 예산)."""
+    batches = []
+    current = []
+    size = 0
+    for term in terms:
+        extra = len(term) + len(BATCH_DELIMITER)
+        if current and (size + extra > max_chars or len(current) >= max_items):
+            batches.append(current)
+            current = []
+            size = 0
+        current.append(term)
+        size += extra
+    if current:
+        batches.append(current)
+    return batches
+
+
+class TranslationMemory:
+    """translations 테이블의 메모리 사본 + 원격 번역 묶음 처리 (스레드 안전).
+
+    db_manager가 None이면 DB 없이 실행 중 메모리만 사용합니다 (적재/기록 없음).
+    """
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self._entries = {}  # memory_key(원문) → 번역
+        self._lock = threading.Lock()
+        self._loaded = threading.Event()
+        self._load_started = db_manager is None
+        if db_manager is None:
+            self._loaded.set()
+        self._counters = {
+            "lookups": 0,
+            "memory_hits": 0,
+            "db_hits": 0,
+            "remote_calls": 0,
+            "remote_terms": 0,
+            "remote_failed": 0,
+            "written": 0,
+        }
+
+    # --- 적재 ---
+
+    def preload_async(self):
+        """용어집 전체를 백그라운드 스레드에서 메모리로 적재합니다 (한 번만)."""
+        with self._lock:
+            if self._load_started:
+                return self._loaded
+            self._load_started = True
+        threading.Thread(
+            target=self._load, name="TranslationMemoryLoader", daemon=True
+        ).start()
+        return self._loaded
+
+    def _load(self):
+        try:
+            rows = self.db_manager.get_all_custom_translations()
+            with self._lock:
+                # 적재 중에 기록된 새 번역이 옛 값으로 덮이지 않게 기존 항목 우선
+                for original, translated in rows.items():
+                    self._entries.setdefault(memory_key(original), translated)
+        finally:
+            self._loaded.set()
+
+    @property
+    def loaded(self):
+        return self._loaded.is_set()
+
+    def __len__(self):
+        return len(self._entries)
+
+    # --- 조회/기록 ---
+
+    def get_translations(self, terms):
+        """{원문: 번역} (메모리/DB에 있는 것만). 적재 전에는 DB 일괄 조회로 보완."""
+        found = {}
+        missing = []
+        with self._lock:
+            for term in terms:
+                translated = self._entries.get(memory_key(term))
+                if translated:
+                    found[term] = translated
+                else:
+                    missing.append(term)
+            self._counters["lookups"] += len(found) + len(missing)
+            self._counters["memory_hits"] += len(found)
+
+        if missing and not self.loaded:
+            rows = self.db_manager.get_translations(missing)
+            by_key = {memory_key(k): v for k, v in rows.items() if v}
+            with self._lock:
+                for term in missing:
+                    translated = by_key.get(memory_key(term))
+                    if translated:
+                        found[term] = translated
+                        self._entries.setdefault(memory_key(term), translated)
+                        self._counters["db_hits"] += 1
+        return found
+
+    def get(self, term):
+        return self.get_translations([term]).get(term)
+
+    def remember(self, pairs, persist=True):
+        """새 번역을 메모리에 반영하고 DB 쓰기 큐에 넘깁니다. pairs: [(원문, 번역), ...]"""
+        pairs = [(o, t) for o, t in pairs if o and t]
+        if not pairs:
+            return
+        with self._lock:
+            for original, translated in pairs:
+                self._entries[memory_key(original)] = translated
+            if persist and self.db_manager is not None:
+                self._counters["written"] += len(pairs)
+        if persist and self.db_manager is not None:
+            self.db_manager.enqueue_translations(pairs)
+
+    def forget(self, term):
+        with self._lock:
+            self._entries.pop(memory_key(term), None)
+
+    # --- 원격 번역 ---
+
+    def translate_terms(
+        self,
+        terms,
+        translate_remote,
+        finish=None,
+        should_stop=None,
+        concurrency=REMOTE_CONCURRENCY,
+    ):
+        """terms의 {원문: 번역}. 메모리에 없는 것만 묶어서 원격 번역 후 기록합니다.
+
+        translate_remote(text): 묶음 문자열 1개를 번역 (호출 스레드마다 따로 불림)
+        finish(text): 원격 번역 결과 후처리 (한자 → 한글 등)
+        원격 번역에 실패한 원문은 결과에서 빠집니다 (호출부에서 원문 유지).
+        """
+        unique = []
+        seen = set()
+        for term in terms:
+            if not term or not isinstance(term, str) or not term.strip():
+                continue
+            if term not in seen:
+                seen.add(term)
+                unique.append(term)
+
+        result = self.get_translations(unique)
+        # 줄바꿈이 든 원문은 묶음 구분자와 섞이므로 단독 요청
+        pending = [t for t in unique if t not in result and BATCH_DELIMITER not in t]
+        singles = [[t] for t in unique if t not in result and BATCH_DELIMITER in t]
+        batches = pack_batches(pending) + singles
+        if not batches:
+            return result
+
+        should_stop = should_stop or (lambda: False)
+        finish = finish or (lambda text: text)
+
+        def run_batch(batch):
+            if should_stop():
+                return {}
+            return self._translate_batch(batch, translate_remote, should_stop)
+
+        with ThreadPoolExecutor(
+            max_workers=min(concurrency, len(batches)),
+            thread_name_prefix="TranslationBatch",
+        ) as executor:
+            translated = {}
+            for batch_result in executor.map(run_batch, batches):
+                translated.update(batch_result)
+
+        fresh = []
+        for original, text in translated.items():
+            try:
+                fresh.append((original, finish(text)))
+            except Exception:
+                fresh.append((original, text))  # 후처리 실패 시 번역 결과 그대로
+        self.remember(fresh)
+        result.update(fresh)
+        return result
+
+    def _translate_batch(self, batch, translate_remote, should_stop):
+        """묶음 1개를 원격 호출 1회로 번역. 줄 수가 어긋나면 반으로 나눠 재시도."""
+        with self._lock:
+            self._counters["remote_calls"] += 1
+            self._counters["remote_terms"] += len(batch)
+        try:
+            output = translate_remote(BATCH_DELIMITER.join(batch))
+        except Exception:
+            output = None
+
+        if output and len(batch) == 1:
+            return {batch[0]: output.strip()}
+        if output:
+            parts = [part.strip() for part in output.strip().split(BATCH_DELIMITER)]
+            if len(parts) == len(batch) and all(parts):
+                return dict(zip(batch, parts))
+
+        if len(batch) == 1 or should_stop():
+            with self._lock:
+                self._counters["remote_failed"] += len(batch)
+            return {}
+        half = len(batch) // 2
+        merged = self._translate_batch(batch[:half], translate_remote, should_stop)
+        merged.update(self._translate_batch(batch[half:], translate_remote, should_stop))
+        return merged
+
+    # --- 통계 ---
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._counters)
+            stats["entries"] = len(self._entries)
+        hits = stats["memory_hits"] + stats["db_hits"]
+        stats["hit_rate"] = hits / stats["lookups"] if stats["lookups"] else 0.0
+        return stats
+
+    def summary(self):
+        """검색 로그용 한 줄 요약."""
+        s = self.stats()
+        return (
+            f"번역 메모리: 조회 {s['lookups']}건 중 {s['memory_hits'] + s['db_hits']}건 적중 "
+            f"({s['hit_rate']:.1%}), 원격 호출 {s['remote_calls']}회/{s['remote_terms']}건, "
+            f"실패 {s['remote_failed']}건, 저장 {s['written']}건 (보유 {s['entries']}건)"
+        )
@@ -1018,3 +1018,51 @@ def adjust_qtableview_columns(
 
     except Exception as e:
         print(f"❌ QTableView 컬럼 조정 실패: {e}")
+
+
+def estimate_column_widths(
+    column_headers,
+    columns,
+    sample_rows=200,
+    char_px=8,
+    padding=24,
+    min_width=60,
+    max_width=400,
+):
+    """✅ [성능 개선] 샘플 행의 글자 수로 컬럼 너비를 추정합니다.
+
+    resizeColumnsToContents()는 모든 행을 측정하므로 수만 행에서 GUI가 멈춥니다.
+    이 함수는 GUI 객체를 쓰지 않아 워커 스레드에서 호출할 수 있습니다.
+    (한글 등 전각 문자는 2칸으로 계산)
+
+    Args:
+        column_headers: 헤더 이름 목록
+        columns: 헤더 순서와 같은 컬럼별 표시 문자열 리스트
+    """
+
+    def text_units(text):
+        first_line = str(text).split("\n", 1)[0]
+        return sum(2 if ord(ch) > 0x2E7F else 1 for ch in first_line)
+
+    widths = []
+    for header, values in zip(column_headers, columns):
+        longest = text_units(header)
+        for value in values[:sample_rows]:
+            units = text_units(value)
+            if units > longest:
+                longest = units
+        widths.append(max(min_width, min(max_width, longest * char_px + padding)))
+    return widths
+
+
+def apply_column_widths(table_view, widths):
+    """estimate_column_widths() 결과를 헤더에 적용합니다 (수동 조정 가능한 Interactive 모드)."""
+    if not table_view:
+        return
+    try:
+        header = table_view.horizontalHeader()
+        for i, width in enumerate(widths):
+            header.resizeSection(i, width)
+            header.setSectionResizeMode(i, QHeaderView.Interactive)
+    except Exception as e:
+        print(f"❌ QTableView 컬럼 너비 적용 실패: {e}")